@@ -0,0 +1,59 @@
+"""Durable meeting job queue
+
+Revision ID: 0004_meeting_jobs
+Revises: 0003_meeting_analyses_audio
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004_meeting_jobs"
+down_revision: Union[str, Sequence[str], None] = "0003_meeting_analyses_audio"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_jobs",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("created_at", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(length=16),
+            nullable=False,
+            server_default=sa.text("'pending'"),
+        ),
+        sa.Column(
+            "stage",
+            sa.String(length=32),
+            nullable=False,
+            server_default=sa.text("'pending'"),
+        ),
+        sa.Column(
+            "progress", sa.Float(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "priority", sa.Integer(), nullable=False, server_default=sa.text("1")
+        ),
+        sa.Column("params_json", sa.Text(), nullable=False),
+        sa.Column("audio_path", sa.Text(), nullable=False),
+        sa.Column(
+            "checkpoint_json",
+            sa.Text(),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+    op.create_index("idx_meeting_jobs_created", "meeting_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_meeting_jobs_created", table_name="meeting_jobs")
+    op.drop_table("meeting_jobs")
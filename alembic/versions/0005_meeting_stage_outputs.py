@@ -0,0 +1,37 @@
+"""Meeting stage outputs for partial re-analysis
+
+Revision ID: 0005_meeting_stage_outputs
+Revises: 0004_meeting_jobs
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005_meeting_stage_outputs"
+down_revision: Union[str, Sequence[str], None] = "0004_meeting_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "meeting_stage_outputs",
+        sa.Column(
+            "meeting_id",
+            sa.String(length=36),
+            sa.ForeignKey("meeting_analyses.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("stage", sa.String(length=16), primary_key=True),
+        sa.Column("created_at", sa.Integer(), nullable=False),
+        sa.Column("output_json", sa.Text(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("meeting_stage_outputs")
@@ -0,0 +1,65 @@
+"""Speaker profiles (embedding centroids) for cross-meeting naming
+
+Revision ID: 0006_speaker_profiles
+Revises: 0005_meeting_stage_outputs
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006_speaker_profiles"
+down_revision: Union[str, Sequence[str], None] = "0005_meeting_stage_outputs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "speaker_profiles",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.Integer(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("centroid_json", sa.Text(), nullable=False),
+    )
+    op.create_index(
+        "idx_speaker_profiles_name", "speaker_profiles", ["name"], unique=True
+    )
+    op.create_table(
+        "speaker_profile_samples",
+        sa.Column(
+            "meeting_id",
+            sa.String(length=36),
+            sa.ForeignKey("meeting_analyses.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("speaker", sa.String(length=64), primary_key=True),
+        sa.Column(
+            "profile_id",
+            sa.Integer(),
+            sa.ForeignKey("speaker_profiles.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.Integer(), nullable=False),
+        sa.Column("embedding_json", sa.Text(), nullable=False),
+    )
+    op.create_index(
+        "idx_speaker_profile_samples_profile",
+        "speaker_profile_samples",
+        ["profile_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_speaker_profile_samples_profile", table_name="speaker_profile_samples"
+    )
+    op.drop_table("speaker_profile_samples")
+    op.drop_index("idx_speaker_profiles_name", table_name="speaker_profiles")
+    op.drop_table("speaker_profiles")
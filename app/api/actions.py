@@ -24,7 +24,10 @@ from typing import Any
 
 from fastapi import APIRouter, Request
 
-router = APIRouter()
+from app.api.readiness import require_ready
+from app.services.readiness import COMPONENT_ACTIONS
+
+router = APIRouter(dependencies=[require_ready(COMPONENT_ACTIONS)])
 
 
 @router.get("/actions")
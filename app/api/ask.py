@@ -17,6 +17,7 @@ Failure paths:
 
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,7 @@ from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.datastructures import UploadFile
 
+from app.api.readiness import require_ready
 from app.api.transcribe import (
     _RAW_BODY_EXTENSION_MAP,
     _is_supported_dispatch_type,
@@ -33,16 +35,24 @@ from app.config import config
 from app.services import auto_session_logger
 from app.services.converter import audio_converter
 from app.services.files import file_manager
+from app.services.language import sticky_for
 from app.services.llm import LLMConfigError, LLMUpstreamError
+from app.services.metrics import observe_inference, observe_stage, timed_stage
 from app.services.postprocess import Drop, Keep, filter_empty_transcription
+from app.services.readiness import COMPONENT_DATABASE, COMPONENT_LLM, COMPONENT_MODEL
+from app.services.scheduler import PRIORITY_INTERACTIVE, scheduled
 from app.services.whisper import WhisperTranscriptionError
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(
+    dependencies=[require_ready(COMPONENT_MODEL, COMPONENT_DATABASE, COMPONENT_LLM)]
+)
 
 CT_JSON = "application/json"
 
+_METRICS_ENDPOINT = "/ask"
+
 
 def _is_supported_ask_content_type(ct: str) -> bool:
     return _is_supported_dispatch_type(ct) or ct == CT_JSON
@@ -83,18 +93,21 @@ async def _extract_audio_body(
     Returns (body, suffix, mime). The mime hint is used by the auto-session
     logger to pick the right extension when persisting the blob for history.
     """
-    if content_type == "multipart/form-data":
-        form = await request.form()
-        upload = form.get("file")
-        if not isinstance(upload, UploadFile):
-            raise HTTPException(status_code=400, detail="Missing form field 'file'")
-        body = await upload.read()
-        suffix = Path(upload.filename or "audio.unknown").suffix or ".audio"
-        mime = upload.content_type or "application/octet-stream"
-    else:
-        body = await request.body()
-        suffix = _RAW_BODY_EXTENSION_MAP.get(content_type, ".audio")
-        mime = content_type or "application/octet-stream"
+    with timed_stage(_METRICS_ENDPOINT, "upload_read"):
+        if content_type == "multipart/form-data":
+            form = await request.form()
+            upload = form.get("file")
+            if not isinstance(upload, UploadFile):
+                raise HTTPException(
+                    status_code=400, detail="Missing form field 'file'"
+                )
+            body = await upload.read()
+            suffix = Path(upload.filename or "audio.unknown").suffix or ".audio"
+            mime = upload.content_type or "application/octet-stream"
+        else:
+            body = await request.body()
+            suffix = _RAW_BODY_EXTENSION_MAP.get(content_type, ".audio")
+            mime = content_type or "application/octet-stream"
     if not body:
         raise HTTPException(status_code=400, detail="Empty audio body")
     return body, suffix, mime
@@ -124,17 +137,31 @@ async def _run_audio_pipeline(
                 status_code=413,
                 detail=f"File too large (max {config.MAX_FILE_SIZE_MB}MB)",
             )
-        if not file_manager.is_audio_file(temp_input):
+        with timed_stage(_METRICS_ENDPOINT, "mime_sniff"):
+            is_audio = file_manager.is_audio_file(temp_input)
+        if not is_audio:
             mime = file_manager.detect_mime_type(temp_input)
             raise HTTPException(
                 status_code=415, detail=f"Unsupported file format. Detected: {mime}"
             )
 
-        temp_wav = audio_converter.convert_to_wav(temp_input)
-        whisper = request.app.state.whisper
+        with timed_stage(_METRICS_ENDPOINT, "convert"):
+            temp_wav = audio_converter.convert_to_wav(temp_input)
+        whisper = scheduled(request.app.state, PRIORITY_INTERACTIVE)
+        sticky = sticky_for(request.app.state, request.headers)
+        inference_start = time.perf_counter()
         result = await whisper.transcribe(
-            temp_wav, language=language, initial_prompt=prompt
+            temp_wav,
+            language=sticky.resolve(language) if sticky else language,
+            initial_prompt=prompt,
         )
+        observe_inference(
+            _METRICS_ENDPOINT,
+            time.perf_counter() - inference_start,
+            result.duration_seconds,
+        )
+        if sticky is not None:
+            sticky.remember(language, result.language)
         return result.text, result.duration_seconds or 0.0
     finally:
         if temp_input:
@@ -222,7 +249,8 @@ async def ask(
             transcript_for_response = None
 
         try:
-            answer = await llm_client.ask(llm_input)
+            with timed_stage(_METRICS_ENDPOINT, "llm"):
+                answer = await llm_client.ask(llm_input)
         except LLMConfigError as e:
             raise HTTPException(status_code=502, detail=str(e)) from e
         except LLMUpstreamError as e:
@@ -240,17 +268,18 @@ async def ask(
                 if transcript_for_response is not None
                 else (user_text or "")
             )
-            sid = auto_session_logger.log_ask_session(
-                transcript=final_text,
-                answer=answer,
-                duration_ms=(
-                    int(audio_duration_s * 1000)
-                    if audio_duration_s
-                    else None
-                ),
-                audio_blob=audio_body,
-                audio_mime_type=audio_mime,
-            )
+            with timed_stage(_METRICS_ENDPOINT, "db_write"):
+                sid = auto_session_logger.log_ask_session(
+                    transcript=final_text,
+                    answer=answer,
+                    duration_ms=(
+                        int(audio_duration_s * 1000)
+                        if audio_duration_s
+                        else None
+                    ),
+                    audio_blob=audio_body,
+                    audio_mime_type=audio_mime,
+                )
             if sid is not None:
                 response["session_id"] = sid
         return response
@@ -306,6 +335,8 @@ async def ask(
             llm_input = stream_decision.text
 
         full_answer_parts: list[str] = []
+        # Covers the whole stream (first token to last), client writes included.
+        llm_start = time.perf_counter()
         try:
             async for delta in llm_client.ask_stream(llm_input):
                 full_answer_parts.append(delta)
@@ -319,6 +350,8 @@ async def ask(
         except Exception as e:  # defensive
             yield _sse_event("error", {"error": f"LLM stream failed: {e}"})
             return
+        finally:
+            observe_stage(_METRICS_ENDPOINT, "llm", time.perf_counter() - llm_start)
 
         # Auto-log AFTER the stream completes successfully. Emit a `session`
         # event before `done` so clients can capture the id without waiting
@@ -327,17 +360,18 @@ async def ask(
             full_answer = "".join(full_answer_parts)
             # Audio path → final.text = transcript; JSON text path → user_text.
             final_text = llm_input  # already equals transcript or user_text
-            sid = auto_session_logger.log_ask_session(
-                transcript=final_text,
-                answer=full_answer,
-                duration_ms=(
-                    int(audio_duration_s * 1000)
-                    if audio_duration_s
-                    else None
-                ),
-                audio_blob=audio_body,
-                audio_mime_type=audio_mime,
-            )
+            with timed_stage(_METRICS_ENDPOINT, "db_write"):
+                sid = auto_session_logger.log_ask_session(
+                    transcript=final_text,
+                    answer=full_answer,
+                    duration_ms=(
+                        int(audio_duration_s * 1000)
+                        if audio_duration_s
+                        else None
+                    ),
+                    audio_blob=audio_body,
+                    audio_mime_type=audio_mime,
+                )
             if sid is not None:
                 yield _sse_event("session", {"session_id": sid})
         yield _sse_event("done", {"finish_reason": "stop"})
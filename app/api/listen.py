@@ -6,19 +6,39 @@ Accepts 16 kHz mono `pcm_s16le` binary frames; emits JSON text frames:
     {"type": "final",   "text": "...", "start_ms": <int>, "end_ms": <int>}
     {"type": "warning", "message": "buffer overflow, oldest audio dropped"}
     {"type": "error",   "message": "<reason>"}    (followed by close 1003)
+
+Optional `?language=<code>` pins the decode language for the whole session;
+by default it is detected once, then pinned. Optional `?model=<name>` decodes
+on another registry model (loaded on demand, see `GET /models`). With
+`STREAM_DRAFT_MODEL_NAME` set, partials are decoded by that small model and
+only finals by the session's model.
 """
 
 import json
 import logging
+import time
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.services.stream import StreamSession
+from app.api.readiness import require_ready
+from app.config import config
+from app.services._whisper_backend import WhisperLoadError
+from app.services.language import LanguagePin, sticky_for
+from app.services.metrics import LISTEN_EVENTS, LISTEN_SESSIONS, observe_inference
+from app.services.model_pool import (
+    ModelPoolFullError,
+    UnknownModelError,
+    draft_backend,
+    resolve_backend,
+)
+from app.services.readiness import COMPONENT_MODEL, COMPONENT_VAD
+from app.services.scheduler import PRIORITY_LIVE, scheduled
+from app.services.stream import SAMPLE_RATE, StreamSession
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[require_ready(COMPONENT_MODEL, COMPONENT_VAD)])
 
 
 # Frame size guards (inclusive on both ends).
@@ -42,13 +62,60 @@ async def _send_error_and_close(ws: WebSocket, message: str) -> None:
 async def listen(ws: WebSocket) -> None:
     await ws.accept()
 
-    whisper = ws.app.state.whisper
+    model = ws.query_params.get("model")
+    try:
+        backend = await resolve_backend(ws.app.state, model)
+    except UnknownModelError:
+        await _send_error_and_close(ws, f"unknown model {model!r}")
+        return
+    except (ModelPoolFullError, WhisperLoadError) as e:
+        await _send_error_and_close(ws, f"model {model!r} unavailable: {e}")
+        return
+
+    # Live captions outrank every other decode; a meeting upload in flight
+    # delays a partial by at most one batch chunk.
+    whisper = scheduled(ws.app.state, PRIORITY_LIVE, backend)
+
+    # One language per session: `?language=` pins it up front; otherwise a
+    # language-ID pre-pass (or a known X-Client-Id) pins it once, so partials
+    # and finals stop re-running detection on every window.
+    sticky = sticky_for(ws.app.state, ws.headers)
+    requested = ws.query_params.get("language") or "auto"
+    pin = LanguagePin(
+        whisper,
+        language=sticky.resolve(requested) if sticky else requested,
+        detect_seconds=config.LANGUAGE_DETECT_SECONDS,
+    )
 
     async def transcribe_fn(samples, *, beam_size: int | None = None) -> str:
-        result = await whisper.transcribe_pcm(samples, beam_size=beam_size)
+        was_pinned = pin.pinned
+        language = await pin.resolve(samples)
+        # Partials (the only calls that pass beam_size) go to the draft model
+        # when one is configured and resident. It is a separate model with
+        # its own CT2 workers, so it bypasses the scheduler gate that orders
+        # calls into the session model — a partial no longer waits for a
+        # final or a meeting chunk to release a slot.
+        draft = draft_backend(ws.app.state, backend) if beam_size is not None else None
+        inference_start = time.perf_counter()
+        result = await (draft or whisper).transcribe_pcm(
+            samples, language=language, beam_size=beam_size
+        )
+        observe_inference(
+            "/listen",
+            time.perf_counter() - inference_start,
+            len(samples) / SAMPLE_RATE,
+        )
+        if draft is not None:
+            # Draft output is provisional; only the session model's results
+            # may pin the language.
+            return result.text
+        pin.observe(result, samples)
+        if sticky is not None and pin.pinned and not was_pinned:
+            sticky.remember(requested, pin.language)
         return result.text
 
     async def send_event(event: dict[str, Any]) -> None:
+        LISTEN_EVENTS.inc(type=str(event.get("type", "")))
         await ws.send_text(json.dumps(event, ensure_ascii=False))
 
     session = StreamSession(
@@ -57,6 +124,7 @@ async def listen(ws: WebSocket) -> None:
         vad_backend=ws.app.state.vad_factory(),
     )
 
+    LISTEN_SESSIONS.inc()
     try:
         while True:
             msg = await ws.receive()
@@ -91,3 +159,5 @@ async def listen(ws: WebSocket) -> None:
             await ws.close(code=1011)
         except Exception:
             pass
+    finally:
+        LISTEN_SESSIONS.dec()
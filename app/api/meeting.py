@@ -17,6 +17,7 @@ from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
 
+from app.api.readiness import require_ready
 from app.api.transcribe import (
     _is_supported_dispatch_type,
     _normalize_content_type,
@@ -27,13 +28,28 @@ from app.config import config
 from app.services._whisper_backend import WhisperBackend
 from app.services.converter import audio_converter
 from app.services.files import file_manager
-from app.services.meeting import MeetingAnalyzer, MeetingResult
+from app.services.job_queue import (
+    MEETING_PRIORITY_NAMES,
+    MEETING_PRIORITY_NORMAL,
+    PRIORITY_MEETING,
+    JobQueue,
+)
+from app.services.meeting import (
+    MeetingAnalyzer,
+    MeetingResult,
+    asr_stage_output,
+    stages_to_rerun,
+)
 from app.services.meeting_jobs import JobStore
+from app.services.meeting_journal import MeetingJobJournal
+from app.services.readiness import COMPONENT_DATABASE, COMPONENT_MODEL
 from app.services.registry import MeetingModelMissingError, resolve_ct2_variant
+from app.services.scheduler import PRIORITY_BATCH as DECODE_BATCH
+from app.services.scheduler import scheduled
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[require_ready(COMPONENT_MODEL, COMPONENT_DATABASE)])
 
 
 def check_meeting_availability(cfg=config) -> tuple[bool, str | None]:
@@ -106,14 +122,36 @@ def _serialise_result(result: MeetingResult) -> dict[str, Any]:
     }
 
 
-def _job_to_json(job) -> dict[str, Any]:
-    """Serialise a Job for the GET endpoint."""
+def _job_to_json(
+    job, queue: JobQueue | None = None, partial_offset: int = 0
+) -> dict[str, Any]:
+    """Serialise a Job for the GET endpoint.
+
+    Pending jobs waiting on the shared JobQueue also carry
+    `queue_position` (1 = next to start). Running jobs carry `partial`, the
+    ASR segments published so far from index `partial_offset` on, so a
+    poller can pass the last `total` back and fetch only what is new.
+    """
     payload: dict[str, Any] = {
         "status": job.status,
         "progress": job.progress,
         "stage": job.stage,
         "result": _serialise_result(job.result) if job.result is not None else None,
     }
+    if job.stages:
+        payload["stages"] = dict(job.stages)
+    if job.status == "pending" and queue is not None:
+        position = queue.position(job.job_id)
+        if position is not None:
+            payload["queue_position"] = position
+    if job.status in ("pending", "running"):
+        offset = max(0, partial_offset)
+        payload["partial"] = {
+            "language": job.partial_language,
+            "offset": offset,
+            "total": len(job.partial),
+            "segments": job.partial[offset:],
+        }
     if job.error is not None:
         payload["error"] = {"code": job.error.code, "message": job.error.message}
     return payload
@@ -127,12 +165,47 @@ def _get_or_create_analyzer(request: Request) -> MeetingAnalyzer:
     """Lazy-construct the analyzer on first call. Caller MUST ensure the
     ct2 variant is downloaded (via check_meeting_availability) — from_config
     raises MeetingModelMissingError otherwise."""
-    state = request.app.state
+    return _analyzer_for_state(request.app.state)
+
+
+def _analyzer_for_state(state) -> MeetingAnalyzer:
     if state.meeting_analyzer is None:
-        state.meeting_analyzer = MeetingAnalyzer.from_config(config)
+        state.meeting_analyzer = MeetingAnalyzer.from_config(
+            config, **_asr_sharing(state)
+        )
     return state.meeting_analyzer
 
 
+def _asr_sharing(state) -> dict[str, Any]:
+    """`from_config` kwargs that let the meeting ASR borrow a server model.
+
+    A borrowed model's decodes hold a scheduler batch slot each (a whole
+    ASR chunk), so sharing is only offered when the scheduler keeps a slot
+    out of batch reach — `batch_slots < max_inflight`, by default
+    `CT2_NUM_WORKERS >= 2`. With a single slot a meeting chunk would hold
+    it and `/listen` partials would wait behind it; the meeting then loads
+    its own copy of the weights instead.
+    """
+    scheduler = getattr(state, "scheduler", None)
+    if scheduler is None or scheduler.batch_slots >= scheduler.concurrency:
+        return {}
+    return {
+        "shared_backends": lambda: _resident_backends(state),
+        "shared_decode_slot": lambda: scheduler.slot(priority=DECODE_BATCH),
+    }
+
+
+def _resident_backends(state) -> list[Any]:
+    """Loaded server backends the meeting ASR may borrow weights from: the
+    default model and, if resident in the pool, the meeting model."""
+    backends = [getattr(state, "whisper", None)]
+    pool = getattr(state, "model_pool", None)
+    entry = pool.resident(config.MEETING_MODEL_NAME) if pool is not None else None
+    if entry is not None:
+        backends.append(entry.backend)
+    return [b for b in backends if b is not None]
+
+
 async def _read_meeting_audio(request: Request) -> tuple[bytes, str]:
     """Mirror `/transcribe`'s dispatch logic: multipart, raw audio/*, or octet-stream."""
     content_type = _normalize_content_type(request.headers.get("content-type"))
@@ -146,6 +219,20 @@ async def _read_meeting_audio(request: Request) -> tuple[bytes, str]:
     return await _read_raw_audio(request, content_type)
 
 
+def _parse_priority(priority: str) -> int:
+    for value, name in MEETING_PRIORITY_NAMES.items():
+        if priority.strip().lower() == name:
+            return value
+    raise HTTPException(
+        status_code=400,
+        detail={
+            "error": "invalid_priority",
+            "reason": "priority must be one of "
+            + ", ".join(MEETING_PRIORITY_NAMES.values()),
+        },
+    )
+
+
 def _validate_speaker_range(
     num_speakers: int | None,
     min_speakers: int | None,
@@ -181,12 +268,23 @@ def _validate_speaker_range(
         )
 
 
+def _convert_audio(path: Path) -> Path:
+    """`convert_to_wav` with ffmpeg failures surfaced as a typed 500."""
+    try:
+        return audio_converter.convert_to_wav(path)
+    except RuntimeError as exc:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": "audio_conversion_failed", "reason": str(exc)},
+        ) from exc
+
+
 async def _run_meeting_job(
     *,
     analyzer: MeetingAnalyzer,
     store: JobStore,
     job_id: str,
-    audio_path: str,
+    audio_path: Path | None,
     language: str | None,
     num_speakers: int | None,
     min_speakers: int | None,
@@ -195,6 +293,9 @@ async def _run_meeting_job(
     fast: bool = False,
     backend: WhisperBackend | None = None,
     filename: str | None = None,
+    journal: MeetingJobJournal | None = None,
+    stages: dict[str, dict[str, Any]] | None = None,
+    meeting_id: str | None = None,
 ) -> None:
     """Background entrypoint — runs the pipeline and updates the job record.
 
@@ -206,18 +307,29 @@ async def _run_meeting_job(
     ASR. The resulting segments are then handed to
     `analyzer.analyze_with_external_asr` which runs only align + diarize +
     merge. Caller MUST supply `backend` when `fast=True`.
+
+    Every stage output is checkpointed: into the `journal` (the durable
+    queue) as it lands, and with the persisted analysis on success. Given
+    saved `stages` — a resumed job, or a re-analysis of `meeting_id`,
+    whose stored result is then replaced instead of a new one created —
+    `analyzer.reanalyze` recomputes only the stale ones (`audio_path`
+    may be None if none are). A cancellation the client did not ask for
+    (server shutdown) leaves a journaled job and its spooled audio in
+    place for resume.
     """
     # Honour cancellation requested before the worker even started running.
     pre_job = store.get(job_id)
     if pre_job is not None and pre_job.cancel_requested:
         store.mark_cancelled(job_id)
-        file_manager.cleanup_file(audio_path)
+        if audio_path is not None:
+            file_manager.cleanup_file(Path(audio_path))
         return
 
     # Stage label differs by path so log scrapers and the UI's progress
     # display can distinguish "fast ASR" from "WhisperX batched ASR".
-    initial_stage = "asr_external" if fast else "asr"
+    initial_stage = "asr_external" if fast or stages else "asr"
     store.mark_running(job_id, stage=initial_stage)
+    finished = False
     try:
 
         def progress(stage: str, progress: float) -> None:
@@ -229,32 +341,49 @@ async def _run_meeting_job(
             if curr is not None and curr.cancel_requested:
                 raise asyncio.CancelledError("meeting job cancelled by client")
 
-        if fast:
-            if backend is None:
-                raise RuntimeError(
-                    "fast=true requires a WhisperBackend instance (server bug)"
-                )
-            # Wire the existing /transcribe path. initial_prompt left None
-            # because pyannote diarize is already speaker-agnostic and we
-            # don't have a per-job prompt convention for meetings yet.
-            asr_result = await backend.transcribe(
+        def stage_state(stage: str, state: str) -> None:
+            store.update_stage(job_id, stage, state)
+
+        def partial(segments: list[dict[str, Any]], language: str | None) -> None:
+            store.append_partial(job_id, segments, language=language)
+
+        stage_outputs: dict[str, dict[str, Any]] = dict(stages or {})
+
+        def checkpoint(stage: str, output: dict[str, Any]) -> None:
+            stage_outputs[stage] = output
+            if journal is not None:
+                journal.checkpoint(job_id, stage, output)
+
+        if stages:
+            result = await analyzer.reanalyze(
                 audio_path,
-                language=language if language and language != "auto" else None,
-                initial_prompt=None,
+                stages=stages,
+                num_speakers=num_speakers,
+                min_speakers=min_speakers,
+                max_speakers=max_speakers,
+                enable_word_timestamps=enable_word_timestamps,
+                progress_callback=progress,
+                stage_callback=stage_state,
+                checkpoint_callback=checkpoint,
+                partial_callback=partial,
             )
-            asr_segments = [
-                {"start": s.start, "end": s.end, "text": s.text}
-                for s in asr_result.segments
-            ]
+        elif fast:
+            asr_out = await _run_external_asr(backend, audio_path, language=language)
+            checkpoint("asr", asr_stage_output(asr_out))
+            # The platform backend transcribes the file in one call, so the
+            # whole transcript becomes partial at once.
+            partial(asr_stage_output(asr_out)["segments"], asr_out["language"])
             result = await analyzer.analyze_with_external_asr(
                 audio_path,
-                asr_segments=asr_segments,
-                language=asr_result.language or "und",
+                asr_segments=asr_out["segments"],
+                language=asr_out["language"] or "und",
                 num_speakers=num_speakers,
                 min_speakers=min_speakers,
                 max_speakers=max_speakers,
                 enable_word_timestamps=enable_word_timestamps,
                 progress_callback=progress,
+                stage_callback=stage_state,
+                checkpoint_callback=checkpoint,
             )
         else:
             result = await analyzer.analyze(
@@ -265,6 +394,9 @@ async def _run_meeting_job(
                 max_speakers=max_speakers,
                 enable_word_timestamps=enable_word_timestamps,
                 progress_callback=progress,
+                stage_callback=stage_state,
+                checkpoint_callback=checkpoint,
+                partial_callback=partial,
             )
         # Late-cancel: client called DELETE after the pipeline ran but before
         # we recorded the result. Honour the cancel and discard the result.
@@ -277,20 +409,49 @@ async def _run_meeting_job(
             # sidebar survives JobStore TTL eviction (default 1h)
             # AND server restarts. Best-effort: failures here are
             # logged but never break the live polling response.
-            from app.api.meeting_history import _persist_completed_job
-
-            _persist_completed_job(
-                job_id=job_id,
-                filename=filename or f"meeting-{job_id}",
-                result_obj=_serialise_result(result),
-                duration_seconds=result.duration_seconds,
-                language=result.language,
-                speakers_count=len(result.speakers),
+            from app.api.meeting_history import (
+                _persist_completed_job,
+                _persist_reanalysis,
             )
+
+            if meeting_id is not None:
+                _persist_reanalysis(
+                    meeting_id=meeting_id,
+                    result_obj=_serialise_result(result),
+                    duration_seconds=result.duration_seconds,
+                    language=result.language,
+                    speakers_count=len(result.speakers),
+                    stage_outputs=stage_outputs,
+                )
+            else:
+                _persist_completed_job(
+                    job_id=job_id,
+                    filename=filename or f"meeting-{job_id}",
+                    result_obj=_serialise_result(result),
+                    duration_seconds=result.duration_seconds,
+                    language=result.language,
+                    speakers_count=len(result.speakers),
+                    stage_outputs=stage_outputs,
+                )
+        finished = True
     except asyncio.CancelledError:
+        curr = store.get(job_id)
+        if journal is not None and (curr is None or not curr.cancel_requested):
+            # Not a client DELETE: the server is going down. Keep the
+            # journal row and the spooled audio so the job resumes.
+            raise
         store.mark_cancelled(job_id)
+        finished = True
     except Exception as exc:  # noqa: BLE001 — surface every failure as job.error
-        stage = store.get(job_id).stage if store.get(job_id) else "unknown"
+        job = store.get(job_id)
+        stage = job.stage if job else "unknown"
+        # Concurrent diarize can fail while progress sits on asr / align;
+        # a stage that reported "failed" is the one to blame.
+        if job is not None:
+            stage = next(
+                (name for name, state in job.stages.items() if state == "failed"),
+                stage,
+            )
         code_map = {
             "asr": "asr_failed",
             "asr_external": "asr_failed",
@@ -300,8 +461,135 @@ async def _run_meeting_job(
         code = code_map.get(stage, "pipeline_failed")
         logger.exception("Meeting job %s failed in stage %s", job_id, stage)
         store.mark_error(job_id, code=code, message=str(exc))
+        finished = True
     finally:
-        file_manager.cleanup_file(audio_path)
+        if audio_path is not None and (finished or journal is None):
+            file_manager.cleanup_file(Path(audio_path))
+
+
+async def _run_external_asr(
+    backend: WhisperBackend | None, audio_path: str, *, language: str | None
+) -> dict[str, Any]:
+    """Fast-path ASR on the platform-default WhisperBackend, in the
+    `{"language", "segments"}` shape of a WhisperX ASR result."""
+    if backend is None:
+        raise RuntimeError("fast=true requires a WhisperBackend instance (server bug)")
+    # Wire the existing /transcribe path. initial_prompt left None
+    # because pyannote diarize is already speaker-agnostic and we
+    # don't have a per-job prompt convention for meetings yet.
+    asr_result = await backend.transcribe(
+        audio_path,
+        language=language if language and language != "auto" else None,
+        initial_prompt=None,
+    )
+    return {
+        "language": asr_result.language,
+        "segments": [
+            {"start": s.start, "end": s.end, "text": s.text}
+            for s in asr_result.segments
+        ],
+    }
+
+
+async def _run_queued_meeting_job(
+    queue: JobQueue,
+    *,
+    priority: int = MEETING_PRIORITY_NORMAL,
+    **job_kwargs: Any,
+) -> None:
+    """Hold a meeting-class slot on the shared JobQueue for the whole run.
+
+    Admitted jobs run side by side and interleave per stage inside the
+    analyzer; the rest wait here behind interactive and batch work, `high`
+    before `normal` and FIFO within each, which is what `queue_position`
+    reports. A DELETE that lands while the job is
+    still queued is honoured by `_run_meeting_job`'s pre-start cancel
+    check once the slot is granted.
+    """
+    async with queue.slot(
+        priority=PRIORITY_MEETING, rank=priority, job_id=job_kwargs["job_id"]
+    ):
+        await _run_meeting_job(**job_kwargs)
+
+
+def resume_meeting_jobs(app) -> list[asyncio.Task]:
+    """Put journaled meeting jobs from a previous run back in the queue.
+
+    Called once at startup after the database and model are ready. Each
+    job is restored under its original id (so clients keep polling the
+    same status_url) and re-admitted through the job queue at its
+    original priority; a checkpointed ASR stage is not rerun, and a
+    re-analysis still replaces its `meeting_id`. Jobs whose spooled audio
+    is gone are dropped. Returns the scheduled tasks.
+    """
+    state = app.state
+    journal: MeetingJobJournal | None = getattr(state, "meeting_journal", None)
+    if journal is None:
+        return []
+    entries = journal.entries()
+    if not entries:
+        return []
+    if not config.MEETING_RESUME_JOBS:
+        for entry in entries:
+            journal.discard(entry.job_id)
+        logger.info("Discarded %d unfinished meeting job(s)", len(entries))
+        return []
+    available, reason = check_meeting_availability(config)
+    if not available:
+        # Leave them journaled; they resume on a start where meeting works.
+        logger.warning(
+            "Not resuming %d meeting job(s): %s", len(entries), reason
+        )
+        return []
+
+    store: JobStore = state.meeting_jobs
+    analyzer = _analyzer_for_state(state)
+    backend: WhisperBackend = scheduled(state, DECODE_BATCH)
+    tasks: list[asyncio.Task] = []
+    for entry in entries:
+        if not Path(entry.audio_path).exists():
+            logger.warning(
+                "Dropping meeting job %s: spooled audio %s is missing",
+                entry.job_id,
+                entry.audio_path,
+            )
+            journal.discard(entry.job_id)
+            continue
+        store.restore(entry.job_id)
+        journal.sync(store.get(entry.job_id))
+        params = {
+            key: entry.params.get(key)
+            for key in (
+                "language",
+                "num_speakers",
+                "min_speakers",
+                "max_speakers",
+                "filename",
+                "meeting_id",
+            )
+        }
+        tasks.append(
+            asyncio.ensure_future(
+                _run_queued_meeting_job(
+                    state.job_queue,
+                    priority=entry.priority,
+                    analyzer=analyzer,
+                    store=store,
+                    job_id=entry.job_id,
+                    audio_path=Path(entry.audio_path),
+                    enable_word_timestamps=entry.params.get(
+                        "enable_word_timestamps", True
+                    ),
+                    fast=bool(entry.params.get("fast", False)),
+                    backend=backend,
+                    journal=journal,
+                    stages=entry.checkpoint or None,
+                    **params,
+                )
+            )
+        )
+    logger.info("Resumed %d unfinished meeting job(s)", len(tasks))
+    return tasks
 
 
 @router.post("/transcribe/meeting", status_code=202)
@@ -337,6 +625,10 @@ async def post_meeting(
             "uploaded in the sidebar, not a synthesised label."
         ),
     ),
+    priority: str = Query(
+        "normal",
+        description="Queue class: `high` jobs start before queued `normal` ones",
+    ),
 ) -> dict[str, Any]:
     """Accept a meeting audio upload and return a job handle.
 
@@ -351,6 +643,7 @@ async def post_meeting(
         )
 
     _validate_speaker_range(num_speakers, min_speakers, max_speakers)
+    priority_class = _parse_priority(priority)
 
     body, suffix = await _read_meeting_audio(request)
     if not body:
@@ -374,7 +667,7 @@ async def post_meeting(
                     "reason": f"unsupported file format (detected: {detected})",
                 },
             )
-        temp_wav = audio_converter.convert_to_wav(temp_input)
+        temp_wav = _convert_audio(temp_input)
     finally:
         file_manager.cleanup_file(temp_input)
 
@@ -382,33 +675,176 @@ async def post_meeting(
     analyzer = _get_or_create_analyzer(request)
     # Capture the WhisperBackend reference now so the BackgroundTasks
     # worker can reach it after the Request goes out of scope. Always
-    # present (lifespan eagerly loads the backend) so safe to read.
-    backend: WhisperBackend = request.app.state.whisper
+    # present (lifespan eagerly loads the backend) so safe to read. The
+    # batch-class view chunks the fast-path decode so live and interactive
+    # requests can cut in between chunks.
+    backend: WhisperBackend = scheduled(request.app.state, DECODE_BATCH)
     job = store.create()
+    params: dict[str, Any] = {
+        "language": language,
+        "num_speakers": num_speakers,
+        "min_speakers": min_speakers,
+        "max_speakers": max_speakers,
+        "enable_word_timestamps": enable_word_timestamps,
+        "fast": fast,
+        "filename": filename,
+    }
+    # Durable queue: move the WAV out of TEMP_DIR and journal the job so
+    # a restart before it finishes puts it back in the queue.
+    journal: MeetingJobJournal | None = getattr(
+        request.app.state, "meeting_journal", None
+    )
+    audio_path = temp_wav
+    if journal is not None:
+        audio_path = journal.spool(job.job_id, temp_wav)
+        journal.record(
+            job.job_id, audio_path=audio_path, params=params, priority=priority_class
+        )
     background_tasks.add_task(
-        _run_meeting_job,
+        _run_queued_meeting_job,
+        request.app.state.job_queue,
+        priority=priority_class,
         analyzer=analyzer,
         store=store,
         job_id=job.job_id,
-        audio_path=temp_wav,
-        language=language,
+        audio_path=audio_path,
+        backend=backend,
+        journal=journal,
+        **params,
+    )
+    return {
+        "job_id": job.job_id,
+        "status_url": f"/transcribe/meeting/{job.job_id}",
+    }
+
+
+@router.post("/v1/meetings/{meeting_id}/reanalyze", status_code=202)
+async def reanalyze_meeting(
+    meeting_id: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    num_speakers: int | None = Query(
+        None, description="Exact speaker count when known (skips clustering search)"
+    ),
+    min_speakers: int | None = Query(None, description="Lower bound on speaker count"),
+    max_speakers: int | None = Query(None, description="Upper bound on speaker count"),
+    enable_word_timestamps: bool = Query(
+        True, description="Include per-word timestamps (alignment stage)"
+    ),
+    priority: str = Query(
+        "normal",
+        description="Queue class: `high` jobs start before queued `normal` ones",
+    ),
+) -> dict[str, Any]:
+    """Re-run a stored meeting with new parameters, reusing saved stages.
+
+    Only stages the new parameters invalidate are recomputed — a changed
+    speaker count reruns diarize alone on top of the saved ASR and
+    alignment. Returns a job handle like POST /transcribe/meeting; on
+    success the stored analysis is replaced.
+    """
+    available, reason = check_meeting_availability(config)
+    if not available:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "meeting_unavailable", "reason": reason},
+        )
+    _validate_speaker_range(num_speakers, min_speakers, max_speakers)
+    priority_class = _parse_priority(priority)
+
+    from app.api.meeting_history import _load_stage_outputs
+
+    row, stages = _load_stage_outputs(meeting_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail={"error": "meeting_not_found"})
+    rerun = stages_to_rerun(
+        stages,
         num_speakers=num_speakers,
         min_speakers=min_speakers,
         max_speakers=max_speakers,
         enable_word_timestamps=enable_word_timestamps,
-        fast=fast,
-        backend=backend,
-        filename=filename,
+    )
+    if "asr" in rerun:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "error": "stages_unavailable",
+                "reason": "meeting has no saved stage outputs; submit it again",
+            },
+        )
+    audio_path: Path | None = None
+    if rerun:
+        # Recomputed stages need the waveform: decode the audio the PWA
+        # attached via POST /v1/meetings/{id}/audio.
+        if not row.audio_path or not Path(row.audio_path).exists():
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "error": "audio_unavailable",
+                    "reason": f"recomputing {', '.join(rerun)} needs the "
+                    "meeting audio; upload it first",
+                },
+            )
+        audio_path = _convert_audio(Path(row.audio_path))
+
+    store = _get_store(request)
+    analyzer = _get_or_create_analyzer(request)
+    job = store.create()
+    params: dict[str, Any] = {
+        "language": None,
+        "num_speakers": num_speakers,
+        "min_speakers": min_speakers,
+        "max_speakers": max_speakers,
+        "enable_word_timestamps": enable_word_timestamps,
+        "filename": row.filename,
+        "meeting_id": meeting_id,
+    }
+    # Journal it like a fresh submission, with the saved stages as its
+    # checkpoint so a resumed job still only recomputes the stale ones. A
+    # re-analysis that recomputes nothing has no audio to spool and is not
+    # journaled.
+    journal: MeetingJobJournal | None = getattr(
+        request.app.state, "meeting_journal", None
+    )
+    if journal is not None and audio_path is not None:
+        audio_path = journal.spool(job.job_id, audio_path)
+        journal.record(
+            job.job_id, audio_path=audio_path, params=params, priority=priority_class
+        )
+        for stage, output in stages.items():
+            journal.checkpoint(job.job_id, stage, output)
+    else:
+        journal = None
+    background_tasks.add_task(
+        _run_queued_meeting_job,
+        request.app.state.job_queue,
+        priority=priority_class,
+        analyzer=analyzer,
+        store=store,
+        job_id=job.job_id,
+        audio_path=audio_path,
+        journal=journal,
+        stages=stages,
+        **params,
     )
     return {
         "job_id": job.job_id,
         "status_url": f"/transcribe/meeting/{job.job_id}",
+        "meeting_id": meeting_id,
+        "rerun": rerun,
     }
 
 
 @router.get("/transcribe/meeting/{job_id}")
-async def get_meeting_status(job_id: str, request: Request) -> dict[str, Any]:
-    """Return the current state of a previously created meeting job."""
+async def get_meeting_status(
+    job_id: str,
+    request: Request,
+    partial_offset: int = Query(0, ge=0),
+) -> dict[str, Any]:
+    """Return the current state of a previously created meeting job.
+
+    `partial_offset` skips partial transcript segments the client already has.
+    """
     available, reason = check_meeting_availability(config)
     if not available:
         raise HTTPException(
@@ -419,7 +855,9 @@ async def get_meeting_status(job_id: str, request: Request) -> dict[str, Any]:
     job = store.get(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail={"error": "job_not_found"})
-    return _job_to_json(job)
+    return _job_to_json(
+        job, getattr(request.app.state, "job_queue", None), partial_offset
+    )
 
 
 @router.delete("/transcribe/meeting/{job_id}", status_code=202)
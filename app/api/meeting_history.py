@@ -7,6 +7,11 @@ limited to `speaker_names` (the only post-write user input). Reads
 serve the PWA history sidebar so it survives the in-memory JobStore
 TTL (default 1h), server restarts, and cross-device access.
 
+Speaker renames double as training data: each renamed speaker's voice
+embedding (from the saved diarize stage output) feeds the speaker profile
+of its new name, and the detail endpoint suggests profile names for the
+speakers of a meeting that are not renamed yet.
+
 Shape mirrors `/v1/sessions` — same pagination cursor (`before_ms`),
 same Depends(get_db), same commit-per-handler discipline.
 """
@@ -33,17 +38,21 @@ from fastapi.responses import FileResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as SASession
 
+from app.api.readiness import require_ready
 from app.api.schemas.meeting_history import (
     MeetingAudioMetaOut,
     MeetingCreate,
     MeetingFull,
     MeetingListResponse,
     MeetingPatch,
+    SpeakerSuggestion,
 )
 from app.config import config
+from app.services import speaker_profiles
 from app.services.persistence import get_db
 from app.services.persistence import meeting_analyses_repo as repo
 from app.services.persistence.models import MeetingAnalysisRow
+from app.services.readiness import COMPONENT_DATABASE
 
 # audio/webm → .webm rather than mimetypes.guess_extension's ".weba".
 # Mirrors `app/api/sessions.py:MIME_TO_EXT`. This is also the
@@ -82,7 +91,11 @@ def _validate_meeting_id(meeting_id: str) -> None:
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/v1/meetings", tags=["meetings"])
+router = APIRouter(
+    prefix="/v1/meetings",
+    tags=["meetings"],
+    dependencies=[require_ready(COMPONENT_DATABASE)],
+)
 
 
 def _row_to_full(row: MeetingAnalysisRow) -> MeetingFull:
@@ -138,7 +151,20 @@ def get_meeting(
     row = repo.get_meeting_analysis(db, meeting_id)
     if row is None:
         raise HTTPException(status_code=404, detail="meeting not found")
-    return _row_to_full(row)
+    full = _row_to_full(row)
+    if config.MEETING_SPEAKER_MATCH_PERCENT > 0:
+        renamed = {label for label, name in full.speaker_names.items() if name}
+        matches = speaker_profiles.suggest_names(
+            db,
+            _speaker_embeddings(db, meeting_id),
+            min_similarity=config.MEETING_SPEAKER_MATCH_PERCENT / 100,
+            exclude=renamed,
+        )
+        full.speaker_suggestions = {
+            label: SpeakerSuggestion(name=m.name, similarity=m.similarity)
+            for label, m in matches.items()
+        }
+    return full
 
 
 @router.post("", response_model=MeetingFull, status_code=201)
@@ -185,12 +211,21 @@ def patch_meeting(
         )
         if row is None:
             raise HTTPException(status_code=404, detail="meeting not found")
+        # Renames are how speaker profiles are learned: each renamed
+        # label's voice embedding joins the profile of its new name.
+        speaker_profiles.learn_speaker_names(
+            db,
+            meeting_id,
+            body.speaker_names,
+            _speaker_embeddings(db, meeting_id),
+        )
     if body.filename is not None:
         row = repo.update_filename(db, meeting_id, body.filename.strip())
         if row is None:
             raise HTTPException(status_code=404, detail="meeting not found")
     assert row is not None
     db.commit()
+    speaker_profiles.invalidate_index()
     return _row_to_full(row)
 
 
@@ -203,9 +238,14 @@ def delete_meeting(
     # is a sidecar file, not an FK).
     row = repo.get_meeting_analysis(db, meeting_id)
     audio_path = row.audio_path if row is not None else None
+    if row is not None:
+        # Samples would cascade away with the row; drop them first so
+        # the centroids they fed are recomputed.
+        speaker_profiles.forget_meeting(db, meeting_id)
     if not repo.delete_meeting_analysis(db, meeting_id):
         raise HTTPException(status_code=404, detail="meeting not found")
     db.commit()
+    speaker_profiles.invalidate_index()
     if audio_path:
         try:
             Path(audio_path).unlink(missing_ok=True)
@@ -334,6 +374,21 @@ def stream_meeting_audio(
     )
 
 
+def _speaker_embeddings(db: SASession, meeting_id: str) -> dict[str, list[float]]:
+    """Per-speaker voice embeddings from the meeting's saved diarize stage
+    output; {} for meetings without one (older or client-created rows)."""
+    for out in repo.list_stage_outputs(db, meeting_id):
+        if out.stage == "diarize":
+            try:
+                return speaker_profiles.diarize_embeddings(json.loads(out.output_json))
+            except (json.JSONDecodeError, TypeError):
+                logger.exception(
+                    "Corrupt diarize output on meeting_stage_outputs.meeting_id=%s",
+                    meeting_id,
+                )
+    return {}
+
+
 def _persist_completed_job(
     *,
     job_id: str,
@@ -342,6 +397,7 @@ def _persist_completed_job(
     duration_seconds: float | None,
     language: str | None,
     speakers_count: int | None,
+    stage_outputs: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     """Worker-side helper called from `_run_meeting_job` after success.
 
@@ -349,7 +405,8 @@ def _persist_completed_job(
     the in-memory JobStore still has the result for the next poll.
     Lives here so `app/api/meeting.py` doesn't have to import the DB
     layer directly (matches the imports-at-callsite pattern in
-    sessions.py).
+    sessions.py). `stage_outputs` (stage checkpoints) are stored with
+    the analysis for later re-analysis.
     """
     from app.services.persistence.engine import SessionLocal
 
@@ -364,6 +421,8 @@ def _persist_completed_job(
                 language=language,
                 speakers_count=speakers_count,
             )
+            for stage, output in (stage_outputs or {}).items():
+                repo.save_stage_output(db, job_id, stage, json.dumps(output))
             db.commit()
     except IntegrityError:
         # Same job_id persisted twice — should not happen in practice
@@ -372,3 +431,77 @@ def _persist_completed_job(
         logger.warning("meeting_analyses row already exists for %s", job_id)
     except Exception:  # noqa: BLE001 — best-effort persistence
         logger.exception("Failed to persist meeting_analyses row %s", job_id)
+
+
+def _load_stage_outputs(
+    meeting_id: str,
+) -> tuple[MeetingAnalysisRow | None, dict[str, dict[str, Any]]]:
+    """The analysis row (None if unknown) and its saved stage outputs,
+    for `POST /v1/meetings/{id}/reanalyze`. Corrupt outputs are skipped,
+    which just means that stage is recomputed."""
+    from app.services.persistence.engine import SessionLocal
+
+    with SessionLocal() as db:
+        row = repo.get_meeting_analysis(db, meeting_id)
+        if row is None:
+            return None, {}
+        stages: dict[str, dict[str, Any]] = {}
+        for out in repo.list_stage_outputs(db, meeting_id):
+            try:
+                stages[out.stage] = json.loads(out.output_json)
+            except (json.JSONDecodeError, TypeError):
+                logger.exception(
+                    "Corrupt %s output on meeting_stage_outputs.meeting_id=%s",
+                    out.stage,
+                    meeting_id,
+                )
+        return row, stages
+
+
+def _persist_reanalysis(
+    *,
+    meeting_id: str,
+    result_obj: dict[str, Any],
+    duration_seconds: float | None,
+    language: str | None,
+    speakers_count: int | None,
+    stage_outputs: dict[str, dict[str, Any]],
+) -> None:
+    """Worker-side helper: overwrite a re-analysed meeting's result and
+    stage outputs. Speaker renames are dropped when diarization changed,
+    since `SPEAKER_00` may now be somebody else. Best-effort, like
+    `_persist_completed_job`."""
+    from app.services.persistence.engine import SessionLocal
+
+    try:
+        with SessionLocal() as db:
+            previous = {
+                out.stage: out.output_json
+                for out in repo.list_stage_outputs(db, meeting_id)
+            }
+            diarize = stage_outputs.get("diarize")
+            reset = diarize is not None and json.dumps(diarize) != previous.get(
+                "diarize"
+            )
+            if (
+                repo.update_result(
+                    db,
+                    meeting_id,
+                    result_json=json.dumps(result_obj),
+                    duration_seconds=duration_seconds,
+                    language=language,
+                    speakers_count=speakers_count,
+                    reset_speaker_names=reset,
+                )
+                is None
+            ):
+                logger.warning("Re-analysed meeting %s no longer exists", meeting_id)
+                return
+            if reset:
+                speaker_profiles.forget_meeting(db, meeting_id)
+            for stage, output in stage_outputs.items():
+                repo.save_stage_output(db, meeting_id, stage, json.dumps(output))
+            db.commit()
+        speaker_profiles.invalidate_index()
+    except Exception:  # noqa: BLE001 — best-effort persistence
+        logger.exception("Failed to persist re-analysis of meeting %s", meeting_id)
@@ -0,0 +1,68 @@
+"""Prometheus scrape endpoint and the request-latency middleware.
+
+Routes:
+  - GET /metrics — every series in `app.services.metrics`, text format 0.0.4
+
+`MetricsMiddleware` times each HTTP request from the first ASGI call to the
+last body chunk and records it under the matched route *template* (e.g.
+`/transcribe/jobs/{job_id}`), so path parameters never explode label
+cardinality; requests that match no route are recorded as `unmatched`.
+It is a plain ASGI middleware rather than `BaseHTTPMiddleware` so streaming
+(`/ask?stream=true`) and WebSocket traffic pass through untouched.
+
+Both are switched off by `METRICS_ENABLED=false`. No authentication is
+enforced (same as `/status`); scrape it from inside the trust boundary.
+"""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import config
+from app.services.metrics import CONTENT_TYPE, REQUEST_SECONDS, refresh_gauges, registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(request: Request) -> PlainTextResponse:
+    if not config.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    refresh_gauges(request.app.state)
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+
+class MetricsMiddleware:
+    """Record `whisper_wrap_request_duration_seconds` for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not config.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                route=route,
+                method=scope["method"],
+                status=str(status),
+            )
@@ -0,0 +1,116 @@
+"""Model residency admin — list, preload, activate, and unload registry models.
+
+Routes:
+  - GET /models                     — pool snapshot (every registry model with
+                                      its state: resident / loading / failed /
+                                      available)
+  - POST /models/{name}/load        — load in the background (HTTP 202)
+  - POST /models/{name}/activate    — make it the default without downtime:
+                                      the current default keeps serving until
+                                      the new model is loaded (HTTP 202)
+  - DELETE /models/{name}           — unload a non-default resident model
+
+Per-request selection does not need these: `?model=` on /transcribe and
+/listen and the OpenAI `model` field load a registry model on demand. No
+authentication is enforced (same as the rest of the API).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.api.readiness import require_ready
+from app.services._whisper_backend import WhisperBackend, WhisperLoadError
+from app.services.model_pool import (
+    ModelPool,
+    ModelPoolFullError,
+    UnknownModelError,
+    resolve_backend,
+)
+from app.services.readiness import COMPONENT_MODEL
+
+router = APIRouter(dependencies=[require_ready(COMPONENT_MODEL)])
+
+
+def _pool(request: Request) -> ModelPool:
+    pool = getattr(request.app.state, "model_pool", None)
+    if pool is None:
+        raise HTTPException(status_code=503, detail={"error": "model_pool_unavailable"})
+    return pool
+
+
+def _unknown(name: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={"error": "unknown_model", "model": name},
+    )
+
+
+async def backend_for_request(state, model: str | None) -> WhisperBackend:
+    """`resolve_backend` with pool failures mapped to HTTP errors."""
+    try:
+        return await resolve_backend(state, model)
+    except UnknownModelError:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "unknown_model", "model": model},
+        ) from None
+    except ModelPoolFullError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"error": "model_pool_full", "model": model, "message": str(e)},
+        ) from e
+    except WhisperLoadError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "model_load_failed", "model": model, "message": str(e)},
+        ) from e
+
+
+@router.get("/models")
+async def list_models(request: Request) -> dict[str, Any]:
+    return _pool(request).snapshot()
+
+
+@router.post("/models/{name}/load", status_code=202)
+async def load_model(name: str, request: Request) -> dict[str, Any]:
+    pool = _pool(request)
+    if pool.resident(name) is not None:
+        return {"model": name, "state": "resident"}
+    try:
+        pool.load_in_background(name)
+    except UnknownModelError:
+        raise _unknown(name) from None
+    return {"model": name, "state": "loading"}
+
+
+@router.post("/models/{name}/activate", status_code=202)
+async def activate_model(name: str, request: Request) -> dict[str, Any]:
+    pool = _pool(request)
+    if name == pool.default_name:
+        return {"model": name, "state": "active"}
+    try:
+        pool.activate_in_background(name)
+    except UnknownModelError:
+        raise _unknown(name) from None
+    return {"model": name, "state": "activating"}
+
+
+@router.delete("/models/{name}", status_code=204)
+async def unload_model(name: str, request: Request) -> Response:
+    pool = _pool(request)
+    try:
+        unloaded = pool.unload(name)
+    except ModelPoolFullError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"error": "model_is_default", "message": str(e)},
+        ) from e
+    if not unloaded:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "model_not_resident", "model": name},
+        )
+    return Response(status_code=204)
@@ -14,23 +14,40 @@ a separate inference path.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
-from fastapi import APIRouter, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Request, Response
 from fastapi.responses import JSONResponse, PlainTextResponse
 from starlette.datastructures import UploadFile
 
+from app.api.readiness import require_ready
+from app.api.transcribe_jobs import (
+    JobOutput,
+    job_backend,
+    job_priority,
+    run_transcription_job,
+    submit_job_response,
+)
 from app.config import config
 from app.services import auto_session_logger
+from app.services._whisper_backend import WhisperLoadError
 from app.services.converter import audio_converter
 from app.services.files import file_manager
+from app.services.metrics import observe_inference, timed_stage
+from app.services.model_pool import ModelPoolFullError, resolve_backend
 from app.services.postprocess import Drop, Keep, filter_empty_transcription
+from app.services.readiness import COMPONENT_DATABASE, COMPONENT_MODEL
+from app.services.scheduler import PRIORITY_INTERACTIVE, scheduled
 from app.services.subtitle_format import format_srt, format_vtt
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[require_ready(COMPONENT_MODEL, COMPONENT_DATABASE)])
 
 ACCEPTED_RESPONSE_FORMATS = ("json", "text", "srt", "verbose_json", "vtt")
 
@@ -45,6 +62,9 @@ def _resolve_active_model_name(state) -> str:
     """Mirror of `app.api.status._resolve_model_name` — when MODEL_DIR overrides
     the registry lookup we report the override path; otherwise the registry
     key (which is what /status surfaces too)."""
+    pool = getattr(state, "model_pool", None)
+    if pool is not None and pool.default_name:
+        return pool.default_name
     if config.MODEL_DIR:
         return getattr(state, "model_dir", "") or ""
     return config.MODEL_NAME
@@ -141,7 +161,8 @@ def _log_model_field(received: str, active: str) -> None:
 async def _read_multipart_fields(request: Request) -> dict:
     """Pull file + form fields from a multipart body. Returns a dict shaped
     `{"file": UploadFile|None, "model": str|None, "language": str|None,
-       "prompt": str|None, "response_format": str|None, "temperature": str|None}`.
+       "prompt": str|None, "response_format": str|None, "temperature": str|None,
+       "batched": str|None, "async": str|None}`.
 
     Returns None for fields the client omitted. Raises ValueError if the body
     is not multipart at all (caller maps to 400)."""
@@ -157,11 +178,193 @@ async def _read_multipart_fields(request: Request) -> dict:
         "prompt": form.get("prompt"),
         "response_format": form.get("response_format"),
         "temperature": form.get("temperature"),
+        "batched": form.get("batched"),
+        "async": form.get("async"),
+    }
+
+
+def _parse_bool_field(raw: str | None, *, param: str) -> bool | None:
+    """Parse a whisper-wrap extension form field ("true"/"false").
+
+    Extensions are not part of the OpenAI schema: `batched` overrides
+    CT2_DECODE_MODE and `async` switches to the 202 + job-handle flow.
+    Clients that never send them get the OpenAI behaviour. Raises
+    ValueError on unrecognised values.
+    """
+    if raw is None or raw == "":
+        return None
+    lowered = raw.strip().lower()
+    if lowered in ("true", "1", "yes", "on"):
+        return True
+    if lowered in ("false", "0", "no", "off"):
+        return False
+    raise ValueError(f"Invalid {param} value {raw!r}. Accepted values: true, false.")
+
+
+def _endpoint_path(task: str) -> str:
+    return f"/v1/audio/{'translations' if task == 'translate' else 'transcriptions'}"
+
+
+async def _infer_and_render(
+    whisper,
+    temp_wav: Path,
+    *,
+    task: str,
+    fields: dict,
+    response_format: str,
+    batched: bool | None,
+    body: bytes,
+    audio_mime_type: str,
+) -> Response:
+    """Run inference on a converted WAV and render the OpenAI-shaped response.
+
+    Shared by the synchronous path and `async=true` jobs.
+    """
+    language = fields["language"] if task == "transcribe" else None
+    transcribe_kwargs: dict = {
+        "language": language or "auto",
+        "initial_prompt": fields["prompt"],
     }
+    if task == "translate":
+        transcribe_kwargs["task"] = "translate"
+    if batched is not None:
+        transcribe_kwargs["batched"] = batched
+    endpoint_path = _endpoint_path(task)
+    inference_start = time.perf_counter()
+    result = await whisper.transcribe(temp_wav, **transcribe_kwargs)
+    observe_inference(
+        endpoint_path,
+        time.perf_counter() - inference_start,
+        getattr(result, "duration_seconds", None),
+    )
+
+    if task == "translate":
+        language_field = "en"
+    else:
+        language_field = language if language else getattr(result, "language", "en")
+
+    # Post-process filter: collapse to per-format empty shapes when the
+    # backend produces noise. The OpenAI response schema is preserved
+    # exactly (no custom fields) so third-party clients keep parsing.
+    with timed_stage(endpoint_path, "postprocess"):
+        decision = filter_empty_transcription(
+            text=result.text,
+            duration_ms=None,
+            enabled=config.FILTER_EMPTY_ENABLED,
+            min_duration_ms=config.FILTER_MIN_DURATION_MS,
+        )
+    if isinstance(decision, Drop):
+        logger.info(
+            "transcription_filtered",
+            extra={
+                "endpoint": endpoint_path,
+                "reason": decision.reason,
+                "response_format": response_format,
+                "raw_text_len": len(result.text),
+            },
+        )
+        return _empty_response_for_format(
+            response_format,
+            task=task,
+            language=language_field,
+            duration=float(getattr(result, "duration_seconds", 0.0)),
+        )
+    assert isinstance(decision, Keep)
+    result_text = decision.text
+
+    # Auto-log: OpenAI compat endpoints SHALL NOT alter their response
+    # schema (third-party SDKs hard-code field names), so the session id
+    # is logged as a side effect only — never returned to the caller.
+    # Failures are swallowed by the logger. Persist the raw audio so
+    # third-party tooling (Shortcut, openai-py, etc.) gets the same
+    # waveform + Re-transcribe affordance the PWA enjoys.
+    compat_duration_s = getattr(result, "duration_seconds", 0.0) or 0.0
+    with timed_stage(endpoint_path, "db_write"):
+        auto_session_logger.log_transcribe_session(
+            transcript=result_text,
+            duration_ms=int(compat_duration_s * 1000) if compat_duration_s else None,
+            audio_blob=body,
+            audio_mime_type=audio_mime_type,
+        )
+
+    if response_format == "json":
+        return JSONResponse(content={"text": result_text})
+
+    if response_format == "text":
+        return PlainTextResponse(
+            content=result_text,
+            media_type="text/plain; charset=utf-8",
+        )
+
+    if response_format == "srt":
+        srt_segments = [
+            (float(s.start), float(s.end), s.text) for s in result.segments
+        ]
+        return PlainTextResponse(
+            content=format_srt(srt_segments),
+            media_type="text/plain; charset=utf-8",
+        )
+
+    if response_format == "vtt":
+        vtt_segments = [
+            (float(s.start), float(s.end), s.text) for s in result.segments
+        ]
+        return Response(
+            content=format_vtt(vtt_segments),
+            media_type="text/vtt; charset=utf-8",
+        )
+
+    # verbose_json
+    return JSONResponse(
+        content={
+            "task": task,
+            "language": language_field,
+            "duration": float(getattr(result, "duration_seconds", 0.0)),
+            "text": result_text,
+            "segments": _segments_to_verbose_json(result.segments),
+        }
+    )
+
+
+def _submit_async_job(
+    state,
+    background_tasks: BackgroundTasks,
+    temp_wav: Path,
+    render: Callable[..., Awaitable[Response]],
+    backend,
+) -> JSONResponse:
+    """Queue `render` as an async transcription job and return HTTP 202.
+
+    The job keeps the rendered body and media type, so
+    GET /transcribe/jobs/{id}/result replays exactly what the synchronous
+    call would have returned (srt / vtt / text / json).
+    """
+    job = state.transcribe_jobs.create()
+    priority = job_priority(temp_wav)
+
+    async def work() -> JobOutput:
+        response = await render(job_backend(state, priority, backend))
+        text = response.body.decode("utf-8")
+        media_type = response.media_type or "application/json"
+        if media_type.startswith("application/json"):
+            return JobOutput(content=json.loads(text), media_type=media_type)
+        return JobOutput(content=text, media_type=media_type)
+
+    background_tasks.add_task(
+        run_transcription_job,
+        store=state.transcribe_jobs,
+        queue=state.job_queue,
+        job_id=job.job_id,
+        priority=priority,
+        work=work,
+        wav_path=temp_wav,
+    )
+    return JSONResponse(status_code=202, content=submit_job_response(job))
 
 
 async def _transcribe_or_translate(
     request: Request,
+    background_tasks: BackgroundTasks,
     *,
     task: str,
 ) -> Response:
@@ -214,11 +417,36 @@ async def _transcribe_or_translate(
             param="language",
         )
 
+    try:
+        batched = _parse_bool_field(fields["batched"], param="batched")
+    except ValueError as e:
+        return _openai_error(status_code=400, message=str(e), param="batched")
+    try:
+        run_async = bool(_parse_bool_field(fields["async"], param="async"))
+    except ValueError as e:
+        return _openai_error(status_code=400, message=str(e), param="async")
+
     state = request.app.state
     active_model = _resolve_active_model_name(state)
-    _log_model_field(model, active_model)
+    pool = getattr(state, "model_pool", None)
+    if pool is not None and model != active_model and pool.is_known(model):
+        # A whisper-wrap registry name: route to that model (loaded on demand).
+        try:
+            backend = await resolve_backend(state, model)
+        except (ModelPoolFullError, WhisperLoadError) as e:
+            return _openai_error(
+                status_code=503,
+                message=f"Model {model!r} is not available: {e}",
+                param="model",
+                error_type="server_error",
+            )
+    else:
+        _log_model_field(model, active_model)
+        backend = state.whisper
 
-    body = await upload.read()
+    endpoint_path = _endpoint_path(task)
+    with timed_stage(endpoint_path, "upload_read"):
+        body = await upload.read()
     if not body:
         return _openai_error(
             status_code=400,
@@ -242,7 +470,9 @@ async def _transcribe_or_translate(
                 param="file",
             )
 
-        if not file_manager.is_audio_file(temp_input):
+        with timed_stage(endpoint_path, "mime_sniff"):
+            is_audio = file_manager.is_audio_file(temp_input)
+        if not is_audio:
             detected_mime = file_manager.detect_mime_type(temp_input)
             return _openai_error(
                 status_code=415,
@@ -250,103 +480,27 @@ async def _transcribe_or_translate(
                 param="file",
             )
 
-        temp_wav = audio_converter.convert_to_wav(temp_input)
-
-        whisper = state.whisper
-        language = fields["language"] if task == "transcribe" else None
-        transcribe_kwargs: dict = {
-            "language": language or "auto",
-            "initial_prompt": fields["prompt"],
-        }
-        if task == "translate":
-            transcribe_kwargs["task"] = "translate"
-        result = await whisper.transcribe(temp_wav, **transcribe_kwargs)
-
-        if task == "translate":
-            language_field = "en"
-        else:
-            language_field = language if language else getattr(result, "language", "en")
-
-        # Post-process filter: collapse to per-format empty shapes when the
-        # backend produces noise. The OpenAI response schema is preserved
-        # exactly (no custom fields) so third-party clients keep parsing.
-        decision = filter_empty_transcription(
-            text=result.text,
-            duration_ms=None,
-            enabled=config.FILTER_EMPTY_ENABLED,
-            min_duration_ms=config.FILTER_MIN_DURATION_MS,
-        )
-        if isinstance(decision, Drop):
-            endpoint_path = f"/v1/audio/{'translations' if task == 'translate' else 'transcriptions'}"
-            logger.info(
-                "transcription_filtered",
-                extra={
-                    "endpoint": endpoint_path,
-                    "reason": decision.reason,
-                    "response_format": response_format,
-                    "raw_text_len": len(result.text),
-                },
-            )
-            return _empty_response_for_format(
-                response_format,
-                task=task,
-                language=language_field,
-                duration=float(getattr(result, "duration_seconds", 0.0)),
-            )
-        assert isinstance(decision, Keep)
-        result_text = decision.text
-
-        # Auto-log: OpenAI compat endpoints SHALL NOT alter their response
-        # schema (third-party SDKs hard-code field names), so the session id
-        # is logged as a side effect only — never returned to the caller.
-        # Failures are swallowed by the logger. Persist the raw audio so
-        # third-party tooling (Shortcut, openai-py, etc.) gets the same
-        # waveform + Re-transcribe affordance the PWA enjoys.
-        compat_duration_s = getattr(result, "duration_seconds", 0.0) or 0.0
-        auto_session_logger.log_transcribe_session(
-            transcript=result_text,
-            duration_ms=int(compat_duration_s * 1000) if compat_duration_s else None,
-            audio_blob=body,
+        with timed_stage(endpoint_path, "convert"):
+            temp_wav = audio_converter.convert_to_wav(temp_input)
+
+        render = functools.partial(
+            _infer_and_render,
+            temp_wav=temp_wav,
+            task=task,
+            fields=fields,
+            response_format=response_format,
+            batched=batched,
+            body=body,
             audio_mime_type=upload.content_type or "application/octet-stream",
         )
-
-        if response_format == "json":
-            return JSONResponse(content={"text": result_text})
-
-        if response_format == "text":
-            return PlainTextResponse(
-                content=result_text,
-                media_type="text/plain; charset=utf-8",
-            )
-
-        if response_format == "srt":
-            srt_segments = [
-                (float(s.start), float(s.end), s.text) for s in result.segments
-            ]
-            return PlainTextResponse(
-                content=format_srt(srt_segments),
-                media_type="text/plain; charset=utf-8",
+        if run_async:
+            response = _submit_async_job(
+                state, background_tasks, temp_wav, render, backend
             )
-
-        if response_format == "vtt":
-            vtt_segments = [
-                (float(s.start), float(s.end), s.text) for s in result.segments
-            ]
-            return Response(
-                content=format_vtt(vtt_segments),
-                media_type="text/vtt; charset=utf-8",
-            )
-
-        # verbose_json
-        return JSONResponse(
-            content={
-                "task": task,
-                "language": language_field,
-                "duration": float(getattr(result, "duration_seconds", 0.0)),
-                "text": result_text,
-                "segments": _segments_to_verbose_json(result.segments),
-            }
-        )
+            # The background job owns the converted WAV from here on.
+            temp_wav = None
+            return response
+        return await render(scheduled(state, PRIORITY_INTERACTIVE, backend))
 
     except Exception:  # noqa: BLE001
         logger.exception("openai-compat: backend failure during %s", task)
@@ -364,28 +518,40 @@ async def _transcribe_or_translate(
 
 
 @router.post("/v1/audio/transcriptions")
-async def transcriptions(request: Request) -> Response:
-    return await _transcribe_or_translate(request, task="transcribe")
+async def transcriptions(request: Request, background_tasks: BackgroundTasks) -> Response:
+    return await _transcribe_or_translate(request, background_tasks, task="transcribe")
 
 
 @router.post("/v1/audio/translations")
-async def translations(request: Request) -> Response:
-    return await _transcribe_or_translate(request, task="translate")
+async def translations(request: Request, background_tasks: BackgroundTasks) -> Response:
+    return await _transcribe_or_translate(request, background_tasks, task="translate")
 
 
 @router.get("/v1/models")
 async def models(request: Request) -> Response:
     state = request.app.state
+    active = _resolve_active_model_name(state)
+    created = int(getattr(state, "lifespan_completed_at", 0.0))
+    # Active model first, then any other resident model a client may select.
+    ids = [active]
+    pool = getattr(state, "model_pool", None)
+    if pool is not None:
+        ids += [
+            m["name"]
+            for m in pool.snapshot()["models"]
+            if m["state"] == "resident" and m["name"] != active
+        ]
     return JSONResponse(
         content={
             "object": "list",
             "data": [
                 {
-                    "id": _resolve_active_model_name(state),
+                    "id": model_id,
                     "object": "model",
-                    "created": int(getattr(state, "lifespan_completed_at", 0.0)),
+                    "created": created,
                     "owned_by": "whisper-wrap",
                 }
+                for model_id in ids
             ],
         }
     )
@@ -0,0 +1,112 @@
+"""Profiling admin routes and the per-request `X-Profile` trigger.
+
+Routes (404 unless `PROFILING_ENABLED=true`):
+  - POST /profiling/start?seconds=N — profile the whole process for N
+                                      seconds (capped at PROFILE_MAX_SECONDS);
+                                      HTTP 202 with the profile name
+  - GET  /profiling                 — captures in progress + written profiles
+  - GET  /profiling/{name}          — download one collapsed-stack profile
+
+`ProfilingMiddleware` starts a capture for any HTTP request or WebSocket
+session that carries `X-Profile: true` and closes it when the response (or
+session) ends. HTTP responses name the profile in `X-Profile-Id`.
+
+No authentication is enforced (same as the rest of the API); the feature is
+off by default because profiles expose code paths and file names.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import config
+from app.services.profiling import SamplingProfiler
+
+router = APIRouter()
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+def _profiler(state) -> SamplingProfiler | None:
+    if not config.PROFILING_ENABLED:
+        return None
+    return getattr(state, "profiler", None)
+
+
+def _require_profiler(request: Request) -> SamplingProfiler:
+    profiler = _profiler(request.app.state)
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return profiler
+
+
+@router.post("/profiling/start", status_code=202)
+def start_profile(
+    request: Request,
+    seconds: float = Query(30.0, gt=0, description="Capture length in seconds"),
+) -> dict[str, Any]:
+    profiler = _require_profiler(request)
+    capture = profiler.start("global", seconds=seconds)
+    return {
+        "profile": capture.name,
+        "seconds": round(capture.deadline - capture.started_at, 1),
+    }
+
+
+@router.get("/profiling")
+def list_profiles(request: Request) -> dict[str, Any]:
+    profiler = _require_profiler(request)
+    return {
+        "interval_ms": round(profiler.interval * 1000, 1),
+        "max_seconds": profiler.max_seconds,
+        "active": profiler.active(),
+        "profiles": profiler.list_profiles(),
+    }
+
+
+@router.get("/profiling/{name}")
+def download_profile(request: Request, name: str) -> FileResponse:
+    path = _require_profiler(request).path_for(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Profile {name!r} not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=name)
+
+
+class ProfilingMiddleware:
+    """Profile requests / sessions that opt in with `X-Profile: true`."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        profiler = _profiler(scope["app"].state)
+        flag = Headers(scope=scope).get(PROFILE_HEADER, "")
+        if profiler is None or flag.strip().lower() not in ("1", "true", "yes", "on"):
+            await self.app(scope, receive, send)
+            return
+
+        capture = profiler.start(f"{scope['type']} {scope['path']}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (PROFILE_ID_HEADER.lower().encode(), capture.name.encode())
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await asyncio.to_thread(profiler.stop, capture)
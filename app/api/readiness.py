@@ -0,0 +1,57 @@
+"""Route dependency that holds requests until their startup components are ready.
+
+Attached per router in `app.main` (`dependencies=[require_ready(...)]`). With
+`STARTUP_MODE=eager` every component is ready before the first request, so
+the check is a dict lookup. With `STARTUP_MODE=lazy` a request arriving
+mid-startup waits up to `STARTUP_WAIT_SECONDS` for what it needs, then gets
+HTTP 503 with `Retry-After` (WebSockets are closed with 1013 "try again
+later"). A component that failed to load answers 503 without `Retry-After`.
+"""
+
+from __future__ import annotations
+
+from fastapi import Depends, HTTPException, WebSocketException
+from starlette.requests import HTTPConnection
+
+from app.config import config
+from app.services.readiness import (
+    RETRY_AFTER_SECONDS,
+    ComponentNotReadyError,
+    Readiness,
+)
+
+# RFC 6455 §7.4.1 (IANA registry): "Try Again Later".
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+def require_ready(*components: str):
+    """`Depends(...)` that waits for every named startup component."""
+
+    async def _wait(connection: HTTPConnection) -> None:
+        readiness: Readiness | None = getattr(connection.app.state, "readiness", None)
+        if readiness is None:
+            return
+        try:
+            for name in components:
+                await readiness.wait(name, timeout=config.STARTUP_WAIT_SECONDS)
+        except ComponentNotReadyError as e:
+            if connection.scope["type"] == "websocket":
+                raise WebSocketException(
+                    code=CLOSE_TRY_AGAIN_LATER, reason=str(e)[:120]
+                ) from e
+            if e.failed:
+                raise HTTPException(
+                    status_code=503,
+                    detail={
+                        "error": "component_failed",
+                        "component": e.component,
+                        "message": e.error,
+                    },
+                ) from e
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "not_ready", "component": e.component},
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            ) from e
+
+    return Depends(_wait)
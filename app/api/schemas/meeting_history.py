@@ -55,6 +55,13 @@ class MeetingPatch(BaseModel):
     filename: str | None = Field(default=None, min_length=1, max_length=256)
 
 
+class SpeakerSuggestion(BaseModel):
+    """A learned speaker profile whose voice matches a meeting speaker."""
+
+    name: str
+    similarity: float
+
+
 class MeetingFull(BaseModel):
     """Detail / list-row response shape."""
 
@@ -68,6 +75,10 @@ class MeetingFull(BaseModel):
     speakers_count: int | None = None
     result: dict[str, Any]
     speaker_names: dict[str, str] = Field(default_factory=dict)
+    # Detail endpoint only: names suggested for speakers not yet renamed,
+    # from voice similarity to speaker profiles learned from earlier
+    # renames (see app.services.speaker_profiles).
+    speaker_suggestions: dict[str, SpeakerSuggestion] = Field(default_factory=dict)
     status: str
     # Audio metadata — null until the client uploads via POST
     # /v1/meetings/{id}/audio. `audio_path` is the server-side disk
@@ -11,6 +11,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session as SASession
 
+from app.api.readiness import require_ready
 from app.api.schemas.sessions import (
     ActionRunIn,
     ActionRunOut,
@@ -25,10 +26,15 @@ from app.api.schemas.sessions import (
 )
 from app.config import config
 from app.services.persistence import get_db, sessions_repo
+from app.services.readiness import COMPONENT_DATABASE
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/v1/sessions", tags=["sessions"])
+router = APIRouter(
+    prefix="/v1/sessions",
+    tags=["sessions"],
+    dependencies=[require_ready(COMPONENT_DATABASE)],
+)
 
 
 # audio/webm → .webm rather than mimetypes.guess_extension's ".weba"; hardcoded
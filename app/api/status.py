@@ -1,9 +1,13 @@
 """GET /status and GET / — service introspection.
 
 `/status` reports rich server + model + LLM configuration so operators can
-distinguish multiple deployments (Mac mini vs GPU server) at a glance. Because
-the lifespan blocks app startup until the model is loaded, `/status` always
-returns `status="ok"` with `model.loaded=true`.
+distinguish multiple deployments (Mac mini vs GPU server) at a glance. With
+the default eager startup every component is loaded before the first request,
+so it reports `status="ok"` with `model.loaded=true`. With
+`STARTUP_MODE=lazy` it answers immediately: `status` is `"starting"` until
+every component in `startup.components` is ready (`"degraded"` if one
+failed), and blocks fed by a component that has not loaded yet fall back to
+configured values.
 
 `/` returns a tiny endpoint catalogue for API discovery.
 """
@@ -15,16 +19,21 @@ from fastapi import APIRouter, Request
 
 from app import __version__
 from app.config import config
+from app.services.memory import process_memory
+from app.services.readiness import COMPONENT_MODEL, STATE_FAILED
 
 router = APIRouter()
 
 
-def _resolve_model_name(model_dir: str) -> str:
+def _resolve_model_name(model_dir: str, pool=None) -> str:
     """Display name shown on /status.
 
     For MODEL_DIR overrides we surface the full path so operators can see exactly
     what was loaded; for MODEL_NAME registry entries we surface the registry key.
+    After a runtime model swap the pool's default name is authoritative.
     """
+    if pool is not None and pool.default_name:
+        return pool.default_name
     if config.MODEL_DIR:
         return model_dir
     return config.MODEL_NAME
@@ -33,6 +42,7 @@ def _resolve_model_name(model_dir: str) -> str:
 @router.get("/status")
 async def status(request: Request) -> dict[str, Any]:
     state = request.app.state
+    readiness = getattr(state, "readiness", None)
     model_dir = getattr(state, "model_dir", None) or ""
     metadata = getattr(state, "backend_metadata", {}) or {}
 
@@ -44,6 +54,9 @@ async def status(request: Request) -> dict[str, Any]:
         backend_block["compute_type"] = metadata.get(
             "compute_type", config.COMPUTE_TYPE
         )
+        backend_block["decode_mode"] = metadata.get(
+            "decode_mode", config.CT2_DECODE_MODE
+        )
     if metadata.get("format") == "ggml":
         if "quant" in metadata:
             backend_block["quant"] = metadata["quant"]
@@ -56,42 +69,81 @@ async def status(request: Request) -> dict[str, Any]:
         _resolve_ct2_dir_for_status,
         check_meeting_availability,
     )
+    from app.api.transcribe_jobs import queue_status
 
     available, _ = check_meeting_availability(config)
+    scheduler = getattr(state, "scheduler", None)
+    language_cache = getattr(state, "language_cache", None)
+    model_pool = getattr(state, "model_pool", None)
     analyzer = getattr(state, "meeting_analyzer", None)
     job_store = getattr(state, "meeting_jobs", None)
+    job_queue = getattr(state, "job_queue", None)
     meeting_block: dict[str, Any] = {
         "available": available,
         "loaded": bool(analyzer and analyzer.loaded),
+        "models": analyzer.resident_models() if analyzer is not None else None,
         "hf_token_configured": bool((config.HF_TOKEN or "").strip()),
         "extras_installed": _extras_installed(),
         "asr_model_dir": _resolve_ct2_dir_for_status(config),
         "active_jobs": job_store.count_by_status("running") if job_store else 0,
         "queued_jobs": job_store.count_by_status("pending") if job_store else 0,
+        # The meeting class of the shared job queue.
+        "pool": (
+            job_queue.snapshot()["classes"]["meeting"]
+            if job_queue is not None
+            else None
+        ),
     }
 
+    startup = readiness.snapshot() if readiness is not None else None
+    llm_client = getattr(state, "llm_client", None)
     return {
-        "status": "ok",
+        "status": _overall_status(startup),
         "version": __version__,
         "uptime_seconds": int(time.time() - state.lifespan_completed_at),
         "model": {
-            "name": _resolve_model_name(model_dir),
+            "name": _resolve_model_name(model_dir, model_pool),
             "path": model_dir,
             "compute_type": config.COMPUTE_TYPE,
             "device": config.DEVICE,
-            "loaded": True,
+            "loaded": readiness is None or readiness.is_ready(COMPONENT_MODEL),
             "load_time_ms": getattr(state, "load_time_ms", 0),
         },
         "backend": backend_block,
+        "model_pool": model_pool.snapshot() if model_pool is not None else None,
         "meeting": meeting_block,
         "vad": {"backend": getattr(state, "vad_backend_name", "rms")},
+        "queue": queue_status(state),
+        "scheduler": scheduler.snapshot() if scheduler is not None else None,
+        "throughput": (
+            scheduler.rtf.snapshot()
+            if scheduler is not None and scheduler.rtf is not None
+            else None
+        ),
+        "language_cache": (
+            language_cache.snapshot() if language_cache is not None else None
+        ),
         "gemini": {
-            "configured": state.llm_client.configured,
-            "model": state.llm_client.model,
+            "configured": (
+                llm_client.configured
+                if llm_client is not None
+                else bool((config.GEMINI_API_KEY or "").strip())
+            ),
+            "model": llm_client.model if llm_client is not None else config.GEMINI_MODEL,
         },
+        "startup": startup,
+        "warmup": getattr(state, "warmup", None),
+        "memory": process_memory(),
     }
 
 
+def _overall_status(startup: dict[str, Any] | None) -> str:
+    if startup is None or startup["ready"]:
+        return "ok"
+    states = {c["state"] for c in startup["components"].values()}
+    return "degraded" if STATE_FAILED in states else "starting"
+
+
 @router.get("/")
 async def root() -> dict[str, Any]:
     return {
@@ -101,6 +153,11 @@ async def root() -> dict[str, Any]:
                 "path": "/transcribe",
                 "description": "Transcribe audio (multipart form, audio/*, or application/octet-stream)",
             },
+            {
+                "method": "GET",
+                "path": "/transcribe/jobs/{job_id}",
+                "description": "Poll an async transcription job (?async=true on /transcribe or /v1/audio/*); /events streams SSE",
+            },
             {
                 "method": "POST",
                 "path": "/transcribe/meeting",
@@ -121,11 +178,26 @@ async def root() -> dict[str, Any]:
                 "path": "/ask",
                 "description": "Audio or text question, Gemini answer (optional ?stream=true for SSE)",
             },
+            {
+                "method": "GET",
+                "path": "/models",
+                "description": "Resident / loadable registry models; POST /models/{name}/load|activate, DELETE /models/{name}",
+            },
             {
                 "method": "GET",
                 "path": "/status",
                 "description": "Service health, loaded model details, and LLM configuration",
             },
+            {
+                "method": "GET",
+                "path": "/metrics",
+                "description": "Prometheus request / per-stage latency and throughput metrics",
+            },
+            {
+                "method": "POST",
+                "path": "/profiling/start",
+                "description": "Sampling profile of the whole process for ?seconds= (PROFILING_ENABLED); GET /profiling lists profiles",
+            },
             {
                 "method": "GET",
                 "path": "/",
@@ -144,7 +216,7 @@ async def root() -> dict[str, Any]:
             {
                 "method": "GET",
                 "path": "/v1/models",
-                "description": "OpenAI-compatible model catalogue (lists the active whisper-wrap model)",
+                "description": "OpenAI-compatible model catalogue (active model first, then other resident models)",
             },
             {
                 "method": "GET",
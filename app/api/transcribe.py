@@ -5,22 +5,44 @@ into a single endpoint that dispatches on Content-Type per the design decision
 "Unify POST /transcribe-raw into POST /transcribe via Content-Type dispatch".
 """
 
+import functools
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from starlette.datastructures import UploadFile
 
+from app.api.models import backend_for_request
+from app.api.readiness import require_ready
+from app.api.transcribe_jobs import (
+    JobOutput,
+    job_backend,
+    job_priority,
+    run_transcription_job,
+    submit_job_response,
+)
 from app.config import config
 from app.services import auto_session_logger
+from app.services._whisper_backend import WhisperBackend
 from app.services.converter import audio_converter
 from app.services.files import file_manager
+from app.services.language import StickyLanguage, sticky_for
+from app.services.longform import transcribe_longform, wav_duration_seconds
+from app.services.metrics import observe_inference, timed_stage
 from app.services.postprocess import Drop, Keep, filter_empty_transcription
+from app.services.readiness import COMPONENT_DATABASE, COMPONENT_MODEL
+from app.services.scheduler import PRIORITY_INTERACTIVE, scheduled
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[require_ready(COMPONENT_MODEL, COMPONENT_DATABASE)])
+
+# `endpoint` label for stage metrics; async jobs report under the same name.
+_METRICS_ENDPOINT = "/transcribe"
 
 
 # Maps a Content-Type seen on a raw audio body to the suffix used for the
@@ -79,9 +101,154 @@ async def _read_raw_audio(request: Request, content_type: str) -> tuple[bytes, s
     return body, suffix
 
 
-@router.post("/transcribe")
+def _use_longform(wav_path: Path, requested: bool | None, *, batched: bool) -> bool:
+    """Per-request `longform` wins; otherwise switch on by WAV duration.
+
+    Batched decoding already VAD-chunks the file inside faster-whisper, so the
+    automatic switch stays off for it — stacking both would only re-split
+    chunks the pipeline is about to split again.
+    """
+    if requested is not None:
+        return requested
+    if batched:
+        return False
+    if config.LONGFORM_MIN_SECONDS <= 0:
+        return False
+    duration = wav_duration_seconds(wav_path)
+    return duration is not None and duration >= config.LONGFORM_MIN_SECONDS
+
+
+async def _transcribe_wav(
+    whisper: WhisperBackend,
+    temp_wav: Path,
+    *,
+    language: str,
+    prompt: str | None,
+    longform: bool | None,
+    batched: bool | None,
+    log: bool,
+    body: bytes,
+    detected_mime: str,
+    sticky: StickyLanguage | None = None,
+) -> dict[str, Any]:
+    """Inference + post-process filter + session logging for a converted WAV.
+
+    Shared by the synchronous response and `?async=true` jobs so both modes
+    produce byte-identical bodies.
+    """
+    requested_language = language
+    if sticky is not None:
+        language = sticky.resolve(language)
+    effective_batched = (
+        batched
+        if batched is not None
+        else getattr(whisper, "decode_mode", None) == "batched"
+    )
+    inference_start = time.perf_counter()
+    if _use_longform(temp_wav, longform, batched=effective_batched):
+        result = await transcribe_longform(
+            whisper,
+            temp_wav,
+            language=language,
+            initial_prompt=prompt,
+            target_seconds=config.LONGFORM_CHUNK_SECONDS,
+            overlap_seconds=config.LONGFORM_OVERLAP_MS / 1000,
+            concurrency=config.LONGFORM_CONCURRENCY,
+            detect_seconds=config.LANGUAGE_DETECT_SECONDS,
+        )
+    else:
+        transcribe_kwargs: dict[str, Any] = {
+            "language": language,
+            "initial_prompt": prompt,
+        }
+        if batched is not None:
+            transcribe_kwargs["batched"] = batched
+        result = await whisper.transcribe(temp_wav, **transcribe_kwargs)
+    observe_inference(
+        _METRICS_ENDPOINT,
+        time.perf_counter() - inference_start,
+        result.duration_seconds,
+    )
+    if sticky is not None:
+        sticky.remember(requested_language, result.language)
+    # Post-process filter: collapse pure-noise results to `{"text": ""}`
+    # so downstream consumers can ignore them uniformly.
+    with timed_stage(_METRICS_ENDPOINT, "postprocess"):
+        decision = filter_empty_transcription(
+            text=result.text,
+            duration_ms=None,
+            enabled=config.FILTER_EMPTY_ENABLED,
+            min_duration_ms=config.FILTER_MIN_DURATION_MS,
+        )
+    if isinstance(decision, Drop):
+        logger.info(
+            "transcription_filtered",
+            extra={
+                "endpoint": "/transcribe",
+                "reason": decision.reason,
+                "duration_ms": None,
+                "raw_text_len": len(result.text),
+            },
+        )
+        return {"text": ""}
+    assert isinstance(decision, Keep)
+    response: dict[str, Any] = {
+        "text": decision.text,
+        "language": result.language,
+        "segments": [
+            {"text": s.text, "start": s.start, "end": s.end}
+            for s in result.segments
+        ],
+    }
+    if log:
+        duration_ms = (
+            int(result.duration_seconds * 1000)
+            if result.duration_seconds
+            else None
+        )
+        with timed_stage(_METRICS_ENDPOINT, "db_write"):
+            sid = auto_session_logger.log_transcribe_session(
+                transcript=decision.text,
+                duration_ms=duration_ms,
+                audio_blob=body,
+                audio_mime_type=detected_mime,
+            )
+        if sid is not None:
+            response["session_id"] = sid
+    return response
+
+
+def _submit_async_job(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    temp_wav: Path,
+    run: Callable[[WhisperBackend], Awaitable[dict[str, Any]]],
+    backend: WhisperBackend,
+) -> JSONResponse:
+    """Create a job record, queue `run` behind the shared JobQueue, return HTTP 202."""
+    state = request.app.state
+    job = state.transcribe_jobs.create()
+    priority = job_priority(temp_wav)
+
+    async def work() -> JobOutput:
+        return JobOutput(content=await run(job_backend(state, priority, backend)))
+
+    background_tasks.add_task(
+        run_transcription_job,
+        store=state.transcribe_jobs,
+        queue=state.job_queue,
+        job_id=job.job_id,
+        priority=priority,
+        work=work,
+        wav_path=temp_wav,
+    )
+    return JSONResponse(status_code=202, content=submit_job_response(job))
+
+
+@router.post("/transcribe", response_model=None)
 async def transcribe(
     request: Request,
+    background_tasks: BackgroundTasks,
     language: str = Query(
         "auto",
         description="Spoken language code (e.g. 'en', 'zh') or 'auto' for detection",
@@ -98,7 +265,38 @@ async def transcribe(
             "it manages its own session lifecycle via /v1/sessions."
         ),
     ),
-) -> dict[str, Any]:
+    longform: bool | None = Query(
+        None,
+        description=(
+            "Force (true) or disable (false) silence-chunked parallel decoding. "
+            "Omit to switch automatically for audio of at least "
+            "LONGFORM_MIN_SECONDS."
+        ),
+    ),
+    batched: bool | None = Query(
+        None,
+        description=(
+            "Force (true) or disable (false) faster-whisper's batched pipeline "
+            "for this request. Omit to use CT2_DECODE_MODE. Ignored on ggml."
+        ),
+    ),
+    async_: bool = Query(
+        False,
+        alias="async",
+        description=(
+            "If true, return HTTP 202 with a job handle immediately and decode "
+            "in the background; poll GET /transcribe/jobs/{job_id} or "
+            "subscribe to its /events stream for the result."
+        ),
+    ),
+    model: str | None = Query(
+        None,
+        description=(
+            "Registry model to decode with (see GET /models). Omit for the "
+            "default model; others load on demand within MODEL_POOL_* limits."
+        ),
+    ),
+) -> dict[str, Any] | JSONResponse:
     """Transcribe an audio body.
 
     Dispatches on `Content-Type`:
@@ -107,6 +305,8 @@ async def transcribe(
       - anything else → HTTP 415
 
     The `language` and `prompt` query parameters apply to every supported body shape.
+    With `async=true` the upload is validated and converted up front (so bad
+    input still fails fast with 4xx) and only the decode is deferred.
     """
     content_type = _normalize_content_type(request.headers.get("content-type"))
 
@@ -116,10 +316,11 @@ async def transcribe(
             detail=f"Unsupported Content-Type: {content_type or '<missing>'}",
         )
 
-    if content_type == "multipart/form-data":
-        body, suffix = await _read_multipart_audio(request)
-    else:
-        body, suffix = await _read_raw_audio(request, content_type)
+    with timed_stage(_METRICS_ENDPOINT, "upload_read"):
+        if content_type == "multipart/form-data":
+            body, suffix = await _read_multipart_audio(request)
+        else:
+            body, suffix = await _read_raw_audio(request, content_type)
 
     if not body:
         raise HTTPException(status_code=400, detail="Empty audio body")
@@ -136,7 +337,9 @@ async def transcribe(
                 detail=f"File too large. Maximum size: {config.MAX_FILE_SIZE_MB}MB",
             )
 
-        detected_mime = file_manager.detect_mime_type(temp_input)
+        with timed_stage(_METRICS_ENDPOINT, "mime_sniff"):
+            detected_mime = file_manager.detect_mime_type(temp_input)
+            is_audio = file_manager.is_audio_file(temp_input)
         logger.info(
             "Transcribe: ct=%s, detected_mime=%s, bytes=%d",
             content_type,
@@ -144,61 +347,39 @@ async def transcribe(
             len(body),
         )
 
-        if not file_manager.is_audio_file(temp_input):
+        if not is_audio:
             raise HTTPException(
                 status_code=415,
                 detail=f"Unsupported file format. Detected: {detected_mime}",
             )
 
-        temp_wav = audio_converter.convert_to_wav(temp_input)
+        # Only an upload that passed the checks above may load (and so
+        # possibly evict) a pool model.
+        backend = await backend_for_request(request.app.state, model)
 
-        whisper = request.app.state.whisper
-        result = await whisper.transcribe(
-            temp_wav, language=language, initial_prompt=prompt
-        )
-        # Post-process filter: collapse pure-noise results to `{"text": ""}`
-        # so downstream consumers can ignore them uniformly.
-        decision = filter_empty_transcription(
-            text=result.text,
-            duration_ms=None,
-            enabled=config.FILTER_EMPTY_ENABLED,
-            min_duration_ms=config.FILTER_MIN_DURATION_MS,
+        with timed_stage(_METRICS_ENDPOINT, "convert"):
+            temp_wav = audio_converter.convert_to_wav(temp_input)
+
+        run = functools.partial(
+            _transcribe_wav,
+            temp_wav=temp_wav,
+            language=language,
+            prompt=prompt,
+            longform=longform,
+            batched=batched,
+            log=log,
+            body=body,
+            detected_mime=detected_mime,
+            sticky=sticky_for(request.app.state, request.headers),
         )
-        if isinstance(decision, Drop):
-            logger.info(
-                "transcription_filtered",
-                extra={
-                    "endpoint": "/transcribe",
-                    "reason": decision.reason,
-                    "duration_ms": None,
-                    "raw_text_len": len(result.text),
-                },
-            )
-            return {"text": ""}
-        assert isinstance(decision, Keep)
-        response: dict[str, Any] = {
-            "text": decision.text,
-            "language": result.language,
-            "segments": [
-                {"text": s.text, "start": s.start, "end": s.end}
-                for s in result.segments
-            ],
-        }
-        if log:
-            duration_ms = (
-                int(result.duration_seconds * 1000)
-                if result.duration_seconds
-                else None
-            )
-            sid = auto_session_logger.log_transcribe_session(
-                transcript=decision.text,
-                duration_ms=duration_ms,
-                audio_blob=body,
-                audio_mime_type=detected_mime,
+        if async_:
+            response = _submit_async_job(
+                request, background_tasks, temp_wav, run, backend
             )
-            if sid is not None:
-                response["session_id"] = sid
-        return response
+            # The background job owns the converted WAV from here on.
+            temp_wav = None
+            return response
+        return await run(scheduled(request.app.state, PRIORITY_INTERACTIVE, backend))
 
     except HTTPException:
         raise
@@ -0,0 +1,243 @@
+"""Async transcription jobs — `?async=true` on /transcribe and /v1/audio/*.
+
+A long upload held open for the whole decode dies on reverse-proxy timeouts.
+In async mode the POST handler converts the audio, creates a job record, and
+returns HTTP 202 with a job handle; the decode itself runs as a background
+task gated by the shared `JobQueue` (same queue as meeting jobs, which
+wait in their own class behind interactive and batch jobs).
+
+Routes:
+  - GET /transcribe/jobs/{job_id}         — poll status / progress / result
+  - GET /transcribe/jobs/{job_id}/events  — SSE stream of status changes
+  - GET /transcribe/jobs/{job_id}/result  — finished body with its original
+                                            media type (srt / vtt / text / json)
+  - DELETE /transcribe/jobs/{job_id}      — cancel a job that has not started
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.config import config
+from app.services._whisper_backend import WhisperBackend
+from app.services.files import file_manager
+from app.services.job_queue import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    JobQueue,
+)
+from app.services.longform import wav_duration_seconds
+from app.services.meeting_jobs import Job, JobStore
+from app.services.scheduler import PRIORITY_BATCH as DECODE_BATCH
+from app.services.scheduler import PRIORITY_INTERACTIVE as DECODE_INTERACTIVE
+from app.services.scheduler import scheduled
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# How often the SSE stream re-reads the job record. Jobs run for seconds to
+# minutes, so a quarter-second poll is imperceptible and keeps the store free
+# of subscriber bookkeeping.
+EVENTS_POLL_SECONDS = 0.25
+
+TERMINAL_STATUSES = ("done", "error", "cancelled")
+
+
+@dataclass
+class JobOutput:
+    """A finished async job's response, kept exactly as the sync path renders it."""
+
+    content: Any
+    media_type: str = "application/json"
+
+
+def job_priority(wav_path: Path) -> int:
+    """Long-form sized uploads queue as batch work; everything else is interactive."""
+    if config.LONGFORM_MIN_SECONDS <= 0:
+        return PRIORITY_INTERACTIVE
+    duration = wav_duration_seconds(wav_path)
+    if duration is not None and duration >= config.LONGFORM_MIN_SECONDS:
+        return PRIORITY_BATCH
+    return PRIORITY_INTERACTIVE
+
+
+def job_backend(
+    state, priority: int, backend: WhisperBackend | None = None
+) -> WhisperBackend:
+    """Scheduler view for a job of queue class `priority` — batch jobs decode
+    as batch (chunked, preemptible), the rest as interactive.
+    """
+    return scheduled(
+        state,
+        DECODE_BATCH if priority == PRIORITY_BATCH else DECODE_INTERACTIVE,
+        backend,
+    )
+
+
+async def run_transcription_job(
+    *,
+    store: JobStore,
+    queue: JobQueue,
+    job_id: str,
+    priority: int,
+    work: Callable[[], Awaitable[JobOutput]],
+    wav_path: Path,
+) -> None:
+    """Background entrypoint — wait for a queue slot, run `work`, record the outcome.
+
+    Owns `wav_path`: it is removed once the job settles, whatever the outcome.
+    """
+    try:
+        async with queue.slot(priority=priority, job_id=job_id):
+            job = store.get(job_id)
+            if job is not None and job.cancel_requested:
+                store.mark_cancelled(job_id)
+                return
+            store.mark_running(job_id, stage="transcribe")
+            output = await work()
+        store.mark_done(job_id, output)
+    except asyncio.CancelledError:
+        store.mark_cancelled(job_id)
+    except HTTPException as exc:
+        store.mark_error(job_id, code="transcription_failed", message=str(exc.detail))
+    except Exception as exc:  # noqa: BLE001 — surface every failure as job.error
+        logger.exception("Transcription job %s failed", job_id)
+        store.mark_error(job_id, code="transcription_failed", message=str(exc))
+    finally:
+        file_manager.cleanup_file(wav_path)
+
+
+def submit_job_response(job: Job) -> dict[str, Any]:
+    """Body of the HTTP 202 handed back by an async submit."""
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "status_url": f"/transcribe/jobs/{job.job_id}",
+        "events_url": f"/transcribe/jobs/{job.job_id}/events",
+    }
+
+
+def _job_to_json(job: Job, queue: JobQueue | None) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "job_id": job.job_id,
+        "status": job.status,
+        "progress": job.progress,
+        "stage": job.stage,
+        "result": job.result.content if isinstance(job.result, JobOutput) else None,
+    }
+    if job.status == "pending" and queue is not None:
+        payload["queue_position"] = queue.position(job.job_id)
+    if job.error is not None:
+        payload["error"] = {"code": job.error.code, "message": job.error.message}
+    return payload
+
+
+def _lookup(request: Request, job_id: str) -> Job:
+    job = request.app.state.transcribe_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "job_not_found", "job_id": job_id},
+        )
+    return job
+
+
+@router.get("/transcribe/jobs/{job_id}")
+async def get_transcription_job(job_id: str, request: Request) -> dict[str, Any]:
+    """Return the current state of an async transcription job."""
+    job = _lookup(request, job_id)
+    return _job_to_json(job, getattr(request.app.state, "job_queue", None))
+
+
+@router.get("/transcribe/jobs/{job_id}/result")
+async def get_transcription_job_result(job_id: str, request: Request) -> Response:
+    """Return a finished job's body with the media type the sync call would have used."""
+    job = _lookup(request, job_id)
+    if job.status != "done" or not isinstance(job.result, JobOutput):
+        raise HTTPException(
+            status_code=409,
+            detail={"error": "job_not_done", "status": job.status},
+        )
+    output = job.result
+    if output.media_type.startswith("application/json"):
+        body = json.dumps(output.content, ensure_ascii=False).encode("utf-8")
+    else:
+        body = str(output.content).encode("utf-8")
+    return Response(content=body, media_type=output.media_type)
+
+
+@router.delete("/transcribe/jobs/{job_id}", status_code=202)
+async def cancel_transcription_job(job_id: str, request: Request) -> dict[str, Any]:
+    """Request cancellation. Takes effect when the job reaches the front of
+    the queue; a decode already in flight runs to completion (same contract
+    as DELETE /transcribe/meeting/{job_id}).
+    """
+    job = _lookup(request, job_id)
+    if job.status in TERMINAL_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "error": "job_not_cancellable",
+                "reason": f"job is in terminal state '{job.status}'",
+            },
+        )
+    request.app.state.transcribe_jobs.mark_cancel_requested(job_id)
+    return {"job_id": job_id, "status": "cancel_requested"}
+
+
+@router.get("/transcribe/jobs/{job_id}/events")
+async def stream_transcription_job(job_id: str, request: Request) -> StreamingResponse:
+    """Server-Sent Events: one `status` event per change, then the terminal event.
+
+    The terminal event is `done` (payload = full job JSON), `error`, or
+    `cancelled`; the stream closes right after it.
+    """
+    _lookup(request, job_id)
+    store: JobStore = request.app.state.transcribe_jobs
+    queue: JobQueue | None = getattr(request.app.state, "job_queue", None)
+
+    async def event_stream():
+        last: dict[str, Any] | None = None
+        while True:
+            job = store.get(job_id)
+            if job is None:
+                yield _sse_event("error", {"error": "job_not_found", "job_id": job_id})
+                return
+            payload = _job_to_json(job, queue)
+            if job.status in TERMINAL_STATUSES:
+                yield _sse_event(job.status, payload)
+                return
+            if payload != last:
+                yield _sse_event("status", payload)
+                last = payload
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+def _sse_event(event_type: str, payload: dict) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def queue_status(state) -> dict[str, Any]:
+    """`/status` block: shared queue metrics plus async transcription job counts."""
+    queue: JobQueue | None = getattr(state, "job_queue", None)
+    store: JobStore | None = getattr(state, "transcribe_jobs", None)
+    block: dict[str, Any] = queue.snapshot() if queue is not None else {}
+    block["transcribe_jobs"] = {
+        status: store.count_by_status(status) if store else 0
+        for status in ("pending", "running", "done", "error")
+    }
+    return block
@@ -132,6 +132,60 @@ class Config:
             os.getenv("CPU_THREADS"), var_name="CPU_THREADS"
         )
 
+        # Read the model's weight files ahead into the page cache (read-only
+        # mmap + MADV_WILLNEED) before the backend loads them, so extra
+        # uvicorn workers, restarts and pool loads copy from RAM, not disk.
+        # The loaded weights themselves stay private per process (CT2 and
+        # whisper.cpp copy them); share them via CT2_NUM_WORKERS instead.
+        self.MODEL_PREFAULT: bool = _parse_bool(
+            os.getenv("MODEL_PREFAULT"), default=False, var_name="MODEL_PREFAULT"
+        )
+
+        # Parallel CT2 decode workers. faster-whisper only runs concurrent
+        # transcribe() calls truly in parallel when the model is built with
+        # num_workers > 1 (each worker gets its own CT2 replica context but
+        # shares the weights). Long-form chunking fans out across these.
+        self.CT2_NUM_WORKERS: int = _parse_int(
+            os.getenv("CT2_NUM_WORKERS"), default=1, var_name="CT2_NUM_WORKERS"
+        ) or 1
+
+        # File decode strategy for the CT2 backend: "sequential" (default,
+        # faster-whisper's sliding-window decode) or "batched"
+        # (BatchedInferencePipeline — VAD-chunked, CT2_BATCH_SIZE chunks per
+        # forward pass; several times the throughput on long files). Unknown
+        # values fail the lifespan with the accepted list. ggml ignores both.
+        self.CT2_DECODE_MODE: str = (
+            os.environ.get("CT2_DECODE_MODE") or "sequential"
+        ).lower()
+        self.CT2_BATCH_SIZE: int = _parse_int(
+            os.getenv("CT2_BATCH_SIZE"), default=8, var_name="CT2_BATCH_SIZE"
+        ) or 8
+
+        # Long-form /transcribe: uploads at least LONGFORM_MIN_SECONDS long are
+        # split at silences into ~LONGFORM_CHUNK_SECONDS chunks and decoded
+        # LONGFORM_CONCURRENCY at a time. 0 disables the automatic switch; the
+        # `longform` query parameter still forces it either way per request.
+        self.LONGFORM_MIN_SECONDS: int = _parse_int(
+            os.getenv("LONGFORM_MIN_SECONDS"),
+            default=600,
+            var_name="LONGFORM_MIN_SECONDS",
+        )
+        self.LONGFORM_CHUNK_SECONDS: int = _parse_int(
+            os.getenv("LONGFORM_CHUNK_SECONDS"),
+            default=120,
+            var_name="LONGFORM_CHUNK_SECONDS",
+        ) or 120
+        self.LONGFORM_OVERLAP_MS: int = _parse_int(
+            os.getenv("LONGFORM_OVERLAP_MS"),
+            default=1000,
+            var_name="LONGFORM_OVERLAP_MS",
+        )
+        self.LONGFORM_CONCURRENCY: int = _parse_int(
+            os.getenv("LONGFORM_CONCURRENCY"),
+            default=self.CT2_NUM_WORKERS,
+            var_name="LONGFORM_CONCURRENCY",
+        ) or 1
+
         # v2.1 backend override. When set ("ct2" | "ggml"), the lifespan SHALL pick
         # the matching variant of the active model. When unset, platform-based
         # `default_on` resolves the variant.
@@ -196,6 +250,243 @@ class Config:
         self.MEETING_TORCH_DEVICE: str = (
             os.environ.get("MEETING_TORCH_DEVICE") or "auto"
         )
+        # Diarization only needs the audio, not the transcript, so by default
+        # pyannote runs concurrently with ASR + align and the two tracks join
+        # before the speaker merge. Saves roughly the diarize duration per
+        # job; false restores the strict asr → align → diarize sequence.
+        self.MEETING_PARALLEL_DIARIZE: bool = _parse_bool(
+            os.getenv("MEETING_PARALLEL_DIARIZE"),
+            default=True,
+            var_name="MEETING_PARALLEL_DIARIZE",
+        )
+        # Torch intra-op threads for align + diarize when they run on CPU
+        # alongside CT2 ASR (which keeps CPU_THREADS). 0 = half the cores so
+        # the two tracks don't oversubscribe each other; ignored when
+        # MEETING_PARALLEL_DIARIZE=false or the torch device is mps/cuda.
+        self.MEETING_DIARIZE_THREADS: int = _parse_int(
+            os.getenv("MEETING_DIARIZE_THREADS"),
+            default=0,
+            var_name="MEETING_DIARIZE_THREADS",
+        )
+        # Meeting jobs admitted at once from the shared job queue's meeting
+        # class (the rest queue, `high` priority first, and report
+        # queue_position); the queue's batch allowance caps it further.
+        # Admitted jobs interleave stage by stage — one in ASR while another
+        # diarizes. 0 = auto: one job per 4 cores, further capped by
+        # available RAM / MEETING_JOB_MEMORY_MB.
+        self.MEETING_CONCURRENCY: int = _parse_int(
+            os.getenv("MEETING_CONCURRENCY"),
+            default=0,
+            var_name="MEETING_CONCURRENCY",
+        )
+        self.MEETING_JOB_MEMORY_MB: int = _parse_int(
+            os.getenv("MEETING_JOB_MEMORY_MB"),
+            default=2048,
+            var_name="MEETING_JOB_MEMORY_MB",
+        )
+        # Meeting jobs are journaled to the database with their audio spooled
+        # under DATA_DIR/meeting_jobs, so a restart can put unfinished jobs
+        # back in the queue (skipping a checkpointed ASR stage). When false,
+        # leftovers from the previous run are discarded on startup instead.
+        self.MEETING_RESUME_JOBS: bool = _parse_bool(
+            os.getenv("MEETING_RESUME_JOBS"),
+            default=True,
+            var_name="MEETING_RESUME_JOBS",
+        )
+        # wav2vec2 alignment models cached across meeting jobs, LRU by
+        # (language, model, device): at most MEETING_ALIGN_CACHE_SIZE of them
+        # and, when MEETING_ALIGN_CACHE_MB > 0, their summed parameter size
+        # (0 = count-only). Languages in MEETING_ALIGN_PRELOAD_LANGUAGES
+        # (comma list, e.g. "zh,en") load with the pipeline on first use.
+        self.MEETING_ALIGN_CACHE_SIZE: int = _parse_int(
+            os.getenv("MEETING_ALIGN_CACHE_SIZE"),
+            default=2,
+            var_name="MEETING_ALIGN_CACHE_SIZE",
+        )
+        self.MEETING_ALIGN_CACHE_MB: int = _parse_int(
+            os.getenv("MEETING_ALIGN_CACHE_MB"),
+            default=0,
+            var_name="MEETING_ALIGN_CACHE_MB",
+        )
+        preload = os.environ.get("MEETING_ALIGN_PRELOAD_LANGUAGES") or ""
+        self.MEETING_ALIGN_PRELOAD_LANGUAGES: tuple[str, ...] = tuple(
+            lang.strip().lower() for lang in preload.split(",") if lang.strip()
+        )
+        # Meeting ASR decodes in silence-cut chunks of about this many
+        # seconds, appending each chunk's segments to the job's `partial`
+        # transcript and advancing progress by audio position. 0 = one
+        # whole-file pass (no partial transcript until ASR finishes).
+        self.MEETING_ASR_CHUNK_SECONDS: int = _parse_int(
+            os.getenv("MEETING_ASR_CHUNK_SECONDS"),
+            default=300,
+            var_name="MEETING_ASR_CHUNK_SECONDS",
+        )
+        # Speakers of a finished meeting whose embedding is at least this
+        # cosine similarity (percent) to a learned speaker profile get that
+        # profile's name suggested (GET /v1/meetings/{id}). Profiles are
+        # learned from speaker renames. 0 = no suggestions.
+        self.MEETING_SPEAKER_MATCH_PERCENT: int = _parse_int(
+            os.getenv("MEETING_SPEAKER_MATCH_PERCENT"),
+            default=60,
+            var_name="MEETING_SPEAKER_MATCH_PERCENT",
+        )
+        # Meeting sub-models (WhisperX ASR, pyannote, wav2vec2 align) load
+        # when a job first runs their stage and are dropped after this many
+        # seconds without one. 0 = keep them resident once loaded.
+        self.MEETING_IDLE_UNLOAD_SECONDS: int = _parse_int(
+            os.getenv("MEETING_IDLE_UNLOAD_SECONDS"),
+            default=600,
+            var_name="MEETING_IDLE_UNLOAD_SECONDS",
+        )
+        # When the server's own CTranslate2 model is the meeting model (same
+        # directory, device and weight type), WhisperX ASR wraps it instead
+        # of loading a second copy. Each meeting ASR chunk then holds a
+        # scheduler batch slot, so this only applies when the scheduler keeps
+        # a slot free for /listen (SCHEDULER_MAX_INFLIGHT above the batch
+        # slots, i.e. CT2_NUM_WORKERS >= 2 by default); otherwise the meeting
+        # loads its own copy rather than make live decodes wait a chunk.
+        self.MEETING_SHARE_ASR_MODEL: bool = _parse_bool(
+            os.getenv("MEETING_SHARE_ASR_MODEL"),
+            default=True,
+            var_name="MEETING_SHARE_ASR_MODEL",
+        )
+
+        # Shared background job queue (async /transcribe + /v1/audio jobs and
+        # meeting jobs). JOB_QUEUE_CONCURRENCY jobs decode at once; batch and
+        # meeting work (long-form uploads, meetings) may hold at most
+        # JOB_QUEUE_BATCH_SLOTS of them — unset → concurrency - 1, so one slot
+        # always stays free for short interactive jobs.
+        self.JOB_QUEUE_CONCURRENCY: int = _parse_int(
+            os.getenv("JOB_QUEUE_CONCURRENCY"),
+            default=2,
+            var_name="JOB_QUEUE_CONCURRENCY",
+        ) or 1
+        self.JOB_QUEUE_BATCH_SLOTS: int | None = _parse_int_or_none(
+            os.getenv("JOB_QUEUE_BATCH_SLOTS"), var_name="JOB_QUEUE_BATCH_SLOTS"
+        )
+        # Decode-call scheduler in front of the Whisper backend. At most
+        # SCHEDULER_MAX_INFLIGHT decode calls reach the model at once (unset →
+        # CT2_NUM_WORKERS, one per CT2 worker); free slots go to live (/listen)
+        # first, then interactive requests, then batch work. Batch calls may
+        # hold SCHEDULER_BATCH_SLOTS slots (unset → max_inflight - 1, min 1)
+        # and are split into SCHEDULER_BATCH_CHUNK_SECONDS pieces that each
+        # re-queue, so interactive work waits at most one chunk. 0 disables
+        # batch chunking.
+        self.SCHEDULER_MAX_INFLIGHT: int = _parse_int(
+            os.getenv("SCHEDULER_MAX_INFLIGHT"),
+            default=self.CT2_NUM_WORKERS,
+            var_name="SCHEDULER_MAX_INFLIGHT",
+        ) or self.CT2_NUM_WORKERS
+        self.SCHEDULER_BATCH_SLOTS: int | None = _parse_int_or_none(
+            os.getenv("SCHEDULER_BATCH_SLOTS"), var_name="SCHEDULER_BATCH_SLOTS"
+        )
+        self.SCHEDULER_INTERACTIVE_SLOTS: int | None = _parse_int_or_none(
+            os.getenv("SCHEDULER_INTERACTIVE_SLOTS"),
+            var_name="SCHEDULER_INTERACTIVE_SLOTS",
+        )
+        self.SCHEDULER_BATCH_CHUNK_SECONDS: int = _parse_int(
+            os.getenv("SCHEDULER_BATCH_CHUNK_SECONDS"),
+            default=30,
+            var_name="SCHEDULER_BATCH_CHUNK_SECONDS",
+        )
+        # Recent scheduled decodes kept for the real-time-factor stats in
+        # /status `throughput` (per backend / model variant / decode mode,
+        # plus queue wait). 0 disables the accounting.
+        self.RTF_SAMPLES: int = _parse_int(
+            os.getenv("RTF_SAMPLES"), default=1000, var_name="RTF_SAMPLES"
+        )
+        # language="auto" handling. LANGUAGE_DETECT_SECONDS of opening audio
+        # feed a language-ID-only pre-pass that pins one language for every
+        # later decode of the same stream / long-form file (0 disables).
+        # LANGUAGE_CACHE_TTL_SECONDS remembers the last detected language per
+        # `X-Client-Id` header so repeat callers skip detection (0 disables).
+        self.LANGUAGE_DETECT_SECONDS: int = _parse_int(
+            os.getenv("LANGUAGE_DETECT_SECONDS"),
+            default=10,
+            var_name="LANGUAGE_DETECT_SECONDS",
+        )
+        self.LANGUAGE_CACHE_TTL_SECONDS: int = _parse_int(
+            os.getenv("LANGUAGE_CACHE_TTL_SECONDS"),
+            default=1800,
+            var_name="LANGUAGE_CACHE_TTL_SECONDS",
+        )
+        # Multi-model residency. MODEL_POOL_MAX_MODELS counts the default
+        # (MODEL_NAME) model too, so 1 keeps today's single-model behaviour;
+        # raise it to let requests pick other registry models via `model`.
+        # MODEL_POOL_BUDGET_MB caps the summed weight size of resident models
+        # (0 = no byte cap). Least-recently-used non-default models go first.
+        self.MODEL_POOL_MAX_MODELS: int = _parse_int(
+            os.getenv("MODEL_POOL_MAX_MODELS"),
+            default=1,
+            var_name="MODEL_POOL_MAX_MODELS",
+        ) or 1
+        self.MODEL_POOL_BUDGET_MB: int = _parse_int(
+            os.getenv("MODEL_POOL_BUDGET_MB"),
+            default=0,
+            var_name="MODEL_POOL_BUDGET_MB",
+        )
+        # Speculative partials: a small registry model (e.g. a tiny / base
+        # variant) that decodes `/listen` partials while MODEL_NAME only runs
+        # finals. Empty (default) keeps partials on the session's model. The
+        # draft is pinned in the model pool (never evicted, outside
+        # MODEL_POOL_MAX_MODELS) and loads in the background on first use.
+        self.STREAM_DRAFT_MODEL_NAME: str = (
+            os.environ.get("STREAM_DRAFT_MODEL_NAME") or ""
+        ).strip()
+        # Startup staging. Migrations, model load, VAD probe, actions registry
+        # and LLM client always load concurrently; STARTUP_MODE=eager (default)
+        # waits for all of them before serving, "lazy" serves /status at once
+        # and holds each request up to STARTUP_WAIT_SECONDS for the components
+        # it needs before answering 503 + Retry-After. Unknown modes fail the
+        # lifespan with the accepted list.
+        self.STARTUP_MODE: str = (os.environ.get("STARTUP_MODE") or "eager").lower()
+        self.STARTUP_WAIT_SECONDS: int = _parse_int(
+            os.getenv("STARTUP_WAIT_SECONDS"),
+            default=30,
+            var_name="STARTUP_WAIT_SECONDS",
+        )
+        # Warm-up rounds of dummy inference (VAD + partial- and final-sized
+        # transcribe_pcm) once the model is loaded, so the first real request
+        # after a deploy runs at steady-state latency. 0 disables.
+        self.WARMUP_ROUNDS: int = _parse_int(
+            os.getenv("WARMUP_ROUNDS"),
+            default=1,
+            var_name="WARMUP_ROUNDS",
+        )
+        # Request / per-stage latency histograms exported at GET /metrics in
+        # the Prometheus text format. Disabling stops the request middleware
+        # and turns /metrics into a 404; stage timers are a few dict updates
+        # and stay on.
+        self.METRICS_ENABLED: bool = _parse_bool(
+            os.getenv("METRICS_ENABLED"), default=True, var_name="METRICS_ENABLED"
+        )
+        # Opt-in sampling profiler (`X-Profile: true` per request, or
+        # POST /profiling/start for a global window). Stacks are sampled
+        # every PROFILE_INTERVAL_MS; each capture stops after at most
+        # PROFILE_MAX_SECONDS and lands in DATA_DIR/profiles.
+        self.PROFILING_ENABLED: bool = _parse_bool(
+            os.getenv("PROFILING_ENABLED"), default=False, var_name="PROFILING_ENABLED"
+        )
+        self.PROFILE_INTERVAL_MS: int = _parse_int(
+            os.getenv("PROFILE_INTERVAL_MS"), default=5, var_name="PROFILE_INTERVAL_MS"
+        )
+        self.PROFILE_MAX_SECONDS: int = _parse_int(
+            os.getenv("PROFILE_MAX_SECONDS"),
+            default=300,
+            var_name="PROFILE_MAX_SECONDS",
+        )
+        # Async transcription job results (`?async=true`) — same TTL/capacity
+        # eviction as meeting jobs, tracked in a separate store.
+        self.TRANSCRIBE_JOB_TTL_SECONDS: int = _parse_int(
+            os.getenv("TRANSCRIBE_JOB_TTL_SECONDS"),
+            default=3600,
+            var_name="TRANSCRIBE_JOB_TTL_SECONDS",
+        )
+        self.TRANSCRIBE_MAX_JOBS: int = _parse_int(
+            os.getenv("TRANSCRIBE_MAX_JOBS"),
+            default=50,
+            var_name="TRANSCRIBE_MAX_JOBS",
+        )
 
         # File handling
         self.MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
@@ -234,6 +525,14 @@ class Config:
     def audio_dir(self) -> Path:
         return self.DATA_DIR / "audio"
 
+    @property
+    def profiles_dir(self) -> Path:
+        return self.DATA_DIR / "profiles"
+
+    @property
+    def meeting_jobs_dir(self) -> Path:
+        return self.DATA_DIR / "meeting_jobs"
+
     @property
     def max_file_size_bytes(self) -> int:
         return self.MAX_FILE_SIZE_MB * 1024 * 1024
@@ -244,6 +543,7 @@ class Config:
     def ensure_data_dirs(self) -> None:
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
         self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.meeting_jobs_dir.mkdir(parents=True, exist_ok=True)
 
     def validate_port(self) -> None:
         if not (1 <= self.API_PORT <= 65535):
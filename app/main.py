@@ -2,13 +2,15 @@
 
 The lifespan handler picks a Whisper backend (CTranslate2 on Linux, pywhispercpp
 on macOS by default) based on the active registry entry's variants and
-`BACKEND_FORMAT` override, then eagerly loads the model so every endpoint sees
-a fully-loaded backend on the first request and `/status` can always report
-`model.loaded=true`.
+`BACKEND_FORMAT` override, then loads the model. Startup steps run
+concurrently (`app.services.readiness`); by default the server waits for all
+of them, with `STARTUP_MODE=lazy` it serves at once and each router waits on
+the components its router declares (`app.api.readiness.require_ready`).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 import time
@@ -24,14 +26,30 @@ from app.api.ask import router as ask_router
 from app.api.listen import router as listen_router
 from app.api.meeting import router as meeting_router
 from app.api.meeting_history import router as meeting_history_router
+from app.api.metrics import MetricsMiddleware
+from app.api.metrics import router as metrics_router
+from app.api.models import router as models_router
 from app.api.openai_compat import router as openai_compat_router
+from app.api.profiling import ProfilingMiddleware
+from app.api.profiling import router as profiling_router
 from app.api.sessions import router as sessions_router
 from app.api.status import router as status_router
 from app.api.transcribe import router as transcribe_router
+from app.api.transcribe_jobs import router as transcribe_jobs_router
 from app.config import config, load_env_file
 from app.services._whisper_backend import WhisperBackend, WhisperLoadError
 from app.services.actions import load_actions, load_categories
 from app.services.llm import LLMClient
+from app.services.memory import prefault_weights
+from app.services.readiness import (
+    COMPONENT_ACTIONS,
+    COMPONENT_DATABASE,
+    COMPONENT_LLM,
+    COMPONENT_MODEL,
+    COMPONENT_VAD,
+    COMPONENT_WARMUP,
+    Readiness,
+)
 from app.services.registry import (
     HARDCODED_FALLBACK_MODEL_NAME,
     RegistryError,
@@ -42,6 +60,8 @@ from app.services.whisper_ct2 import CTranslate2Backend
 
 logger = logging.getLogger(__name__)
 
+STARTUP_MODES = ("eager", "lazy")
+
 
 def _build_backend(
     *,
@@ -51,15 +71,22 @@ def _build_backend(
     compute_type: str,
     device: str,
     cpu_threads: int | None = None,
+    num_workers: int = 1,
+    decode_mode: str = "sequential",
+    batch_size: int = 8,
+    prefault: bool = False,
 ) -> tuple[WhisperBackend, dict]:
     """Resolve the active variant and instantiate the matching backend.
 
     Returns `(backend, metadata)` where metadata is a dict carrying the
     fields surfaced via `/status` (backend name, format, compute_type/quant,
-    coreml_encoder_compiled).
+    coreml_encoder_compiled). With `prefault`, the weight files are read
+    ahead into the shared page cache before the backend loads them.
     """
     if model_dir_override:
         model_dir = Path(model_dir_override)
+        if prefault:
+            prefault_weights(model_dir)
         # Infer format from the directory layout
         if (model_dir / "model.bin").is_file():
             backend: WhisperBackend = CTranslate2Backend(
@@ -67,11 +94,15 @@ def _build_backend(
                 compute_type=compute_type,
                 device=device,
                 cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                decode_mode=decode_mode,
+                batch_size=batch_size,
             )
             return backend, {
                 "backend": "ctranslate2",
                 "format": "ct2",
                 "compute_type": compute_type,
+                "decode_mode": decode_mode,
                 "local_dir": str(model_dir),
             }
         ggml_files = list(model_dir.glob("ggml-*.bin"))
@@ -115,6 +146,8 @@ def _build_backend(
     )
 
     variant_dir = Path("models") / variant["local_dir"]
+    if prefault:
+        prefault_weights(variant_dir)
 
     if variant["format"] == "ct2":
         backend = CTranslate2Backend(
@@ -122,11 +155,15 @@ def _build_backend(
             compute_type=compute_type,
             device=device,
             cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            decode_mode=decode_mode,
+            batch_size=batch_size,
         )
         return backend, {
             "backend": "ctranslate2",
             "format": "ct2",
             "compute_type": variant.get("compute_type", compute_type),
+            "decode_mode": decode_mode,
             "local_dir": str(variant_dir),
         }
 
@@ -148,6 +185,30 @@ def _build_backend(
     }
 
 
+def _registry_model_names() -> list[str]:
+    """Model names the pool may load; empty when the registry is unreadable."""
+    try:
+        return sorted(load_registry())
+    except RegistryError:
+        return []
+
+
+def _model_footprint_mb(name: str) -> float | None:
+    """On-disk size of the variant `name` would load, for the pool's budget check."""
+    from app.services.model_pool import dir_size_mb
+
+    try:
+        entry = load_registry().get(name)
+        if entry is None:
+            return None
+        variant = resolve_variant(
+            entry, platform=sys.platform, backend_format=config.BACKEND_FORMAT
+        )
+    except RegistryError:
+        return None
+    return dir_size_mb(Path("models") / variant["local_dir"])
+
+
 def _infer_quant(filename: str) -> str | None:
     """Extract `q6_k` from `ggml-breeze-asr-25-q6_k.bin` for /status display."""
     stem = Path(filename).stem
@@ -207,85 +268,225 @@ async def lifespan(app: FastAPI):
     logger.info("Starting whisper-wrap API server")
     config.ensure_temp_dir()
 
+    # Staged startup: the independent steps below run concurrently in worker
+    # threads; STARTUP_MODE decides whether the server waits for them
+    # (eager) or starts serving at once and gates routes on readiness (lazy).
+    if config.STARTUP_MODE not in STARTUP_MODES:
+        raise ValueError(
+            f"STARTUP_MODE={config.STARTUP_MODE!r} is not recognised; "
+            f"expected one of {', '.join(STARTUP_MODES)}"
+        )
+    readiness = Readiness(mode=config.STARTUP_MODE)
+    app.state.readiness = readiness
+
     # v2.3 persistence init: create data dirs, run Alembic to head, expose the
-    # engine on app.state. Done BEFORE model loading so any schema errors fail
-    # fast (engine init is sub-second; model load can take 30s on cold ANE).
+    # engine on app.state. Data dirs are created inline so a bad DATA_DIR
+    # fails fast in either startup mode.
     config.ensure_data_dirs()
-    from alembic.config import Config as AlembicConfig
-
-    from alembic import command as alembic_command
-    from app.services.persistence import SessionLocal, build_engine
-
-    alembic_cfg = AlembicConfig(str(Path("alembic.ini")))
-    alembic_cfg.set_main_option("sqlalchemy.url", config.DATABASE_URL)
-    alembic_command.upgrade(alembic_cfg, "head")
-
-    db_engine = build_engine(config.DATABASE_URL)
-    SessionLocal.configure(bind=db_engine)
-    app.state.db_engine = db_engine
-    logger.info("Persistence ready: %s", config.DATABASE_URL)
-
-    load_start = time.perf_counter()
-    backend, metadata = _build_backend(
-        model_dir_override=config.MODEL_DIR,
-        model_name=config.MODEL_NAME,
-        backend_format_override=config.BACKEND_FORMAT,
-        compute_type=config.COMPUTE_TYPE,
-        device=config.DEVICE,
-        cpu_threads=config.CPU_THREADS,
-    )
-    load_time_ms = int((time.perf_counter() - load_start) * 1000)
 
-    app.state.whisper = backend
-    app.state.backend_metadata = metadata
-    app.state.model_dir = metadata["local_dir"]
-    app.state.load_time_ms = load_time_ms
-    app.state.lifespan_completed_at = time.time()
+    def _init_database() -> None:
+        from alembic.config import Config as AlembicConfig
+
+        from alembic import command as alembic_command
+        from app.services.persistence import SessionLocal, build_engine
+
+        alembic_cfg = AlembicConfig(str(Path("alembic.ini")))
+        alembic_cfg.set_main_option("sqlalchemy.url", config.DATABASE_URL)
+        alembic_command.upgrade(alembic_cfg, "head")
+
+        db_engine = build_engine(config.DATABASE_URL)
+        SessionLocal.configure(bind=db_engine)
+        app.state.db_engine = db_engine
+        logger.info("Persistence ready: %s", config.DATABASE_URL)
+
+    readiness.add(COMPONENT_DATABASE, _init_database)
+
+    def _load_model() -> None:
+        load_start = time.perf_counter()
+        backend, metadata = _build_backend(
+            model_dir_override=config.MODEL_DIR,
+            model_name=config.MODEL_NAME,
+            backend_format_override=config.BACKEND_FORMAT,
+            compute_type=config.COMPUTE_TYPE,
+            device=config.DEVICE,
+            cpu_threads=config.CPU_THREADS,
+            num_workers=config.CT2_NUM_WORKERS,
+            decode_mode=config.CT2_DECODE_MODE,
+            batch_size=config.CT2_BATCH_SIZE,
+            prefault=config.MODEL_PREFAULT,
+        )
+        load_time_ms = int((time.perf_counter() - load_start) * 1000)
+
+        app.state.whisper = backend
+        app.state.backend_metadata = metadata
+        app.state.model_dir = metadata["local_dir"]
+        app.state.load_time_ms = load_time_ms
+
+        # Multi-model residency: the backend above is the pool's default; other
+        # registry models load on demand (or via /models) under MODEL_POOL_*.
+        from app.services.model_pool import ModelPool, ResidentModel
+
+        def _build_named(name: str) -> tuple[WhisperBackend, dict]:
+            return _build_backend(
+                model_dir_override=None,
+                model_name=name,
+                backend_format_override=config.BACKEND_FORMAT,
+                compute_type=config.COMPUTE_TYPE,
+                device=config.DEVICE,
+                cpu_threads=config.CPU_THREADS,
+                num_workers=config.CT2_NUM_WORKERS,
+                decode_mode=config.CT2_DECODE_MODE,
+                batch_size=config.CT2_BATCH_SIZE,
+                prefault=config.MODEL_PREFAULT,
+            )
+
+        def _publish_default(entry: ResidentModel) -> None:
+            app.state.whisper = entry.backend
+            app.state.backend_metadata = entry.metadata
+            app.state.model_dir = entry.metadata["local_dir"]
+            app.state.load_time_ms = entry.load_time_ms
+
+        known = _registry_model_names()
+        default_name = metadata["local_dir"] if config.MODEL_DIR else config.MODEL_NAME
+        draft = config.STREAM_DRAFT_MODEL_NAME or None
+        if draft is not None and draft not in known:
+            logger.warning(
+                "STREAM_DRAFT_MODEL_NAME=%s is not a registry model; ignored", draft
+            )
+            draft = None
+        elif draft == default_name:
+            draft = None
+        app.state.stream_draft_model = draft
+
+        pool = ModelPool(
+            build=_build_named,
+            known=known,
+            pinned=[draft] if draft else [],
+            max_models=config.MODEL_POOL_MAX_MODELS,
+            budget_mb=config.MODEL_POOL_BUDGET_MB,
+            estimate_mb=_model_footprint_mb,
+            on_activate=_publish_default,
+        )
+        pool.adopt(
+            default_name,
+            backend,
+            metadata,
+            load_time_ms=load_time_ms,
+        )
+        app.state.model_pool = pool
+
+        logger.info(
+            "Whisper backend ready (%s/%s) in %d ms",
+            metadata["backend"],
+            metadata["format"],
+            load_time_ms,
+        )
+
+    readiness.add(COMPONENT_MODEL, _load_model)
 
     # v2.2: VAD backend resolved once at startup; factory returns a fresh
     # instance per call so each WS session gets isolated state.
-    from app.services.vad import make_vad_backend
+    def _init_vad() -> None:
+        from app.services.vad import make_vad_backend
 
-    initial_vad = make_vad_backend(config.VAD_BACKEND)
-    app.state.vad_backend_name = (
-        "silero" if initial_vad.__class__.__name__ == "SileroVad" else "rms"
-    )
+        initial_vad = make_vad_backend(config.VAD_BACKEND)
+        app.state.vad_backend_name = (
+            "silero" if initial_vad.__class__.__name__ == "SileroVad" else "rms"
+        )
+
+        def vad_factory():
+            return make_vad_backend(config.VAD_BACKEND)
 
-    def vad_factory():
-        return make_vad_backend(config.VAD_BACKEND)
+        app.state.vad_factory = vad_factory
+        logger.info("VAD backend: %s", app.state.vad_backend_name)
 
-    app.state.vad_factory = vad_factory
-    logger.info("VAD backend: %s", app.state.vad_backend_name)
+    readiness.add(COMPONENT_VAD, _init_vad)
 
     # v2.4: prompt-action templates registry, served at GET /actions.
     # Read the path through the services module each call so test monkeypatching
     # of DEFAULT_REGISTRY_PATH affects lifespan-time loading.
-    from app.services import actions as _actions_module
-
-    app.state.actions = load_actions(_actions_module.DEFAULT_REGISTRY_PATH)
-    app.state.action_categories = load_categories(_actions_module.DEFAULT_REGISTRY_PATH)
-    logger.info(
-        "Prompt-actions registry: %d entries loaded, %d categories",
-        len(app.state.actions),
-        len(app.state.action_categories),
-    )
+    def _load_actions() -> None:
+        from app.services import actions as _actions_module
+
+        app.state.actions = load_actions(_actions_module.DEFAULT_REGISTRY_PATH)
+        app.state.action_categories = load_categories(
+            _actions_module.DEFAULT_REGISTRY_PATH
+        )
+        logger.info(
+            "Prompt-actions registry: %d entries loaded, %d categories",
+            len(app.state.actions),
+            len(app.state.action_categories),
+        )
+
+    readiness.add(COMPONENT_ACTIONS, _load_actions)
+
+    def _init_llm() -> None:
+        app.state.llm_client = LLMClient(
+            api_key=config.GEMINI_API_KEY,
+            model=config.GEMINI_MODEL,
+            system_prompt=config.GEMINI_SYSTEM_PROMPT,
+        )
+        logger.info(
+            "Gemini LLM client: configured=%s, model=%s",
+            app.state.llm_client.configured,
+            app.state.llm_client.model,
+        )
+
+    readiness.add(COMPONENT_LLM, _init_llm)
+
+    # Dummy decodes + VAD call so the first real request does not pay the
+    # allocator / graph / page-in cost. Best-effort: never fails startup.
+    async def _warm_up() -> None:
+        from app.services.warmup import warm_up
 
-    app.state.llm_client = LLMClient(
-        api_key=config.GEMINI_API_KEY,
-        model=config.GEMINI_MODEL,
-        system_prompt=config.GEMINI_SYSTEM_PROMPT,
+        app.state.warmup = await warm_up(
+            app.state.whisper,
+            app.state.vad_factory(),
+            rounds=config.WARMUP_ROUNDS,
+            concurrency=config.CT2_NUM_WORKERS,
+        )
+
+    if config.WARMUP_ROUNDS > 0:
+        readiness.add(
+            COMPONENT_WARMUP, _warm_up, after=(COMPONENT_MODEL, COMPONENT_VAD)
+        )
+
+    # Decode-call scheduler: endpoints take a priority-bound view of the
+    # backend (live > interactive > batch); `app.state.whisper` stays raw.
+    from app.services.rtf import RtfTracker, backend_labels
+    from app.services.scheduler import Scheduler
+
+    app.state.scheduler = Scheduler(
+        max_inflight=config.SCHEDULER_MAX_INFLIGHT,
+        batch_slots=config.SCHEDULER_BATCH_SLOTS,
+        interactive_slots=config.SCHEDULER_INTERACTIVE_SLOTS,
+        batch_chunk_seconds=config.SCHEDULER_BATCH_CHUNK_SECONDS,
+        rtf=(
+            RtfTracker(capacity=config.RTF_SAMPLES)
+            if config.RTF_SAMPLES > 0
+            else None
+        ),
+        describe=lambda backend: backend_labels(
+            getattr(app.state, "model_pool", None), backend
+        ),
     )
-    logger.info(
-        "Gemini LLM client: configured=%s, model=%s",
-        app.state.llm_client.configured,
-        app.state.llm_client.model,
+
+    # Opt-in sampling profiler; idle (no thread) until a capture starts.
+    from app.services.profiling import SamplingProfiler
+
+    app.state.profiler = SamplingProfiler(
+        config.profiles_dir,
+        interval=config.PROFILE_INTERVAL_MS / 1000,
+        max_seconds=config.PROFILE_MAX_SECONDS,
     )
 
-    logger.info(
-        "Whisper backend ready (%s/%s) in %d ms",
-        metadata["backend"],
-        metadata["format"],
-        load_time_ms,
+    # Sticky per-client language for language="auto" (X-Client-Id header).
+    from app.services.language import LanguageCache
+
+    app.state.language_cache = (
+        LanguageCache(ttl_seconds=config.LANGUAGE_CACHE_TTL_SECONDS)
+        if config.LANGUAGE_CACHE_TTL_SECONDS > 0
+        else None
     )
 
     # Meeting analysis: lightweight job store always available; the analyzer
@@ -293,15 +494,68 @@ async def lifespan(app: FastAPI):
     # preconditions, so missing HF_TOKEN / missing CT2 variant never breaks
     # server startup.
     from app.services.meeting_jobs import JobStore
+    from app.services.meeting_journal import MeetingJobJournal
 
+    # Durable side of the meeting queue: spooled audio + `meeting_jobs` rows,
+    # kept in step with the in-memory store and replayed after a restart.
+    meeting_journal = MeetingJobJournal(config.meeting_jobs_dir)
+    app.state.meeting_journal = meeting_journal
     app.state.meeting_jobs = JobStore(
         ttl_seconds=config.MEETING_JOB_TTL_SECONDS,
         max_jobs=config.MEETING_MAX_JOBS,
+        on_change=meeting_journal.sync,
     )
     app.state.meeting_analyzer = None
 
+    # Shared admission queue for background decode work (async transcription
+    # jobs and meeting jobs, the latter capped at a concurrency sized from
+    # cores and RAM) and the store backing GET /transcribe/jobs/{id}.
+    from app.services.job_queue import JobQueue
+
+    app.state.job_queue = JobQueue.from_config(config)
+    app.state.transcribe_jobs = JobStore(
+        ttl_seconds=config.TRANSCRIBE_JOB_TTL_SECONDS,
+        max_jobs=config.TRANSCRIBE_MAX_JOBS,
+    )
+
+    async def _resume_meeting_jobs() -> list[asyncio.Task]:
+        if startup is not None:
+            await startup
+        if not (
+            readiness.is_ready(COMPONENT_DATABASE)
+            and readiness.is_ready(COMPONENT_MODEL)
+        ):
+            return []
+        from app.api.meeting import resume_meeting_jobs
+
+        try:
+            return resume_meeting_jobs(app)
+        except Exception:  # noqa: BLE001 — a bad journal must not stop serving
+            logger.exception("Failed to resume meeting jobs")
+            return []
+
+    startup: asyncio.Future | None = None
+    if config.STARTUP_MODE == "lazy":
+        # Serve /status (and anything whose components are ready) right away.
+        startup = asyncio.ensure_future(readiness.start())
+        resume: asyncio.Future = asyncio.ensure_future(_resume_meeting_jobs())
+    else:
+        await readiness.start()
+        readiness.raise_for_failure()
+        resume = asyncio.ensure_future(_resume_meeting_jobs())
+    app.state.lifespan_completed_at = time.time()
+
     yield
 
+    # Resumed jobs cancelled here stay journaled and resume on next start.
+    if not resume.done():
+        resume.cancel()
+    elif not resume.cancelled() and resume.exception() is None:
+        for task in resume.result():
+            task.cancel()
+    if startup is not None and not startup.done():
+        # Worker threads cannot be interrupted; the process exit reaps them.
+        logger.warning("Shutting down before startup finished")
     logger.info("Shutting down whisper-wrap API server")
 
 
@@ -313,6 +567,7 @@ app = FastAPI(
 )
 
 app.include_router(transcribe_router)
+app.include_router(transcribe_jobs_router)
 app.include_router(ask_router)
 app.include_router(status_router)
 app.include_router(listen_router)
@@ -321,6 +576,11 @@ app.include_router(actions_router)
 app.include_router(sessions_router)
 app.include_router(meeting_router)
 app.include_router(meeting_history_router)
+app.include_router(models_router)
+app.include_router(metrics_router)
+app.include_router(profiling_router)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # v2.4: PWA static bundle mounted at /app/. The bundle is produced by
 # `make build-frontend`; if it's missing (developer hasn't run the frontend
@@ -66,6 +66,7 @@ class WhisperBackend(Protocol):
         language: str,
         initial_prompt: str | None,
         task: str = "transcribe",
+        batched: bool | None = None,
     ) -> TranscriptionResult:
         """Transcribe a WAV file at `wav_path`.
 
@@ -73,6 +74,9 @@ class WhisperBackend(Protocol):
         is an optional bias string forwarded to the underlying model. `task` is
         `"transcribe"` (default) or `"translate"`; the latter routes through the
         underlying model's translation mode and the output language is English.
+        `batched` overrides the backend's configured decode strategy for this
+        call (``None`` = use the configured default); backends without a
+        batched decoder accept and ignore it.
 
         Raises `WhisperTranscriptionError` on inference failure and the standard
         `FileNotFoundError` when `wav_path` does not exist.
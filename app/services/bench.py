@@ -0,0 +1,320 @@
+"""Measurement helpers for the compute-type tuner and the fixture bench suite.
+
+`scripts/tune-compute-type.py` loads one registry model's CT2 variant once
+per (compute_type, cpu_threads) combination, decodes a fixture set at each
+beam size, and hands the timings and transcripts to the functions below:
+
+  - `error_rate` — a WER proxy: token edit distance between a run's
+    transcript and the *reference* run's, divided by the reference length.
+    Latin-script words are tokens; CJK characters are one token each, so
+    the number means the same for Breeze (zh) and English models. There is
+    no human ground truth — the question is only "how much does cheaper
+    precision change the output".
+  - `reference_run` — the highest-precision compute type at the largest
+    beam size (ties: more threads), i.e. the run everyone else is scored
+    against.
+  - `recommend` — the fastest run at the production beam size whose error
+    rate stays within `max_error_rate` of the reference, expressed as the
+    env settings that reproduce it. COMPUTE_TYPE / CPU_THREADS apply to
+    every decode, so a run only measured at a beam production never uses
+    (e.g. greedy beam=1) cannot pick them.
+
+`scripts/bench-suite.py` runs every transcription path over the test
+fixtures and scores each transcript with `similarity` against stored
+references; `compare_reports` diffs two of its JSON reports and flags rows
+that got slower or less accurate beyond a tolerance.
+
+Nothing here imports CTranslate2 at module level; `supported_compute_types`
+asks it lazily so the scoring functions stay usable in tests and reports.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import re
+import socket
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any
+
+# Most to least precise. Anything not listed (e.g. "default", "auto") ranks
+# below all of these — it is whatever CT2 picks and cannot be a reference.
+COMPUTE_TYPE_PRECISION = (
+    "float32",
+    "bfloat16",
+    "float16",
+    "int16",
+    "int8_float32",
+    "int8_bfloat16",
+    "int8_float16",
+    "int8",
+)
+DEFAULT_MAX_ERROR_RATE = 0.02
+# faster-whisper's default beam, which /transcribe and /listen finals decode
+# with; `recommend` only considers runs at this beam unless told otherwise.
+PRODUCTION_BEAM_SIZE = 5
+# `compare_reports` tolerances: wall time may grow 10 %, similarity may drop
+# 0.02 before a row counts as a regression. Wall time is noisy on shared
+# hosts; pass a larger tolerance there rather than chasing flakes.
+DEFAULT_TIME_TOLERANCE = 0.10
+DEFAULT_SIMILARITY_TOLERANCE = 0.02
+
+_CJK_RANGES = (
+    (0x3040, 0x30FF),  # Hiragana, Katakana
+    (0x3400, 0x4DBF),  # CJK Extension A
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0xAC00, 0xD7AF),  # Hangul syllables
+    (0xF900, 0xFAFF),  # CJK Compatibility Ideographs
+)
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class TuneConfig:
+    compute_type: str
+    cpu_threads: int | None
+    beam_size: int
+
+    @property
+    def label(self) -> str:
+        threads = self.cpu_threads if self.cpu_threads is not None else "default"
+        return f"{self.compute_type}/threads={threads}/beam={self.beam_size}"
+
+
+@dataclass
+class TuneRun:
+    config: TuneConfig
+    load_seconds: float = 0.0
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    texts: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def rtf(self) -> float | None:
+        if self.error or not self.audio_seconds:
+            return None
+        return self.wall_seconds / self.audio_seconds
+
+
+def _is_cjk(ch: str) -> bool:
+    code = ord(ch)
+    return any(lo <= code <= hi for lo, hi in _CJK_RANGES)
+
+
+def tokens(text: str) -> list[str]:
+    """Lower-cased word tokens; every CJK character is its own token."""
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    out: list[str] = []
+    for word in _WORD_RE.findall(normalized):
+        run = ""
+        for ch in word:
+            if _is_cjk(ch):
+                if run:
+                    out.append(run)
+                    run = ""
+                out.append(ch)
+            else:
+                run += ch
+        if run:
+            out.append(run)
+    return out
+
+
+def error_rate(reference: str, hypothesis: str) -> float:
+    """Token edit distance / reference length (0.0 = identical)."""
+    ref = tokens(reference)
+    hyp = tokens(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (r != h),  # substitution
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def similarity(reference: str, hypothesis: str) -> float:
+    """1.0 for an identical transcript, 0.0 at (or beyond) one error per token."""
+    return 1.0 - min(1.0, error_rate(reference, hypothesis))
+
+
+def precision_rank(compute_type: str) -> int:
+    """0 for the most precise type; unknown types rank last."""
+    try:
+        return COMPUTE_TYPE_PRECISION.index(compute_type)
+    except ValueError:
+        return len(COMPUTE_TYPE_PRECISION)
+
+
+def reference_run(runs: list[TuneRun]) -> TuneRun | None:
+    ok = [r for r in runs if r.error is None]
+    if not ok:
+        return None
+    return min(
+        ok,
+        key=lambda r: (
+            precision_rank(r.config.compute_type),
+            -r.config.beam_size,
+            -(r.config.cpu_threads or 0),
+        ),
+    )
+
+
+def score(runs: list[TuneRun]) -> list[dict[str, Any]]:
+    """One JSON-ready row per run, with its error rate against the reference."""
+    reference = reference_run(runs)
+    rows = []
+    for run in runs:
+        rate = None
+        if run.error is None and reference is not None:
+            rates = [
+                error_rate(reference.texts[name], run.texts.get(name, ""))
+                for name in reference.texts
+            ]
+            rate = round(sum(rates) / len(rates), 4) if rates else 0.0
+        rows.append(
+            {
+                "compute_type": run.config.compute_type,
+                "cpu_threads": run.config.cpu_threads,
+                "beam_size": run.config.beam_size,
+                "load_seconds": round(run.load_seconds, 2),
+                "audio_seconds": round(run.audio_seconds, 2),
+                "wall_seconds": round(run.wall_seconds, 3),
+                "rtf": round(run.rtf, 4) if run.rtf is not None else None,
+                "error_rate": rate,
+                "reference": run is reference,
+                "error": run.error,
+            }
+        )
+    return rows
+
+
+def recommend(
+    rows: list[dict[str, Any]],
+    *,
+    max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+    beam_size: int = PRODUCTION_BEAM_SIZE,
+) -> dict[str, Any] | None:
+    """Fastest scored row at `beam_size` within `max_error_rate`, as env
+    settings; None when no run at that beam qualifies."""
+    eligible = [
+        r
+        for r in rows
+        if r["beam_size"] == beam_size
+        and r["rtf"] is not None
+        and r["error_rate"] is not None
+        and r["error_rate"] <= max_error_rate
+    ]
+    if not eligible:
+        return None
+    best = min(eligible, key=lambda r: (r["rtf"], r["error_rate"]))
+    env = {"COMPUTE_TYPE": best["compute_type"]}
+    if best["cpu_threads"] is not None:
+        env["CPU_THREADS"] = str(best["cpu_threads"])
+    return {
+        "compute_type": best["compute_type"],
+        "cpu_threads": best["cpu_threads"],
+        "beam_size": best["beam_size"],
+        "rtf": best["rtf"],
+        "error_rate": best["error_rate"],
+        "max_error_rate": max_error_rate,
+        "env": env,
+    }
+
+
+def _row_key(row: dict[str, Any]) -> tuple[str, str]:
+    return row["path"], row["fixture"]
+
+
+def compare_reports(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    *,
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    similarity_tolerance: float = DEFAULT_SIMILARITY_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Per (path, fixture) deltas between two bench-suite reports.
+
+    A row is a regression when its wall time grew by more than
+    `time_tolerance` (relative), its similarity dropped by more than
+    `similarity_tolerance` (absolute), or it failed in `new` but not `old`.
+    Rows present in only one report are listed with `status` "added" /
+    "removed" and never count as regressions.
+    """
+    before = {_row_key(r): r for r in old.get("results", [])}
+    after = {_row_key(r): r for r in new.get("results", [])}
+    rows = []
+    for key in sorted(before.keys() | after.keys()):
+        a, b = before.get(key), after.get(key)
+        row: dict[str, Any] = {"path": key[0], "fixture": key[1]}
+        if a is None or b is None:
+            row["status"] = "added" if a is None else "removed"
+            row["regression"] = False
+            rows.append(row)
+            continue
+        reasons = []
+        if b.get("error") and not a.get("error"):
+            reasons.append("error")
+        wall_delta = None
+        if a.get("wall_seconds") and b.get("wall_seconds") is not None:
+            wall_delta = b["wall_seconds"] / a["wall_seconds"] - 1.0
+            if wall_delta > time_tolerance:
+                reasons.append("slower")
+        sim_delta = None
+        if a.get("similarity") is not None and b.get("similarity") is not None:
+            sim_delta = b["similarity"] - a["similarity"]
+            if -sim_delta > similarity_tolerance:
+                reasons.append("less accurate")
+        row.update(
+            status="changed" if reasons else "ok",
+            wall_delta=round(wall_delta, 4) if wall_delta is not None else None,
+            similarity_delta=round(sim_delta, 4) if sim_delta is not None else None,
+            peak_rss_delta_mb=(
+                round(b["peak_rss_mb"] - a["peak_rss_mb"], 1)
+                if a.get("peak_rss_mb") is not None
+                and b.get("peak_rss_mb") is not None
+                else None
+            ),
+            reasons=reasons,
+            regression=bool(reasons),
+        )
+        rows.append(row)
+    return rows
+
+
+def supported_compute_types(device: str) -> list[str]:
+    """Compute types CT2 can run on `device` here, most precise first."""
+    import ctranslate2
+
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    supported = set(ctranslate2.get_supported_compute_types(device))
+    return [ct for ct in COMPUTE_TYPE_PRECISION if ct in supported]
+
+
+def host_info() -> dict[str, Any]:
+    """Identifies the machine a tuning report applies to."""
+    info: dict[str, Any] = {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+    try:
+        import ctranslate2
+
+        info["ctranslate2"] = ctranslate2.__version__
+        info["cuda_devices"] = ctranslate2.get_cuda_device_count()
+    except ImportError:
+        pass
+    return info
@@ -0,0 +1,358 @@
+"""Prioritised admission queue shared by every background decode job.
+
+Async `/transcribe` + `/v1/audio/*` jobs and meeting jobs all run as FastAPI
+`BackgroundTasks`; before doing any model work each one awaits a slot here.
+The queue bounds how many jobs decode at once (`concurrency`) and grants free
+slots to the best waiting job first:
+
+  - `PRIORITY_INTERACTIVE` — short async transcriptions. Always eligible.
+  - `PRIORITY_BATCH` — long-form uploads.
+  - `PRIORITY_MEETING` — meeting jobs, the longest work the server does.
+    At most `meeting_slots` of them run at once (`MEETING_CONCURRENCY`,
+    sized from cores and RAM); `MeetingAnalyzer` interleaves the admitted
+    jobs stage by stage. Within the class a meeting's own priority is the
+    waiter's rank: `high` before `normal`.
+
+Batch and meeting jobs together may hold at most `batch_slots` slots
+(default `concurrency - 1` when concurrency > 1), so a burst of multi-hour
+uploads or meetings can never occupy every slot and starve a 30-second
+voice memo queued behind them.
+
+Within a priority class, jobs are FIFO (by rank, then arrival). There is no
+preemption — a running batch job keeps its slot until it finishes; the
+guarantee is only that new interactive work jumps the queue and finds a
+reserved slot.
+
+The queue is deliberately a gate rather than a worker pool: the job body
+stays a plain coroutine owned by the caller's background task, so cancellation,
+error mapping, and the `JobStore` bookkeeping remain where they already live
+(e.g. `app.api.transcribe_jobs.run_transcription_job`).
+
+`snapshot()` feeds the `queue` block of `/status`: depth and running count per
+class, plus rolling wait-time stats (enqueue → slot granted).
+
+The gate itself (`PriorityGate`) is class-agnostic; `app.services.scheduler`
+reuses it one level down, in front of individual backend calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+PRIORITY_MEETING = 2
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BATCH: "batch",
+    PRIORITY_MEETING: "meeting",
+}
+
+# Wait-time samples kept for the rolling stats in `snapshot()`.
+WAIT_SAMPLES = 512
+
+MEETING_PRIORITY_HIGH = 0
+MEETING_PRIORITY_NORMAL = 1
+MEETING_PRIORITY_NAMES = {
+    MEETING_PRIORITY_HIGH: "high",
+    MEETING_PRIORITY_NORMAL: "normal",
+}
+# Auto-sizing for the meeting class: a meeting job keeps a CT2 ASR pool
+# and a torch pool busy (~4 cores) and, for a 2 h file, its decoded audio
+# plus stage intermediates on top of the shared models.
+MEETING_CORES_PER_JOB = 4
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    rank: int
+    seq: int
+    job_id: str | None = field(compare=False, default=None)
+    enqueued_at: float = field(compare=False, default=0.0)
+    future: asyncio.Future = field(compare=False, default=None)  # type: ignore[assignment]
+
+
+class PriorityGate:
+    """Priority-ordered concurrency gate over an arbitrary set of classes.
+
+    `priorities` maps class id → display name; lower ids are served first,
+    then lower `rank` within a class, then arrival order.
+    `class_limits` optionally caps how many slots one class may hold at once
+    (a class without an entry is bounded only by `concurrency`). `clock` is
+    injected so tests can control wait-time accounting.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        priorities: dict[int, str],
+        class_limits: dict[int, int] | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self._names = dict(priorities)
+        self._limits = {
+            p: max(1, min(limit, self.concurrency))
+            for p, limit in (class_limits or {}).items()
+        }
+        self._clock = clock
+        self._seq = itertools.count()
+        # Kept sorted by (priority, seq) so position lookups and the
+        # eligibility scan in `_dispatch` walk waiters in grant order.
+        self._waiters: list[_Waiter] = []
+        self._running: dict[int, int] = dict.fromkeys(self._names, 0)
+        self._waits: deque[tuple[int, float]] = deque(maxlen=WAIT_SAMPLES)
+        self._completed: dict[int, int] = dict.fromkeys(self._names, 0)
+
+    # ---- public API ----
+
+    @asynccontextmanager
+    async def slot(
+        self, *, priority: int, job_id: str | None = None, rank: int = 0
+    ) -> AsyncIterator[None]:
+        """Wait for a slot, hold it for the `async with` body, then release."""
+        await self.acquire(priority=priority, job_id=job_id, rank=rank)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    async def acquire(
+        self, *, priority: int, job_id: str | None = None, rank: int = 0
+    ) -> None:
+        if priority not in self._names:
+            raise ValueError(f"unknown priority {priority!r}")
+        waiter = _Waiter(
+            priority=priority,
+            rank=rank,
+            seq=next(self._seq),
+            job_id=job_id,
+            enqueued_at=self._clock(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(self._waiters, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted and cancelled in the same tick — hand the slot back.
+                self.release(priority)
+            else:
+                self._remove(waiter)
+            raise
+
+    def release(self, priority: int) -> None:
+        self._running[priority] = max(0, self._running[priority] - 1)
+        self._completed[priority] += 1
+        self._dispatch()
+
+    def position(self, job_id: str) -> int | None:
+        """1-based position among waiters, or None when not waiting."""
+        for idx, waiter in enumerate(self._waiters):
+            if waiter.job_id == job_id:
+                return idx + 1
+        return None
+
+    def depth(self, priority: int | None = None) -> int:
+        if priority is None:
+            return len(self._waiters)
+        return sum(1 for w in self._waiters if w.priority == priority)
+
+    def running(self, priority: int | None = None) -> int:
+        if priority is None:
+            return sum(self._running.values())
+        return self._running[priority]
+
+    def snapshot(self) -> dict:
+        """JSON-ready view for `/status`."""
+        classes: dict[str, dict] = {}
+        for priority, name in self._names.items():
+            waits = [w for p, w in self._waits if p == priority]
+            classes[name] = {
+                "limit": self._limits.get(priority, self.concurrency),
+                "queued": self.depth(priority),
+                "running": self._running[priority],
+                "completed": self._completed[priority],
+                "wait_ms": _wait_stats(waits),
+            }
+        return {
+            "concurrency": self.concurrency,
+            "queued": self.depth(),
+            "running": self.running(),
+            "classes": classes,
+        }
+
+    # ---- internals ----
+
+    def _eligible(self, waiter: _Waiter) -> bool:
+        if self.running() >= self.concurrency:
+            return False
+        limit = self._limits.get(waiter.priority)
+        return limit is None or self._running[waiter.priority] < limit
+
+    def _dispatch(self) -> None:
+        granted = True
+        while granted and self._waiters and self.running() < self.concurrency:
+            granted = False
+            for waiter in self._waiters:
+                if waiter.future.done():
+                    # Cancelled while queued; `acquire` removes it.
+                    continue
+                if not self._eligible(waiter):
+                    continue
+                self._waiters.remove(waiter)
+                self._running[waiter.priority] += 1
+                self._waits.append(
+                    (waiter.priority, self._clock() - waiter.enqueued_at)
+                )
+                waiter.future.set_result(None)
+                logger.debug(
+                    "%s: granted %s slot to %s",
+                    type(self).__name__,
+                    self._names[waiter.priority],
+                    waiter.job_id,
+                )
+                granted = True
+                break
+
+    def _remove(self, waiter: _Waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._dispatch()
+
+
+class JobQueue(PriorityGate):
+    """Admission gate for background jobs. See module docstring."""
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 2,
+        batch_slots: int | None = None,
+        meeting_slots: int = 1,
+        clock=time.monotonic,
+    ) -> None:
+        concurrency = max(1, concurrency)
+        if batch_slots is None:
+            batch_slots = concurrency - 1 if concurrency > 1 else 1
+        batch_slots = max(1, min(batch_slots, concurrency))
+        super().__init__(
+            concurrency=concurrency,
+            priorities=PRIORITY_NAMES,
+            class_limits={
+                PRIORITY_BATCH: batch_slots,
+                PRIORITY_MEETING: min(max(1, meeting_slots), batch_slots),
+            },
+            clock=clock,
+        )
+        self.batch_slots = batch_slots
+        self.meeting_slots = self._limits[PRIORITY_MEETING]
+
+    @classmethod
+    def from_config(cls, config) -> JobQueue:
+        """`JOB_QUEUE_*` sizing plus the meeting class limit:
+        `MEETING_CONCURRENCY`, or the auto size when it is 0."""
+        from app.services.memory import available_memory_mb
+
+        meeting_slots = config.MEETING_CONCURRENCY or auto_meeting_concurrency(
+            cpu_count=os.cpu_count(),
+            available_mb=available_memory_mb(),
+            job_memory_mb=config.MEETING_JOB_MEMORY_MB,
+        )
+        queue = cls(
+            concurrency=config.JOB_QUEUE_CONCURRENCY,
+            batch_slots=config.JOB_QUEUE_BATCH_SLOTS,
+            meeting_slots=meeting_slots,
+        )
+        logger.info(
+            "Job queue: concurrency=%d batch_slots=%d meeting_slots=%d (%s)",
+            queue.concurrency,
+            queue.batch_slots,
+            queue.meeting_slots,
+            "configured" if config.MEETING_CONCURRENCY else "auto",
+        )
+        return queue
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        *,
+        priority: int = PRIORITY_INTERACTIVE,
+        job_id: str | None = None,
+        rank: int = 0,
+    ) -> AsyncIterator[None]:
+        async with super().slot(priority=priority, job_id=job_id, rank=rank):
+            yield
+
+    async def acquire(
+        self,
+        *,
+        priority: int = PRIORITY_INTERACTIVE,
+        job_id: str | None = None,
+        rank: int = 0,
+    ) -> None:
+        await super().acquire(priority=priority, job_id=job_id, rank=rank)
+
+    def snapshot(self) -> dict:
+        snap = super().snapshot()
+        snap["batch_slots"] = self.batch_slots
+        return snap
+
+    def _eligible(self, waiter: _Waiter) -> bool:
+        if not super()._eligible(waiter):
+            return False
+        if waiter.priority == PRIORITY_INTERACTIVE:
+            return True
+        # Batch and meeting jobs share the batch allowance, so together they
+        # never take the slot kept for interactive work.
+        background = self._running[PRIORITY_BATCH] + self._running[PRIORITY_MEETING]
+        return background < self.batch_slots
+
+
+def auto_meeting_concurrency(
+    *,
+    cpu_count: int | None,
+    available_mb: float | None,
+    job_memory_mb: int,
+) -> int:
+    """Meeting jobs this host can run side by side (at least 1).
+
+    Bounded by cores (`MEETING_CORES_PER_JOB` each) and, when the available
+    RAM is known, by `job_memory_mb` per job.
+    """
+    limit = max(1, (cpu_count or 1) // MEETING_CORES_PER_JOB)
+    if available_mb is not None and job_memory_mb > 0:
+        limit = min(limit, int(available_mb // job_memory_mb))
+    return max(1, limit)
+
+
+def _wait_stats(waits: list[float]) -> dict:
+    if not waits:
+        return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(waits)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.mean(ordered) * 1000, 1),
+        "p50": round(statistics.median(ordered) * 1000, 1),
+        "p95": round(p95 * 1000, 1),
+        "max": round(ordered[-1] * 1000, 1),
+    }
@@ -0,0 +1,232 @@
+"""Language-ID pre-pass, per-stream pinning, and the sticky per-client cache.
+
+With `language="auto"` Whisper re-detects the language on every call. For a
+single file that is one detection, but `/listen` re-transcribes the active
+utterance every ~500 ms and long-form / scheduler chunking decodes a file as
+dozens of independent pieces — each paying detection again, and each free to
+disagree with its neighbours. Three pieces remove that cost:
+
+  - `detect_language` — a language-ID-only pass over the first
+    `LANGUAGE_DETECT_SECONDS` of audio. Backends that expose a native
+    `detect_language(samples)` coroutine (CT2: encoder + one decoder step)
+    use it; others report `None` and callers keep `"auto"`.
+  - `LanguagePin` — one per `/listen` session. Runs the pre-pass once enough
+    speech has arrived, then hands the pinned language to every later
+    partial and final. Backends without native detection pin from the
+    first sufficiently long decode instead, at no extra cost.
+  - `LanguageCache` / `StickyLanguage` — per-client memory of the last
+    detected language, keyed by the `X-Client-Id` request header (never by
+    IP: clients behind one proxy would share an entry). Requests from a
+    known client with `language="auto"` skip detection entirely. An explicit
+    `language` always wins and is never overridden by the cache.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.services._whisper_backend import TranscriptionResult, WhisperBackend
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_RATE = 16_000
+CLIENT_ID_HEADER = "X-Client-Id"
+MAX_CLIENT_ID_LENGTH = 128
+# Labels that carry no language information and must never be pinned/cached.
+UNDETERMINED = frozenset({"", "auto", "und"})
+# Below this much audio, language ID is close to a coin toss — wait for more.
+MIN_PIN_SECONDS = 2.0
+# Same default faster-whisper uses for its own `language_detection_threshold`.
+PIN_THRESHOLD = 0.5
+# A stream that stays ambiguous (code-switching, music) stops paying for the
+# pre-pass after this many tries and keeps per-call detection.
+MAX_DETECT_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class LanguageGuess:
+    language: str
+    probability: float
+
+
+def can_detect(backend: WhisperBackend) -> bool:
+    """True when `backend` offers a native language-ID pass."""
+    flag = getattr(backend, "detects_language", None)
+    if isinstance(flag, bool):
+        return flag
+    return inspect.iscoroutinefunction(getattr(backend, "detect_language", None))
+
+
+async def detect_language(
+    backend: WhisperBackend,
+    samples: np.ndarray,
+    *,
+    max_seconds: float,
+) -> LanguageGuess | None:
+    """Language-ID pre-pass on the first `max_seconds` of `samples`.
+
+    Returns None when the backend has no native detector or the pass fails —
+    detection is an optimisation, so the caller just keeps `"auto"`.
+    """
+    if max_seconds <= 0 or not can_detect(backend):
+        return None
+    window = samples[: int(max_seconds * SAMPLE_RATE)]
+    try:
+        language, probability = await backend.detect_language(window)
+    except Exception:  # noqa: BLE001 — never fail the request over a hint
+        logger.warning("Language pre-pass failed; falling back to auto", exc_info=True)
+        return None
+    if not language or language in UNDETERMINED:
+        return None
+    return LanguageGuess(language=language, probability=float(probability))
+
+
+class LanguagePin:
+    """Language for one streaming session: fixed, or detected once and reused."""
+
+    def __init__(
+        self,
+        backend: WhisperBackend,
+        *,
+        language: str | None = "auto",
+        detect_seconds: float,
+    ) -> None:
+        self._backend = backend
+        self._detect_seconds = detect_seconds
+        self._attempts = 0
+        self.language: str | None = (
+            language if language and language not in UNDETERMINED else None
+        )
+
+    @property
+    def pinned(self) -> bool:
+        return self.language is not None
+
+    async def resolve(self, samples: np.ndarray) -> str:
+        """Language to pass for the next decode of `samples`."""
+        if self.language is not None:
+            return self.language
+        if (
+            self._detect_seconds > 0
+            and self._attempts < MAX_DETECT_ATTEMPTS
+            and len(samples) >= MIN_PIN_SECONDS * SAMPLE_RATE
+            and can_detect(self._backend)
+        ):
+            self._attempts += 1
+            guess = await detect_language(
+                self._backend, samples, max_seconds=self._detect_seconds
+            )
+            if guess is not None and guess.probability >= PIN_THRESHOLD:
+                self.language = guess.language
+                logger.info(
+                    "Pinned stream language %s (p=%.2f)",
+                    guess.language,
+                    guess.probability,
+                )
+                return self.language
+        return "auto"
+
+    def observe(self, result: TranscriptionResult, samples: np.ndarray) -> None:
+        """Pin from a finished decode when the backend cannot pre-detect."""
+        if self.language is not None or self._detect_seconds <= 0:
+            return
+        if can_detect(self._backend):
+            return
+        if len(samples) < MIN_PIN_SECONDS * SAMPLE_RATE:
+            return
+        language = getattr(result, "language", None)
+        if language and language not in UNDETERMINED:
+            self.language = language
+            logger.info("Pinned stream language %s from first decode", language)
+
+
+class LanguageCache:
+    """TTL + LRU map of client id → last detected language."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        clock=time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, client_id: str) -> str | None:
+        entry = self._entries.get(client_id)
+        if entry is None:
+            self._misses += 1
+            return None
+        language, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[client_id]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(client_id)
+        self._hits += 1
+        return language
+
+    def put(self, client_id: str, language: str) -> None:
+        if not language or language in UNDETERMINED:
+            return
+        self._entries[client_id] = (language, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(client_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+@dataclass
+class StickyLanguage:
+    """One request's view of the cache: resolve before decoding, remember after.
+
+    Only a language the backend actually detected is remembered. A decode
+    forced to the cached language reports that language back, and storing
+    it again would renew the TTL forever — an active client who switched
+    languages would never be re-detected.
+    """
+
+    cache: LanguageCache
+    client_id: str
+    _forced: bool = field(default=False, init=False)
+
+    def resolve(self, requested: str | None) -> str | None:
+        if requested not in (None, "auto"):
+            return requested
+        cached = self.cache.get(self.client_id)
+        self._forced = cached is not None
+        return cached or requested
+
+    def remember(self, requested: str | None, detected: str | None) -> None:
+        if requested in (None, "auto") and detected and not self._forced:
+            self.cache.put(self.client_id, detected)
+
+
+def sticky_for(state, headers) -> StickyLanguage | None:
+    """`StickyLanguage` for a request carrying `X-Client-Id`, else None."""
+    cache: LanguageCache | None = getattr(state, "language_cache", None)
+    if cache is None:
+        return None
+    client_id = (headers.get(CLIENT_ID_HEADER) or "").strip()[:MAX_CLIENT_ID_LENGTH]
+    if not client_id:
+        return None
+    return StickyLanguage(cache=cache, client_id=client_id)
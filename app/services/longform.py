@@ -0,0 +1,324 @@
+"""Long-form chunked transcription for multi-hour `/transcribe` uploads.
+
+A single `WhisperBackend.transcribe()` call decodes the whole file
+sequentially on one CT2 worker — a 2 h recording is wall-clock bound no
+matter how many cores the host has. This module splits the converted WAV at
+detected silences into independent chunks, transcribes them concurrently,
+then stitches the segments back onto the file's absolute timeline.
+
+Pipeline:
+  1. `load_wav_float32` decodes the 16 kHz mono WAV once (the converter
+     contract guarantees that shape).
+  2. `plan_chunks` scores 30 ms frames with the same int16 RMS threshold
+     `RmsVad` uses for `/listen`, collects silence runs, and cuts near
+     `target_seconds` at the centre of the nearest run. Chunks that find no
+     silence within `max_seconds` are hard-cut. Every chunk is padded with
+     `overlap_seconds` of context on each side.
+  3. Chunks go through `backend.transcribe()` as temp WAV files so the
+     caller's `initial_prompt` / `task` knobs survive. Concurrency is bounded
+     by a semaphore; real parallelism on CT2 needs `CT2_NUM_WORKERS > 1`.
+  4. `stitch_segments` shifts chunk-relative timestamps by the chunk offset
+     and keeps each segment only in the chunk that *owns* its midpoint, so
+     the overlap padding never yields duplicate text.
+
+The frame scoring is vectorised NumPy rather than a per-frame `VadBackend`
+call — `RmsVad.is_speech` unpacks with `struct`, which is fine for a 250 ms
+WS frame but far too slow for 240 k frames of a 2 h file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import wave
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.services._whisper_backend import (
+    Segment,
+    TranscriptionResult,
+    WhisperBackend,
+)
+from app.services.files import file_manager
+from app.services.language import PIN_THRESHOLD, detect_language
+from app.services.punctuation import join_newline_segments, normalize_punctuation
+from app.services.vad import DEFAULT_RMS_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_RATE = 16_000
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+# Silence runs shorter than this are ordinary inter-word gaps; cutting there
+# risks splitting a word across chunks.
+MIN_SILENCE_MS = 300
+# Never cut a chunk shorter than this fraction of the target — avoids a
+# burst of tiny chunks when the speaker pauses often.
+MIN_CHUNK_FRACTION = 0.5
+
+
+@dataclass
+class Chunk:
+    """One planned slice of the source waveform.
+
+    `start` / `end` are sample indices INCLUDING overlap padding (what gets
+    decoded). `owned_start` / `owned_end` are seconds on the absolute
+    timeline; a stitched segment is kept only when its midpoint falls in
+    `[owned_start, owned_end)`.
+    """
+
+    index: int
+    start: int
+    end: int
+    owned_start: float
+    owned_end: float
+
+    @property
+    def offset_seconds(self) -> float:
+        return self.start / SAMPLE_RATE
+
+
+def wav_duration_seconds(path: Path | str) -> float | None:
+    """Header-only duration probe. Returns None for anything `wave` can't parse."""
+    try:
+        with wave.open(str(path), "rb") as wf:
+            rate = wf.getframerate()
+            return wf.getnframes() / rate if rate else None
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def load_wav_float32(path: Path | str) -> np.ndarray:
+    """Decode a 16-bit PCM WAV into a float32 mono array in [-1, 1]."""
+    with wave.open(str(path), "rb") as wf:
+        n_channels = wf.getnchannels()
+        sample_width = wf.getsampwidth()
+        raw = wf.readframes(wf.getnframes())
+    if sample_width != 2:
+        raise RuntimeError(
+            f"long-form input WAV must be 16-bit PCM, got sample_width={sample_width}"
+        )
+    audio = np.frombuffer(raw, dtype=np.int16)
+    if n_channels > 1:
+        audio = audio.reshape(-1, n_channels).mean(axis=1)
+    return audio.astype(np.float32) / 32768.0
+
+
+def speech_frames(
+    samples: np.ndarray, *, threshold: float = DEFAULT_RMS_THRESHOLD
+) -> np.ndarray:
+    """Per-30 ms-frame speech mask. `threshold` is in int16 RMS units (RmsVad's scale)."""
+    n_frames = len(samples) // FRAME_SAMPLES
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+    frames = samples[: n_frames * FRAME_SAMPLES].reshape(n_frames, FRAME_SAMPLES)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1)) * 32768.0
+    return rms >= threshold
+
+
+def _silence_cut_points(mask: np.ndarray, *, min_silence_ms: int) -> np.ndarray:
+    """Sample index at the centre of every silence run of at least `min_silence_ms`."""
+    if mask.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    silent = (~mask).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], silent, [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    min_frames = max(1, min_silence_ms // FRAME_MS)
+    keep = (run_ends - run_starts) >= min_frames
+    centres = (run_starts[keep] + run_ends[keep]) // 2
+    return centres.astype(np.int64) * FRAME_SAMPLES
+
+
+def plan_chunks(
+    samples: np.ndarray,
+    *,
+    target_seconds: float,
+    max_seconds: float | None = None,
+    overlap_seconds: float = 1.0,
+    min_silence_ms: int = MIN_SILENCE_MS,
+    threshold: float = DEFAULT_RMS_THRESHOLD,
+) -> list[Chunk]:
+    """Split `samples` at silences into chunks of roughly `target_seconds`.
+
+    Returns at least one chunk for non-empty input. `max_seconds` defaults to
+    1.5 × target; when no silence run lands inside the window the chunk is
+    hard-cut there and the overlap padding + midpoint ownership absorb the
+    boundary.
+    """
+    total = len(samples)
+    if total == 0:
+        return []
+    target = int(target_seconds * SAMPLE_RATE)
+    hard_max = int((max_seconds or target_seconds * 1.5) * SAMPLE_RATE)
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+    cuts = _silence_cut_points(
+        speech_frames(samples, threshold=threshold), min_silence_ms=min_silence_ms
+    )
+
+    boundaries = [0]
+    cursor = 0
+    while total - cursor > hard_max:
+        lo = cursor + int(target * MIN_CHUNK_FRACTION)
+        hi = cursor + hard_max
+        window = cuts[(cuts > lo) & (cuts <= hi)]
+        if window.size:
+            ideal = cursor + target
+            cut = int(window[np.argmin(np.abs(window - ideal))])
+        else:
+            cut = hi
+        boundaries.append(cut)
+        cursor = cut
+    boundaries.append(total)
+
+    chunks: list[Chunk] = []
+    for i in range(len(boundaries) - 1):
+        lo, hi = boundaries[i], boundaries[i + 1]
+        chunks.append(
+            Chunk(
+                index=i,
+                start=max(0, lo - overlap),
+                end=min(total, hi + overlap),
+                owned_start=lo / SAMPLE_RATE,
+                # Last chunk owns everything to +inf so a segment whose
+                # end timestamp overshoots the file is still kept.
+                owned_end=hi / SAMPLE_RATE if i < len(boundaries) - 2 else float("inf"),
+            )
+        )
+    return chunks
+
+
+def stitch_segments(
+    chunk_results: list[tuple[Chunk, TranscriptionResult]],
+) -> list[Segment]:
+    """Shift chunk-relative segments onto the absolute timeline and dedupe overlap.
+
+    Ownership is by segment midpoint; in addition, an identical-text segment
+    that starts before the previous kept segment ended is dropped (the same
+    phrase decoded twice from both sides of a hard cut).
+    """
+    stitched: list[Segment] = []
+    for chunk, result in sorted(chunk_results, key=lambda cr: cr[0].index):
+        offset = chunk.offset_seconds
+        for seg in result.segments:
+            start = seg.start + offset
+            end = seg.end + offset
+            mid = (start + end) / 2
+            if not (chunk.owned_start <= mid < chunk.owned_end):
+                continue
+            if stitched:
+                prev = stitched[-1]
+                if seg.text.strip() == prev.text.strip() and start < prev.end:
+                    continue
+            stitched.append(Segment(text=seg.text, start=start, end=end))
+    return stitched
+
+
+def _write_chunk_wav(samples: np.ndarray) -> Path:
+    path = file_manager.create_temp_file(suffix=".wav")
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm)
+    return path
+
+
+def _dominant_language(chunk_results: list[tuple[Chunk, TranscriptionResult]]) -> str:
+    """Language carried by the most audio, so one noisy chunk can't flip the label."""
+    weights: Counter[str] = Counter()
+    for chunk, result in chunk_results:
+        if result.language:
+            weights[result.language] += chunk.end - chunk.start
+    if not weights:
+        return "und"
+    return weights.most_common(1)[0][0]
+
+
+async def transcribe_longform(
+    backend: WhisperBackend,
+    wav_path: Path,
+    *,
+    language: str | None = "auto",
+    initial_prompt: str | None = None,
+    task: str = "transcribe",
+    target_seconds: float = 120.0,
+    overlap_seconds: float = 1.0,
+    concurrency: int = 2,
+    detect_seconds: float = 0.0,
+) -> TranscriptionResult:
+    """Chunk `wav_path` at silences, transcribe chunks concurrently, and stitch.
+
+    Returns the same `TranscriptionResult` shape a single `backend.transcribe()`
+    would, with segment timestamps on the absolute timeline of the input file.
+
+    With `language="auto"` and `detect_seconds > 0`, a language-ID pre-pass on
+    the opening audio pins one language for every chunk, so chunks neither
+    repeat detection nor disagree with each other. Falls back to per-chunk
+    detection when the backend cannot pre-detect or the guess is unsure.
+    """
+    if not wav_path.exists():
+        raise FileNotFoundError(f"WAV file not found: {wav_path}")
+
+    samples = await asyncio.to_thread(load_wav_float32, wav_path)
+    chunks = plan_chunks(
+        samples, target_seconds=target_seconds, overlap_seconds=overlap_seconds
+    )
+    duration = len(samples) / SAMPLE_RATE
+    logger.info(
+        "Long-form transcription: %.1fs audio → %d chunks (target=%.0fs, concurrency=%d)",
+        duration,
+        len(chunks),
+        target_seconds,
+        concurrency,
+    )
+
+    pinned: str | None = None
+    if language in (None, "auto") and detect_seconds > 0:
+        guess = await detect_language(backend, samples, max_seconds=detect_seconds)
+        if guess is not None and guess.probability >= PIN_THRESHOLD:
+            pinned = guess.language
+            logger.info(
+                "Long-form language pre-pass: %s (p=%.2f)", pinned, guess.probability
+            )
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_chunk(chunk: Chunk) -> tuple[Chunk, TranscriptionResult]:
+        async with semaphore:
+            chunk_path = await asyncio.to_thread(
+                _write_chunk_wav, samples[chunk.start : chunk.end]
+            )
+            try:
+                result = await backend.transcribe(
+                    chunk_path,
+                    language=pinned or language,
+                    initial_prompt=initial_prompt,
+                    task=task,
+                )
+            finally:
+                file_manager.cleanup_file(chunk_path)
+        return chunk, result
+
+    chunk_results = list(await asyncio.gather(*(run_chunk(c) for c in chunks)))
+
+    segments = stitch_segments(chunk_results)
+    if pinned is not None:
+        detected = pinned
+    elif language in (None, "auto"):
+        detected = _dominant_language(chunk_results)
+    else:
+        detected = language
+    raw_text = "".join(s.text for s in segments).strip()
+    text = normalize_punctuation(join_newline_segments(raw_text), detected)
+    return TranscriptionResult(
+        text=text,
+        segments=segments,
+        language=detected,
+        duration_seconds=duration,
+    )
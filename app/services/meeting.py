@@ -8,22 +8,244 @@ isolated prevents accidental coupling to the /transcribe / /listen / /ask
 hot paths.
 
 Heavy imports (`whisperx`, `pyannote.audio`, `torch`) happen lazily inside
-`_load_pipeline()` so that:
+`_load_pipeline()` and the per-stage model loaders so that:
   - server startup is unaffected when the meeting endpoint is never called
   - servers without the optional `[meeting]` extras still start normally
   - tests can monkeypatch the per-stage methods without dragging the deps in
+
+The converted WAV is decoded once per job. Each analyze call wraps its path
+in a `SharedWaveform`; the first stage that needs samples decodes it
+(`load_meeting_audio`: the int16 PCM is memory-mapped and scaled into one
+float32 array) and every later stage gets that same array — WhisperX ASR
+and align take it as-is, pyannote gets a zero-copy `torch.from_numpy` view
+— instead of each stage re-decoding the file (two ffmpeg spawns plus a
+`wave` read, ~460 MB each for 2 h of audio).
+
+Alignment models are per language and outlive the job: `AlignModelCache`
+keeps the recently used ones (count- and size-bounded, LRU), so back-to-back
+meetings in one language load wav2vec2 once.
+
+The WhisperX ASR and the pyannote pipeline load the first time a job runs
+their stage, so fast mode (ASR by the server's own backend) never loads
+WhisperX ASR at all. When that backend is CTranslate2 on the same model
+directory, device and weight type, the WhisperX ASR wraps its
+`WhisperModel` rather than loading the weights a second time. With
+`idle_unload_seconds` set, sub-models unused that long are dropped
+(`MeetingAnalyzer.unload_idle`) and reload on the next job that needs them.
+
+Diarization turns stay NumPy arrays (`SpeakerTurns`) and `_merge` labels
+segments and words with `speaker_assign.assign_speakers`, a prefix-sum
+sweep, rather than WhisperX's per-word pandas overlap.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import gc
 import logging
+import os
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
+from app.services.metrics import observe_stage
+from app.services.speaker_assign import SpeakerTurns, assign_speakers
+
 logger = logging.getLogger(__name__)
 
+# `endpoint` label for per-stage metrics (both analyze paths).
+_METRICS_ENDPOINT = "/transcribe/meeting"
+
+# Model-running stages; each admits one job at a time (see MeetingAnalyzer).
+STAGES = ("asr", "align", "diarize")
+
+# `audio_converter.convert_to_wav` output rate; WhisperX and pyannote both
+# expect 16 kHz.
+SAMPLE_RATE = 16_000
+
+
+class SharedWaveform:
+    """One job's audio, decoded on first use and then shared by every stage."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self._audio: np.ndarray | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> np.ndarray:
+        # ASR and a parallel diarize task ask at once on the first stage;
+        # the lock makes the later caller wait for the one decode.
+        async with self._lock:
+            if self._audio is None:
+                import time as _time
+
+                start = _time.monotonic()
+                self._audio = await asyncio.to_thread(load_meeting_audio, self.path)
+                elapsed = _time.monotonic() - start
+                logger.info(
+                    "Meeting stage=decode done elapsed=%.1fs (%.0f MiB float32)",
+                    elapsed,
+                    self._audio.nbytes / (1024 * 1024),
+                )
+                observe_stage(_METRICS_ENDPOINT, "decode", elapsed)
+        return self._audio
+
+
+# What the per-stage methods accept: a job's `SharedWaveform`, an already
+# decoded array, or a WAV path they decode themselves (direct callers).
+AudioInput = SharedWaveform | str | os.PathLike | np.ndarray
+
+
+@dataclass
+class _AlignEntry:
+    model: Any
+    metadata: dict
+    size_mb: float
+    last_used: float
+
+
+class AlignModelCache:
+    """wav2vec2 alignment models kept across jobs, least-recently-used first.
+
+    Keyed by (language, model name, torch device) — `model_name=None` is
+    WhisperX's per-language default. Bounded like the ASR `ModelPool`: at
+    most `max_models` entries and, when `budget_mb` is set, their summed
+    parameter size. The model just loaded is never evicted, so a single
+    model larger than the budget still serves its job.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_models: int = 2,
+        budget_mb: int = 0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        import time as _time
+
+        self.max_models = max(1, max_models)
+        self.budget_mb = max(0, budget_mb)
+        self._clock = clock or _time.monotonic
+        self._entries: dict[tuple[str, str | None, str], _AlignEntry] = {}
+        # The align stage gate serialises jobs, but the preload languages
+        # load under the analyzer's load lock; this keeps the two from
+        # loading (or evicting) at once.
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def used_mb(self) -> float:
+        return sum(e.size_mb for e in self._entries.values())
+
+    async def get(
+        self, language: str, *, model_name: str | None, device: str
+    ) -> tuple[Any, dict]:
+        """(model, metadata) for `language`, loading it on a miss."""
+        key = (language, model_name, device)
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                entry.last_used = self._clock()
+                logger.info("Align model cache hit language=%s", language)
+                return entry.model, entry.metadata
+            self.misses += 1
+            import time as _time
+
+            import whisperx as _wx
+
+            start = _time.monotonic()
+            model, metadata = await asyncio.to_thread(
+                _wx.load_align_model,
+                language_code=language,
+                device=device,
+                model_name=model_name,
+            )
+            entry = _AlignEntry(model, metadata, _param_size_mb(model), self._clock())
+            self._entries[key] = entry
+            logger.info(
+                "Loaded align model language=%s in %.1fs (%.0f MiB, %d cached)",
+                language,
+                _time.monotonic() - start,
+                entry.size_mb,
+                len(self._entries),
+            )
+            self._enforce_limits(keep=key)
+            return model, metadata
+
+    def clear(self) -> int:
+        """Drop every cached model (idle unload); returns how many."""
+        dropped = len(self._entries)
+        self._entries.clear()
+        self.evictions += dropped
+        return dropped
+
+    def _enforce_limits(self, *, keep: tuple) -> None:
+        victims = sorted(
+            (k for k in self._entries if k != keep),
+            key=lambda k: self._entries[k].last_used,
+        )
+        evicted = False
+        for key in victims:
+            over_count = len(self._entries) > self.max_models
+            over_budget = self.budget_mb and self.used_mb() > self.budget_mb
+            if not (over_count or over_budget):
+                break
+            self._entries.pop(key)
+            self.evictions += 1
+            evicted = True
+            logger.info("Align model cache: evicted language=%s (LRU)", key[0])
+        if evicted:
+            gc.collect()
+
+
+def _param_size_mb(model: Any) -> float:
+    """Parameter + buffer bytes of a torch module in MiB; 0.0 for anything else."""
+    total = 0
+    for attr in ("parameters", "buffers"):
+        tensors = getattr(model, attr, None)
+        if not callable(tensors):
+            continue
+        total += sum(t.numel() * t.element_size() for t in tensors())
+    return total / (1024 * 1024)
+
+
+def _ct2_compatible(model: Any, *, device: str, compute_type: str) -> bool:
+    """Whether a loaded faster-whisper `WhisperModel` can serve the meeting
+    ASR: same CT2 device and, unless the meeting asks for "default", the
+    same weight type (CT2 reports e.g. "int8_float32" for an "int8" load)."""
+    ct2 = getattr(model, "model", None)
+    if getattr(ct2, "device", None) != device:
+        return False
+    if compute_type in ("default", "auto"):
+        return True
+    loaded = str(getattr(ct2, "compute_type", ""))
+    return loaded.split("_")[0] == compute_type.split("_")[0]
+
+
+def _whisperx_model_view(model: Any) -> Any:
+    """`model` as WhisperX's `WhisperModel` subclass, which adds the batched
+    decode its pipeline calls. The view shares the original's attributes —
+    the CT2 model, tokenizer, feature extractor — so no weights are copied.
+    """
+    from whisperx.asr import WhisperModel as WhisperXModel
+
+    if isinstance(model, WhisperXModel):
+        return model
+    view = WhisperXModel.__new__(WhisperXModel)
+    view.__dict__.update(model.__dict__)
+    return view
+
 
 @dataclass
 class Word:
@@ -59,18 +281,43 @@ class MeetingExtrasMissingError(MeetingAnalysisError):
 
 
 ProgressCallback = Callable[[str, float], None]
+# (stage, state) with state one of "waiting" | "running" | "done" | "skipped"
+# | "reused" (saved output, reanalysis) | "failed".
+# Progress stays one number on the foreground stage; this reports every
+# stage's own state, which is how concurrent diarize becomes visible.
+StageCallback = Callable[[str, str], None]
+# (stage, output) once a stage's output is final, as plain JSON (see
+# `asr_stage_output` and friends). The durable job queue keeps them so a
+# resumed job skips finished stages; finished meetings keep them so
+# `reanalyze` only recomputes what a parameter change invalidates.
+CheckpointCallback = Callable[[str, dict[str, Any]], None]
+# (new segments, language) as chunked ASR finishes each chunk — timed
+# segment text on the file's absolute timeline, in order and never
+# repeated. Lets a job's status carry the transcript while ASR still runs.
+PartialCallback = Callable[[list[dict[str, Any]], str | None], None]
+# Opens one scheduler slot around a decode on a borrowed server model.
+DecodeSlot = Callable[[], contextlib.AbstractAsyncContextManager[None]]
 
 
 class MeetingAnalyzer:
     """WhisperX-backed meeting analysis pipeline (ASR + align + diarize).
 
-    The constructor records configuration but does NOT load any models — the
-    first call to `analyze()` triggers `_load_pipeline()`. After loading the
-    pipeline stays resident for the lifetime of the process.
-
-    Concurrency: a single `asyncio.Lock` serialises calls so only one analysis
-    runs at a time per process. Whisper + pyannote are CPU-bound; running two
-    in parallel would just double memory and halve throughput.
+    The constructor records configuration but does NOT load any models —
+    each stage loads its own on first use (see the module docstring). They
+    stay resident until idle for `idle_unload_seconds` (0 = for the
+    lifetime of the process).
+
+    Concurrency: calls may overlap, but each stage (asr / align / diarize)
+    admits one job at a time. Running two ASRs in parallel would just double
+    memory and halve throughput; running job A's diarize while job B is in
+    ASR uses otherwise idle cores. How many jobs are in flight at all is
+    decided by the caller (the shared `JobQueue` for the HTTP endpoint).
+
+    Within one analysis, `parallel_diarize=True` starts diarization as soon
+    as the job begins (it needs only the audio) and joins it before
+    `_merge`, so the job takes max(asr + align, diarize) instead of the sum.
+    A diarize failure cancels the foreground stages rather than waiting for
+    them.
     """
 
     def __init__(
@@ -85,7 +332,19 @@ class MeetingAnalyzer:
         cpu_threads: int | None = None,
         batch_size: int = 32,
         torch_device: str = "cpu",
+        parallel_diarize: bool = False,
+        diarize_threads: int = 0,
+        align_cache_size: int = 2,
+        align_cache_mb: int = 0,
+        align_preload_languages: tuple[str, ...] = (),
+        asr_chunk_seconds: int = 0,
+        idle_unload_seconds: int = 0,
+        shared_backends: Callable[[], list[Any]] | None = None,
+        shared_decode_slot: DecodeSlot | None = None,
+        clock: Callable[[], float] | None = None,
     ) -> None:
+        import time as _time
+
         self.ct2_model_dir = ct2_model_dir
         self.hf_token = hf_token
         self.diarization_pipeline_name = diarization_pipeline
@@ -103,17 +362,75 @@ class MeetingAnalyzer:
         # `device` because pyannote / wav2vec2 are torch-native and CAN use
         # MPS on Apple Silicon, while ct2 cannot. Resolved by from_config().
         self.torch_device = torch_device
+        # Run diarize as a task alongside ASR + align instead of after them.
+        # diarize_threads caps torch's CPU pool in that mode so pyannote and
+        # CT2 ASR split the cores (0 = half of them); see _load_pipeline.
+        self.parallel_diarize = parallel_diarize
+        self.diarize_threads = diarize_threads
+        # wav2vec2 align models survive across jobs (see AlignModelCache);
+        # the preload languages are loaded with the rest of the pipeline.
+        self._align_cache = AlignModelCache(
+            max_models=align_cache_size, budget_mb=align_cache_mb
+        )
+        self.align_preload_languages = align_preload_languages
+        # > 0: ASR decodes the audio in silence-cut chunks of about this
+        # many seconds when the caller wants partial results, reporting
+        # segments and progress after each one (see _run_asr_chunked).
+        self.asr_chunk_seconds = asr_chunk_seconds
+        # Sub-models load on first use by their stage (see _asr_model and
+        # _diarize_pipeline) and, when > 0, are dropped again after this
+        # many seconds without a job in that stage.
+        self.idle_unload_seconds = max(0, idle_unload_seconds)
+        # Resident main-process backends (app.state.whisper and friends).
+        # One on the same CT2 weights lends its WhisperModel to the ASR
+        # stage instead of WhisperX loading a second copy. Each decode on a
+        # borrowed model runs inside `shared_decode_slot()` (a scheduler
+        # batch slot), so it queues with the server's other decodes rather
+        # than ahead of them in the CT2 worker queue.
+        self.shared_backends = shared_backends
+        self.shared_decode_slot = shared_decode_slot
+        self._clock = clock or _time.monotonic
         self._asr: Any = None
+        self._asr_shared = False
+        self._asr_lender: Any = None
         self._diarize: Any = None
-        self._lock = asyncio.Lock()
+        self._last_used: dict[str, float] = {}
+        self._idle_timer: asyncio.TimerHandle | None = None
+        # Jobs run concurrently (admission is the job queue's meeting
+        # class); each stage admits one job at a time, so two jobs interleave
+        # — one in ASR while another aligns or diarizes — without two of
+        # them sharing one model or doubling a stage's peak memory.
+        self._load_lock = asyncio.Lock()
+        self._stage_gates = {stage: asyncio.Semaphore(1) for stage in STAGES}
         self._loaded = False
 
     @property
     def loaded(self) -> bool:
-        return self._loaded
+        """True while any sub-model (ASR, diarize, align) is resident."""
+        return any(state != "unloaded" for state in self.resident_models().values())
+
+    def resident_models(self) -> dict[str, str]:
+        """Per stage: "unloaded", "resident", or "shared" (the ASR wraps a
+        main-backend WhisperModel, so it holds no weights of its own)."""
+        self._drop_orphaned_asr()
+        if self._asr is None:
+            asr = "unloaded"
+        else:
+            asr = "shared" if self._asr_shared else "resident"
+        return {
+            "asr": asr,
+            "align": "resident" if len(self._align_cache) else "unloaded",
+            "diarize": "unloaded" if self._diarize is None else "resident",
+        }
 
     @classmethod
-    def from_config(cls, config: Any) -> MeetingAnalyzer:
+    def from_config(
+        cls,
+        config: Any,
+        *,
+        shared_backends: Callable[[], list[Any]] | None = None,
+        shared_decode_slot: DecodeSlot | None = None,
+    ) -> MeetingAnalyzer:
         """Construct an analyzer from a populated `app.config.Config` instance.
 
         Resolves the CT2 ASR model directory AND its registry-declared
@@ -127,6 +444,10 @@ class MeetingAnalyzer:
         because CPU lacks float16 SIMD). On CPU we map int8_float16 →
         int8, which is supported and gives the same ~3x speedup over
         float32 without needing a separate registry entry.
+
+        `shared_backends` lists the server's resident backends and
+        `shared_decode_slot` gates decodes on them (see `__init__`);
+        `MEETING_SHARE_ASR_MODEL=false` ignores both.
         """
         from app.services.registry import (
             DEFAULT_MODELS_ROOT,
@@ -151,6 +472,7 @@ class MeetingAnalyzer:
         # the torch import cost.
         configured_td = (getattr(config, "MEETING_TORCH_DEVICE", "auto") or "auto").lower()
         torch_device = _resolve_torch_device(configured_td)
+        share = getattr(config, "MEETING_SHARE_ASR_MODEL", True)
 
         return cls(
             ct2_model_dir=str(DEFAULT_MODELS_ROOT / variant["local_dir"]),
@@ -161,34 +483,67 @@ class MeetingAnalyzer:
             cpu_threads=getattr(config, "CPU_THREADS", None),
             batch_size=getattr(config, "MEETING_BATCH_SIZE", 32),
             torch_device=torch_device,
+            parallel_diarize=getattr(config, "MEETING_PARALLEL_DIARIZE", False),
+            diarize_threads=getattr(config, "MEETING_DIARIZE_THREADS", 0),
+            align_cache_size=getattr(config, "MEETING_ALIGN_CACHE_SIZE", 2),
+            align_cache_mb=getattr(config, "MEETING_ALIGN_CACHE_MB", 0),
+            align_preload_languages=tuple(
+                getattr(config, "MEETING_ALIGN_PRELOAD_LANGUAGES", ())
+            ),
+            asr_chunk_seconds=getattr(config, "MEETING_ASR_CHUNK_SECONDS", 0),
+            idle_unload_seconds=getattr(config, "MEETING_IDLE_UNLOAD_SECONDS", 0),
+            shared_backends=shared_backends if share else None,
+            shared_decode_slot=shared_decode_slot if share else None,
         )
 
     async def _load_pipeline(self) -> None:
-        """Import and instantiate the WhisperX ASR model and the pyannote
-        diarization pipeline. Alignment models are loaded per language on
-        demand inside `_run_align`.
+        """Check the meeting extras import and do the one-time setup.
+
+        The models themselves load per stage on first use — the ASR in
+        `_asr_model`, pyannote in `_diarize_pipeline`, wav2vec2 per language
+        in `AlignModelCache` — so a job that never runs a stage (fast mode's
+        external ASR, a diarize-only reanalysis) never loads its model.
+        `align_preload_languages` are loaded here so the first job in them
+        doesn't pay for it.
         """
         if self._loaded:
             return
         try:
             import whisperx  # noqa: F401
-            from pyannote.audio import Pipeline
+            from pyannote.audio import Pipeline  # noqa: F401
         except ImportError as e:
             raise MeetingExtrasMissingError("meeting extras not installed") from e
 
+        # In parallel mode pyannote (and wav2vec2 align) compete with CT2
+        # ASR for the same cores; torch's default pool is all of them.
+        # Give the torch stages their own budget so neither track thrashes.
+        if self.parallel_diarize and self.torch_device == "cpu":
+            import torch
+
+            threads = self.diarize_threads or max(1, (os.cpu_count() or 2) // 2)
+            torch.set_num_threads(threads)
+            logger.info("Parallel diarize: torch intra-op threads=%d", threads)
+        for language in self.align_preload_languages:
+            try:
+                await self._align_cache.get(
+                    language, model_name=self.align_model_name, device=self.torch_device
+                )
+            except Exception as e:  # noqa: BLE001 — a bad preload must not block jobs
+                logger.warning("Failed to preload align model for %s: %s", language, e)
+        if self.align_preload_languages:
+            self._touch("align")
+        self._loaded = True
+
+    async def _asr_model(self) -> Any:
+        """The WhisperX ASR pipeline, loaded on first use. Called inside the
+        asr stage gate, so concurrent jobs never load it twice."""
+        self._drop_orphaned_asr()
+        if self._asr is not None:
+            return self._asr
         import time as _time
 
         import whisperx as _wx
 
-        load_start = _time.monotonic()
-        logger.info(
-            "Loading WhisperX ASR model from %s (compute_type=%s, device=%s, cpu_threads=%s)",
-            self.ct2_model_dir,
-            self.compute_type,
-            self.device,
-            self.cpu_threads if self.cpu_threads is not None else "default",
-        )
-        asr_load_start = _time.monotonic()
         # WhisperX forwards extra kwargs to faster-whisper's WhisperModel.
         # cpu_threads is a real WhisperModel parameter; only pass it when
         # set so we don't override CT2's heuristic when the user hasn't
@@ -199,22 +554,80 @@ class MeetingAnalyzer:
         }
         if self.cpu_threads is not None:
             load_kwargs["threads"] = self.cpu_threads
+        shared = self._shared_whisper_model()
+        if shared is not None:
+            # WhisperX wraps the given model instead of loading the
+            # directory, so the CT2 weights stay a single copy.
+            load_kwargs["model"] = _whisperx_model_view(shared)
+        logger.info(
+            "Loading WhisperX ASR model from %s (compute_type=%s, device=%s, "
+            "cpu_threads=%s, shared=%s)",
+            self.ct2_model_dir,
+            self.compute_type,
+            self.device,
+            self.cpu_threads if self.cpu_threads is not None else "default",
+            shared is not None,
+        )
+        start = _time.monotonic()
         self._asr = await asyncio.to_thread(
             _wx.load_model,
             self.ct2_model_dir,
             **load_kwargs,
         )
-        logger.info(
-            "Loaded WhisperX ASR model in %.1fs",
-            _time.monotonic() - asr_load_start,
-        )
+        self._asr_shared = shared is not None
+        self._asr_lender = shared
+        logger.info("Loaded WhisperX ASR model in %.1fs", _time.monotonic() - start)
+        return self._asr
+
+    def _drop_orphaned_asr(self) -> None:
+        """Forget a shared ASR whose lending `WhisperModel` is no longer
+        resident (hot-swapped out or evicted from the model pool): holding
+        on would keep its weights alive outside the pool's accounting. The
+        next job wraps a current model or loads its own."""
+        if not self._asr_shared:
+            return
+        backends = self.shared_backends() if self.shared_backends else []
+        if any(getattr(b, "model", None) is self._asr_lender for b in backends):
+            return
+        logger.info("Dropping shared WhisperX ASR: its server model was unloaded")
+        self._asr = None
+        self._asr_shared = False
+        self._asr_lender = None
+
+    def _shared_whisper_model(self) -> Any | None:
+        """A resident main-backend `WhisperModel` on the same CT2 directory,
+        device and weight type as the meeting ASR, or None."""
+        if self.shared_backends is None:
+            return None
+        wanted = os.path.realpath(self.ct2_model_dir)
+        for backend in self.shared_backends():
+            model_dir = getattr(backend, "model_dir", None)
+            model = getattr(backend, "model", None)
+            if model is None or not model_dir:
+                continue
+            if os.path.realpath(model_dir) != wanted:
+                continue
+            if _ct2_compatible(
+                model, device=self.device, compute_type=self.compute_type
+            ):
+                return model
+        return None
+
+    async def _diarize_pipeline(self) -> Any:
+        """The pyannote pipeline, loaded on first use inside the diarize gate."""
+        if self._diarize is not None:
+            return self._diarize
+        import time as _time
+
+        from pyannote.audio import Pipeline
+
         logger.info(
             "Loading pyannote diarization pipeline %s (torch_device=%s)",
             self.diarization_pipeline_name,
             self.torch_device,
         )
-        diar_load_start = _time.monotonic()
-        self._diarize = await asyncio.to_thread(
+        start = _time.monotonic()
+        pipeline = await asyncio.to_thread(
             Pipeline.from_pretrained,
             self.diarization_pipeline_name,
             token=self.hf_token,
@@ -230,7 +643,7 @@ class MeetingAnalyzer:
             import torch
 
             try:
-                await asyncio.to_thread(self._diarize.to, torch.device(self.torch_device))
+                await asyncio.to_thread(pipeline.to, torch.device(self.torch_device))
                 logger.info(
                     "Moved pyannote pipeline to %s for accelerated inference",
                     self.torch_device,
@@ -241,15 +654,70 @@ class MeetingAnalyzer:
                     self.torch_device,
                     e,
                 )
-        logger.info(
-            "Loaded pyannote pipeline in %.1fs",
-            _time.monotonic() - diar_load_start,
-        )
-        self._loaded = True
-        logger.info(
-            "Meeting pipeline ready (total load %.1fs)",
-            _time.monotonic() - load_start,
-        )
+        self._diarize = pipeline
+        logger.info("Loaded pyannote pipeline in %.1fs", _time.monotonic() - start)
+        return pipeline
+
+    def unload_idle(self, *, now: float | None = None) -> list[str]:
+        """Drop the sub-models of stages unused for `idle_unload_seconds`.
+
+        A stage with a job inside it is never idle. Returns the stages
+        unloaded; their models load again on the next job that needs them.
+        """
+        if self.idle_unload_seconds <= 0:
+            return []
+        now = self._clock() if now is None else now
+        resident = self.resident_models()
+        unloaded: list[str] = []
+        for stage in STAGES:
+            last_used = self._last_used.get(stage)
+            if resident[stage] == "unloaded" or last_used is None:
+                continue
+            if self._stage_gates[stage].locked():
+                continue
+            if now - last_used < self.idle_unload_seconds:
+                continue
+            if stage == "asr":
+                self._asr = None
+                self._asr_shared = False
+                self._asr_lender = None
+            elif stage == "diarize":
+                self._diarize = None
+            else:
+                self._align_cache.clear()
+            unloaded.append(stage)
+        if unloaded:
+            gc.collect()
+            logger.info(
+                "Unloaded idle meeting models: %s (idle >= %ds)",
+                ", ".join(unloaded),
+                self.idle_unload_seconds,
+            )
+        return unloaded
+
+    def _touch(self, stage: str) -> None:
+        """Record a stage's use and make sure an idle check is scheduled."""
+        self._last_used[stage] = self._clock()
+        if self.idle_unload_seconds > 0 and self._idle_timer is None:
+            self._schedule_idle_check(self.idle_unload_seconds)
+
+    def _schedule_idle_check(self, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        self._idle_timer = loop.call_later(delay, self._on_idle_timer)
+
+    def _on_idle_timer(self) -> None:
+        self._idle_timer = None
+        self.unload_idle()
+        # Re-arm for whichever resident stage goes idle next.
+        now = self._clock()
+        resident = self.resident_models()
+        deadlines = [
+            self._last_used[stage] + self.idle_unload_seconds - now
+            for stage in STAGES
+            if resident[stage] != "unloaded" and stage in self._last_used
+        ]
+        if deadlines:
+            self._schedule_idle_check(max(1.0, min(deadlines)))
 
     async def analyze(
         self,
@@ -261,62 +729,63 @@ class MeetingAnalyzer:
         max_speakers: int | None = None,
         enable_word_timestamps: bool = True,
         progress_callback: ProgressCallback | None = None,
+        stage_callback: StageCallback | None = None,
+        checkpoint_callback: CheckpointCallback | None = None,
+        partial_callback: PartialCallback | None = None,
     ) -> MeetingResult:
-        async with self._lock:
-            # Per-stage timing log. Uses time.monotonic() so wall-clock
-            # adjustments don't skew the elapsed numbers. Same lines also
-            # double as the canonical "how long did each stage take" record
-            # that future regressions can be compared against.
-            import time as _time
+        # Per-stage timing log. Uses time.monotonic() so wall-clock
+        # adjustments don't skew the elapsed numbers. Same lines also
+        # double as the canonical "how long did each stage take" record
+        # that future regressions can be compared against.
+        import time as _time
 
-            pipeline_start = _time.monotonic()
+        pipeline_start = _time.monotonic()
+        async with self._load_lock:
             await self._load_pipeline()
+        audio = SharedWaveform(audio_path)
 
-            _report(progress_callback, "asr", 0.1)
-            asr_start = _time.monotonic()
-            logger.info("Meeting stage=asr start")
-            asr_out = await self._run_asr(audio_path, language=language)
-            asr_elapsed = _time.monotonic() - asr_start
-            logger.info("Meeting stage=asr done elapsed=%.1fs", asr_elapsed)
-
-            align_elapsed = 0.0
-            if enable_word_timestamps:
-                _report(progress_callback, "align", 0.4)
-                align_start = _time.monotonic()
-                logger.info("Meeting stage=align start")
-                aligned = await self._run_align(asr_out, audio_path)
-                align_elapsed = _time.monotonic() - align_start
-                logger.info("Meeting stage=align done elapsed=%.1fs", align_elapsed)
+        _report(progress_callback, "asr", 0.1)
+        # Started after the first checkpoint so a job cancelled before
+        # it began never spends time in pyannote.
+        diarize_task = self._start_diarize(
+            audio,
+            stage_callback,
+            num_speakers=num_speakers,
+            min_speakers=min_speakers,
+            max_speakers=max_speakers,
+        )
+        try:
+            if partial_callback is not None and self.asr_chunk_seconds > 0:
+                asr_coro = self._run_asr_chunked(
+                    audio,
+                    language=language,
+                    partial_callback=partial_callback,
+                    progress_callback=progress_callback,
+                )
             else:
-                logger.info("Meeting stage=align skipped (word_timestamps=false)")
-                aligned = asr_out
-
-            _report(progress_callback, "diarize", 0.7)
-            diar_start = _time.monotonic()
-            logger.info("Meeting stage=diarize start")
-            diarize_out = await self._run_diarize(
-                audio_path,
+                asr_coro = self._run_asr(audio, language=language)
+            asr_out, asr_elapsed = await _alongside(
+                self._timed_stage("asr", asr_coro, stage_callback),
+                diarize_task,
+            )
+            _checkpoint(checkpoint_callback, "asr", asr_stage_output, asr_out)
+
+            return await self._align_diarize_merge(
+                asr_out,
+                audio,
+                diarize_task,
+                pipeline_start=pipeline_start,
+                asr_elapsed=asr_elapsed,
                 num_speakers=num_speakers,
                 min_speakers=min_speakers,
                 max_speakers=max_speakers,
+                enable_word_timestamps=enable_word_timestamps,
+                progress_callback=progress_callback,
+                stage_callback=stage_callback,
+                checkpoint_callback=checkpoint_callback,
             )
-            diar_elapsed = _time.monotonic() - diar_start
-            logger.info("Meeting stage=diarize done elapsed=%.1fs", diar_elapsed)
-
-            result = self._merge(
-                aligned, diarize_out, enable_word_timestamps=enable_word_timestamps
-            )
-            _report(progress_callback, "complete", 1.0)
-            total = _time.monotonic() - pipeline_start
-            logger.info(
-                "Meeting pipeline complete total=%.1fs"
-                " (asr=%.1fs align=%.1fs diarize=%.1fs)",
-                total,
-                asr_elapsed,
-                align_elapsed,
-                diar_elapsed,
-            )
-            return result
+        finally:
+            _cancel(diarize_task)
 
     async def analyze_with_external_asr(
         self,
@@ -329,6 +798,8 @@ class MeetingAnalyzer:
         max_speakers: int | None = None,
         enable_word_timestamps: bool = True,
         progress_callback: ProgressCallback | None = None,
+        stage_callback: StageCallback | None = None,
+        checkpoint_callback: CheckpointCallback | None = None,
     ) -> MeetingResult:
         """Run align + diarize + merge given pre-computed ASR segments.
 
@@ -349,103 +820,403 @@ class MeetingAnalyzer:
         result is byte-for-byte identical with the slow-path output for
         the same effective transcript — only the ASR backend swapped.
         """
-        async with self._lock:
-            import time as _time
+        import time as _time
 
-            pipeline_start = _time.monotonic()
+        pipeline_start = _time.monotonic()
+        async with self._load_lock:
             await self._load_pipeline()
+        audio = SharedWaveform(audio_path)
 
-            # The "asr_external" stage label distinguishes this path from
-            # the WhisperX ASR stage in log scrapers and progress UI.
-            _report(progress_callback, "asr_external", 0.1)
-            logger.info(
-                "Meeting stage=asr_external (using external segments, %d items)",
-                len(asr_segments),
-            )
-
+        # The "asr_external" stage label distinguishes this path from
+        # the WhisperX ASR stage in log scrapers and progress UI.
+        _report(progress_callback, "asr_external", 0.1)
+        logger.info(
+            "Meeting stage=asr_external (using external segments, %d items)",
+            len(asr_segments),
+        )
+        _stage(stage_callback, "asr_external", "done")
+        diarize_task = self._start_diarize(
+            audio,
+            stage_callback,
+            num_speakers=num_speakers,
+            min_speakers=min_speakers,
+            max_speakers=max_speakers,
+        )
+        try:
             asr_out: dict[str, Any] = {
                 "language": language,
                 "segments": asr_segments,
             }
+            return await self._align_diarize_merge(
+                asr_out,
+                audio,
+                diarize_task,
+                pipeline_start=pipeline_start,
+                asr_elapsed=None,
+                num_speakers=num_speakers,
+                min_speakers=min_speakers,
+                max_speakers=max_speakers,
+                enable_word_timestamps=enable_word_timestamps,
+                progress_callback=progress_callback,
+                stage_callback=stage_callback,
+                checkpoint_callback=checkpoint_callback,
+            )
+        finally:
+            _cancel(diarize_task)
 
-            align_elapsed = 0.0
-            if enable_word_timestamps:
-                _report(progress_callback, "align", 0.4)
-                align_start = _time.monotonic()
-                logger.info("Meeting stage=align start (fast path)")
-                aligned = await self._run_align(asr_out, audio_path)
-                align_elapsed = _time.monotonic() - align_start
-                logger.info(
-                    "Meeting stage=align done elapsed=%.1fs", align_elapsed
-                )
-            else:
-                logger.info(
-                    "Meeting stage=align skipped (word_timestamps=false)"
+    async def reanalyze(
+        self,
+        audio_path: str | None,
+        *,
+        stages: dict[str, dict[str, Any]],
+        num_speakers: int | None = None,
+        min_speakers: int | None = None,
+        max_speakers: int | None = None,
+        enable_word_timestamps: bool = True,
+        progress_callback: ProgressCallback | None = None,
+        stage_callback: StageCallback | None = None,
+        checkpoint_callback: CheckpointCallback | None = None,
+        partial_callback: PartialCallback | None = None,
+    ) -> MeetingResult:
+        """Finish a meeting from saved stage outputs, recomputing only the
+        stages `stages_to_rerun` reports as stale.
+
+        `stages` maps stage name to its checkpoint (at least `asr`). A new
+        speaker count reruns diarize alone, so tuning it costs seconds of
+        clustering + merge instead of the full ASR + align. `audio_path`
+        may be None when nothing needs recomputing (e.g. only the word
+        timestamp switch changed and `align` was saved).
+        """
+        import time as _time
+
+        pipeline_start = _time.monotonic()
+        rerun = stages_to_rerun(
+            stages,
+            num_speakers=num_speakers,
+            min_speakers=min_speakers,
+            max_speakers=max_speakers,
+            enable_word_timestamps=enable_word_timestamps,
+        )
+        if "asr" in rerun:
+            raise ValueError("reanalyze needs a saved asr stage")
+        audio: SharedWaveform | None = None
+        if rerun:
+            if audio_path is None:
+                raise ValueError(
+                    f"stages {', '.join(rerun)} must be recomputed from the audio"
                 )
-                aligned = asr_out
+            async with self._load_lock:
+                await self._load_pipeline()
+            audio = SharedWaveform(audio_path)
 
-            _report(progress_callback, "diarize", 0.7)
-            diar_start = _time.monotonic()
-            logger.info("Meeting stage=diarize start (fast path)")
-            diarize_out = await self._run_diarize(
-                audio_path,
+        _report(progress_callback, "asr", 0.1)
+        logger.info(
+            "Meeting reanalysis: reusing %s, recomputing %s",
+            ", ".join(sorted(set(stages) - set(rerun))) or "nothing",
+            ", ".join(rerun) or "nothing",
+        )
+        _stage(stage_callback, "asr", "reused")
+        if partial_callback is not None:
+            partial_callback(
+                list(stages["asr"].get("segments", [])),
+                stages["asr"].get("language"),
+            )
+        diarize_task = None
+        if "diarize" in rerun:
+            diarize_task = self._start_diarize(
+                audio,
+                stage_callback,
                 num_speakers=num_speakers,
                 min_speakers=min_speakers,
                 max_speakers=max_speakers,
             )
-            diar_elapsed = _time.monotonic() - diar_start
-            logger.info(
-                "Meeting stage=diarize done elapsed=%.1fs", diar_elapsed
+        try:
+            return await self._align_diarize_merge(
+                stages["asr"],
+                audio,
+                diarize_task,
+                pipeline_start=pipeline_start,
+                asr_elapsed=0.0,
+                aligned=(
+                    stages["align"]
+                    if enable_word_timestamps and "align" not in rerun
+                    else None
+                ),
+                diarize_out=(
+                    _diarize_turns(stages["diarize"]) if "diarize" not in rerun else None
+                ),
+                num_speakers=num_speakers,
+                min_speakers=min_speakers,
+                max_speakers=max_speakers,
+                enable_word_timestamps=enable_word_timestamps,
+                progress_callback=progress_callback,
+                stage_callback=stage_callback,
+                checkpoint_callback=checkpoint_callback,
             )
+        finally:
+            _cancel(diarize_task)
 
-            result = self._merge(
-                aligned,
-                diarize_out,
-                enable_word_timestamps=enable_word_timestamps,
+    async def _align_diarize_merge(
+        self,
+        asr_out: dict[str, Any],
+        audio: SharedWaveform | None,
+        diarize_task: asyncio.Task | None,
+        *,
+        pipeline_start: float,
+        asr_elapsed: float | None,
+        num_speakers: int | None,
+        min_speakers: int | None,
+        max_speakers: int | None,
+        enable_word_timestamps: bool,
+        progress_callback: ProgressCallback | None,
+        stage_callback: StageCallback | None,
+        checkpoint_callback: CheckpointCallback | None = None,
+        aligned: dict[str, Any] | None = None,
+        diarize_out: Any = None,
+    ) -> MeetingResult:
+        """Shared tail of every analyze path: align, join (or run) diarize,
+        merge. `asr_elapsed` is None on the fast path (external ASR).
+        A saved `aligned` / `diarize_out` (reanalysis) is used as is."""
+        import time as _time
+
+        fast = asr_elapsed is None
+        suffix = " (fast path)" if fast else ""
+        align_elapsed = 0.0
+        if aligned is not None:
+            _stage(stage_callback, "align", "reused")
+        elif enable_word_timestamps:
+            _report(progress_callback, "align", 0.4)
+            aligned, align_elapsed = await _alongside(
+                self._timed_stage(
+                    "align",
+                    self._run_align(asr_out, audio),
+                    stage_callback,
+                    suffix=suffix,
+                ),
+                diarize_task,
             )
-            _report(progress_callback, "complete", 1.0)
-            total = _time.monotonic() - pipeline_start
+            _checkpoint(checkpoint_callback, "align", _align_stage_output, aligned)
+        else:
+            logger.info("Meeting stage=align skipped (word_timestamps=false)")
+            _stage(stage_callback, "align", "skipped")
+            aligned = asr_out
+
+        if diarize_out is not None:
+            _stage(stage_callback, "diarize", "reused")
+            diar_elapsed = 0.0
+        else:
+            if diarize_task is None:
+                _report(progress_callback, "diarize", 0.7)
+                diarize_out, diar_elapsed = await self._diarize_stage(
+                    audio,
+                    stage_callback,
+                    num_speakers=num_speakers,
+                    min_speakers=min_speakers,
+                    max_speakers=max_speakers,
+                )
+            else:
+                # Foreground track finished; whatever diarize has left is the
+                # remaining wall time. Report it so the job shows what it
+                # waits on.
+                if not diarize_task.done():
+                    _report(progress_callback, "diarize", 0.7)
+                diarize_out, diar_elapsed = await diarize_task
+            if checkpoint_callback is not None:
+                checkpoint_callback(
+                    "diarize",
+                    _diarize_stage_output(
+                        diarize_out,
+                        num_speakers=num_speakers,
+                        min_speakers=min_speakers,
+                        max_speakers=max_speakers,
+                    ),
+                )
+
+        result = self._merge(
+            aligned, diarize_out, enable_word_timestamps=enable_word_timestamps
+        )
+        _report(progress_callback, "complete", 1.0)
+        total = _time.monotonic() - pipeline_start
+        if fast:
             logger.info(
                 "Meeting pipeline complete (fast) total=%.1fs"
-                " (align=%.1fs diarize=%.1fs)",
+                " (align=%.1fs diarize=%.1fs parallel=%s)",
+                total,
+                align_elapsed,
+                diar_elapsed,
+                diarize_task is not None,
+            )
+        else:
+            logger.info(
+                "Meeting pipeline complete total=%.1fs"
+                " (asr=%.1fs align=%.1fs diarize=%.1fs parallel=%s)",
                 total,
+                asr_elapsed,
                 align_elapsed,
                 diar_elapsed,
+                diarize_task is not None,
             )
-            return result
+        return result
+
+    def _start_diarize(
+        self,
+        audio: SharedWaveform,
+        stage_callback: StageCallback | None,
+        **speakers: int | None,
+    ) -> asyncio.Task | None:
+        """Launch diarize as a background task when running in parallel mode.
+
+        Returns None in sequential mode; the caller then runs diarize after
+        align as before.
+        """
+        if not self.parallel_diarize:
+            return None
+        return asyncio.create_task(
+            self._diarize_stage(audio, stage_callback, **speakers)
+        )
+
+    async def _diarize_stage(
+        self,
+        audio: SharedWaveform,
+        stage_callback: StageCallback | None,
+        **speakers: int | None,
+    ) -> tuple[Any, float]:
+        return await self._timed_stage(
+            "diarize",
+            self._run_diarize(audio, **speakers),
+            stage_callback,
+            suffix=" (concurrent)" if self.parallel_diarize else "",
+        )
+
+    async def _timed_stage(
+        self,
+        stage: str,
+        coro: Any,
+        stage_callback: StageCallback | None,
+        *,
+        suffix: str = "",
+    ) -> tuple[Any, float]:
+        """Run one stage behind its gate; returns (output, elapsed seconds).
+
+        Elapsed time (logs and the stage histogram) starts once the gate is
+        held, so another job's turn in the stage counts as `waiting`, not
+        as stage time.
+        """
+        import time as _time
+
+        gate = self._stage_gates[stage]
+        try:
+            if gate.locked():
+                _stage(stage_callback, stage, "waiting")
+                logger.info("Meeting stage=%s waiting for another job", stage)
+            async with gate:
+                _stage(stage_callback, stage, "running")
+                start = _time.monotonic()
+                logger.info("Meeting stage=%s start%s", stage, suffix)
+                try:
+                    out = await coro
+                except Exception:
+                    _stage(stage_callback, stage, "failed")
+                    raise
+        finally:
+            coro.close()  # no-op once awaited; avoids a never-awaited warning
+            self._touch(stage)
+        elapsed = _time.monotonic() - start
+        logger.info("Meeting stage=%s done elapsed=%.1fs", stage, elapsed)
+        observe_stage(_METRICS_ENDPOINT, stage, elapsed)
+        _stage(stage_callback, stage, "done")
+        return out, elapsed
 
     async def _run_asr(
-        self, audio_path: str, *, language: str | None
+        self, audio: AudioInput, *, language: str | None
     ) -> dict[str, Any]:
-        import whisperx as _wx
-
-        audio = await asyncio.to_thread(_wx.load_audio, audio_path)
+        audio = await _as_waveform(audio)
         # batch_size is the WhisperX-specific knob — higher = better CPU
         # SIMD saturation on long files. Memory cost ~150-250 MB per slot
         # on whisper-large; 32 is the documented sweet spot.
-        return await asyncio.to_thread(
-            self._asr.transcribe,
-            audio,
-            language=language,
-            batch_size=self.batch_size,
-        )
+        asr = await self._asr_model()
+        # A borrowed model decodes under a scheduler slot; with chunked ASR
+        # that is one slot per chunk, so live decodes cut in between them.
+        slot = self.shared_decode_slot if self._asr_shared else None
+        async with slot() if slot is not None else contextlib.nullcontext():
+            return await asyncio.to_thread(
+                asr.transcribe,
+                audio,
+                language=language,
+                batch_size=self.batch_size,
+            )
+
+    async def _run_asr_chunked(
+        self,
+        audio: AudioInput,
+        *,
+        language: str | None,
+        partial_callback: PartialCallback,
+        progress_callback: ProgressCallback | None,
+    ) -> dict[str, Any]:
+        """ASR one chunk at a time, publishing segments as each lands.
+
+        Chunks are cut at silences by `longform.plan_chunks` and padded with
+        overlap; a segment is kept only in the chunk that owns its midpoint,
+        and an identical-text segment starting inside the previous one is
+        dropped, as in `longform.stitch_segments`. The first chunk's
+        detected language is pinned for the rest so a quiet stretch can't
+        flip it. Progress moves through the ASR band (0.1 → 0.4) by audio
+        position, and each report is a cancellation point.
+        """
+        from app.services.longform import plan_chunks
+
+        samples = await _as_waveform(audio)
+        chunks = plan_chunks(samples, target_seconds=self.asr_chunk_seconds)
+        total = max(len(samples), 1)
+        segments: list[dict[str, Any]] = []
+        for chunk in chunks:
+            out = await self._run_asr(
+                samples[chunk.start : chunk.end], language=language
+            )
+            language = language or out.get("language")
+            offset = chunk.offset_seconds
+            new: list[dict[str, Any]] = []
+            for seg in out.get("segments", []):
+                start = float(seg["start"]) + offset
+                end = float(seg["end"]) + offset
+                if not chunk.owned_start <= (start + end) / 2 < chunk.owned_end:
+                    continue
+                prev = new[-1] if new else (segments[-1] if segments else None)
+                if (
+                    prev is not None
+                    and str(seg["text"]).strip() == str(prev["text"]).strip()
+                    and start < prev["end"]
+                ):
+                    continue
+                new.append({**seg, "start": start, "end": end})
+            segments.extend(new)
+            partial_callback(
+                [
+                    {"start": s["start"], "end": s["end"], "text": str(s["text"])}
+                    for s in new
+                ],
+                language,
+            )
+            _report(progress_callback, "asr", 0.1 + 0.3 * chunk.end / total)
+        return {"language": language, "segments": segments}
 
     async def _run_align(
-        self, asr_out: dict[str, Any], audio_path: str
+        self, asr_out: dict[str, Any], audio: AudioInput
     ) -> dict[str, Any]:
         import whisperx as _wx
 
         # Align uses the torch-native wav2vec2 path, so it CAN take MPS
         # while the ct2 ASR upstream stays CPU-bound. self.torch_device is
-        # the resolved device for the align + diarize stages.
-        language = asr_out["language"]
-        model_a, metadata = await asyncio.to_thread(
-            _wx.load_align_model,
-            language_code=language,
-            device=self.torch_device,
+        # the resolved device for the align + diarize stages. The model
+        # comes from the per-language cache, so back-to-back meetings in
+        # the same language skip the wav2vec2 reload.
+        model_a, metadata = await self._align_cache.get(
+            asr_out["language"],
             model_name=self.align_model_name,
+            device=self.torch_device,
         )
-        audio = await asyncio.to_thread(_wx.load_audio, audio_path)
+        audio = await _as_waveform(audio)
         return await asyncio.to_thread(
             _wx.align,
             asr_out["segments"],
@@ -458,7 +1229,7 @@ class MeetingAnalyzer:
 
     async def _run_diarize(
         self,
-        audio_path: str,
+        audio: AudioInput,
         *,
         num_speakers: int | None,
         min_speakers: int | None,
@@ -479,32 +1250,28 @@ class MeetingAnalyzer:
         # pyannote's `get_audio_metadata()`. The documented workaround
         # is to pre-decode and pass `{"waveform": Tensor, "sample_rate":
         # int}` directly. We do that here so the diarize stage works
-        # regardless of whether torchcodec resolves its dylibs at runtime.
-        audio_input = await asyncio.to_thread(_load_wav_for_pyannote, audio_path)
-        output = await asyncio.to_thread(self._diarize, audio_input, **kwargs)
+        # regardless of whether torchcodec resolves its dylibs at runtime;
+        # the tensor is a view of the shared waveform, not a copy.
+        audio_input = _pyannote_input(await _as_waveform(audio))
+        pipeline = await self._diarize_pipeline()
+        output = await asyncio.to_thread(pipeline, audio_input, **kwargs)
         # Pyannote 3.x speaker-diarization-3.1 pipeline returns a
         # `DiarizeOutput` (or directly an `Annotation` for community-1).
-        # WhisperX's `assign_word_speakers` downstream expects a pandas
-        # DataFrame with columns [segment, label, speaker, start, end] —
-        # that conversion normally lives inside
-        # `whisperx.DiarizationPipeline.__call__`, which we bypass to get
-        # MPS support and avoid the torchcodec audio-decoding path.
-        # Replicate the conversion here so the rest of WhisperX's API
-        # works unchanged. The lambda extractor handles both shapes:
-        # `DiarizeOutput` has `.speaker_diarization`; raw `Annotation`
-        # already IS the diarization.
-        return await asyncio.to_thread(_pyannote_output_to_df, output)
+        # `_merge` assigns speakers from plain turn arrays (see
+        # app.services.speaker_assign), so flatten either shape into
+        # `SpeakerTurns` here; `whisperx.DiarizationPipeline.__call__`,
+        # which would build its pandas DataFrame instead, is bypassed to
+        # get MPS support and avoid the torchcodec audio-decoding path.
+        return await asyncio.to_thread(_pyannote_output_to_turns, output)
 
     def _merge(
         self,
         aligned: dict[str, Any],
-        diarize_out: Any,
+        diarize_out: SpeakerTurns,
         *,
         enable_word_timestamps: bool,
     ) -> MeetingResult:
-        import whisperx as _wx
-
-        merged = _wx.assign_word_speakers(diarize_out, aligned)
+        merged = assign_speakers(diarize_out, aligned)
         segments: list[Segment] = []
         speaker_order: list[str] = []
         seen: set[str] = set()
@@ -548,11 +1315,163 @@ def _report(cb: ProgressCallback | None, stage: str, progress: float) -> None:
         cb(stage, progress)
 
 
-def _pyannote_output_to_df(output: Any) -> Any:
-    """Convert pyannote's diarize output into the pandas DataFrame shape
-    that `whisperx.assign_word_speakers` expects.
+def _stage(cb: StageCallback | None, stage: str, state: str) -> None:
+    if cb is not None:
+        cb(stage, state)
+
 
-    Replicates the conversion that lives inside WhisperX's wrapper
+def _checkpoint(
+    cb: CheckpointCallback | None,
+    stage: str,
+    reduce: Callable[[Any], dict[str, Any]],
+    output: Any,
+) -> None:
+    if cb is not None:
+        cb(stage, reduce(output))
+
+
+def stages_to_rerun(
+    stages: dict[str, dict[str, Any]],
+    *,
+    num_speakers: int | None,
+    min_speakers: int | None,
+    max_speakers: int | None,
+    enable_word_timestamps: bool,
+) -> list[str]:
+    """Stages whose saved output is missing or no longer matches the request.
+
+    ASR and align depend only on the audio (and the ASR on the language it
+    ran with), so once saved they are always reusable; diarize is stale
+    when the speaker-count constraints differ from the ones it ran with.
+    """
+    rerun: list[str] = []
+    if "asr" not in stages:
+        rerun.append("asr")
+    if enable_word_timestamps and "align" not in stages:
+        rerun.append("align")
+    diarize = stages.get("diarize")
+    wanted = (num_speakers, min_speakers, max_speakers)
+    if diarize is None or (
+        diarize.get("num_speakers"),
+        diarize.get("min_speakers"),
+        diarize.get("max_speakers"),
+    ) != wanted:
+        rerun.append("diarize")
+    return rerun
+
+
+def asr_stage_output(asr_out: dict[str, Any]) -> dict[str, Any]:
+    """Checkpoint form of an ASR result: language + timed segment text."""
+    return {
+        "language": asr_out.get("language"),
+        "segments": [
+            {
+                "start": float(seg["start"]),
+                "end": float(seg["end"]),
+                "text": str(seg["text"]),
+            }
+            for seg in asr_out.get("segments", [])
+        ],
+    }
+
+
+def _align_stage_output(aligned: dict[str, Any]) -> dict[str, Any]:
+    """Checkpoint form of an align result — what `_merge` reads back.
+
+    WhisperX leaves words it could not align (digits, symbols) without
+    timestamps; they are kept so the text still round-trips.
+    """
+    segments = []
+    for seg in aligned.get("segments", []):
+        words = []
+        for w in seg.get("words", []):
+            word: dict[str, Any] = {"word": str(w["word"])}
+            for key in ("start", "end", "score"):
+                if w.get(key) is not None:
+                    word[key] = float(w[key])
+            words.append(word)
+        segments.append(
+            {
+                "start": float(seg["start"]),
+                "end": float(seg["end"]),
+                "text": str(seg["text"]),
+                "words": words,
+            }
+        )
+    return {"language": aligned.get("language"), "segments": segments}
+
+
+def _diarize_stage_output(
+    diarize_out: SpeakerTurns,
+    *,
+    num_speakers: int | None,
+    min_speakers: int | None,
+    max_speakers: int | None,
+) -> dict[str, Any]:
+    """Checkpoint form of a diarize result: the speaker turns, the
+    per-speaker embeddings pyannote returned (if any), and the speaker
+    constraints it ran with so `stages_to_rerun` can tell when it is stale."""
+    return {
+        "num_speakers": num_speakers,
+        "min_speakers": min_speakers,
+        "max_speakers": max_speakers,
+        "turns": diarize_out.records(),
+        "embeddings": dict(diarize_out.embeddings),
+    }
+
+
+def _diarize_turns(output: dict[str, Any]) -> SpeakerTurns:
+    """Rebuild the diarize stage's `SpeakerTurns` from its checkpoint."""
+    return SpeakerTurns.from_tracks(
+        (
+            (float(t["start"]), float(t["end"]), str(t["speaker"]))
+            for t in output.get("turns", [])
+        ),
+        embeddings=output.get("embeddings"),
+    )
+
+
+async def _alongside(coro: Any, diarize_task: asyncio.Task | None) -> Any:
+    """Await a foreground stage, failing fast if concurrent diarize fails.
+
+    Without this a pyannote error would only surface after ASR + align ran
+    to completion. A diarize task that *succeeds* first is left for the
+    join before `_merge`.
+    """
+    if diarize_task is None:
+        return await coro
+    foreground = asyncio.ensure_future(coro)
+    try:
+        await asyncio.wait(
+            {foreground, diarize_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if (
+            not foreground.done()
+            and not diarize_task.cancelled()
+            and diarize_task.exception() is not None
+        ):
+            foreground.cancel()
+            raise diarize_task.exception()
+        return await foreground
+    finally:
+        _cancel(foreground)
+
+
+def _cancel(task: asyncio.Task | None) -> None:
+    """Best-effort cancel; like cancellation between stages, a stage already
+    inside `asyncio.to_thread` still runs to completion in its thread."""
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()  # retrieved: the other track's error is the one raised
+
+
+def _pyannote_output_to_turns(output: Any) -> SpeakerTurns:
+    """Convert pyannote's diarize output into `SpeakerTurns` for `_merge`.
+
+    Stands in for the conversion inside WhisperX's wrapper
     `DiarizationPipeline.__call__`, which we bypass so we can call
     pyannote directly with the pre-decoded waveform dict (the
     torchcodec workaround) and route to MPS.
@@ -562,73 +1481,105 @@ def _pyannote_output_to_df(output: Any) -> Any:
         carries `.speaker_diarization` (an `Annotation`).
       - `Annotation` itself (community-1 or older pipelines).
 
-    The downstream consumer
-    (`whisperx.diarize.assign_word_speakers`) uses `len()` on the
-    DataFrame as an empty-check, so returning anything that isn't a
-    DataFrame crashes with `TypeError: object of type 'DiarizeOutput'
-    has no len()`.
+    Passing the `DiarizeOutput` on unconverted crashes the merge
+    (`TypeError: object of type 'DiarizeOutput' has no len()`).
     """
-    import pandas as pd
-
     diarization = getattr(output, "speaker_diarization", output)
-    df = pd.DataFrame(
-        diarization.itertracks(yield_label=True),
-        columns=["segment", "label", "speaker"],
-    )
-    df["start"] = df["segment"].apply(lambda x: x.start)
-    df["end"] = df["segment"].apply(lambda x: x.end)
-    return df
+    tracks = [
+        (segment.start, segment.end, speaker)
+        for segment, _track, speaker in diarization.itertracks(yield_label=True)
+    ]
+    # speaker-diarization-3.1 also returns one centroid embedding per
+    # speaker (rows follow `labels()`); kept with the diarize checkpoint.
+    embeddings = getattr(output, "speaker_embeddings", None)
+    if embeddings is not None:
+        embeddings = {
+            label: [float(x) for x in vector]
+            for label, vector in zip(diarization.labels(), embeddings, strict=True)
+        }
+    return SpeakerTurns.from_tracks(tracks, embeddings=embeddings)
 
 
-def _load_wav_for_pyannote(path: Any) -> dict[str, Any]:
-    """Decode a 16-bit PCM WAV into pyannote's pre-loaded dict format.
+def load_meeting_audio(path: Any) -> np.ndarray:
+    """Decode a converted meeting WAV into a float32 mono array in [-1, 1].
+
+    The file is always produced by `audio_converter.convert_to_wav` —
+    16-bit signed PCM mono at 16 kHz — so the int16 samples are
+    memory-mapped straight out of the `data` chunk and scaled into a single
+    float32 allocation: no ffmpeg spawn, no intermediate `bytes` copy. If
+    the input ever drifts from that contract, stereo is down-mixed on the
+    fly and other sample rates go through `whisperx.load_audio` (ffmpeg
+    resampling) as before.
 
-    Returns `{"waveform": torch.Tensor (1, n_samples), "sample_rate": int}`.
-    Used by `_run_diarize` to bypass `torchcodec`, which has known dylib
-    loading bugs on macOS + PyTorch 2.8.
-
-    The audio file is always produced by `audio_converter.convert_to_wav`,
-    which guarantees 16-bit signed PCM mono at 16 kHz — so `wave` stdlib
-    is enough, no extra dependency. If the input ever drifts from that
-    contract (e.g. stereo), we down-mix to mono on the fly.
-
-    Accepts both `str` and `pathlib.Path` because the upload path in
-    `app/api/meeting.py` carries `Path` objects but earlier downstream
-    callers (whisperx, pyannote) silently accepted either. Python's
-    stdlib `wave.open` is stricter — `isinstance(f, str)` check means a
-    raw `Path` gets treated as a file-like object and crashes with
-    `AttributeError: 'PosixPath' object has no attribute 'read'`. Cast
-    here to honour the broader contract the rest of the codebase
-    assumes.
+    Accepts both `str` and `pathlib.Path`; `wave.open` treats anything that
+    is not a `str` as a file object, hence the explicit `open()`.
     """
     import wave
 
-    import numpy as np
-    import torch
-
-    with wave.open(str(path), "rb") as wf:
-        sample_rate = wf.getframerate()
-        n_channels = wf.getnchannels()
-        sample_width = wf.getsampwidth()
-        n_frames = wf.getnframes()
-        raw = wf.readframes(n_frames)
+    with open(path, "rb") as f:
+        with wave.open(f) as wf:
+            sample_rate = wf.getframerate()
+            n_channels = wf.getnchannels()
+            sample_width = wf.getsampwidth()
+            n_frames = wf.getnframes()
+        # `wave` stops right after the `data` chunk header.
+        offset = f.tell()
+        size = os.fstat(f.fileno()).st_size
 
     if sample_width != 2:
         raise RuntimeError(
-            f"diarize input WAV must be 16-bit PCM, got sample_width={sample_width}"
+            f"meeting input WAV must be 16-bit PCM, got sample_width={sample_width}"
         )
+    if sample_rate != SAMPLE_RATE:
+        import whisperx as _wx
 
-    audio_int16 = np.frombuffer(raw, dtype=np.int16)
+        return _wx.load_audio(str(path))
+
+    # A truncated upload can claim more frames than the file holds.
+    n_frames = min(n_frames, (size - offset) // (2 * n_channels))
+    if n_frames <= 0:
+        return np.zeros(0, dtype=np.float32)
+    pcm = np.memmap(
+        path, dtype="<i2", mode="r", offset=offset, shape=(n_frames * n_channels,)
+    )
     if n_channels > 1:
         # Defensive down-mix in case converter contract changes later.
-        audio_int16 = audio_int16.reshape(-1, n_channels).mean(axis=1).astype(
-            np.int16
-        )
-    audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        audio = pcm.reshape(-1, n_channels).mean(axis=1, dtype=np.float32)
+    else:
+        audio = pcm.astype(np.float32)
+    del pcm
+    audio /= 32768.0
+    return audio
+
+
+async def _as_waveform(audio: AudioInput) -> np.ndarray:
+    """Samples for a stage: the job's shared decode, or a path decoded here."""
+    if isinstance(audio, SharedWaveform):
+        return await audio.get()
+    if isinstance(audio, (str, os.PathLike)):
+        return await asyncio.to_thread(load_meeting_audio, audio)
+    return audio
+
+
+def _pyannote_input(audio: np.ndarray) -> dict[str, Any]:
+    """pyannote's pre-loaded dict for a decoded waveform (zero-copy)."""
+    import torch
+
     # pyannote expects shape (n_channels, n_samples) — we unsqueeze to add
     # the channel dim (mono → 1 channel).
-    waveform = torch.from_numpy(audio_float32).unsqueeze(0)
-    return {"waveform": waveform, "sample_rate": sample_rate}
+    waveform = torch.from_numpy(audio).unsqueeze(0)
+    return {"waveform": waveform, "sample_rate": SAMPLE_RATE}
+
+
+def _load_wav_for_pyannote(path: Any) -> dict[str, Any]:
+    """Decode a 16-bit PCM WAV into pyannote's pre-loaded dict format.
+
+    Returns `{"waveform": torch.Tensor (1, n_samples), "sample_rate": int}`,
+    which bypasses `torchcodec` (known dylib loading bugs on macOS +
+    PyTorch 2.8). `_run_diarize` builds the same dict from the shared
+    waveform; this is the standalone form for a path.
+    """
+    return _pyannote_input(load_meeting_audio(path))
 
 
 def _resolve_torch_device(configured: str) -> str:
@@ -1,8 +1,12 @@
-"""In-memory job store for the meeting analysis endpoint.
+"""In-memory job store for the meeting analysis and async transcription endpoints.
 
 Jobs are kept in a process-local dict keyed by a sortable opaque ID. They are
-NOT persisted across server restarts. Eviction by TTL and capacity lives in
-this module as well (`prune()` is called on every create and every get).
+NOT persisted across server restarts by this module; the meeting store mirrors
+its transitions into the database through `on_change` (see
+`app.services.meeting_journal`), which is how meeting jobs resume. Eviction by
+TTL and capacity lives in this module as well (`prune()` is called on every
+create and every get); it only ever drops finished jobs, so a queued or
+running job keeps its record however long it waits.
 
 The store exists separately from `MeetingAnalyzer` because the two have very
 different lifecycles: the store is lightweight and always available, while
@@ -14,7 +18,9 @@ from __future__ import annotations
 import logging
 import os
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 from app.services.meeting import MeetingResult
 
@@ -62,23 +68,40 @@ class Job:
     status: JobStatus = "pending"
     progress: float = 0.0
     stage: str = "pending"
-    result: MeetingResult | None = None
+    # MeetingResult for meeting jobs; async transcription jobs store their
+    # rendered response (see app.api.transcribe_jobs.JobOutput).
+    result: MeetingResult | Any | None = None
     error: JobError | None = None
     created_at: float = field(default_factory=time.time)
+    # Set on reaching done / error / cancelled; the TTL counts from here.
+    finished_at: float | None = None
     # Cancel flag — set by mark_cancel_requested(); the meeting worker
     # inspects this between pipeline stages and bails out as soon as
     # control returns to its async loop. Best-effort: PyTorch sync code
     # inside `asyncio.to_thread` cannot be interrupted mid-call, so the
     # current stage runs to completion regardless.
     cancel_requested: bool = False
+    # Per-stage state ("running" | "done" | "reused" | "failed" ...) for meeting
+    # jobs. `stage` names the single stage progress is on; with diarize
+    # running concurrently this is where both tracks show up.
+    stages: dict[str, str] = field(default_factory=dict)
+    # Meeting ASR segments published so far ({"start", "end", "text"}) and
+    # their language, so a polling client can show the transcript while
+    # the job is still running. Cleared by mark_done — the result has it.
+    partial: list[dict[str, Any]] = field(default_factory=list)
+    partial_language: str | None = None
 
 
 class JobStore:
     """Process-local dict of job records with TTL + capacity eviction.
 
+    Only finished jobs (done / error / cancelled) are evicted: `ttl_seconds`
+    after they finish, and oldest first once more than `max_jobs` are kept.
     Pass `ttl_seconds=None` to disable TTL pruning, `max_jobs=None` to disable
-    capacity pruning. `clock` is injected so tests can advance time without
-    real sleeps.
+    capacity pruning. Transitions on an unknown (already evicted) id are
+    no-ops. `clock` is injected so tests can advance time without
+    real sleeps. `on_change`, when given, is called with the job after every
+    status / stage / progress transition.
     """
 
     def __init__(
@@ -87,11 +110,17 @@ class JobStore:
         ttl_seconds: int | None = 3600,
         max_jobs: int | None = 20,
         clock=time.time,
+        on_change: Callable[[Job], None] | None = None,
     ) -> None:
         self._jobs: dict[str, Job] = {}
         self._ttl_seconds = ttl_seconds
         self._max_jobs = max_jobs
         self._clock = clock
+        self._on_change = on_change
+
+    def _changed(self, job: Job) -> None:
+        if self._on_change is not None:
+            self._on_change(job)
 
     def create(self) -> Job:
         self.prune()
@@ -100,6 +129,13 @@ class JobStore:
         self._jobs[job_id] = job
         return job
 
+    def restore(self, job_id: str) -> Job:
+        """Re-create a pending job under its original id (startup resume)."""
+        self.prune()
+        job = Job(job_id=job_id, created_at=self._clock())
+        self._jobs[job_id] = job
+        return job
+
     def get(self, job_id: str) -> Job | None:
         self.prune()
         return self._jobs.get(job_id)
@@ -111,10 +147,13 @@ class JobStore:
         return sum(1 for j in self._jobs.values() if j.status == status)
 
     def mark_running(self, job_id: str, stage: str = "asr") -> None:
-        job = self._jobs[job_id]
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
         job.status = "running"
         job.stage = stage
         job.progress = 0.0
+        self._changed(job)
 
     def update_progress(self, job_id: str, stage: str, progress: float) -> None:
         job = self._jobs.get(job_id)
@@ -122,18 +161,50 @@ class JobStore:
             return
         job.stage = stage
         job.progress = progress
+        self._changed(job)
+
+    def update_stage(self, job_id: str, stage: str, state: str) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.stages[stage] = state
 
-    def mark_done(self, job_id: str, result: MeetingResult) -> None:
-        job = self._jobs[job_id]
+    def append_partial(
+        self,
+        job_id: str,
+        segments: list[dict[str, Any]],
+        *,
+        language: str | None = None,
+    ) -> None:
+        """Append in-progress transcript segments (not mirrored to on_change;
+        a resumed job re-publishes them from its checkpoint)."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.partial.extend(segments)
+        if language:
+            job.partial_language = language
+
+    def mark_done(self, job_id: str, result: MeetingResult | Any) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
         job.status = "done"
+        job.finished_at = self._clock()
+        job.partial = []
         job.stage = "complete"
         job.progress = 1.0
         job.result = result
+        self._changed(job)
 
     def mark_error(self, job_id: str, code: str, message: str) -> None:
-        job = self._jobs[job_id]
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
         job.status = "error"
+        job.finished_at = self._clock()
         job.error = JobError(code=code, message=message)
+        self._changed(job)
 
     def mark_cancel_requested(self, job_id: str) -> bool:
         """Flag a job for cancellation. Returns True if the job existed and
@@ -161,21 +232,28 @@ class JobStore:
             return
         job.status = "cancelled"
         job.stage = "cancelled"
+        job.finished_at = self._clock()
+        self._changed(job)
 
     def prune(self) -> None:
-        """Evict jobs older than `ttl_seconds`, then by capacity (oldest first)."""
+        """Evict finished jobs `ttl_seconds` after they finished, then by
+        capacity (oldest first). Pending and running jobs are never evicted:
+        their worker still reports to them, and a client still polls them."""
         now = self._clock()
         if self._ttl_seconds is not None:
             expired = [
                 jid
                 for jid, job in self._jobs.items()
-                if (now - job.created_at) > self._ttl_seconds
+                if job.finished_at is not None
+                and (now - job.finished_at) > self._ttl_seconds
             ]
             for jid in expired:
                 del self._jobs[jid]
         if self._max_jobs is not None and len(self._jobs) > self._max_jobs:
             overflow = len(self._jobs) - self._max_jobs
             # ULID-like IDs are time-sortable; oldest = lexicographically smallest.
-            sorted_ids = sorted(self._jobs.keys())
-            for jid in sorted_ids[:overflow]:
+            finished = sorted(
+                jid for jid, job in self._jobs.items() if job.finished_at is not None
+            )
+            for jid in finished[:overflow]:
                 del self._jobs[jid]
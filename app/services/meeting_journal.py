@@ -0,0 +1,193 @@
+"""Durable record of queued / in-flight meeting jobs.
+
+`JobStore` is process-local, so before this module a restart (a deploy, a
+crash) silently dropped every meeting job and the converted WAV sitting in
+TEMP_DIR. The journal closes that gap:
+
+- the converted WAV is *spooled* to DATA_DIR/meeting_jobs/<job_id>.wav,
+- a `meeting_jobs` row records the request parameters and queue priority,
+- the row mirrors status / stage (wired as `JobStore.on_change`; progress is
+  written along with them, not on every tick),
+- finished stage outputs are *checkpointed* into the row (ASR segments),
+- on startup `entries()` lists what to put back in the queue.
+
+Rows are deleted once a job reaches a terminal state; successful results
+live on in `meeting_analyses`. Every write is best-effort: a database
+hiccup is logged and never fails the job itself, which still runs from
+the spooled audio.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.services.meeting_jobs import Job
+from app.services.persistence import meeting_jobs_repo as repo
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("done", "error", "cancelled")
+
+
+@dataclass
+class JournalEntry:
+    """One resumable job as read back from the `meeting_jobs` table."""
+
+    job_id: str
+    priority: int
+    audio_path: str
+    params: dict[str, Any] = field(default_factory=dict)
+    checkpoint: dict[str, Any] = field(default_factory=dict)
+
+
+class MeetingJobJournal:
+    """Spool directory + `meeting_jobs` table behind the meeting queue.
+
+    `session_factory` defaults to the app-wide `SessionLocal` (looked up at
+    call time so tests can rebind it); inject one to point elsewhere.
+    """
+
+    def __init__(
+        self,
+        spool_dir: Path,
+        *,
+        session_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.spool_dir = Path(spool_dir)
+        self._session_factory = session_factory
+        # (status, stage) last written per job. `sync` runs on the event loop
+        # for every progress tick; only a transition is worth a commit.
+        self._synced: dict[str, tuple[str, str]] = {}
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app.services.persistence.engine import SessionLocal
+
+        return SessionLocal()
+
+    def spool(self, job_id: str, wav_path: Path) -> Path:
+        """Move a converted WAV out of TEMP_DIR into the spool directory.
+
+        Returns the new path, or the original one if the move failed (the
+        job still runs; it just won't survive a restart).
+        """
+        target = self.spool_dir / f"{job_id}.wav"
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(wav_path), target)
+        except OSError:
+            logger.exception("Failed to spool meeting audio for job %s", job_id)
+            return wav_path
+        return target
+
+    def record(
+        self,
+        job_id: str,
+        *,
+        audio_path: str | Path,
+        params: dict[str, Any],
+        priority: int,
+    ) -> None:
+        """Insert the row for a freshly submitted job."""
+        try:
+            with self._session() as db:
+                repo.create_meeting_job(
+                    db,
+                    id=job_id,
+                    audio_path=str(audio_path),
+                    params_json=json.dumps(params),
+                    priority=priority,
+                )
+                db.commit()
+        except Exception:  # noqa: BLE001 — best-effort persistence
+            logger.exception("Failed to record meeting_jobs row %s", job_id)
+
+    def sync(self, job: Job) -> None:
+        """Mirror a `JobStore` transition; drop the row once terminal.
+
+        Progress-only updates are skipped: resume restarts the current stage
+        anyway, so the stored progress only needs to be as fresh as the stage.
+        """
+        if job.status in TERMINAL_STATUSES:
+            self._synced.pop(job.job_id, None)
+        else:
+            state = (job.status, job.stage)
+            if self._synced.get(job.job_id) == state:
+                return
+            self._synced[job.job_id] = state
+        try:
+            with self._session() as db:
+                if job.status in TERMINAL_STATUSES:
+                    repo.delete_meeting_job(db, job.job_id)
+                else:
+                    repo.update_meeting_job(
+                        db,
+                        job.job_id,
+                        status=job.status,
+                        stage=job.stage,
+                        progress=job.progress,
+                    )
+                db.commit()
+        except Exception:  # noqa: BLE001 — best-effort persistence
+            logger.exception("Failed to sync meeting_jobs row %s", job.job_id)
+
+    def checkpoint(self, job_id: str, stage: str, output: dict[str, Any]) -> None:
+        """Store a finished stage's output so a resumed job skips it."""
+        try:
+            with self._session() as db:
+                row = repo.get_meeting_job(db, job_id)
+                if row is None:
+                    return
+                checkpoints = _loads(row.checkpoint_json)
+                checkpoints[stage] = output
+                repo.update_meeting_job(
+                    db, job_id, checkpoint_json=json.dumps(checkpoints)
+                )
+                db.commit()
+        except Exception:  # noqa: BLE001 — best-effort persistence
+            logger.exception(
+                "Failed to checkpoint stage %s of meeting job %s", stage, job_id
+            )
+
+    def entries(self) -> list[JournalEntry]:
+        """Unfinished jobs in submission order."""
+        with self._session() as db:
+            return [
+                JournalEntry(
+                    job_id=row.id,
+                    priority=row.priority,
+                    audio_path=row.audio_path,
+                    params=_loads(row.params_json),
+                    checkpoint=_loads(row.checkpoint_json),
+                )
+                for row in repo.list_meeting_jobs(db)
+            ]
+
+    def discard(self, job_id: str) -> None:
+        """Forget a job that cannot (or should not) be resumed, audio included."""
+        self._synced.pop(job_id, None)
+        try:
+            with self._session() as db:
+                row = repo.get_meeting_job(db, job_id)
+                if row is not None:
+                    Path(row.audio_path).unlink(missing_ok=True)
+                    repo.delete_meeting_job(db, job_id)
+                db.commit()
+        except Exception:  # noqa: BLE001 — best-effort persistence
+            logger.exception("Failed to discard meeting_jobs row %s", job_id)
+
+
+def _loads(text: str | None) -> dict[str, Any]:
+    """Decode a JSON object column; corrupt or non-object values read as {}."""
+    try:
+        value = json.loads(text or "{}")
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return value if isinstance(value, dict) else {}
@@ -0,0 +1,146 @@
+"""Model-weight page-cache prefault and per-process memory reporting.
+
+Several uvicorn workers on one host each construct their own backend, and
+neither CTranslate2 nor whisper.cpp can serve inference straight from a
+read-only mapping of the weights file: both read it into private
+allocations (CT2 also converts to the requested `compute_type`). Steady-state
+weights therefore cannot be shared between processes. What *can* be shared
+is the page cache the loads read from:
+
+  - `prefault_weights` maps each weight file read-only and advises the kernel
+    (`MADV_WILLNEED`, `MADV_SEQUENTIAL`) to read it ahead. The first worker
+    pays one sequential disk read; every later worker, restart, and pool
+    load of the same model copies from RAM instead of disk.
+  - `process_memory` reports resident vs shared vs private memory for this
+    process (plus PSS where the kernel exposes it), so `/status` shows what
+    each extra worker really costs.
+  - `available_memory_mb` is the system's spare RAM, used to size the
+    job queue's meeting class.
+
+For more concurrency without another copy of the weights, raise
+`CT2_NUM_WORKERS` in a single process instead: CT2 workers are threads that
+share one set of weights, and the decode scheduler orders their calls.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# Tokenizer / config / vocabulary files are tiny; only weight files are
+# worth a mapping.
+MIN_PREFAULT_BYTES = 1024 * 1024
+_MIB = 1024 * 1024
+
+
+def _weight_files(path: Path) -> list[Path]:
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        return []
+    return sorted(
+        p
+        for p in path.rglob("*")
+        if p.is_file() and p.stat().st_size >= MIN_PREFAULT_BYTES
+    )
+
+
+def prefault_weights(path: Path | str) -> dict[str, Any]:
+    """Read-ahead the weight files under `path` into the page cache.
+
+    Best-effort: an unreadable file or a platform without `madvise` is
+    skipped, never raised. Returns `{files, size_mb, ms}` for the logs.
+    """
+    start = time.perf_counter()
+    files = 0
+    total = 0
+    for weight_file in _weight_files(Path(path)):
+        try:
+            with weight_file.open("rb") as fh, mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                    if hasattr(mmap, advice) and hasattr(mapped, "madvise"):
+                        mapped.madvise(getattr(mmap, advice))
+                total += len(mapped)
+                files += 1
+        except (OSError, ValueError) as e:
+            logger.debug("Prefault skipped %s: %s", weight_file, e)
+    report = {
+        "files": files,
+        "size_mb": round(total / _MIB, 1),
+        "ms": int((time.perf_counter() - start) * 1000),
+    }
+    logger.info(
+        "Prefaulted %d weight file(s), %.0f MiB in %d ms",
+        files,
+        report["size_mb"],
+        report["ms"],
+    )
+    return report
+
+
+def _read_proc(path: str) -> str | None:
+    try:
+        with open(path) as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+def available_memory_mb() -> float | None:
+    """RAM the system can hand out without swapping, in MiB (None when unknown)."""
+    meminfo = _read_proc("/proc/meminfo")
+    if meminfo:
+        for line in meminfo.splitlines():
+            if line.startswith("MemAvailable:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page = os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+    return round(pages * page / _MIB, 1)
+
+
+def process_memory() -> dict[str, Any]:
+    """RSS / shared / private / PSS of this process in MiB (None when unknown)."""
+    report: dict[str, Any] = {
+        "rss_mb": None,
+        "shared_mb": None,
+        "private_mb": None,
+        "pss_mb": None,
+        "peak_rss_mb": None,
+    }
+    statm = _read_proc("/proc/self/statm")
+    if statm:
+        page = os.sysconf("SC_PAGE_SIZE")
+        _size, resident, shared = (int(v) for v in statm.split()[:3])
+        report["rss_mb"] = round(resident * page / _MIB, 1)
+        report["shared_mb"] = round(shared * page / _MIB, 1)
+        report["private_mb"] = round((resident - shared) * page / _MIB, 1)
+    rollup = _read_proc("/proc/self/smaps_rollup")
+    if rollup:
+        for line in rollup.splitlines():
+            if line.startswith("Pss:"):
+                report["pss_mb"] = round(int(line.split()[1]) / 1024, 1)
+                break
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes.
+        report["peak_rss_mb"] = round(
+            peak / _MIB if sys.platform == "darwin" else peak / 1024, 1
+        )
+    except (ImportError, OSError):
+        pass
+    return report
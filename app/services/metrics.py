@@ -0,0 +1,324 @@
+"""In-process latency / throughput metrics with Prometheus text exposition.
+
+A deliberately small registry (counters, gauges, fixed-bucket histograms with
+labels) rendered in the Prometheus text format 0.0.4 by `GET /metrics`. It
+avoids a new runtime dependency for the handful of series below; names and
+semantics follow Prometheus conventions so dashboards carry over unchanged
+if the project ever switches to `prometheus_client`.
+
+Series:
+
+  - `whisper_wrap_request_duration_seconds{route,method,status}` — every
+    HTTP request, labelled by route *template* (bounded cardinality).
+  - `whisper_wrap_stage_duration_seconds{endpoint,stage}` — per-stage time
+    inside a request: `upload_read`, `mime_sniff`, `convert`, `inference`,
+    `postprocess`, `db_write`, `llm`; meeting jobs add `asr`, `align`,
+    `diarize`.
+  - `whisper_wrap_audio_seconds_total{endpoint}` and
+    `whisper_wrap_inference_rtf{endpoint}` — decoded audio and the real-time
+    factor (inference seconds / audio seconds) of each decode.
+  - `whisper_wrap_listen_active_sessions`, `whisper_wrap_listen_events_total
+    {type}` — live `/listen` sessions and the partial / final / warning
+    events they emit.
+  - `whisper_wrap_scheduler_*`, `whisper_wrap_job_queue_*`,
+    `whisper_wrap_process_resident_bytes` — gauges refreshed from
+    `app.state` on every scrape.
+
+Recording never raises and costs a dict lookup plus a lock; the module-level
+`registry` is shared by every request like `config` is.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds: covers a 5 ms mime sniff up to a 10-minute meeting stage.
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+    120.0, 300.0, 600.0,
+)
+# Real-time factor: < 1 is faster than real time.
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 5.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+            for k, v in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+            for k, v in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum.
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key in sorted(self._counts):
+            counts = self._counts[key]
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += n
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name!r} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_SECONDS = registry.histogram(
+    "whisper_wrap_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("route", "method", "status"),
+)
+STAGE_SECONDS = registry.histogram(
+    "whisper_wrap_stage_duration_seconds",
+    "Time spent in one processing stage of a request.",
+    ("endpoint", "stage"),
+)
+AUDIO_SECONDS = registry.counter(
+    "whisper_wrap_audio_seconds_total",
+    "Seconds of audio decoded.",
+    ("endpoint",),
+)
+INFERENCE_RTF = registry.histogram(
+    "whisper_wrap_inference_rtf",
+    "Real-time factor of each decode (inference seconds / audio seconds).",
+    ("endpoint",),
+    RTF_BUCKETS,
+)
+LISTEN_SESSIONS = registry.gauge(
+    "whisper_wrap_listen_active_sessions",
+    "Open /listen WebSocket sessions.",
+)
+LISTEN_EVENTS = registry.counter(
+    "whisper_wrap_listen_events_total",
+    "Events emitted to /listen clients.",
+    ("type",),
+)
+SCHEDULER_QUEUED = registry.gauge(
+    "whisper_wrap_scheduler_queued",
+    "Decode calls waiting for a scheduler slot.",
+    ("priority",),
+)
+SCHEDULER_RUNNING = registry.gauge(
+    "whisper_wrap_scheduler_running",
+    "Decode calls holding a scheduler slot.",
+    ("priority",),
+)
+JOB_QUEUE_QUEUED = registry.gauge(
+    "whisper_wrap_job_queue_queued",
+    "Background jobs waiting in the job queue.",
+    ("priority",),
+)
+JOB_QUEUE_RUNNING = registry.gauge(
+    "whisper_wrap_job_queue_running",
+    "Background jobs running.",
+    ("priority",),
+)
+PROCESS_RESIDENT_BYTES = registry.gauge(
+    "whisper_wrap_process_resident_bytes",
+    "Resident set size of this process.",
+)
+
+
+def observe_stage(endpoint: str, stage: str, seconds: float) -> None:
+    STAGE_SECONDS.observe(seconds, endpoint=endpoint, stage=stage)
+
+
+@contextmanager
+def timed_stage(endpoint: str, stage: str) -> Iterator[None]:
+    """Record the wall time of the `with` body as one `stage` observation."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(endpoint, stage, time.perf_counter() - start)
+
+
+def observe_inference(
+    endpoint: str, seconds: float, audio_seconds: float | None
+) -> None:
+    """Record one decode: its stage time, and audio + RTF when duration is known."""
+    observe_stage(endpoint, "inference", seconds)
+    if isinstance(audio_seconds, (int, float)) and audio_seconds > 0:
+        AUDIO_SECONDS.inc(audio_seconds, endpoint=endpoint)
+        INFERENCE_RTF.observe(seconds / audio_seconds, endpoint=endpoint)
+
+
+def refresh_gauges(state) -> None:
+    """Copy scheduler / job-queue / memory snapshots into their gauges."""
+    from app.services.memory import process_memory
+
+    scheduler = getattr(state, "scheduler", None)
+    if scheduler is not None:
+        for name, cls in scheduler.snapshot()["classes"].items():
+            SCHEDULER_QUEUED.set(cls["queued"], priority=name)
+            SCHEDULER_RUNNING.set(cls["running"], priority=name)
+    queue = getattr(state, "job_queue", None)
+    if queue is not None:
+        for name, cls in queue.snapshot()["classes"].items():
+            JOB_QUEUE_QUEUED.set(cls["queued"], priority=name)
+            JOB_QUEUE_RUNNING.set(cls["running"], priority=name)
+    rss_mb = process_memory()["rss_mb"]
+    if rss_mb is not None:
+        PROCESS_RESIDENT_BYTES.set(rss_mb * 1024 * 1024)
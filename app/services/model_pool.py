@@ -0,0 +1,376 @@
+"""Multi-model residency: keep several registry models loaded under a budget.
+
+The lifespan eagerly loads one backend (the *default*, published on
+`app.state.whisper`). The pool adopts it and can hold further registry
+models next to it, bounded by:
+
+  - `max_models` — resident models including the default (1 = default only,
+    which keeps single-model deployments exactly as before), and
+  - `budget_mb` — summed on-disk weight size of resident models (0 = no
+    byte budget). On-disk size is a good proxy for CT2 residency: weights
+    are loaded at their stored precision.
+
+Non-default models are evicted least-recently-used first to make room. The
+default is never evicted; `activate()` swaps it with zero downtime — the new
+model loads in a worker thread while the old one keeps serving, then
+`on_activate` republishes `app.state.whisper` and the old default becomes an
+ordinary LRU entry (evicted straight away if the limits require it).
+
+Eviction only drops the pool's reference. A decode already running on an
+evicted backend holds its own reference, so its weights are released when
+that call returns rather than mid-inference.
+
+Requests select a model with `resolve_backend(state, name)`; an unloaded
+registry model is loaded on demand (concurrent requests share one load).
+
+*Pinned* models (`STREAM_DRAFT_MODEL_NAME`, the small model that decodes
+`/listen` partials) are companions of the default: never evicted and not
+counted against `max_models`, though their weights do count against
+`budget_mb`. `draft_backend(state, serving)` hands one out once resident and
+starts its background load on first use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.services._whisper_backend import WhisperBackend
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownModelError(LookupError):
+    """Requested model is not declared in the registry."""
+
+
+class ModelPoolFullError(RuntimeError):
+    """The model cannot be made resident without evicting the default."""
+
+
+@dataclass
+class ResidentModel:
+    name: str
+    backend: WhisperBackend
+    metadata: dict
+    size_mb: float
+    load_time_ms: int
+    last_used: float
+
+
+def dir_size_mb(path: Path | str) -> float:
+    """Summed size of the files under `path` in MiB; 0.0 when it is missing."""
+    root = Path(path)
+    if root.is_file():
+        return root.stat().st_size / (1024 * 1024)
+    if not root.is_dir():
+        return 0.0
+    total = sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+    return total / (1024 * 1024)
+
+
+class ModelPool:
+    """Registry models resident in this process. See module docstring."""
+
+    def __init__(
+        self,
+        *,
+        build: Callable[[str], tuple[WhisperBackend, dict]],
+        known: Iterable[str] = (),
+        pinned: Iterable[str] = (),
+        max_models: int = 1,
+        budget_mb: int = 0,
+        estimate_mb: Callable[[str], float | None] | None = None,
+        on_activate: Callable[[ResidentModel], None] | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        self._build = build
+        self._known = set(known)
+        self._pinned = set(pinned)
+        self.max_models = max(1, max_models)
+        self.budget_mb = max(0, budget_mb)
+        self._estimate_mb = estimate_mb or (lambda name: None)
+        self._on_activate = on_activate
+        self._clock = clock
+        self._resident: dict[str, ResidentModel] = {}
+        self._loading: dict[str, asyncio.Task] = {}
+        self._errors: dict[str, str] = {}
+        self._default: str | None = None
+        self._evictions = 0
+
+    # ---- queries ----
+
+    @property
+    def default_name(self) -> str | None:
+        return self._default
+
+    def is_known(self, name: str) -> bool:
+        return name in self._known or name in self._resident
+
+    def resident(self, name: str) -> ResidentModel | None:
+        return self._resident.get(name)
+
+    def peek(self, name: str) -> WhisperBackend | None:
+        """Backend for `name` if resident; otherwise start a background load
+        (not retried after a failure) and return None without waiting."""
+        entry = self._resident.get(name)
+        if entry is not None:
+            entry.last_used = self._clock()
+            return entry.backend
+        if (
+            name not in self._loading
+            and name not in self._errors
+            and self.is_known(name)
+        ):
+            self.load_in_background(name)
+        return None
+
+    def find(self, backend: WhisperBackend) -> ResidentModel | None:
+        """The resident entry holding this exact backend instance, if any."""
+        for entry in self._resident.values():
+            if entry.backend is backend:
+                return entry
+        return None
+
+    def used_mb(self) -> float:
+        return sum(m.size_mb for m in self._resident.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view for `/status` and `GET /models`."""
+        now = self._clock()
+        models = []
+        for name in sorted(self._known | set(self._resident) | set(self._loading)):
+            entry = self._resident.get(name)
+            if entry is not None:
+                state = "resident"
+            elif name in self._loading:
+                state = "loading"
+            elif name in self._errors:
+                state = "failed"
+            else:
+                state = "available"
+            models.append(
+                {
+                    "name": name,
+                    "state": state,
+                    "default": name == self._default,
+                    "pinned": name in self._pinned,
+                    "size_mb": round(entry.size_mb, 1) if entry else None,
+                    "load_time_ms": entry.load_time_ms if entry else None,
+                    "idle_seconds": round(now - entry.last_used, 1) if entry else None,
+                    "error": self._errors.get(name),
+                }
+            )
+        return {
+            "default": self._default,
+            "max_models": self.max_models,
+            "budget_mb": self.budget_mb,
+            "used_mb": round(self.used_mb(), 1),
+            "evictions": self._evictions,
+            "models": models,
+        }
+
+    # ---- lifecycle ----
+
+    def adopt(
+        self,
+        name: str,
+        backend: WhisperBackend,
+        metadata: dict,
+        *,
+        load_time_ms: int = 0,
+    ) -> ResidentModel:
+        """Register the backend the lifespan already loaded as the default."""
+        entry = self._entry(name, backend, metadata, load_time_ms)
+        self._resident[name] = entry
+        self._default = name
+        return entry
+
+    async def get(self, name: str | None) -> WhisperBackend:
+        """Backend for `name` (None → default), loading it on demand."""
+        if name is None or name == self._default:
+            name = self._default
+        entry = self._resident.get(name) if name else None
+        if entry is None:
+            entry = await self.load(name)
+        entry.last_used = self._clock()
+        return entry.backend
+
+    async def load(self, name: str) -> ResidentModel:
+        """Make `name` resident (evicting LRU models as needed) and return it."""
+        entry = self._resident.get(name)
+        if entry is not None:
+            return entry
+        return await self._load_task(name, swap=False)
+
+    def load_in_background(self, name: str) -> asyncio.Task:
+        if not self.is_known(name):
+            raise UnknownModelError(name)
+        return self._background(name, self.load(name))
+
+    async def activate(self, name: str) -> ResidentModel:
+        """Make `name` the default without a serving gap."""
+        entry = self._resident.get(name)
+        if entry is None:
+            entry = await self._load_task(name, swap=True)
+        previous = self._default
+        self._default = name
+        entry.last_used = self._clock()
+        if self._on_activate is not None:
+            self._on_activate(entry)
+        logger.info("Model pool: default switched %s → %s", previous, name)
+        self._enforce_limits()
+        return entry
+
+    def activate_in_background(self, name: str) -> asyncio.Task:
+        if not self.is_known(name):
+            raise UnknownModelError(name)
+        return self._background(name, self.activate(name))
+
+    def unload(self, name: str) -> bool:
+        """Drop a non-default resident model. Returns False if it was not resident."""
+        if name == self._default:
+            raise ModelPoolFullError(f"cannot unload the default model {name!r}")
+        if self._resident.pop(name, None) is None:
+            return False
+        gc.collect()
+        logger.info("Model pool: unloaded %s", name)
+        return True
+
+    # ---- internals ----
+
+    def _background(self, name: str, coro) -> asyncio.Task:
+        """Run an admin-triggered load; failures land in `snapshot()` not the log void."""
+        self._errors.pop(name, None)
+        task = asyncio.ensure_future(coro)
+
+        def _done(t: asyncio.Task) -> None:
+            if t.cancelled():
+                return
+            exc = t.exception()
+            if exc is not None:
+                self._errors[name] = str(exc) or type(exc).__name__
+                logger.error("Model pool: background load of %s failed: %s", name, exc)
+
+        task.add_done_callback(_done)
+        return task
+
+    def _entry(
+        self, name: str, backend: WhisperBackend, metadata: dict, load_time_ms: int
+    ) -> ResidentModel:
+        local_dir = metadata.get("local_dir")
+        return ResidentModel(
+            name=name,
+            backend=backend,
+            metadata=metadata,
+            size_mb=dir_size_mb(local_dir) if local_dir else 0.0,
+            load_time_ms=load_time_ms,
+            last_used=self._clock(),
+        )
+
+    async def _load_task(self, name: str, *, swap: bool) -> ResidentModel:
+        if not self.is_known(name):
+            raise UnknownModelError(name)
+        task = self._loading.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._do_load(name, swap=swap))
+            self._loading[name] = task
+            task.add_done_callback(lambda _t, n=name: self._loading.pop(n, None))
+        return await asyncio.shield(task)
+
+    async def _do_load(self, name: str, *, swap: bool) -> ResidentModel:
+        self._make_room(self._estimate_mb(name) or 0.0, swap=swap)
+        start = time.perf_counter()
+        backend, metadata = await asyncio.to_thread(self._build, name)
+        load_time_ms = int((time.perf_counter() - start) * 1000)
+        entry = self._entry(name, backend, metadata, load_time_ms)
+        self._resident[name] = entry
+        self._errors.pop(name, None)
+        logger.info(
+            "Model pool: loaded %s (%.0f MiB) in %d ms", name, entry.size_mb, load_time_ms
+        )
+        return entry
+
+    def _evictable(self) -> list[ResidentModel]:
+        return sorted(
+            (
+                m
+                for m in self._resident.values()
+                if m.name != self._default and m.name not in self._pinned
+            ),
+            key=lambda m: m.last_used,
+        )
+
+    def _fits(self, extra_mb: float, *, swap: bool) -> bool:
+        # During a swap the outgoing default is about to become evictable, so
+        # it does not count against the limits for the incoming model.
+        others = [
+            m for m in self._resident.values() if not (swap and m.name == self._default)
+        ]
+        counted = [m for m in others if m.name not in self._pinned]
+        loading = [n for n in self._loading if n not in self._pinned]
+        if len(counted) + len(loading) > self.max_models:
+            return False
+        if self.budget_mb and sum(m.size_mb for m in others) + extra_mb > self.budget_mb:
+            return False
+        return True
+
+    def _make_room(self, extra_mb: float, *, swap: bool) -> None:
+        # `_loading` already contains the model being made room for.
+        for victim in self._evictable():
+            if self._fits(extra_mb, swap=swap):
+                return
+            self._evict(victim)
+        if not self._fits(extra_mb, swap=swap):
+            raise ModelPoolFullError(
+                f"no room for another model (max_models={self.max_models}, "
+                f"budget_mb={self.budget_mb or 'unlimited'})"
+            )
+
+    def _enforce_limits(self) -> None:
+        for victim in self._evictable():
+            counted = [n for n in self._resident if n not in self._pinned]
+            over_count = len(counted) > self.max_models
+            over_budget = self.budget_mb and self.used_mb() > self.budget_mb
+            if not (over_count or over_budget):
+                return
+            self._evict(victim)
+
+    def _evict(self, entry: ResidentModel) -> None:
+        self._resident.pop(entry.name, None)
+        self._evictions += 1
+        logger.info("Model pool: evicted %s (LRU)", entry.name)
+        gc.collect()
+
+
+async def resolve_backend(state, name: str | None) -> WhisperBackend:
+    """Backend serving `name` on this app; the default for None / default name.
+
+    Raises `UnknownModelError`, `ModelPoolFullError`, or the backend's
+    `WhisperLoadError` when `name` cannot be served.
+    """
+    pool: ModelPool | None = getattr(state, "model_pool", None)
+    if pool is None or not name or name == pool.default_name:
+        return state.whisper
+    return await pool.get(name)
+
+
+def draft_backend(state, serving: WhisperBackend) -> WhisperBackend | None:
+    """The `STREAM_DRAFT_MODEL_NAME` backend for `/listen` partials, or None.
+
+    None when no draft model is configured, while it is still loading (the
+    first call starts the load), after its load failed, or when it is the
+    model already serving the session — partials then stay on `serving`.
+    """
+    pool: ModelPool | None = getattr(state, "model_pool", None)
+    name = getattr(state, "stream_draft_model", None)
+    if pool is None or not name:
+        return None
+    draft = pool.peek(name)
+    return None if draft is serving else draft
@@ -16,7 +16,7 @@ import time
 from sqlalchemy import select
 from sqlalchemy.orm import Session as SASession
 
-from app.services.persistence.models import MeetingAnalysisRow
+from app.services.persistence.models import MeetingAnalysisRow, MeetingStageOutputRow
 
 
 def list_meeting_analyses(
@@ -142,3 +142,57 @@ def set_audio(
     row.audio_size_bytes = audio_size_bytes
     db.flush()
     return row
+
+
+def update_result(
+    db: SASession,
+    id: str,
+    *,
+    result_json: str,
+    duration_seconds: float | None,
+    language: str | None,
+    speakers_count: int | None,
+    reset_speaker_names: bool = False,
+) -> MeetingAnalysisRow | None:
+    """Replace an analysis result in place (re-analysis). Returns None if
+    the id is unknown. `reset_speaker_names` drops the rename map, for
+    when the speaker labels no longer denote the same people."""
+    row = db.get(MeetingAnalysisRow, id)
+    if row is None:
+        return None
+    row.result_json = result_json
+    row.duration_seconds = duration_seconds
+    row.language = language
+    row.speakers_count = speakers_count
+    if reset_speaker_names:
+        row.speaker_names_json = "{}"
+    db.flush()
+    return row
+
+
+def list_stage_outputs(
+    db: SASession, meeting_id: str
+) -> list[MeetingStageOutputRow]:
+    """Saved stage outputs for one analysis (any order)."""
+    stmt = select(MeetingStageOutputRow).where(
+        MeetingStageOutputRow.meeting_id == meeting_id
+    )
+    return list(db.scalars(stmt))
+
+
+def save_stage_output(
+    db: SASession, meeting_id: str, stage: str, output_json: str
+) -> MeetingStageOutputRow:
+    """Insert or replace the output of one stage for an analysis."""
+    now = int(time.time() * 1000)
+    row = db.get(MeetingStageOutputRow, (meeting_id, stage))
+    if row is None:
+        row = MeetingStageOutputRow(
+            meeting_id=meeting_id, stage=stage, created_at=now, output_json=output_json
+        )
+        db.add(row)
+    else:
+        row.created_at = now
+        row.output_json = output_json
+    db.flush()
+    return row
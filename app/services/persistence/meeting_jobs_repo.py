@@ -0,0 +1,93 @@
+"""Data-access functions for the meeting_jobs table (durable job queue).
+
+Mirrors `meeting_analyses_repo.py`: pure functions that take a SQLAlchemy
+`Session` first, return ORM instances or `None` on miss, and never
+commit — `app.services.meeting_journal` owns the commit boundaries.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session as SASession
+
+from app.services.persistence.models import MeetingJobRow
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def create_meeting_job(
+    db: SASession,
+    *,
+    id: str,
+    audio_path: str,
+    params_json: str,
+    priority: int = 1,
+    created_at_ms: int | None = None,
+) -> MeetingJobRow:
+    """Insert a freshly submitted (pending) job."""
+    now = _now_ms()
+    row = MeetingJobRow(
+        id=id,
+        created_at=created_at_ms if created_at_ms is not None else now,
+        updated_at=now,
+        status="pending",
+        stage="pending",
+        progress=0.0,
+        priority=priority,
+        params_json=params_json,
+        audio_path=audio_path,
+        checkpoint_json="{}",
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def get_meeting_job(db: SASession, id: str) -> MeetingJobRow | None:
+    return db.get(MeetingJobRow, id)
+
+
+def list_meeting_jobs(db: SASession) -> list[MeetingJobRow]:
+    """Every queued / in-flight job, oldest first (= original FIFO order)."""
+    stmt = select(MeetingJobRow).order_by(MeetingJobRow.created_at, MeetingJobRow.id)
+    return list(db.scalars(stmt))
+
+
+def update_meeting_job(
+    db: SASession,
+    id: str,
+    *,
+    status: str | None = None,
+    stage: str | None = None,
+    progress: float | None = None,
+    checkpoint_json: str | None = None,
+) -> MeetingJobRow | None:
+    """Patch the given fields. Returns None if the id is unknown."""
+    row = db.get(MeetingJobRow, id)
+    if row is None:
+        return None
+    if status is not None:
+        row.status = status
+    if stage is not None:
+        row.stage = stage
+    if progress is not None:
+        row.progress = progress
+    if checkpoint_json is not None:
+        row.checkpoint_json = checkpoint_json
+    row.updated_at = _now_ms()
+    db.flush()
+    return row
+
+
+def delete_meeting_job(db: SASession, id: str) -> bool:
+    """Idempotent delete — returns True if a row was removed."""
+    row = db.get(MeetingJobRow, id)
+    if row is None:
+        return False
+    db.delete(row)
+    db.flush()
+    return True
@@ -157,6 +157,138 @@ class MeetingAnalysisRow(Base):
     )
     audio_size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    stage_outputs: Mapped[list[MeetingStageOutputRow]] = relationship(
+        back_populates="meeting",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
     __table_args__ = (
         Index("idx_meeting_analyses_created", "created_at"),
     )
+
+
+class MeetingStageOutputRow(Base):
+    """One pipeline stage's output for a finished meeting.
+
+    Keyed `(meeting_id, stage)` with stage one of `asr` / `align` /
+    `diarize`; `output_json` is the stage checkpoint produced by
+    `app.services.meeting` (ASR segments, aligned words, diarization
+    turns + speaker embeddings + the speaker constraints it ran with).
+    `POST /v1/meetings/{id}/reanalyze` reads them back so only stages a
+    parameter change invalidates are recomputed.
+    """
+
+    __tablename__ = "meeting_stage_outputs"
+
+    meeting_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("meeting_analyses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    stage: Mapped[str] = mapped_column(String(16), primary_key=True)
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    output_json: Mapped[str] = mapped_column(Text, nullable=False)
+
+    meeting: Mapped[MeetingAnalysisRow] = relationship(
+        back_populates="stage_outputs"
+    )
+
+
+class MeetingJobRow(Base):
+    """Queued or in-flight meeting analysis jobs (the durable job queue).
+
+    The in-memory `JobStore` still serves polling; this table is what a
+    restarted server reads to put unfinished jobs back in the queue.
+    A row lives from submission until the job reaches a terminal state
+    — done jobs live on in `meeting_analyses`, failed/cancelled ones
+    are simply dropped. `audio_path` points at the converted WAV
+    spooled under DATA_DIR (not TEMP_DIR, which may not survive a
+    reboot). `checkpoint_json` maps a finished stage to its output
+    (today only `asr`: language + segments) so a resumed job skips it.
+    """
+
+    __tablename__ = "meeting_jobs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="pending"
+    )
+    stage: Mapped[str] = mapped_column(
+        String(32), nullable=False, default="pending"
+    )
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Request parameters (language, speaker bounds, fast, filename, ...)
+    # replayed verbatim on resume.
+    params_json: Mapped[str] = mapped_column(Text, nullable=False)
+    audio_path: Mapped[str] = mapped_column(Text, nullable=False)
+    checkpoint_json: Mapped[str] = mapped_column(
+        Text, nullable=False, default="{}"
+    )
+
+    __table_args__ = (
+        Index("idx_meeting_jobs_created", "created_at"),
+    )
+
+
+class SpeakerProfile(Base):
+    """A named voice learned from renamed meeting speakers.
+
+    `centroid_json` is the mean of the profile's samples (a list of
+    floats), kept denormalised so `app.services.speaker_profiles` builds
+    its lookup index from one small table. `sample_count` is how many
+    meeting speakers were averaged into it.
+    """
+
+    __tablename__ = "speaker_profiles"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    centroid_json: Mapped[str] = mapped_column(Text, nullable=False)
+
+    samples: Mapped[list[SpeakerProfileSample]] = relationship(
+        back_populates="profile",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("idx_speaker_profiles_name", "name", unique=True),
+    )
+
+
+class SpeakerProfileSample(Base):
+    """One meeting speaker's embedding, attributed to a profile.
+
+    Keyed `(meeting_id, speaker)` so renaming the same speaker again moves
+    its sample instead of counting it twice; deleting the meeting removes
+    it (the API recomputes the affected centroids first).
+    """
+
+    __tablename__ = "speaker_profile_samples"
+
+    meeting_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("meeting_analyses.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    speaker: Mapped[str] = mapped_column(String(64), primary_key=True)
+    profile_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("speaker_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    created_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    embedding_json: Mapped[str] = mapped_column(Text, nullable=False)
+
+    profile: Mapped[SpeakerProfile] = relationship(back_populates="samples")
+
+    __table_args__ = (
+        Index("idx_speaker_profile_samples_profile", "profile_id"),
+    )
@@ -0,0 +1,117 @@
+"""Data-access functions for the speaker_profiles / speaker_profile_samples tables.
+
+Mirrors `meeting_analyses_repo.py`: pure functions that take a SQLAlchemy
+`Session` first, return ORM instances or `None` on miss, and never
+commit — the caller (`app.services.speaker_profiles` via the
+`/v1/meetings` handlers) owns the commit boundaries.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session as SASession
+
+from app.services.persistence.models import SpeakerProfile, SpeakerProfileSample
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def list_profiles(db: SASession) -> list[SpeakerProfile]:
+    """Every profile, by id."""
+    return list(db.scalars(select(SpeakerProfile).order_by(SpeakerProfile.id)))
+
+
+def get_profile_by_name(db: SASession, name: str) -> SpeakerProfile | None:
+    stmt = select(SpeakerProfile).where(SpeakerProfile.name == name)
+    return db.scalars(stmt).first()
+
+
+def create_profile(db: SASession, *, name: str) -> SpeakerProfile:
+    """Insert an empty profile; `update_centroid` fills it in."""
+    now = _now_ms()
+    row = SpeakerProfile(
+        name=name,
+        created_at=now,
+        updated_at=now,
+        sample_count=0,
+        centroid_json="[]",
+    )
+    db.add(row)
+    db.flush()
+    return row
+
+
+def update_centroid(
+    db: SASession, profile_id: int, *, centroid_json: str, sample_count: int
+) -> SpeakerProfile | None:
+    row = db.get(SpeakerProfile, profile_id)
+    if row is None:
+        return None
+    row.centroid_json = centroid_json
+    row.sample_count = sample_count
+    row.updated_at = _now_ms()
+    db.flush()
+    return row
+
+
+def delete_profile(db: SASession, profile_id: int) -> bool:
+    row = db.get(SpeakerProfile, profile_id)
+    if row is None:
+        return False
+    db.delete(row)
+    db.flush()
+    return True
+
+
+def list_samples(
+    db: SASession,
+    *,
+    meeting_id: str | None = None,
+    profile_id: int | None = None,
+) -> list[SpeakerProfileSample]:
+    """Samples of one meeting and/or one profile."""
+    stmt = select(SpeakerProfileSample)
+    if meeting_id is not None:
+        stmt = stmt.where(SpeakerProfileSample.meeting_id == meeting_id)
+    if profile_id is not None:
+        stmt = stmt.where(SpeakerProfileSample.profile_id == profile_id)
+    return list(db.scalars(stmt))
+
+
+def save_sample(
+    db: SASession,
+    meeting_id: str,
+    speaker: str,
+    *,
+    profile_id: int,
+    embedding_json: str,
+) -> SpeakerProfileSample:
+    """Insert or re-point the sample for one meeting speaker."""
+    row = db.get(SpeakerProfileSample, (meeting_id, speaker))
+    if row is None:
+        row = SpeakerProfileSample(
+            meeting_id=meeting_id,
+            speaker=speaker,
+            profile_id=profile_id,
+            created_at=_now_ms(),
+            embedding_json=embedding_json,
+        )
+        db.add(row)
+    else:
+        row.profile_id = profile_id
+        row.embedding_json = embedding_json
+    db.flush()
+    return row
+
+
+def delete_sample(db: SASession, meeting_id: str, speaker: str) -> bool:
+    row = db.get(SpeakerProfileSample, (meeting_id, speaker))
+    if row is None:
+        return False
+    db.delete(row)
+    db.flush()
+    return True
@@ -0,0 +1,221 @@
+"""Opt-in sampling profiler for the Python side of the request hot paths.
+
+A background thread snapshots every thread's Python stack
+(`sys._current_frames()`) every `interval` seconds while at least one
+*capture* is open, and counts identical stacks. A finished capture is written
+to `DATA_DIR/profiles/` in the collapsed-stack format (`a;b;c <count>` per
+line, root first) that speedscope, `flamegraph.pl` and most flame-graph
+viewers open directly.
+
+Captures are started two ways (see `app.api.profiling`):
+
+  - per request — an `X-Profile: true` header on any HTTP request or on the
+    `/listen` WebSocket handshake profiles that request / session; the
+    response names the file in `X-Profile-Id`.
+  - globally — `POST /profiling/start?seconds=N` profiles everything for N
+    seconds, which is how meeting jobs (they outlive their request) and
+    background decodes are caught.
+
+Each stack is rooted at its thread name, so the event loop (`MainThread`:
+handlers, `StreamSession.feed_frame`) is separated from worker threads
+(`asyncio_*`: `to_thread` decodes, meeting stages). The sampler sees every
+thread, so a per-request profile also contains whatever else ran during
+that request. Native CT2 / whisper.cpp / torch time shows up as the Python
+frame that called into it.
+
+Sampling costs nothing while no capture is open; during a capture it is one
+stack walk per thread per tick. Every capture is capped at `max_seconds`.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+SUFFIX = ".collapsed"
+# Deepest stack kept; deeper frames are dropped from the root end.
+MAX_DEPTH = 128
+
+
+@dataclass
+class Capture:
+    name: str
+    label: str
+    started_at: float
+    deadline: float
+    samples: Counter = field(default_factory=Counter)
+    ticks: int = 0
+    path: Path | None = None
+
+
+class SamplingProfiler:
+    """Shared sampler thread plus the captures currently recording."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        interval: float = 0.005,
+        max_seconds: float = 300.0,
+        clock=time.monotonic,
+    ) -> None:
+        self.directory = Path(directory)
+        self.interval = max(0.001, interval)
+        self.max_seconds = max(1.0, max_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._active: dict[str, Capture] = {}
+        self._thread: threading.Thread | None = None
+
+    # ---- public API ----
+
+    def start(self, label: str, *, seconds: float | None = None) -> Capture:
+        """Open a capture; it ends at `stop()` or after `seconds` (capped)."""
+        now = self._clock()
+        duration = min(seconds or self.max_seconds, self.max_seconds)
+        capture = Capture(
+            name=f"{time.strftime('%Y%m%dT%H%M%S')}-{_slug(label)}-"
+            f"{uuid.uuid4().hex[:6]}{SUFFIX}",
+            label=label,
+            started_at=now,
+            deadline=now + duration,
+        )
+        with self._lock:
+            self._active[capture.name] = capture
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sample_loop, name="profiler", daemon=True
+                )
+                self._thread.start()
+        return capture
+
+    def stop(self, capture: Capture) -> Path | None:
+        """Close `capture` and write it out; a no-op once it has been written."""
+        with self._lock:
+            if self._active.pop(capture.name, None) is None:
+                return capture.path
+        return self._write(capture)
+
+    def active(self) -> list[dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            return [
+                {
+                    "name": c.name,
+                    "label": c.label,
+                    "elapsed_seconds": round(now - c.started_at, 1),
+                    "remaining_seconds": round(max(0.0, c.deadline - now), 1),
+                }
+                for c in self._active.values()
+            ]
+
+    def list_profiles(self) -> list[dict[str, Any]]:
+        """Written profiles, newest first."""
+        if not self.directory.is_dir():
+            return []
+        files = sorted(
+            self.directory.glob(f"*{SUFFIX}"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        return [{"name": p.name, "size_bytes": p.stat().st_size} for p in files]
+
+    def path_for(self, name: str) -> Path | None:
+        """Path of a written profile, refusing anything outside the directory."""
+        if "/" in name or "\\" in name or not name.endswith(SUFFIX):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    # ---- internals ----
+
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while True:
+            with self._lock:
+                now = self._clock()
+                expired = [c for c in self._active.values() if c.deadline <= now]
+                for capture in expired:
+                    del self._active[capture.name]
+                captures = list(self._active.values())
+                if not captures:
+                    self._thread = None
+            for capture in expired:
+                self._write(capture)
+            if not captures:
+                return
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks = [
+                _collapse(frame, names.get(ident, str(ident)))
+                for ident, frame in sys._current_frames().items()
+                if ident != own
+            ]
+            with self._lock:
+                for capture in captures:
+                    capture.ticks += 1
+                    capture.samples.update(stacks)
+            time.sleep(self.interval)
+
+    def _write(self, capture: Capture) -> Path | None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / capture.name
+            path.write_text(
+                "".join(
+                    f"{stack} {count}\n"
+                    for stack, count in capture.samples.most_common()
+                )
+            )
+        except OSError as e:
+            logger.warning("Profile %s not written: %s", capture.name, e)
+            return None
+        capture.path = path
+        logger.info(
+            "Profile %s: %d samples over %.1fs -> %s",
+            capture.label,
+            capture.ticks,
+            self._clock() - capture.started_at,
+            path,
+        )
+        return path
+
+
+def _collapse(frame, thread_name: str) -> str:
+    parts: list[str] = []
+    while frame is not None and len(parts) < MAX_DEPTH:
+        code = frame.f_code
+        # Definition line, not the current line: one node per function keeps
+        # flame graphs readable (the same choice as `py-spy --nolineno`).
+        parts.append(
+            f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    parts.append(f"thread:{thread_name}")
+    # Viewers split each line on its last space, so only `;` must be escaped.
+    return ";".join(p.replace(";", ",") for p in reversed(parts))
+
+
+def _short_path(filename: str) -> str:
+    marker = "site-packages/"
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    for root in ("/app/", "/scripts/"):
+        if root in filename:
+            return root.lstrip("/") + filename.split(root, 1)[1]
+    return Path(filename).name
+
+
+def _slug(label: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", label).strip("-")[:40] or "profile"
@@ -0,0 +1,193 @@
+"""Staged startup: run independent lifespan steps concurrently and track them.
+
+The lifespan used to run migrations, the Whisper model load, the VAD probe,
+the prompt-actions registry, and the LLM client strictly one after another,
+and the HTTP server accepted nothing until the last one finished. None of
+these depend on each other, so each is registered here as a *component* and
+run in its own worker thread:
+
+  - `STARTUP_MODE=eager` (default) — the lifespan still waits for every
+    component before serving, but the wall time is the slowest step rather
+    than the sum. A failing step fails startup with its original exception.
+  - `STARTUP_MODE=lazy` — the lifespan yields immediately; `/status` answers
+    at once with per-component state, and routes that need a component wait
+    for it (see `wait`) or answer 503 with `Retry-After`.
+
+Components are named by the `COMPONENT_*` constants; a name that was never
+registered counts as ready, so an app built without the lifespan (tests,
+scripts) is never gated. A component may declare `after=` dependencies
+(warm-up needs the model and the VAD); it starts once they are ready and is
+marked failed without running if one of them failed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+COMPONENT_DATABASE = "database"
+COMPONENT_MODEL = "model"
+COMPONENT_VAD = "vad"
+COMPONENT_ACTIONS = "actions"
+COMPONENT_LLM = "llm"
+COMPONENT_WARMUP = "warmup"
+
+STATE_PENDING = "pending"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+# Retry-After hint for a component that is still loading. Model loads take
+# seconds to tens of seconds; polling faster than this only adds noise.
+RETRY_AFTER_SECONDS = 5
+
+
+class ComponentNotReadyError(RuntimeError):
+    """A request needed a component that is still loading or failed to load."""
+
+    def __init__(self, component: str, *, failed: bool, error: str | None = None):
+        self.component = component
+        self.failed = failed
+        self.error = error
+        reason = f"failed: {error}" if failed else "still loading"
+        super().__init__(f"{component} is {reason}")
+
+
+@dataclass
+class _Component:
+    name: str
+    step: Callable[[], Any]
+    after: tuple[str, ...] = ()
+    state: str = STATE_PENDING
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: BaseException | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def duration_ms(self) -> int | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return int((self.finished_at - self.started_at) * 1000)
+
+
+class Readiness:
+    """Startup components and their state. See module docstring."""
+
+    def __init__(self, *, mode: str = "eager", clock=time.perf_counter) -> None:
+        self.mode = mode
+        self._clock = clock
+        self._components: dict[str, _Component] = {}
+
+    def add(
+        self, name: str, step: Callable[[], Any], *, after: tuple[str, ...] = ()
+    ) -> None:
+        """Register `step` as component `name`, to run once `after` are ready.
+
+        Blocking callables run in a worker thread; coroutine functions are
+        awaited on the event loop.
+        """
+        self._components[name] = _Component(name=name, step=step, after=after)
+
+    async def start(self) -> None:
+        """Run every pending component concurrently; returns when all settle.
+
+        Failures are recorded, not raised — see `raise_for_failure`.
+        """
+        pending = [c for c in self._components.values() if c.state == STATE_PENDING]
+        await asyncio.gather(*(self._run(c) for c in pending))
+
+    def raise_for_failure(self) -> None:
+        """Re-raise the first failed component's exception (eager startup)."""
+        for component in self._components.values():
+            if component.error is not None:
+                raise component.error
+
+    def is_ready(self, name: str) -> bool:
+        component = self._components.get(name)
+        return component is None or component.state == STATE_READY
+
+    @property
+    def ready(self) -> bool:
+        return all(c.state == STATE_READY for c in self._components.values())
+
+    async def wait(self, name: str, *, timeout: float) -> None:
+        """Return once `name` is ready; raise `ComponentNotReadyError` otherwise.
+
+        Waits at most `timeout` seconds for a component that is still
+        loading. A failed component raises immediately.
+        """
+        component = self._components.get(name)
+        if component is None or component.state == STATE_READY:
+            return
+        if component.state != STATE_FAILED and timeout > 0:
+            try:
+                await asyncio.wait_for(component.done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        if component.state == STATE_READY:
+            return
+        failed = component.state == STATE_FAILED
+        raise ComponentNotReadyError(
+            name,
+            failed=failed,
+            error=_describe(component.error) if failed else None,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view for `/status`."""
+        return {
+            "mode": self.mode,
+            "ready": self.ready,
+            "components": {
+                c.name: {
+                    "state": c.state,
+                    "duration_ms": c.duration_ms,
+                    "error": _describe(c.error) if c.error is not None else None,
+                }
+                for c in self._components.values()
+            },
+        }
+
+    # ---- internals ----
+
+    async def _run(self, component: _Component) -> None:
+        for name in component.after:
+            dependency = self._components.get(name)
+            if dependency is not None:
+                await dependency.done.wait()
+        blocked = [name for name in component.after if not self.is_ready(name)]
+        component.state = STATE_LOADING
+        component.started_at = self._clock()
+        try:
+            if blocked:
+                raise ComponentNotReadyError(blocked[0], failed=True)
+            if inspect.iscoroutinefunction(component.step):
+                await component.step()
+            else:
+                await asyncio.to_thread(component.step)
+        except Exception as e:
+            component.error = e
+            component.state = STATE_FAILED
+            logger.error("Startup: %s failed: %s", component.name, e)
+        else:
+            component.state = STATE_READY
+        finally:
+            component.finished_at = self._clock()
+            component.done.set()
+        if component.state == STATE_READY:
+            logger.info(
+                "Startup: %s ready in %d ms", component.name, component.duration_ms
+            )
+
+
+def _describe(error: BaseException) -> str:
+    return str(error) or type(error).__name__
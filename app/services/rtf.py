@@ -0,0 +1,188 @@
+"""Rolling real-time-factor accounting for every scheduled decode.
+
+`TranscriptionResult.duration_seconds` says how much audio a decode covered;
+the scheduler knows how long the call held its slot and how long it queued
+for it. `RtfTracker` keeps the most recent `capacity` of those records in a
+ring buffer and summarises them for the `throughput` block of `/status`:
+
+  - `groups` — one row per (backend, model, variant, mode): decode count,
+    audio vs inference seconds, RTF mean / p50 / p95 / max (inference
+    seconds ÷ audio seconds; < 1 is faster than real time), the overall
+    speed-up (`x_realtime`), and the queue wait in front of those decodes.
+    `mode` is `greedy` (beam_size=1: `/listen` partials), `beam` (default
+    beam: finals and file decodes) or `batched` (BatchedInferencePipeline).
+  - `queue_wait_ms` — wait for a scheduler slot per priority class.
+  - `recent` — the last few decodes, newest first.
+
+`variant` is the registry `compute_type` (CT2) or `quant` (ggml), so two
+resident variants of one model — or the same deployment before and after a
+`COMPUTE_TYPE` / `CPU_THREADS` change — can be compared on real traffic.
+Decodes without a known duration still count toward wait and inference
+time but not toward RTF.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+# Recent decodes listed verbatim in the snapshot.
+RECENT_SAMPLES = 10
+
+
+@dataclass(frozen=True)
+class Inference:
+    backend: str
+    model: str
+    variant: str | None
+    mode: str
+    priority: str
+    audio_seconds: float | None
+    inference_seconds: float
+    wait_seconds: float
+    finished_at: float
+
+    @property
+    def rtf(self) -> float | None:
+        if not self.audio_seconds:
+            return None
+        return self.inference_seconds / self.audio_seconds
+
+
+class RtfTracker:
+    """Ring buffer of recent decodes. See module docstring."""
+
+    def __init__(self, *, capacity: int = 1000, clock=time.monotonic) -> None:
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._samples: deque[Inference] = deque(maxlen=self.capacity)
+        self._total = 0
+        # Cheap insurance: snapshots copy the buffer while decodes append.
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        *,
+        backend: str,
+        model: str,
+        variant: str | None,
+        mode: str,
+        priority: str,
+        audio_seconds: float | None,
+        inference_seconds: float,
+        wait_seconds: float,
+    ) -> None:
+        sample = Inference(
+            backend=backend,
+            model=model,
+            variant=variant,
+            mode=mode,
+            priority=priority,
+            audio_seconds=audio_seconds if audio_seconds and audio_seconds > 0 else None,
+            inference_seconds=max(0.0, inference_seconds),
+            wait_seconds=max(0.0, wait_seconds),
+            finished_at=self._clock(),
+        )
+        with self._lock:
+            self._samples.append(sample)
+            self._total += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view for `/status`."""
+        with self._lock:
+            samples = list(self._samples)
+            total = self._total
+        now = self._clock()
+
+        grouped: dict[tuple, list[Inference]] = {}
+        for s in samples:
+            grouped.setdefault((s.backend, s.model, s.variant, s.mode), []).append(s)
+        groups = []
+        for (backend, model, variant, mode), items in sorted(
+            grouped.items(), key=lambda kv: tuple(str(k) for k in kv[0])
+        ):
+            timed = [s for s in items if s.audio_seconds]
+            audio = sum(s.audio_seconds for s in timed)
+            inference = sum(s.inference_seconds for s in timed)
+            groups.append(
+                {
+                    "backend": backend,
+                    "model": model,
+                    "variant": variant,
+                    "mode": mode,
+                    "count": len(items),
+                    "audio_seconds": round(audio, 1),
+                    "inference_seconds": round(
+                        sum(s.inference_seconds for s in items), 1
+                    ),
+                    "rtf": _stats([s.rtf for s in timed], scale=1, digits=3),
+                    "x_realtime": round(audio / inference, 1) if inference else None,
+                    "wait_ms": _stats([s.wait_seconds for s in items]),
+                }
+            )
+
+        waits: dict[str, list[float]] = {}
+        for s in samples:
+            waits.setdefault(s.priority, []).append(s.wait_seconds)
+
+        return {
+            "capacity": self.capacity,
+            "samples": len(samples),
+            "total_decodes": total,
+            "window_seconds": (
+                round(now - samples[0].finished_at, 1) if samples else None
+            ),
+            "groups": groups,
+            "queue_wait_ms": {p: _stats(w) for p, w in sorted(waits.items())},
+            "recent": [
+                {
+                    "model": s.model,
+                    "mode": s.mode,
+                    "priority": s.priority,
+                    "audio_seconds": (
+                        round(s.audio_seconds, 2) if s.audio_seconds else None
+                    ),
+                    "inference_ms": round(s.inference_seconds * 1000, 1),
+                    "wait_ms": round(s.wait_seconds * 1000, 1),
+                    "rtf": round(s.rtf, 3) if s.rtf is not None else None,
+                    "age_seconds": round(now - s.finished_at, 1),
+                }
+                for s in reversed(samples[-RECENT_SAMPLES:])
+            ],
+        }
+
+
+def backend_labels(pool, backend) -> tuple[str, str, str | None]:
+    """(backend, model, variant) for `backend`, via the model pool's metadata.
+
+    Falls back to the backend class name for a backend the pool does not
+    hold (tests, scripts, or a model evicted mid-decode).
+    """
+    entry = pool.find(backend) if pool is not None else None
+    if entry is None:
+        return type(backend).__name__, "unknown", None
+    metadata = entry.metadata or {}
+    variant = metadata.get("compute_type") or metadata.get("quant")
+    return (
+        metadata.get("backend", type(backend).__name__),
+        entry.name,
+        str(variant) if variant else None,
+    )
+
+
+def _stats(values: list[float | None], *, scale: float = 1000, digits: int = 1) -> dict:
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.mean(ordered) * scale, digits),
+        "p50": round(statistics.median(ordered) * scale, digits),
+        "p95": round(p95 * scale, digits),
+        "max": round(ordered[-1] * scale, digits),
+    }
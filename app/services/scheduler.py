@@ -0,0 +1,297 @@
+"""Priority-aware scheduler in front of the shared Whisper backend.
+
+Every endpoint decodes on the same in-process model (`app.state.whisper`),
+whose real parallelism is bounded by `CT2_NUM_WORKERS`. Without a gate the
+CT2 worker queue is FIFO: a live-caption partial from `/listen` waits behind
+whatever a meeting upload already submitted. The scheduler puts a
+`PriorityGate` in front of each individual backend call:
+
+  - `PRIORITY_LIVE` — `/listen` partials and finals. Never capped by class.
+  - `PRIORITY_INTERACTIVE` — synchronous `/transcribe`, `/v1/audio/*`,
+    `/ask`. Optionally capped by `interactive_slots`.
+  - `PRIORITY_BATCH` — meeting ASR and long-form async jobs. Capped at
+    `batch_slots` (default `max_inflight - 1`) so at least one slot is
+    always free for the classes above.
+
+Preemption happens at chunk boundaries. A batch-class `transcribe()` on a
+file longer than `batch_chunk_seconds` is split with `transcribe_longform`;
+each chunk acquires its own slot, so a waiting live / interactive request is
+granted the next free slot after at most one chunk's decode instead of
+after the whole meeting. Chunks are never interrupted mid-decode — CT2 has
+no cancellation point inside `generate()`.
+
+Endpoints never call the gate directly; they take a `view()` — a
+`WhisperBackend`-shaped wrapper bound to one priority — and use it exactly
+like the raw backend. `app.state.whisper` itself stays the unwrapped model.
+
+With an `RtfTracker` attached, each decode records its queue wait, slot
+time, audio length and decode mode (see `app.services.rtf`).
+
+This sits *below* `JobQueue`: the queue decides which background jobs may
+start at all, the scheduler orders the decode calls those jobs (and every
+synchronous request) make.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.config import config
+from app.services._whisper_backend import TranscriptionResult, WhisperBackend
+from app.services.job_queue import PriorityGate
+from app.services.language import can_detect
+from app.services.longform import transcribe_longform, wav_duration_seconds
+from app.services.rtf import RtfTracker
+from app.services.stream import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+
+PRIORITY_LIVE = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BATCH = 2
+CLASS_NAMES = {
+    PRIORITY_LIVE: "live",
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BATCH: "batch",
+}
+
+# A batch file only gets chunked when it is meaningfully longer than one
+# chunk — splitting a 35 s clip into 30 s + 5 s buys no latency and costs a
+# second decoder warm-up.
+CHUNK_SLACK = 1.5
+# Context padding on each side of a batch chunk; same role as
+# `LONGFORM_OVERLAP_MS`, kept small because chunks are short.
+CHUNK_OVERLAP_SECONDS = 1.0
+
+
+class Scheduler(PriorityGate):
+    """Decode-call gate shared by every endpoint. See module docstring."""
+
+    def __init__(
+        self,
+        *,
+        max_inflight: int = 1,
+        batch_slots: int | None = None,
+        interactive_slots: int | None = None,
+        batch_chunk_seconds: float = 30.0,
+        rtf: RtfTracker | None = None,
+        describe: Callable[[WhisperBackend], tuple[str, str, str | None]] | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        max_inflight = max(1, max_inflight)
+        if batch_slots is None:
+            batch_slots = max_inflight - 1 if max_inflight > 1 else 1
+        limits = {PRIORITY_BATCH: batch_slots}
+        if interactive_slots is not None:
+            limits[PRIORITY_INTERACTIVE] = interactive_slots
+        super().__init__(
+            concurrency=max_inflight,
+            priorities=CLASS_NAMES,
+            class_limits=limits,
+            clock=clock,
+        )
+        self.batch_slots = self._limits[PRIORITY_BATCH]
+        self.batch_chunk_seconds = max(0.0, batch_chunk_seconds)
+        self.rtf = rtf
+        self._describe = describe or (lambda b: (type(b).__name__, "unknown", None))
+
+    async def run(self, priority: int, fn, /, *args: Any, **kwargs: Any) -> Any:
+        """Await `fn(*args, **kwargs)` while holding one slot of `priority`."""
+        async with self.slot(priority=priority):
+            return await fn(*args, **kwargs)
+
+    async def decode(
+        self,
+        priority: int,
+        backend: WhisperBackend,
+        mode: str,
+        audio_seconds: float | None,
+        fn,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> TranscriptionResult:
+        """`run` for a transcription call, recorded in `rtf` when attached.
+
+        `audio_seconds` is the caller's estimate (PCM length); the result's
+        `duration_seconds` wins when the backend reports one.
+        """
+        if self.rtf is None:
+            return await self.run(priority, fn, *args, **kwargs)
+        enqueued = self._clock()
+        async with self.slot(priority=priority):
+            started = self._clock()
+            result = await fn(*args, **kwargs)
+            finished = self._clock()
+        reported = getattr(result, "duration_seconds", None)
+        if isinstance(reported, (int, float)) and reported > 0:
+            audio_seconds = reported
+        backend_name, model, variant = self._describe(backend)
+        self.rtf.record(
+            backend=backend_name,
+            model=model,
+            variant=variant,
+            mode=mode,
+            priority=self._names[priority],
+            audio_seconds=audio_seconds,
+            inference_seconds=finished - started,
+            wait_seconds=started - enqueued,
+        )
+        return result
+
+    def view(self, backend: WhisperBackend, priority: int) -> ScheduledBackend:
+        """A `WhisperBackend` whose decode calls go through this scheduler."""
+        if priority not in CLASS_NAMES:
+            raise ValueError(f"unknown priority {priority!r}")
+        return ScheduledBackend(self, backend, priority)
+
+    def should_chunk(self, wav_path: Path) -> bool:
+        if self.batch_chunk_seconds <= 0:
+            return False
+        duration = wav_duration_seconds(wav_path)
+        return duration is not None and duration > self.batch_chunk_seconds * CHUNK_SLACK
+
+    def snapshot(self) -> dict:
+        snap = super().snapshot()
+        snap["max_inflight"] = snap.pop("concurrency")
+        snap["batch_chunk_seconds"] = self.batch_chunk_seconds
+        return snap
+
+
+class ScheduledBackend:
+    """`WhisperBackend` view bound to one priority class.
+
+    Attribute reads other than the decode methods fall through to the
+    wrapped backend (`decode_mode`, `batch_size`, ...), so call sites that
+    introspect the backend keep working unchanged.
+    """
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        backend: WhisperBackend,
+        priority: int,
+        *,
+        chunk: bool = True,
+    ) -> None:
+        self._scheduler = scheduler
+        self._backend = backend
+        self._priority = priority
+        self._chunk = chunk
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+    async def transcribe(
+        self,
+        wav_path: Path,
+        *,
+        language: str | None,
+        initial_prompt: str | None,
+        task: str = "transcribe",
+        batched: bool | None = None,
+    ) -> TranscriptionResult:
+        kwargs: dict[str, Any] = {
+            "language": language,
+            "initial_prompt": initial_prompt,
+        }
+        if task != "transcribe":
+            kwargs["task"] = task
+        if batched is not None:
+            kwargs["batched"] = batched
+        if self._should_chunk(wav_path, batched):
+            return await self._transcribe_chunked(wav_path, **kwargs)
+        return await self._scheduler.decode(
+            self._priority,
+            self._backend,
+            "batched" if self._effective_batched(batched) else "beam",
+            None,
+            self._backend.transcribe,
+            wav_path,
+            **kwargs,
+        )
+
+    async def transcribe_pcm(self, samples, **kwargs: Any) -> TranscriptionResult:
+        return await self._scheduler.decode(
+            self._priority,
+            self._backend,
+            "greedy" if kwargs.get("beam_size") == 1 else "beam",
+            len(samples) / SAMPLE_RATE,
+            self._backend.transcribe_pcm,
+            samples,
+            **kwargs,
+        )
+
+    @property
+    def detects_language(self) -> bool:
+        return can_detect(self._backend)
+
+    async def detect_language(self, samples) -> tuple[str, float]:
+        return await self._scheduler.run(
+            self._priority, self._backend.detect_language, samples
+        )
+
+    # ---- internals ----
+
+    def _should_chunk(self, wav_path: Path, batched: bool | None) -> bool:
+        if not self._chunk or self._priority != PRIORITY_BATCH:
+            return False
+        # The batched pipeline needs the whole file to fill its batches;
+        # cutting it into scheduler-sized pieces would defeat the point.
+        if self._effective_batched(batched):
+            return False
+        return self._scheduler.should_chunk(Path(wav_path))
+
+    def _effective_batched(self, batched: bool | None) -> bool:
+        if batched is not None:
+            return batched
+        return getattr(self._backend, "decode_mode", None) == "batched"
+
+    async def _transcribe_chunked(
+        self, wav_path: Path, **kwargs: Any
+    ) -> TranscriptionResult:
+        kwargs.pop("batched", None)
+        per_chunk = ScheduledBackend(
+            self._scheduler, self._backend, self._priority, chunk=False
+        )
+        logger.debug(
+            "Scheduler: chunking batch decode of %s at %.0fs",
+            wav_path,
+            self._scheduler.batch_chunk_seconds,
+        )
+        return await transcribe_longform(
+            per_chunk,
+            Path(wav_path),
+            language=kwargs["language"],
+            initial_prompt=kwargs["initial_prompt"],
+            task=kwargs.get("task", "transcribe"),
+            target_seconds=self._scheduler.batch_chunk_seconds,
+            overlap_seconds=CHUNK_OVERLAP_SECONDS,
+            # Each chunk re-queues on its own, so this only bounds how many
+            # of one job's chunks may wait at once; the gate does the rest.
+            concurrency=self._scheduler.batch_slots,
+            detect_seconds=config.LANGUAGE_DETECT_SECONDS,
+        )
+
+
+def scheduled(
+    state, priority: int, backend: WhisperBackend | None = None
+) -> WhisperBackend:
+    """`backend` (default `app.state.whisper`) wrapped for `priority`, or left
+    raw when no scheduler is installed (e.g. an app built without the lifespan).
+    """
+    if backend is None:
+        backend = state.whisper
+    scheduler: Scheduler | None = getattr(state, "scheduler", None)
+    if scheduler is None:
+        return backend
+    return scheduler.view(backend, priority)
@@ -0,0 +1,250 @@
+"""Cross-meeting speaker identification from pyannote speaker embeddings.
+
+Each meeting's diarize stage output keeps one centroid embedding per
+`SPEAKER_xx` label (see `app.services.meeting._diarize_stage_output`).
+When a user renames a speaker through `PATCH /v1/meetings/{id}`, that
+embedding becomes a *sample* of the profile with the new name, and the
+profile's centroid (`speaker_profiles.centroid_json`) is the mean of its
+unit-normalised samples. Renaming the speaker again moves the sample;
+deleting or re-diarizing the meeting drops it.
+
+A new meeting's speakers are then looked up against every centroid in a
+`SpeakerIndex` — the centroids stacked into one unit-row matrix per
+embedding size, so cosine similarity for all speakers × all profiles is a
+single matrix product. Matches at or above `MEETING_SPEAKER_MATCH_PERCENT`
+come back as name suggestions (one profile per speaker, best pairs
+first). The index is built once from the table and reused until a
+committed write invalidates it.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from sqlalchemy.orm import Session as SASession
+
+from app.services.persistence import speaker_profiles_repo as repo
+
+
+@dataclass
+class SpeakerMatch:
+    profile_id: int
+    name: str
+    similarity: float
+
+
+class SpeakerIndex:
+    """Unit-normalised profile centroids for nearest-neighbour lookup."""
+
+    def __init__(self, profiles: list[tuple[int, str, list[float]]]) -> None:
+        grouped: dict[int, list[tuple[int, str, list[float]]]] = {}
+        for profile_id, name, centroid in profiles:
+            if centroid:
+                grouped.setdefault(len(centroid), []).append(
+                    (profile_id, name, centroid)
+                )
+        # Keyed by embedding size: profiles from a different pyannote
+        # embedding model are simply not comparable.
+        self._by_dim: dict[int, tuple[list[tuple[int, str]], np.ndarray]] = {
+            dim: (
+                [(pid, name) for pid, name, _ in rows],
+                _unit_rows(np.array([c for _, _, c in rows], dtype=np.float64)),
+            )
+            for dim, rows in grouped.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids, _ in self._by_dim.values())
+
+    def match(
+        self, embeddings: dict[str, list[float]], *, min_similarity: float
+    ) -> dict[str, SpeakerMatch]:
+        """Best profile per speaker label with cosine similarity at or above
+        `min_similarity`. Two labels of one meeting never get the same
+        profile: pairs are taken best-first, skipping used ones."""
+        matches: dict[str, SpeakerMatch] = {}
+        queries: dict[int, list[tuple[str, list[float]]]] = {}
+        for label, vector in embeddings.items():
+            if vector and len(vector) in self._by_dim:
+                queries.setdefault(len(vector), []).append((label, vector))
+        for dim, items in queries.items():
+            ids, centroids = self._by_dim[dim]
+            labels = [label for label, _ in items]
+            q = _unit_rows(np.array([v for _, v in items], dtype=np.float64))
+            sims = q @ centroids.T
+            used: set[int] = set()
+            for flat in np.argsort(-sims, axis=None):
+                i, j = divmod(int(flat), len(ids))
+                if sims[i, j] < min_similarity:
+                    break
+                if labels[i] in matches or j in used:
+                    continue
+                used.add(j)
+                matches[labels[i]] = SpeakerMatch(
+                    profile_id=ids[j][0],
+                    name=ids[j][1],
+                    similarity=round(float(sims[i, j]), 4),
+                )
+        return matches
+
+
+# (engine the index was read from, index); None until first use and
+# after every invalidation.
+_index: tuple[Any, SpeakerIndex] | None = None
+_index_lock = threading.Lock()
+
+
+def load_index(db: SASession) -> SpeakerIndex:
+    """The cached index, rebuilt from `speaker_profiles` after a write or
+    when `db` is bound to another engine than the one it was read from."""
+    global _index
+    bind = db.get_bind()
+    with _index_lock:
+        if _index is None or _index[0] is not bind:
+            _index = (
+                bind,
+                SpeakerIndex(
+                    [
+                        (row.id, row.name, _loads_vector(row.centroid_json))
+                        for row in repo.list_profiles(db)
+                    ]
+                ),
+            )
+        return _index[1]
+
+
+def invalidate_index() -> None:
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def suggest_names(
+    db: SASession,
+    embeddings: dict[str, list[float]],
+    *,
+    min_similarity: float,
+    exclude: set[str] | None = None,
+) -> dict[str, SpeakerMatch]:
+    """Profile suggestions for a meeting's speaker embeddings, skipping
+    the labels in `exclude` (already named by the user)."""
+    wanted = {k: v for k, v in embeddings.items() if k not in (exclude or set())}
+    if not wanted:
+        return {}
+    return load_index(db).match(wanted, min_similarity=min_similarity)
+
+
+def learn_speaker_names(
+    db: SASession,
+    meeting_id: str,
+    speaker_names: dict[str, str],
+    embeddings: dict[str, list[float]],
+) -> None:
+    """Sync one meeting's samples with its rename map.
+
+    A label renamed to anything but itself becomes a sample of the profile
+    with that name (created on first use); labels no longer renamed lose
+    their sample. Affected centroids are recomputed; does not commit —
+    call `invalidate_index()` once the caller has.
+    """
+    previous = {
+        s.speaker: s.profile_id for s in repo.list_samples(db, meeting_id=meeting_id)
+    }
+    touched: set[int] = set()
+    named: set[str] = set()
+    for label, raw_name in speaker_names.items():
+        name = (raw_name or "").strip()
+        vector = embeddings.get(label)
+        if not name or name == label or not vector:
+            continue
+        profile = repo.get_profile_by_name(db, name) or repo.create_profile(
+            db, name=name
+        )
+        repo.save_sample(
+            db,
+            meeting_id,
+            label,
+            profile_id=profile.id,
+            embedding_json=json.dumps([float(x) for x in vector]),
+        )
+        named.add(label)
+        touched.add(profile.id)
+        if label in previous:
+            touched.add(previous[label])
+    for label, profile_id in previous.items():
+        if label not in named:
+            repo.delete_sample(db, meeting_id, label)
+            touched.add(profile_id)
+    _refresh_profiles(db, touched)
+
+
+def forget_meeting(db: SASession, meeting_id: str) -> None:
+    """Drop a meeting's samples (meeting deleted, or its speaker labels
+    re-diarized) and recompute the affected centroids. Like
+    `learn_speaker_names`, the caller commits and then invalidates."""
+    touched: set[int] = set()
+    for sample in repo.list_samples(db, meeting_id=meeting_id):
+        touched.add(sample.profile_id)
+        repo.delete_sample(db, meeting_id, sample.speaker)
+    _refresh_profiles(db, touched)
+
+
+def diarize_embeddings(stage_output: dict[str, Any] | None) -> dict[str, list[float]]:
+    """Per-speaker embeddings from a diarize stage output ({} if none)."""
+    embeddings = (stage_output or {}).get("embeddings")
+    if not isinstance(embeddings, dict):
+        return {}
+    return {
+        str(label): vector
+        for label, vector in embeddings.items()
+        if isinstance(vector, list) and vector
+    }
+
+
+def _refresh_profiles(db: SASession, profile_ids: set[int]) -> None:
+    """Recompute centroids; a profile left without samples is deleted."""
+    if not profile_ids:
+        return
+    for profile_id in sorted(profile_ids):
+        vectors = [
+            _loads_vector(s.embedding_json)
+            for s in repo.list_samples(db, profile_id=profile_id)
+        ]
+        vectors = [v for v in vectors if v]
+        if vectors:
+            # Samples of another embedding size (a changed pyannote model)
+            # can't be averaged in; the most common size wins.
+            dims = [len(v) for v in vectors]
+            dim = max(set(dims), key=dims.count)
+            same = np.array([v for v in vectors if len(v) == dim], dtype=np.float64)
+            centroid = _unit_rows(same).mean(axis=0)
+            repo.update_centroid(
+                db,
+                profile_id,
+                centroid_json=json.dumps([round(float(x), 6) for x in centroid]),
+                sample_count=len(same),
+            )
+        else:
+            repo.delete_profile(db, profile_id)
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def _loads_vector(text: str | None) -> list[float]:
+    try:
+        value = json.loads(text or "[]")
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(value, list):
+        return []
+    try:
+        return [float(x) for x in value]
+    except (TypeError, ValueError):
+        return []
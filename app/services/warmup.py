@@ -0,0 +1,118 @@
+"""Startup warm-up: prime the decode and VAD paths before real traffic.
+
+The first decode after a model load is several times slower than steady
+state — CT2 grows its allocator and builds per-thread state on first use,
+whisper.cpp / Core ML compile and page in on the first encoder pass, and
+silero-vad traces its TorchScript graph on the first call. Without a warm-up
+that cost lands on whichever `/listen` partial or `/transcribe` arrives first
+after every deploy.
+
+`warm_up` runs `WARMUP_ROUNDS` rounds of dummy inference shaped like real
+traffic: the VAD on one client frame, `transcribe_pcm` on a partial window
+(`PARTIAL_WINDOW_MS`, greedy `beam_size=1`, as `StreamSession` sends) and on
+a final-sized utterance (default beam). Partial decodes run
+`concurrency` at a time so every CT2 worker gets primed, not just the first.
+The per-step timings land in `/status` under `warmup`; the first round is
+the cold cost, later rounds show the steady state.
+
+Warm-up is best-effort: a failure is logged and reported, never fatal.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any
+
+import numpy as np
+
+from app.services._whisper_backend import WhisperBackend
+from app.services.stream import PARTIAL_WINDOW_MS, SAMPLE_RATE
+from app.services.vad import VadBackend
+
+logger = logging.getLogger(__name__)
+
+
+# A final covers the whole utterance; 10 s is a typical spoken sentence and
+# exercises a longer decoder run than the partial window.
+FINAL_WINDOW_SECONDS = 10.0
+# One ~250 ms client frame, the cadence /listen is tuned for.
+VAD_FRAME_MS = 250
+
+
+def _dummy_audio(seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """Low-level noise: decodes like near-silence without tripping any fast path."""
+    n = int(seconds * SAMPLE_RATE)
+    return (rng.standard_normal(n) * 0.01).astype(np.float32)
+
+
+def can_warm_up(backend: WhisperBackend) -> bool:
+    """True when `backend.transcribe_pcm` is a real coroutine (not a test double)."""
+    return inspect.iscoroutinefunction(getattr(backend, "transcribe_pcm", None))
+
+
+async def warm_up(
+    backend: WhisperBackend,
+    vad: VadBackend | None,
+    *,
+    rounds: int,
+    concurrency: int = 1,
+) -> dict[str, Any]:
+    """Run the warm-up rounds; returns the report shown on `/status`."""
+    report: dict[str, Any] = {
+        "rounds": rounds,
+        "total_ms": 0,
+        "vad_ms": [],
+        "partial_ms": [],
+        "final_ms": [],
+        "error": None,
+    }
+    if rounds <= 0 or not can_warm_up(backend):
+        report["rounds"] = 0
+        return report
+
+    rng = np.random.default_rng(0)
+    partial = _dummy_audio(PARTIAL_WINDOW_MS / 1000, rng)
+    final = _dummy_audio(FINAL_WINDOW_SECONDS, rng)
+    frame = (
+        _dummy_audio(VAD_FRAME_MS / 1000, rng) * 32767
+    ).astype("<i2").tobytes()
+
+    start = time.perf_counter()
+    try:
+        for _ in range(rounds):
+            if vad is not None:
+                t0 = time.perf_counter()
+                await asyncio.to_thread(vad.is_speech, frame)
+                report["vad_ms"].append(_elapsed_ms(t0))
+
+            t0 = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    backend.transcribe_pcm(partial, language="auto", beam_size=1)
+                    for _ in range(max(1, concurrency))
+                )
+            )
+            report["partial_ms"].append(_elapsed_ms(t0))
+
+            t0 = time.perf_counter()
+            await backend.transcribe_pcm(final, language="auto")
+            report["final_ms"].append(_elapsed_ms(t0))
+    except Exception as e:  # noqa: BLE001 — warm-up must never block startup
+        report["error"] = str(e) or type(e).__name__
+        logger.warning("Warm-up aborted: %s", report["error"], exc_info=True)
+    report["total_ms"] = _elapsed_ms(start)
+    logger.info(
+        "Warm-up: %d round(s) in %d ms (partial %s ms, final %s ms)",
+        rounds,
+        report["total_ms"],
+        report["partial_ms"],
+        report["final_ms"],
+    )
+    return report
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
@@ -164,11 +164,13 @@ class PyWhisperCppBackend:
         language: str = "auto",
         initial_prompt: str | None = None,
         task: str = "transcribe",
+        batched: bool | None = None,
     ) -> TranscriptionResult:
         """Transcribe a WAV file. Returns a `TranscriptionResult`.
 
         `task="translate"` sets the whisper.cpp `translate` parameter so the
-        output is English regardless of source language.
+        output is English regardless of source language. `batched` is accepted
+        for Protocol parity and ignored — whisper.cpp has no batched decoder.
         """
         if not wav_path.exists():
             raise FileNotFoundError(f"WAV file not found: {wav_path}")
@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from app.services._whisper_backend import (
     Segment,
@@ -35,6 +35,12 @@ from app.services.punctuation import (
 
 logger = logging.getLogger(__name__)
 
+# File decode strategies. "sequential" is faster-whisper's classic 30 s
+# sliding-window decode; "batched" runs `BatchedInferencePipeline`, which
+# VAD-chunks the file and decodes `batch_size` chunks per forward pass.
+DECODE_MODES = ("sequential", "batched")
+DEFAULT_BATCH_SIZE = 8
+
 
 def _validate_ct2_directory(model_dir: str) -> None:
     """Pre-flight: a CT2 directory must contain `model.bin` and at least one tokenizer file."""
@@ -78,6 +84,26 @@ def _run_inference(
     return list(segments), info
 
 
+def _run_batched_inference(
+    pipeline: BatchedInferencePipeline,
+    media: Any,
+    *,
+    language: str | None,
+    initial_prompt: str | None,
+    task: str = "transcribe",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[list, Any]:
+    """Batched counterpart of `_run_inference`; the pipeline's own VAD picks chunk edges."""
+    segments, info = pipeline.transcribe(
+        media,
+        language=language,
+        initial_prompt=initial_prompt,
+        task=task,
+        batch_size=batch_size,
+    )
+    return list(segments), info
+
+
 class CTranslate2Backend:
     """`WhisperBackend` implementation backed by `faster_whisper.WhisperModel`.
 
@@ -87,6 +113,11 @@ class CTranslate2Backend:
         constructs the WhisperModel itself and wraps any error in `WhisperLoadError`.
 
     Sync inference is dispatched to `asyncio.to_thread` so the event loop stays free.
+
+    `decode_mode` picks the default strategy for file transcription
+    (`transcribe()`); callers may override it per request with `batched=`.
+    PCM transcription (`/listen` partials and finals) always stays sequential —
+    those windows are seconds long, so there is nothing to batch.
     """
 
     def __init__(
@@ -97,15 +128,33 @@ class CTranslate2Backend:
         compute_type: str = "default",
         device: str = "auto",
         cpu_threads: int | None = None,
+        num_workers: int = 1,
+        decode_mode: str = "sequential",
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         if model is None and model_dir is None:
             raise ValueError("CTranslate2Backend requires either model or model_dir")
+        if decode_mode not in DECODE_MODES:
+            raise WhisperLoadError(
+                f"CT2_DECODE_MODE={decode_mode!r} is not recognised; "
+                f"accepted values: {', '.join(DECODE_MODES)}"
+            )
+
+        self.decode_mode = decode_mode
+        self.batch_size = max(1, batch_size)
+        # Built on first batched request — it wraps the same WhisperModel, so
+        # both modes share one copy of the weights.
+        self._batched_pipeline: BatchedInferencePipeline | None = None
+        # Set when the backend loads the weights itself; the meeting ASR
+        # compares it with its own CT2 directory to reuse `model`.
+        self.model_dir: str | None = None
 
         if model is not None:
             self._model = model
             return
 
         _validate_ct2_directory(model_dir)
+        self.model_dir = model_dir
         # Pass cpu_threads only when set so callers that haven't opted in get
         # faster-whisper's library default (currently 4). Apple Silicon M2
         # benefits from bumping to 6-8; documented in .env.example.
@@ -115,6 +164,11 @@ class CTranslate2Backend:
         }
         if cpu_threads is not None:
             load_kwargs["cpu_threads"] = cpu_threads
+        # num_workers > 1 lets concurrent transcribe() calls from separate
+        # threads (long-form chunks, overlapping requests) decode in parallel
+        # against the same weights instead of queueing on one CT2 worker.
+        if num_workers > 1:
+            load_kwargs["num_workers"] = num_workers
         try:
             self._model = WhisperModel(model_dir, **load_kwargs)
         except Exception as e:
@@ -122,6 +176,11 @@ class CTranslate2Backend:
                 f"Failed to load WhisperModel from {model_dir}: {e}"
             ) from e
 
+    @property
+    def model(self) -> WhisperModel:
+        """The loaded `WhisperModel`, for pipelines that wrap the same weights."""
+        return self._model
+
     async def transcribe(
         self,
         wav_path: Path,
@@ -129,26 +188,41 @@ class CTranslate2Backend:
         language: str = "auto",
         initial_prompt: str | None = None,
         task: str = "transcribe",
+        batched: bool | None = None,
     ) -> TranscriptionResult:
         """Transcribe a WAV file. Returns a `TranscriptionResult` dataclass.
 
         `task="translate"` invokes faster-whisper's translation mode (output
         in English). Default `task="transcribe"` preserves prior behaviour.
+        `batched` overrides the configured `decode_mode` for this call.
         """
         if not wav_path.exists():
             raise FileNotFoundError(f"WAV file not found: {wav_path}")
 
         model_language = None if language == "auto" else language
+        if batched is None:
+            batched = self.decode_mode == "batched"
 
         try:
-            segment_list, info = await asyncio.to_thread(
-                _run_inference,
-                self._model,
-                str(wav_path),
-                language=model_language,
-                initial_prompt=initial_prompt,
-                task=task,
-            )
+            if batched:
+                segment_list, info = await asyncio.to_thread(
+                    _run_batched_inference,
+                    self._get_batched_pipeline(),
+                    str(wav_path),
+                    language=model_language,
+                    initial_prompt=initial_prompt,
+                    task=task,
+                    batch_size=self.batch_size,
+                )
+            else:
+                segment_list, info = await asyncio.to_thread(
+                    _run_inference,
+                    self._model,
+                    str(wav_path),
+                    language=model_language,
+                    initial_prompt=initial_prompt,
+                    task=task,
+                )
         except Exception as e:
             raise WhisperTranscriptionError(f"{e}") from e
 
@@ -178,6 +252,25 @@ class CTranslate2Backend:
 
         return self._build_result(segment_list, info)
 
+    async def detect_language(self, samples: np.ndarray) -> tuple[str, float]:
+        """Language ID only — one encoder pass plus a single decoder step.
+
+        Returns `(language, probability)`. Used by the `language="auto"`
+        pre-pass so later decodes can skip per-call detection.
+        """
+        try:
+            language, probability, _ = await asyncio.to_thread(
+                self._model.detect_language, samples
+            )
+        except Exception as e:
+            raise WhisperTranscriptionError(f"{e}") from e
+        return language, probability
+
+    def _get_batched_pipeline(self) -> BatchedInferencePipeline:
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self._model)
+        return self._batched_pipeline
+
     @staticmethod
     def _build_result(segment_list: list, info: Any) -> TranscriptionResult:
         raw_text = "".join(seg.text for seg in segment_list).strip()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""bench-decode-modes.py — compare sequential vs batched CT2 file decoding.
+
+Loads the CT2 variant of a registry model in-process (no server needed),
+runs every fixture through `CTranslate2Backend.transcribe()` once per decode
+mode, and prints wall time + real-time factor (RTF = wall / audio seconds;
+lower is better). The model is loaded once and shared by both modes, exactly
+as the running server does.
+
+Usage:
+    .venv/bin/python scripts/bench-decode-modes.py
+    .venv/bin/python scripts/bench-decode-modes.py \
+        --model large-v3-turbo --batch-size 16 --loop 20
+
+Defaults to every WAV under tests/fixtures/meeting/. `--loop N` concatenates
+each fixture N times before decoding — the 30 s meeting fixture is too short
+for batching to pay off, so pass `--loop 20` (10 min) to see long-file
+throughput. `--json` emits the raw numbers for scripting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.longform import SAMPLE_RATE, load_wav_float32  # noqa: E402
+from app.services.whisper_ct2 import DECODE_MODES, CTranslate2Backend  # noqa: E402
+
+DEFAULT_FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "meeting"
+
+
+def _looped_wav(src: Path, loop: int, tmp_dir: Path) -> tuple[Path, float]:
+    """Return (path, audio_seconds), concatenating `src` `loop` times when > 1."""
+    samples = load_wav_float32(src)
+    if loop > 1:
+        samples = np.tile(samples, loop)
+    dst = tmp_dir / f"{src.stem}-x{loop}.wav"
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    with wave.open(str(dst), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm)
+    return dst, len(samples) / SAMPLE_RATE
+
+
+async def bench(
+    backend: CTranslate2Backend,
+    wavs: list[tuple[Path, float]],
+    *,
+    language: str,
+    repeat: int,
+) -> list[dict]:
+    rows: list[dict] = []
+    for wav, audio_s in wavs:
+        for mode in DECODE_MODES:
+            batched = mode == "batched"
+            # Warm-up pass: first call pays CT2 allocator + pipeline setup.
+            await backend.transcribe(
+                wav, language=language, initial_prompt=None, batched=batched
+            )
+            walls: list[float] = []
+            text = ""
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                result = await backend.transcribe(
+                    wav, language=language, initial_prompt=None, batched=batched
+                )
+                walls.append(time.perf_counter() - t0)
+                text = result.text
+            wall = min(walls)
+            rows.append(
+                {
+                    "fixture": wav.name,
+                    "mode": mode,
+                    "audio_s": round(audio_s, 2),
+                    "wall_s": round(wall, 3),
+                    "rtf": round(wall / audio_s, 4) if audio_s else None,
+                    "chars": len(text),
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument(
+        "fixtures",
+        nargs="*",
+        type=Path,
+        help=f"16 kHz mono WAV files (default: {DEFAULT_FIXTURE_DIR.relative_to(REPO_ROOT)}/*.wav)",
+    )
+    p.add_argument("--model", default=None, help="Registry model name (default: registry default)")
+    p.add_argument("--model-dir", default=None, help="CT2 model directory; bypasses the registry")
+    p.add_argument("--compute-type", default="default")
+    p.add_argument("--device", default="auto")
+    p.add_argument("--cpu-threads", type=int, default=None)
+    p.add_argument("--batch-size", type=int, default=8)
+    p.add_argument("--language", default="auto")
+    p.add_argument("--loop", type=int, default=1, help="Concatenate each fixture N times")
+    p.add_argument("--repeat", type=int, default=1, help="Timed runs per mode; best is reported")
+    p.add_argument("--json", action="store_true", help="Print raw JSON rows only")
+    args = p.parse_args()
+
+    fixtures = args.fixtures or sorted(DEFAULT_FIXTURE_DIR.glob("*.wav"))
+    if not fixtures:
+        print("No fixtures found.", file=sys.stderr)
+        sys.exit(1)
+
+    model_dir = args.model_dir
+    if model_dir is None:
+        from app.services.registry import default_model_name, resolve_ct2_variant
+
+        model_dir = str(REPO_ROOT / resolve_ct2_variant(args.model or default_model_name()))
+
+    t0 = time.perf_counter()
+    backend = CTranslate2Backend(
+        model_dir=model_dir,
+        compute_type=args.compute_type,
+        device=args.device,
+        cpu_threads=args.cpu_threads,
+        batch_size=args.batch_size,
+    )
+    load_s = time.perf_counter() - t0
+
+    with tempfile.TemporaryDirectory(prefix="bench-decode-") as tmp:
+        wavs = [_looped_wav(f, max(1, args.loop), Path(tmp)) for f in fixtures]
+        rows = asyncio.run(
+            bench(backend, wavs, language=args.language, repeat=max(1, args.repeat))
+        )
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"Model: {model_dir} (loaded in {load_s:.1f}s, batch_size={args.batch_size})")
+    print("=" * 72)
+    print(f"{'fixture':<28} {'mode':<11} {'audio s':>8} {'wall s':>8} {'RTF':>8} {'chars':>6}")
+    for r in rows:
+        print(
+            f"{r['fixture']:<28} {r['mode']:<11} {r['audio_s']:>8.1f} "
+            f"{r['wall_s']:>8.2f} {r['rtf']:>8.3f} {r['chars']:>6}"
+        )
+    print("=" * 72)
+    by_fixture: dict[str, dict[str, float]] = {}
+    for r in rows:
+        by_fixture.setdefault(r["fixture"], {})[r["mode"]] = r["wall_s"]
+    for name, walls in by_fixture.items():
+        if walls.get("batched"):
+            print(f"{name}: batched speedup ×{walls['sequential'] / walls['batched']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""bench-speaker-assign.py — time the meeting merge's speaker assignment.
+
+Builds a synthetic meeting (speaker turns plus aligned segments with word
+timestamps) and times `app.services.speaker_assign.assign_speakers` against
+the path it replaced: a pandas DataFrame of the turns handed to
+`whisperx.assign_word_speakers`. Both outputs are compared label by label.
+No models or audio are involved, so it runs anywhere; the WhisperX column
+is skipped when the `[meeting]` extras (whisperx + pandas) are missing.
+
+Usage:
+    .venv/bin/python scripts/bench-speaker-assign.py
+    .venv/bin/python scripts/bench-speaker-assign.py --hours 2 --speakers 6
+
+Defaults: a 2 h meeting, 4 speakers, one turn every ~4 s, ~2.5 words/s.
+`--json` emits the raw numbers for scripting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.speaker_assign import SpeakerTurns, assign_speakers  # noqa: E402
+
+
+def synthetic_meeting(
+    *, seconds: float, speakers: int, seed: int
+) -> tuple[SpeakerTurns, dict]:
+    """Turns that alternate speakers with some crosstalk, and an aligned
+    transcript of ~10 s segments holding ~0.4 s words."""
+    rng = np.random.default_rng(seed)
+    tracks: list[tuple[float, float, str]] = []
+    t = 0.0
+    while t < seconds:
+        length = float(rng.uniform(1.0, 7.0))
+        label = f"SPEAKER_{int(rng.integers(speakers)):02d}"
+        # A little overlap with the previous turn, as real diarization has.
+        tracks.append((max(0.0, t - float(rng.uniform(0, 0.5))), t + length, label))
+        t += length + float(rng.uniform(0, 0.8))
+
+    segments = []
+    t = 0.0
+    while t < seconds:
+        seg_end = min(seconds, t + float(rng.uniform(4.0, 14.0)))
+        words = []
+        w = t
+        while w < seg_end - 0.1:
+            w_end = min(seg_end, w + float(rng.uniform(0.15, 0.6)))
+            words.append({"word": "w", "start": round(w, 3), "end": round(w_end, 3)})
+            w = w_end + 0.02
+        segments.append(
+            {"start": t, "end": seg_end, "text": " ...", "words": words}
+        )
+        t = seg_end + float(rng.uniform(0, 1.0))
+    return SpeakerTurns.from_tracks(tracks), {"language": "en", "segments": segments}
+
+
+def _labels(merged: dict) -> list[str | None]:
+    out: list[str | None] = []
+    for seg in merged["segments"]:
+        out.append(seg.get("speaker"))
+        out.extend(w.get("speaker") for w in seg.get("words", []))
+    return out
+
+
+def _best_of(repeat: int, fn) -> tuple[float, dict]:
+    walls, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        walls.append(time.perf_counter() - t0)
+    return min(walls), result
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument("--hours", type=float, default=2.0, help="Meeting length")
+    p.add_argument("--speakers", type=int, default=4)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs; best is reported")
+    p.add_argument("--json", action="store_true", help="Print raw JSON only")
+    args = p.parse_args()
+
+    turns, aligned = synthetic_meeting(
+        seconds=args.hours * 3600, speakers=args.speakers, seed=args.seed
+    )
+    words = sum(len(s["words"]) for s in aligned["segments"])
+    repeat = max(1, args.repeat)
+
+    numpy_s, ours = _best_of(repeat, lambda: assign_speakers(turns, aligned))
+    report: dict = {
+        "hours": args.hours,
+        "turns": len(turns),
+        "segments": len(aligned["segments"]),
+        "words": words,
+        "numpy_s": round(numpy_s, 4),
+        "whisperx_s": None,
+        "mismatches": None,
+    }
+
+    try:
+        import pandas as pd
+        import whisperx
+    except ImportError:
+        pass
+    else:
+        records = turns.records()
+
+        def whisperx_path() -> dict:
+            df = pd.DataFrame(records, columns=["start", "end", "speaker"])
+            df["label"] = df["speaker"]
+            return whisperx.assign_word_speakers(df, copy.deepcopy(aligned))
+
+        whisperx_s, theirs = _best_of(repeat, whisperx_path)
+        report["whisperx_s"] = round(whisperx_s, 4)
+        report["mismatches"] = sum(
+            a != b for a, b in zip(_labels(ours), _labels(theirs), strict=True)
+        )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{args.hours:g} h meeting: {report['turns']} turns, "
+        f"{report['segments']} segments, {words} words"
+    )
+    print("=" * 60)
+    print(f"{'numpy sweep':<24} {numpy_s * 1000:>10.1f} ms")
+    if report["whisperx_s"] is None:
+        print(f"{'whisperx + pandas':<24} {'skipped (meeting extras missing)':>10}")
+        return
+    print(f"{'whisperx + pandas':<24} {report['whisperx_s'] * 1000:>10.1f} ms")
+    print("=" * 60)
+    print(f"speedup ×{report['whisperx_s'] / numpy_s:.0f}, label mismatches: "
+          f"{report['mismatches']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""bench-suite.py — speed + accuracy regression report over the test fixtures.
+
+Runs every transcription path in-process against the real app (lifespan,
+scheduler, configured backend and models — whatever `.env` selects):
+
+  - transcribe    POST /transcribe with each fixture as a WAV body
+  - stream        replays each fixture through the /listen StreamSession in
+                  250 ms frames (draining every partial, then enough silence
+                  to close the last utterance); the text is the joined finals
+  - meeting-fast  POST /transcribe/meeting?fast=true, polled until done
+  - meeting-slow  POST /transcribe/meeting (WhisperX ASR), polled until done
+
+Each path runs in its own subprocess so peak RSS is attributable to it.
+Every (path, fixture) row records wall time (best of `--repeat`), RTF
+(wall / audio seconds; lower is better), the path's peak RSS, the transcript
+and its similarity to the stored reference (1.0 = identical; see
+`app/services/bench.py`). Meeting paths are reported as skipped when the
+meeting extras / HF_TOKEN / model are missing.
+
+References live in `tests/fixtures/bench/references.json` (fixture name ->
+transcript). Review a run's transcripts, then store them with
+`--update-references`; rows without a reference have similarity null.
+
+Usage:
+    .venv/bin/python scripts/bench-suite.py
+    .venv/bin/python scripts/bench-suite.py --paths transcribe,stream --repeat 3
+    .venv/bin/python scripts/bench-suite.py --compare DATA_DIR/bench/<old>.json
+
+The report is written to `DATA_DIR/bench/<git-sha>.json` (override with
+`--out`). `--compare OLD` prints per-row deltas against an earlier report and
+exits 1 when any row regressed beyond the tolerances.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.bench import (  # noqa: E402
+    DEFAULT_SIMILARITY_TOLERANCE,
+    DEFAULT_TIME_TOLERANCE,
+    compare_reports,
+    host_info,
+    similarity,
+)
+
+SAMPLE_RATE = 16_000
+BYTES_PER_SAMPLE = 2  # pcm_s16le
+FRAME_MS = 250  # same client cadence as bench-stream-latency.py
+FIXTURE_ROOT = REPO_ROOT / "tests" / "fixtures"
+DEFAULT_FIXTURE_DIRS = ("streaming", "vad", "meeting")
+MEETING_FIXTURE_DIR = FIXTURE_ROOT / "meeting"
+REFERENCES_PATH = FIXTURE_ROOT / "bench" / "references.json"
+PATHS = ("transcribe", "stream", "meeting-fast", "meeting-slow")
+MEETING_TIMEOUT_S = 1800
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _git_sha() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def load_pcm(path: Path) -> bytes:
+    """16 kHz mono pcm_s16le bytes from a `.pcm` fixture or a 16-bit WAV."""
+    if path.suffix.lower() != ".wav":
+        return path.read_bytes()
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != BYTES_PER_SAMPLE or wf.getframerate() != SAMPLE_RATE:
+            raise RuntimeError(f"{path.name}: expected 16 kHz 16-bit PCM WAV")
+        raw = wf.readframes(wf.getnframes())
+        channels = wf.getnchannels()
+    if channels == 1:
+        return raw
+    import numpy as np
+
+    audio = np.frombuffer(raw, dtype=np.int16).reshape(-1, channels)
+    return audio.mean(axis=1).astype(np.int16).tobytes()
+
+
+def wav_bytes(pcm: bytes) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(BYTES_PER_SAMPLE)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+def default_fixtures(path_name: str) -> list[Path]:
+    if path_name.startswith("meeting"):
+        return sorted(MEETING_FIXTURE_DIR.glob("*.wav"))
+    found: list[Path] = []
+    for sub in DEFAULT_FIXTURE_DIRS:
+        d = FIXTURE_ROOT / sub
+        found += sorted(d.glob("*.wav")) + sorted(d.glob("*.pcm"))
+    return found
+
+
+# ---- per-path runners (child process) ----
+
+
+def _run_transcribe(client, pcm: bytes, language: str) -> str:
+    resp = client.post(
+        "/transcribe",
+        params={"language": language, "log": "false"},
+        content=wav_bytes(pcm),
+        headers={"Content-Type": "audio/wav"},
+    )
+    resp.raise_for_status()
+    return resp.json()["text"]
+
+
+async def _replay_stream(app, pcm: bytes, language: str) -> str:
+    from app.config import config
+    from app.services.language import LanguagePin
+    from app.services.scheduler import PRIORITY_LIVE, scheduled
+    from app.services.stream import SILENCE_DURATION_MS, StreamSession
+
+    whisper = scheduled(app.state, PRIORITY_LIVE)
+    pin = LanguagePin(
+        whisper, language=language, detect_seconds=config.LANGUAGE_DETECT_SECONDS
+    )
+    finals: list[str] = []
+
+    async def transcribe_fn(samples, *, beam_size: int | None = None) -> str:
+        result = await whisper.transcribe_pcm(
+            samples, language=await pin.resolve(samples), beam_size=beam_size
+        )
+        pin.observe(result, samples)
+        return result.text
+
+    async def send_event(event) -> None:
+        if event.get("type") == "final":
+            finals.append(event.get("text", ""))
+
+    session = StreamSession(
+        transcribe_fn=transcribe_fn,
+        send_event=send_event,
+        vad_backend=app.state.vad_factory(),
+    )
+    frame_bytes = SAMPLE_RATE * FRAME_MS // 1000 * BYTES_PER_SAMPLE
+    tail = bytes(
+        (SILENCE_DURATION_MS + 2 * FRAME_MS) * SAMPLE_RATE // 1000 * BYTES_PER_SAMPLE
+    )
+    audio = pcm + tail
+    for start in range(0, len(audio), frame_bytes):
+        await session.feed_frame(audio[start : start + frame_bytes])
+        # Run every due partial: the replay measures the full decode work a
+        # patient real-time client would cause, independent of feed speed.
+        await session.drain()
+    return " ".join(t for t in finals if t)
+
+
+def _run_meeting(client, pcm: bytes, language: str, *, fast: bool) -> str:
+    params = {"fast": str(fast).lower(), "filename": "bench.wav"}
+    if language != "auto":
+        params["language"] = language
+    resp = client.post(
+        "/transcribe/meeting",
+        params=params,
+        content=wav_bytes(pcm),
+        headers={"Content-Type": "audio/wav"},
+    )
+    resp.raise_for_status()
+    status_url = resp.json()["status_url"]
+    deadline = time.monotonic() + MEETING_TIMEOUT_S
+    while time.monotonic() < deadline:
+        job = client.get(status_url).json()
+        if job["status"] == "done":
+            return " ".join(s["text"].strip() for s in job["result"]["segments"])
+        if job["status"] in ("error", "cancelled"):
+            raise RuntimeError(f"meeting job {job['status']}: {job.get('error')}")
+        time.sleep(0.5)
+    raise TimeoutError(f"meeting job not done after {MEETING_TIMEOUT_S}s")
+
+
+def run_path(path_name: str, fixtures: list[Path], args) -> list[dict]:
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.services.memory import process_memory
+
+    rows = []
+    t0 = time.perf_counter()
+    with TestClient(app) as client:
+        startup_s = time.perf_counter() - t0
+        skip_reason = None
+        if path_name.startswith("meeting"):
+            from app.api.meeting import check_meeting_availability
+
+            available, reason = check_meeting_availability()
+            skip_reason = None if available else reason
+
+        for fixture in fixtures:
+            pcm = load_pcm(fixture)
+            row = {
+                "path": path_name,
+                "fixture": fixture.name,
+                "audio_seconds": round(len(pcm) / BYTES_PER_SAMPLE / SAMPLE_RATE, 2),
+                "wall_seconds": None,
+                "rtf": None,
+                "text": None,
+                "error": None,
+                "skipped": skip_reason is not None,
+            }
+            if skip_reason is not None:
+                row["error"] = f"skipped: {skip_reason}"
+                rows.append(row)
+                continue
+            best = None
+            try:
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    if path_name == "transcribe":
+                        text = _run_transcribe(client, pcm, args.language)
+                    elif path_name == "stream":
+                        text = client.portal.call(
+                            _replay_stream, app, pcm, args.language
+                        )
+                    else:
+                        text = _run_meeting(
+                            client, pcm, args.language, fast=path_name == "meeting-fast"
+                        )
+                    wall = time.perf_counter() - start
+                    best = wall if best is None else min(best, wall)
+            except Exception as e:  # noqa: BLE001 — record and keep going
+                row["error"] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+            else:
+                row["wall_seconds"] = round(best, 3)
+                row["rtf"] = (
+                    round(best / row["audio_seconds"], 4) if row["audio_seconds"] else None
+                )
+                row["text"] = text
+            print(
+                f"  {path_name} {fixture.name}: "
+                + (row["error"] or f"{row['wall_seconds']:.2f}s (RTF {row['rtf']})"),
+                file=sys.stderr,
+            )
+            rows.append(row)
+
+    peak = process_memory()["peak_rss_mb"]
+    for row in rows:
+        row["startup_seconds"] = round(startup_s, 2)
+        row["peak_rss_mb"] = peak
+    return rows
+
+
+# ---- orchestration (parent process) ----
+
+
+def _spawn(path_name: str, args) -> list[dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        rows_path = Path(tmp) / "rows.json"
+        cmd = [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--only",
+            path_name,
+            "--rows-out",
+            str(rows_path),
+            "--language",
+            args.language,
+            "--repeat",
+            str(args.repeat),
+            *(str(f) for f in args.fixtures),
+        ]
+        proc = subprocess.run(cmd, cwd=REPO_ROOT)
+        if proc.returncode != 0 or not rows_path.is_file():
+            return [
+                {
+                    "path": path_name,
+                    "fixture": f.name,
+                    "error": f"bench process exited with {proc.returncode}",
+                }
+                for f in (args.fixtures or default_fixtures(path_name))
+            ]
+        return json.loads(rows_path.read_text())
+
+
+def _load_references() -> dict[str, str]:
+    if not REFERENCES_PATH.is_file():
+        return {}
+    return json.loads(REFERENCES_PATH.read_text())
+
+
+def _print_report(report: dict) -> None:
+    print(f"Commit {report['commit']} on {report['host']['hostname']}")
+    print("=" * 78)
+    print(f"{'path':<13} {'fixture':<22} {'wall s':>8} {'RTF':>7} {'sim':>6} {'RSS MB':>8}")
+    for r in report["results"]:
+        if r.get("error"):
+            print(f"{r['path']:<13} {r['fixture']:<22}  {r['error'][:40]}")
+            continue
+        sim = f"{r['similarity']:.3f}" if r.get("similarity") is not None else "-"
+        rss = r.get("peak_rss_mb")
+        print(
+            f"{r['path']:<13} {r['fixture']:<22} {r['wall_seconds']:>8.2f} "
+            f"{r['rtf']:>7.3f} {sim:>6} {rss if rss is not None else '-':>8}"
+        )
+    print("=" * 78)
+
+
+def _print_comparison(rows: list[dict], old_name: str) -> None:
+    print(f"Against {old_name}:")
+    for r in rows:
+        if r["status"] in ("added", "removed"):
+            print(f"  {r['path']:<13} {r['fixture']:<22} {r['status']}")
+            continue
+        wall = f"{r['wall_delta']:+.1%}" if r["wall_delta"] is not None else "-"
+        sim = f"{r['similarity_delta']:+.3f}" if r["similarity_delta"] is not None else "-"
+        flag = f"  REGRESSION ({', '.join(r['reasons'])})" if r["regression"] else ""
+        print(f"  {r['path']:<13} {r['fixture']:<22} wall {wall:>7}  sim {sim:>7}{flag}")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument(
+        "fixtures",
+        nargs="*",
+        type=Path,
+        help="16 kHz mono WAV / pcm_s16le files (default: tests/fixtures/{streaming,vad,meeting}; "
+        "meeting paths use tests/fixtures/meeting only)",
+    )
+    p.add_argument("--paths", type=_csv, default=list(PATHS), help="Comma list of paths to run")
+    p.add_argument("--language", default="auto")
+    p.add_argument("--repeat", type=int, default=1, help="Timed passes per row; best is kept")
+    p.add_argument("--out", type=Path, default=None, help="Report path (default: DATA_DIR/bench/)")
+    p.add_argument("--compare", type=Path, default=None, help="Earlier report to diff against")
+    p.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    p.add_argument("--similarity-tolerance", type=float, default=DEFAULT_SIMILARITY_TOLERANCE)
+    p.add_argument(
+        "--update-references",
+        action="store_true",
+        help="Store this run's transcribe-path texts as the references",
+    )
+    p.add_argument("--json", action="store_true", help="Print the JSON report only")
+    # Internal: one path in this process, rows written to --rows-out.
+    p.add_argument("--only", choices=PATHS, help=argparse.SUPPRESS)
+    p.add_argument("--rows-out", type=Path, help=argparse.SUPPRESS)
+    args = p.parse_args()
+    args.repeat = max(1, args.repeat)
+
+    if args.only:
+        rows = run_path(args.only, args.fixtures or default_fixtures(args.only), args)
+        args.rows_out.write_text(json.dumps(rows, ensure_ascii=False))
+        return
+
+    unknown = [name for name in args.paths if name not in PATHS]
+    if unknown:
+        p.error(f"unknown path(s) {', '.join(unknown)}; choose from {', '.join(PATHS)}")
+
+    results: list[dict] = []
+    for name in args.paths:
+        print(f"Running {name}...", file=sys.stderr)
+        results += _spawn(name, args)
+
+    if args.update_references:
+        refs = _load_references()
+        refs.update(
+            {
+                r["fixture"]: r["text"]
+                for r in results
+                if r["path"] == "transcribe" and r.get("text") is not None
+            }
+        )
+        REFERENCES_PATH.parent.mkdir(parents=True, exist_ok=True)
+        REFERENCES_PATH.write_text(
+            json.dumps(dict(sorted(refs.items())), indent=2, ensure_ascii=False) + "\n"
+        )
+        print(f"References: {REFERENCES_PATH}", file=sys.stderr)
+
+    references = _load_references()
+    for r in results:
+        ref = references.get(r["fixture"])
+        r["similarity"] = (
+            round(similarity(ref, r["text"]), 4)
+            if ref is not None and r.get("text") is not None
+            else None
+        )
+
+    from app.config import config
+
+    commit = _git_sha()
+    report = {
+        "commit": commit,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": host_info(),
+        "settings": {
+            "model": config.MODEL_NAME,
+            "compute_type": config.COMPUTE_TYPE,
+            "meeting_model": config.MEETING_MODEL_NAME,
+            "language": args.language,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    out = args.out or config.DATA_DIR / "bench" / f"{commit or time.strftime('%Y%m%dT%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    comparison = None
+    if args.compare:
+        comparison = compare_reports(
+            json.loads(args.compare.read_text()),
+            report,
+            time_tolerance=args.time_tolerance,
+            similarity_tolerance=args.similarity_tolerance,
+        )
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(report)
+        if comparison is not None:
+            _print_comparison(comparison, args.compare.name)
+        print(f"Report: {out}")
+    if comparison is not None and any(r["regression"] for r in comparison):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""tune-compute-type.py — measure compute_type × CPU_THREADS × beam on this host.
+
+For one registry model, loads its CT2 variant once per (compute_type,
+cpu_threads) combination and decodes every fixture at each beam size
+(greedy `beam=1` is what /listen partials use, the default 5 is finals and
+files). Each run reports wall time, real-time factor (RTF = wall / audio
+seconds; lower is better) and an error rate against the most precise run
+(see `app/services/bench.py`), then the fastest configuration within
+`--max-error` at the production beam (`--production-beam`, default 5) is
+recommended as env settings — a compute type that only keeps up at
+beam=1 is not one finals can use.
+
+Usage:
+    .venv/bin/python scripts/tune-compute-type.py
+    .venv/bin/python scripts/tune-compute-type.py --model large-v3-turbo \
+        --compute-types float32,int8_float32,int8 --threads 4,8 --beam-sizes 1,5
+
+Defaults: every WAV under tests/fixtures/meeting/, every compute type CT2
+supports on the device, threads = {CPU_THREADS default, half the cores, all
+cores}, beams 1 and 5. The report is written to
+`DATA_DIR/tuning/<hostname>-<model>.json` (override with `--out`); `--json`
+prints it instead of the table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.bench import (  # noqa: E402
+    DEFAULT_MAX_ERROR_RATE,
+    PRODUCTION_BEAM_SIZE,
+    TuneConfig,
+    TuneRun,
+    host_info,
+    recommend,
+    score,
+    supported_compute_types,
+)
+from app.services.longform import SAMPLE_RATE, load_wav_float32  # noqa: E402
+
+DEFAULT_FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "meeting"
+
+
+def _csv(kind):
+    def parse(value: str) -> list:
+        return [kind(v.strip()) for v in value.split(",") if v.strip()]
+
+    return parse
+
+
+def _default_threads() -> list[int | None]:
+    cores = os.cpu_count() or 4
+    threads: list[int | None] = [None]
+    for n in (max(1, cores // 2), cores):
+        if n not in threads:
+            threads.append(n)
+    return threads
+
+
+async def _decode_all(backend, fixtures, *, beam_size: int, language: str, repeat: int):
+    """Best-of-`repeat` wall time over all fixtures, plus the transcripts."""
+    texts: dict[str, str] = {}
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for name, samples in fixtures:
+            result = await backend.transcribe_pcm(
+                samples, language=language, beam_size=beam_size
+            )
+            texts[name] = result.text
+        wall = time.perf_counter() - t0
+        best = wall if best is None else min(best, wall)
+    return best or 0.0, texts
+
+
+def sweep(args, model_dir: str, fixtures) -> list[TuneRun]:
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    audio_seconds = sum(len(s) for _, s in fixtures) / SAMPLE_RATE
+    runs: list[TuneRun] = []
+    for compute_type in args.compute_types:
+        for threads in args.threads:
+            t0 = time.perf_counter()
+            try:
+                backend = CTranslate2Backend(
+                    model_dir=model_dir,
+                    compute_type=compute_type,
+                    device=args.device,
+                    cpu_threads=threads,
+                )
+            except Exception as e:  # noqa: BLE001 — report and keep sweeping
+                for beam in args.beam_sizes:
+                    runs.append(
+                        TuneRun(TuneConfig(compute_type, threads, beam), error=str(e))
+                    )
+                print(f"  {compute_type} threads={threads}: load failed: {e}", file=sys.stderr)
+                continue
+            load_s = time.perf_counter() - t0
+            # Warm-up: the first decode pays CT2 allocator growth.
+            asyncio.run(
+                _decode_all(backend, fixtures[:1], beam_size=1, language=args.language, repeat=1)
+            )
+            for beam in args.beam_sizes:
+                config = TuneConfig(compute_type, threads, beam)
+                wall, texts = asyncio.run(
+                    _decode_all(
+                        backend,
+                        fixtures,
+                        beam_size=beam,
+                        language=args.language,
+                        repeat=args.repeat,
+                    )
+                )
+                runs.append(
+                    TuneRun(
+                        config,
+                        load_seconds=load_s,
+                        audio_seconds=audio_seconds,
+                        wall_seconds=wall,
+                        texts=texts,
+                    )
+                )
+                print(f"  {config.label}: {wall:.2f}s (RTF {wall / audio_seconds:.3f})", file=sys.stderr)
+            del backend
+    return runs
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument(
+        "fixtures",
+        nargs="*",
+        type=Path,
+        help=f"16 kHz mono WAV files (default: {DEFAULT_FIXTURE_DIR.relative_to(REPO_ROOT)}/*.wav)",
+    )
+    p.add_argument("--model", default=None, help="Registry model name (default: registry default)")
+    p.add_argument("--model-dir", default=None, help="CT2 model directory; bypasses the registry")
+    p.add_argument("--device", default="auto")
+    p.add_argument(
+        "--compute-types",
+        type=_csv(str),
+        default=None,
+        help="Comma list (default: every type CT2 supports on --device)",
+    )
+    p.add_argument(
+        "--threads",
+        type=_csv(int),
+        default=None,
+        help="Comma list of CPU_THREADS values (default: CT2 default, cores/2, cores)",
+    )
+    p.add_argument("--beam-sizes", type=_csv(int), default=[1, 5])
+    p.add_argument("--language", default="auto")
+    p.add_argument("--repeat", type=int, default=1, help="Timed passes per run; best is kept")
+    p.add_argument(
+        "--max-error",
+        type=float,
+        default=DEFAULT_MAX_ERROR_RATE,
+        help="Highest error rate vs the reference run a recommendation may have",
+    )
+    p.add_argument(
+        "--production-beam",
+        type=int,
+        default=PRODUCTION_BEAM_SIZE,
+        help="Beam size the recommendation is chosen at (what the server decodes with)",
+    )
+    p.add_argument("--out", type=Path, default=None, help="Report path (default: DATA_DIR/tuning/)")
+    p.add_argument("--json", action="store_true", help="Print the JSON report only")
+    args = p.parse_args()
+
+    fixture_paths = args.fixtures or sorted(DEFAULT_FIXTURE_DIR.glob("*.wav"))
+    if not fixture_paths:
+        print("No fixtures found.", file=sys.stderr)
+        sys.exit(1)
+    fixtures = [(f.name, load_wav_float32(f)) for f in fixture_paths]
+
+    model_name = args.model
+    model_dir = args.model_dir
+    if model_dir is None:
+        from app.services.registry import default_model_name, resolve_ct2_variant
+
+        model_name = model_name or default_model_name()
+        model_dir = str(REPO_ROOT / resolve_ct2_variant(model_name))
+    model_label = model_name or Path(model_dir).name
+
+    args.compute_types = args.compute_types or supported_compute_types(args.device)
+    args.threads = args.threads or _default_threads()
+    args.repeat = max(1, args.repeat)
+
+    print(
+        f"Sweeping {len(args.compute_types)} compute types × {len(args.threads)} thread "
+        f"counts × {len(args.beam_sizes)} beams on {len(fixtures)} fixture(s)",
+        file=sys.stderr,
+    )
+    rows = score(sweep(args, model_dir, fixtures))
+    host = host_info()
+    report = {
+        "host": host,
+        "model": model_label,
+        "model_dir": model_dir,
+        "device": args.device,
+        "fixtures": [f.name for f in fixture_paths],
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "runs": rows,
+        "recommendation": recommend(
+            rows, max_error_rate=args.max_error, beam_size=args.production_beam
+        ),
+    }
+
+    from app.config import config
+
+    out = args.out or config.DATA_DIR / "tuning" / f"{host['hostname']}-{model_label}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    print(f"Model: {model_dir} on {host['hostname']} ({host['cpu_count']} cores)")
+    print("=" * 78)
+    print(f"{'compute_type':<14} {'threads':>7} {'beam':>4} {'load s':>7} {'wall s':>8} {'RTF':>7} {'err':>7}")
+    for r in rows:
+        threads = r["cpu_threads"] if r["cpu_threads"] is not None else "def"
+        if r["error"]:
+            print(f"{r['compute_type']:<14} {threads:>7} {r['beam_size']:>4}  failed: {r['error'][:40]}")
+            continue
+        marker = " ref" if r["reference"] else ""
+        print(
+            f"{r['compute_type']:<14} {threads:>7} {r['beam_size']:>4} {r['load_seconds']:>7.1f} "
+            f"{r['wall_seconds']:>8.2f} {r['rtf']:>7.3f} {r['error_rate']:>7.3f}{marker}"
+        )
+    print("=" * 78)
+    rec = report["recommendation"]
+    if rec is None:
+        print(
+            f"No beam {args.production_beam} run within error rate "
+            f"{args.max_error}; keep the current settings."
+        )
+    else:
+        print(
+            f"Recommended (RTF {rec['rtf']:.3f}, error {rec['error_rate']:.3f}, "
+            f"beam {rec['beam_size']}):"
+        )
+        for key, value in rec["env"].items():
+            print(f"  {key}={value}")
+    print(f"Report: {out}")
+
+
+if __name__ == "__main__":
+    main()
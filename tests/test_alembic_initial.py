@@ -29,6 +29,14 @@ def test_alembic_upgrade_head_creates_expected_tables(alembic_cfg):
     assert {"sessions", "finals", "action_runs", "alembic_version"}.issubset(
         table_names
     )
+    assert "meeting_jobs" in table_names
+    jobs_idx = {ix["name"] for ix in insp.get_indexes("meeting_jobs")}
+    assert "idx_meeting_jobs_created" in jobs_idx
+    assert {"speaker_profiles", "speaker_profile_samples"}.issubset(table_names)
+    profile_idx = {ix["name"] for ix in insp.get_indexes("speaker_profiles")}
+    assert "idx_speaker_profiles_name" in profile_idx
+    samples_pk = insp.get_pk_constraint("speaker_profile_samples")
+    assert samples_pk["constrained_columns"] == ["meeting_id", "speaker"]
 
     # Indexes from the initial schema should be present.
     sess_idx = {ix["name"] for ix in insp.get_indexes("sessions")}
@@ -208,6 +208,26 @@ def test_prompt_query_param_forwarded_on_raw_body(client):
     assert kw["initial_prompt"] == "custom seed"
 
 
+def test_batched_omitted_by_default(client):
+    """No `batched` query param → backend keeps its configured decode mode."""
+    kw = _captured_kwargs(
+        client,
+        headers={"Content-Type": "audio/wav"},
+        content=b"raw",
+    )
+    assert "batched" not in kw
+
+
+def test_batched_query_param_forwarded(client):
+    kw = _captured_kwargs(
+        client,
+        headers={"Content-Type": "audio/wav"},
+        content=b"raw",
+        params={"batched": "true"},
+    )
+    assert kw["batched"] is True
+
+
 # ---------- Task 3.3: /transcribe-raw is removed ----------
 
 
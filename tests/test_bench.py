@@ -0,0 +1,126 @@
+"""Tests for the tuner and bench-suite scoring helpers (app/services/bench.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.bench import (
+    TuneConfig,
+    TuneRun,
+    compare_reports,
+    error_rate,
+    recommend,
+    reference_run,
+    score,
+    similarity,
+    tokens,
+)
+
+
+def _run(compute_type, beam, wall, text, threads=None, error=None) -> TuneRun:
+    return TuneRun(
+        TuneConfig(compute_type, threads, beam),
+        audio_seconds=10.0,
+        wall_seconds=wall,
+        texts={"a.wav": text},
+        error=error,
+    )
+
+
+def test_tokens_split_cjk_per_character():
+    assert tokens("今天 OK, Hello世界!") == ["今", "天", "ok", "hello", "世", "界"]
+
+
+def test_error_rate_counts_token_edits():
+    assert error_rate("the cat sat", "the cat sat") == 0.0
+    assert error_rate("the cat sat", "the bat sat down") == pytest.approx(2 / 3)
+    assert error_rate("今天天氣", "今天天汽") == pytest.approx(0.25)
+    assert error_rate("", "") == 0.0
+
+
+def test_reference_is_most_precise_widest_beam():
+    runs = [
+        _run("int8", 5, 1.0, "x"),
+        _run("float32", 1, 4.0, "x"),
+        _run("float32", 5, 5.0, "x"),
+        _run("float16", 5, 2.0, "x", error="unsupported"),
+    ]
+    assert reference_run(runs) is runs[2]
+
+
+def test_recommend_picks_fastest_within_error_budget():
+    runs = [
+        _run("float32", 5, 5.0, "one two three four five"),
+        _run("int8_float32", 5, 2.0, "one two three four five", threads=8),
+        _run("int8", 1, 1.0, "one two tree four"),
+    ]
+    rows = score(runs)
+    assert [r["error_rate"] for r in rows] == [0.0, 0.0, 0.4]
+    rec = recommend(rows, max_error_rate=0.02)
+    assert rec["env"] == {"COMPUTE_TYPE": "int8_float32", "CPU_THREADS": "8"}
+    # The faster int8 run was only measured greedy; at the production beam
+    # it is not a candidate however loose the error budget.
+    assert recommend(rows, max_error_rate=0.5)["compute_type"] == "int8_float32"
+    assert recommend(rows, max_error_rate=0.5, beam_size=1)["compute_type"] == "int8"
+
+
+def test_failed_runs_are_reported_not_recommended():
+    rows = score([_run("float16", 5, 0.0, "", error="unsupported")])
+    assert rows[0]["error"] == "unsupported"
+    assert recommend(rows) is None
+
+
+def test_similarity_is_clamped_inverse_error_rate():
+    assert similarity("the cat sat", "the cat sat") == 1.0
+    assert similarity("the cat sat", "the bat sat") == pytest.approx(2 / 3)
+    assert similarity("hi", "one two three four") == 0.0
+    assert similarity("", "") == 1.0
+
+
+def _row(path, wall, sim, error=None, rss=100.0) -> dict:
+    return {
+        "path": path,
+        "fixture": "a.wav",
+        "wall_seconds": wall,
+        "similarity": sim,
+        "peak_rss_mb": rss,
+        "error": error,
+    }
+
+
+def test_compare_reports_flags_slower_less_accurate_and_failed_rows():
+    old = {
+        "results": [
+            _row("transcribe", 1.0, 0.95),
+            _row("stream", 2.0, 0.90),
+            _row("meeting-fast", 5.0, 0.80),
+            _row("meeting-slow", 9.0, 0.85),
+        ]
+    }
+    new = {
+        "results": [
+            _row("transcribe", 1.05, 0.94, rss=120.0),
+            _row("stream", 2.5, 0.90),
+            _row("meeting-fast", 5.0, 0.70),
+            _row("meeting-slow", None, None, error="boom"),
+        ]
+    }
+    rows = {r["path"]: r for r in compare_reports(old, new)}
+    assert not rows["transcribe"]["regression"]
+    assert rows["transcribe"]["peak_rss_delta_mb"] == 20.0
+    assert rows["stream"]["reasons"] == ["slower"]
+    assert rows["stream"]["wall_delta"] == pytest.approx(0.25)
+    assert rows["meeting-fast"]["reasons"] == ["less accurate"]
+    assert rows["meeting-slow"]["reasons"] == ["error"]
+
+
+def test_compare_reports_lists_added_and_removed_rows():
+    rows = compare_reports(
+        {"results": [_row("transcribe", 1.0, None)]},
+        {"results": [_row("stream", 1.0, None)]},
+    )
+    assert [(r["path"], r["status"]) for r in rows] == [
+        ("stream", "added"),
+        ("transcribe", "removed"),
+    ]
+    assert not any(r["regression"] for r in rows)
@@ -48,6 +48,47 @@ def clean_env(monkeypatch):
         "MEETING_MAX_JOBS",
         "MEETING_DIARIZATION_PIPELINE",
         "MEETING_ALIGN_MODEL",
+        "MEETING_PARALLEL_DIARIZE",
+        "MEETING_DIARIZE_THREADS",
+        "MEETING_CONCURRENCY",
+        "MEETING_JOB_MEMORY_MB",
+        "MEETING_RESUME_JOBS",
+        "MEETING_ALIGN_CACHE_SIZE",
+        "MEETING_ALIGN_CACHE_MB",
+        "MEETING_ALIGN_PRELOAD_LANGUAGES",
+        "MEETING_ASR_CHUNK_SECONDS",
+        "MEETING_SPEAKER_MATCH_PERCENT",
+        "MEETING_IDLE_UNLOAD_SECONDS",
+        "MEETING_SHARE_ASR_MODEL",
+        "CT2_NUM_WORKERS",
+        "CT2_DECODE_MODE",
+        "CT2_BATCH_SIZE",
+        "JOB_QUEUE_CONCURRENCY",
+        "JOB_QUEUE_BATCH_SLOTS",
+        "TRANSCRIBE_JOB_TTL_SECONDS",
+        "TRANSCRIBE_MAX_JOBS",
+        "SCHEDULER_MAX_INFLIGHT",
+        "SCHEDULER_BATCH_SLOTS",
+        "SCHEDULER_INTERACTIVE_SLOTS",
+        "SCHEDULER_BATCH_CHUNK_SECONDS",
+        "LANGUAGE_DETECT_SECONDS",
+        "LANGUAGE_CACHE_TTL_SECONDS",
+        "MODEL_POOL_MAX_MODELS",
+        "MODEL_POOL_BUDGET_MB",
+        "STREAM_DRAFT_MODEL_NAME",
+        "STARTUP_MODE",
+        "STARTUP_WAIT_SECONDS",
+        "WARMUP_ROUNDS",
+        "MODEL_PREFAULT",
+        "METRICS_ENABLED",
+        "RTF_SAMPLES",
+        "PROFILING_ENABLED",
+        "PROFILE_INTERVAL_MS",
+        "PROFILE_MAX_SECONDS",
+        "LONGFORM_MIN_SECONDS",
+        "LONGFORM_CHUNK_SECONDS",
+        "LONGFORM_OVERLAP_MS",
+        "LONGFORM_CONCURRENCY",
     ):
         monkeypatch.delenv(k, raising=False)
     return monkeypatch
@@ -324,6 +365,18 @@ def test_meeting_defaults(clean_env):
     assert c.MEETING_MAX_JOBS == 20
     assert c.MEETING_DIARIZATION_PIPELINE == "pyannote/speaker-diarization-3.1"
     assert c.MEETING_ALIGN_MODEL is None
+    assert c.MEETING_PARALLEL_DIARIZE is True
+    assert c.MEETING_DIARIZE_THREADS == 0
+    assert c.MEETING_CONCURRENCY == 0
+    assert c.MEETING_JOB_MEMORY_MB == 2048
+    assert c.MEETING_RESUME_JOBS is True
+    assert c.MEETING_ALIGN_CACHE_SIZE == 2
+    assert c.MEETING_ALIGN_CACHE_MB == 0
+    assert c.MEETING_ALIGN_PRELOAD_LANGUAGES == ()
+    assert c.MEETING_ASR_CHUNK_SECONDS == 300
+    assert c.MEETING_SPEAKER_MATCH_PERCENT == 60
+    assert c.MEETING_IDLE_UNLOAD_SECONDS == 600
+    assert c.MEETING_SHARE_ASR_MODEL is True
 
 
 def test_meeting_env_overrides(clean_env):
@@ -333,6 +386,7 @@ def test_meeting_env_overrides(clean_env):
     clean_env.setenv("MEETING_MAX_JOBS", "5")
     clean_env.setenv("MEETING_DIARIZATION_PIPELINE", "pyannote/speaker-diarization-3.0")
     clean_env.setenv("MEETING_ALIGN_MODEL", "WAV2VEC2_ASR_BASE_960H")
+    clean_env.setenv("MEETING_ALIGN_PRELOAD_LANGUAGES", " zh, EN ,")
     c = Config()
     assert c.HF_TOKEN == "hf_test_token"
     assert c.MEETING_MODEL_NAME == "large-v3-turbo"
@@ -340,6 +394,7 @@ def test_meeting_env_overrides(clean_env):
     assert c.MEETING_MAX_JOBS == 5
     assert c.MEETING_DIARIZATION_PIPELINE == "pyannote/speaker-diarization-3.0"
     assert c.MEETING_ALIGN_MODEL == "WAV2VEC2_ASR_BASE_960H"
+    assert c.MEETING_ALIGN_PRELOAD_LANGUAGES == ("zh", "en")
 
 
 def test_meeting_model_name_falls_back_to_model_name(clean_env):
@@ -360,3 +415,111 @@ def test_hf_token_unset_vs_empty(clean_env):
     clean_env.setenv("HF_TOKEN", "")
     c_empty = Config()
     assert c_empty.HF_TOKEN == ""
+
+
+def test_longform_defaults(clean_env):
+    c = Config()
+    assert c.CT2_NUM_WORKERS == 1
+    assert c.LONGFORM_MIN_SECONDS == 600
+    assert c.LONGFORM_CHUNK_SECONDS == 120
+    assert c.LONGFORM_OVERLAP_MS == 1000
+    assert c.LONGFORM_CONCURRENCY == 1
+
+
+def test_longform_concurrency_follows_num_workers(clean_env):
+    """Unset LONGFORM_CONCURRENCY fans out across exactly the CT2 worker pool."""
+    clean_env.setenv("CT2_NUM_WORKERS", "4")
+    c = Config()
+    assert c.CT2_NUM_WORKERS == 4
+    assert c.LONGFORM_CONCURRENCY == 4
+
+    clean_env.setenv("LONGFORM_CONCURRENCY", "2")
+    assert Config().LONGFORM_CONCURRENCY == 2
+
+
+def test_decode_mode_defaults_and_override(clean_env):
+    c = Config()
+    assert c.CT2_DECODE_MODE == "sequential"
+    assert c.CT2_BATCH_SIZE == 8
+
+    clean_env.setenv("CT2_DECODE_MODE", "Batched")
+    clean_env.setenv("CT2_BATCH_SIZE", "16")
+    c = Config()
+    assert c.CT2_DECODE_MODE == "batched"
+    assert c.CT2_BATCH_SIZE == 16
+
+
+def test_job_queue_defaults(clean_env):
+    c = Config()
+    assert c.JOB_QUEUE_CONCURRENCY == 2
+    assert c.JOB_QUEUE_BATCH_SLOTS is None
+    assert c.TRANSCRIBE_JOB_TTL_SECONDS == 3600
+    assert c.TRANSCRIBE_MAX_JOBS == 50
+
+
+def test_scheduler_defaults_follow_worker_count(clean_env):
+    c = Config()
+    assert c.SCHEDULER_MAX_INFLIGHT == 1
+    assert c.SCHEDULER_BATCH_SLOTS is None
+    assert c.SCHEDULER_INTERACTIVE_SLOTS is None
+    assert c.SCHEDULER_BATCH_CHUNK_SECONDS == 30
+
+    clean_env.setenv("CT2_NUM_WORKERS", "3")
+    assert Config().SCHEDULER_MAX_INFLIGHT == 3
+    clean_env.setenv("SCHEDULER_MAX_INFLIGHT", "2")
+    assert Config().SCHEDULER_MAX_INFLIGHT == 2
+
+
+def test_language_detection_defaults(clean_env):
+    c = Config()
+    assert c.LANGUAGE_DETECT_SECONDS == 10
+    assert c.LANGUAGE_CACHE_TTL_SECONDS == 1800
+    clean_env.setenv("LANGUAGE_CACHE_TTL_SECONDS", "0")
+    assert Config().LANGUAGE_CACHE_TTL_SECONDS == 0
+
+
+def test_model_pool_defaults_to_single_model(clean_env):
+    c = Config()
+    assert c.MODEL_POOL_MAX_MODELS == 1
+    assert c.MODEL_POOL_BUDGET_MB == 0
+    assert c.STREAM_DRAFT_MODEL_NAME == ""
+
+
+def test_startup_mode_defaults_to_eager(clean_env):
+    c = Config()
+    assert c.STARTUP_MODE == "eager"
+    assert c.STARTUP_WAIT_SECONDS == 30
+    clean_env.setenv("STARTUP_MODE", "Lazy")
+    assert Config().STARTUP_MODE == "lazy"
+
+
+def test_warmup_runs_one_round_by_default(clean_env):
+    assert Config().WARMUP_ROUNDS == 1
+    clean_env.setenv("WARMUP_ROUNDS", "0")
+    assert Config().WARMUP_ROUNDS == 0
+
+
+def test_rtf_samples_default_and_disable(clean_env):
+    assert Config().RTF_SAMPLES == 1000
+    clean_env.setenv("RTF_SAMPLES", "0")
+    assert Config().RTF_SAMPLES == 0
+
+
+def test_profiling_is_opt_in(clean_env):
+    c = Config()
+    assert c.PROFILING_ENABLED is False
+    assert (c.PROFILE_INTERVAL_MS, c.PROFILE_MAX_SECONDS) == (5, 300)
+    clean_env.setenv("PROFILING_ENABLED", "true")
+    assert Config().PROFILING_ENABLED is True
+
+
+def test_metrics_enabled_by_default(clean_env):
+    assert Config().METRICS_ENABLED is True
+    clean_env.setenv("METRICS_ENABLED", "false")
+    assert Config().METRICS_ENABLED is False
+
+
+def test_model_prefault_off_by_default(clean_env):
+    assert Config().MODEL_PREFAULT is False
+    clean_env.setenv("MODEL_PREFAULT", "true")
+    assert Config().MODEL_PREFAULT is True
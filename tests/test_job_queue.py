@@ -0,0 +1,209 @@
+"""Tests for the shared prioritised job queue (app/services/job_queue.py)."""
+
+import asyncio
+
+import pytest
+
+from app.services.job_queue import (
+    MEETING_PRIORITY_HIGH,
+    MEETING_PRIORITY_NORMAL,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_MEETING,
+    JobQueue,
+    auto_meeting_concurrency,
+)
+
+
+async def _hold(
+    queue: JobQueue,
+    priority: int,
+    job_id: str,
+    order: list,
+    gate: asyncio.Event,
+    rank: int = 0,
+):
+    async with queue.slot(priority=priority, job_id=job_id, rank=rank):
+        order.append(job_id)
+        await gate.wait()
+
+
+async def test_concurrency_bound_and_fifo_within_class():
+    queue = JobQueue(concurrency=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, f"j{i}", order, gate))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert order == ["j0"]
+    assert queue.depth() == 2
+    assert queue.position("j1") == 1
+    assert queue.position("j2") == 2
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["j0", "j1", "j2"]
+    assert queue.running() == 0
+
+
+async def test_interactive_jumps_ahead_of_queued_batch():
+    queue = JobQueue(concurrency=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+    first = asyncio.create_task(_hold(queue, PRIORITY_BATCH, "meeting-1", order, gate))
+    await asyncio.sleep(0)
+    batch = asyncio.create_task(_hold(queue, PRIORITY_BATCH, "meeting-2", order, gate))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "memo", order, gate))
+    await asyncio.sleep(0)
+
+    assert queue.position("memo") == 1
+    assert queue.position("meeting-2") == 2
+    gate.set()
+    await asyncio.gather(first, batch, interactive)
+    assert order == ["meeting-1", "memo", "meeting-2"]
+
+
+async def test_batch_cannot_take_reserved_interactive_slot():
+    """With concurrency=2, batch work holds at most one slot by default."""
+    queue = JobQueue(concurrency=2)
+    assert queue.batch_slots == 1
+    order: list[str] = []
+    gate = asyncio.Event()
+    b1 = asyncio.create_task(_hold(queue, PRIORITY_BATCH, "b1", order, gate))
+    b2 = asyncio.create_task(_hold(queue, PRIORITY_BATCH, "b2", order, gate))
+    await asyncio.sleep(0)
+    assert order == ["b1"]
+    assert queue.running() == 1
+
+    memo = asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "memo", order, gate))
+    await asyncio.sleep(0)
+    assert order == ["b1", "memo"]
+
+    gate.set()
+    await asyncio.gather(b1, b2, memo)
+    assert order == ["b1", "memo", "b2"]
+
+
+async def test_cancelled_waiter_leaves_queue():
+    queue = JobQueue(concurrency=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+    holder = asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "a", order, gate))
+    waiter = asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "b", order, gate))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert queue.depth() == 0
+    gate.set()
+    await holder
+    assert queue.running() == 0
+
+
+async def test_snapshot_reports_depth_and_wait_times():
+    now = [0.0]
+    queue = JobQueue(concurrency=1, clock=lambda: now[0])
+    order: list[str] = []
+    gate = asyncio.Event()
+    a = asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "a", order, gate))
+    b = asyncio.create_task(_hold(queue, PRIORITY_BATCH, "b", order, gate))
+    await asyncio.sleep(0)
+
+    snap = queue.snapshot()
+    assert snap["queued"] == 1
+    assert snap["running"] == 1
+    assert snap["classes"]["batch"]["queued"] == 1
+    assert snap["classes"]["interactive"]["running"] == 1
+
+    now[0] = 2.5
+    gate.set()
+    await asyncio.gather(a, b)
+    snap = queue.snapshot()
+    assert snap["classes"]["batch"]["wait_ms"]["max"] == 2500.0
+    assert snap["classes"]["interactive"]["wait_ms"]["count"] == 1
+    assert snap["classes"]["interactive"]["completed"] == 1
+
+
+async def test_unknown_priority_rejected():
+    queue = JobQueue()
+    with pytest.raises(ValueError):
+        await queue.acquire(priority=7)
+
+
+async def test_meeting_class_admits_high_priority_first():
+    queue = JobQueue(concurrency=3, meeting_slots=2)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    def meeting(job_id: str, rank: int) -> asyncio.Task:
+        return asyncio.create_task(
+            _hold(queue, PRIORITY_MEETING, job_id, order, gate, rank=rank)
+        )
+
+    running = [meeting(f"m{i}", MEETING_PRIORITY_NORMAL) for i in range(2)]
+    await asyncio.sleep(0)
+    normal = meeting("m2", MEETING_PRIORITY_NORMAL)
+    await asyncio.sleep(0)
+    urgent = meeting("urgent", MEETING_PRIORITY_HIGH)
+    await asyncio.sleep(0)
+
+    assert order == ["m0", "m1"]
+    assert queue.position("urgent") == 1
+    assert queue.position("m2") == 2
+    gate.set()
+    await asyncio.gather(*running, normal, urgent)
+    assert order == ["m0", "m1", "urgent", "m2"]
+
+
+async def test_meetings_share_the_batch_allowance_with_long_form_jobs():
+    """A running long-form job and a meeting together never take the slot
+    kept for interactive work, and queued interactive and batch jobs are
+    admitted before a queued meeting."""
+    queue = JobQueue(concurrency=3, meeting_slots=4)
+    assert queue.batch_slots == 2
+    assert queue.meeting_slots == 2
+    order: list[str] = []
+    gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_hold(queue, PRIORITY_BATCH, "upload", order, gate)),
+        asyncio.create_task(_hold(queue, PRIORITY_MEETING, "meeting-1", order, gate)),
+        asyncio.create_task(_hold(queue, PRIORITY_MEETING, "meeting-2", order, gate)),
+        asyncio.create_task(_hold(queue, PRIORITY_BATCH, "upload-2", order, gate)),
+    ]
+    await asyncio.sleep(0)
+    assert order == ["upload", "meeting-1"]
+    assert queue.position("upload-2") == 1
+    assert queue.position("meeting-2") == 2
+
+    tasks.append(
+        asyncio.create_task(_hold(queue, PRIORITY_INTERACTIVE, "memo", order, gate))
+    )
+    await asyncio.sleep(0)
+    assert order == ["upload", "meeting-1", "memo"]
+    snap = queue.snapshot()
+    assert snap["classes"]["meeting"]["limit"] == 2
+    assert snap["classes"]["meeting"]["queued"] == 1
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["upload", "meeting-1", "memo", "upload-2", "meeting-2"]
+
+
+@pytest.mark.parametrize(
+    ("cpu_count", "available_mb", "expected"),
+    [
+        (16, None, 4),  # cores only
+        (16, 5000, 2),  # RAM-bound: 5000 // 2048
+        (2, 64000, 1),  # never below one job
+        (None, 100, 1),
+    ],
+)
+def test_auto_meeting_concurrency(cpu_count, available_mb, expected):
+    assert (
+        auto_meeting_concurrency(
+            cpu_count=cpu_count, available_mb=available_mb, job_memory_mb=2048
+        )
+        == expected
+    )
@@ -0,0 +1,183 @@
+"""Tests for language-ID pre-pass, pinning, and the sticky cache (app/services/language.py)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import Segment, TranscriptionResult
+from app.services.language import (
+    MAX_DETECT_ATTEMPTS,
+    LanguageCache,
+    LanguagePin,
+    StickyLanguage,
+    can_detect,
+)
+
+
+def _seconds(n: float) -> np.ndarray:
+    return np.zeros(int(16_000 * n), dtype=np.float32)
+
+
+def _result(language: str = "en") -> TranscriptionResult:
+    return TranscriptionResult(
+        text="hi",
+        segments=[Segment(text="hi", start=0.0, end=1.0)],
+        language=language,
+        duration_seconds=1.0,
+    )
+
+
+class _Detector:
+    def __init__(self, language: str = "zh", probability: float = 0.9) -> None:
+        self.guess = (language, probability)
+        self.calls = 0
+
+    async def detect_language(self, samples):
+        self.calls += 1
+        return self.guess
+
+
+class _NoDetector:
+    async def transcribe_pcm(self, samples, **kwargs):
+        return _result()
+
+
+def test_can_detect_ignores_mock_attributes():
+    assert can_detect(_Detector())
+    assert not can_detect(_NoDetector())
+    assert not can_detect(MagicMock())
+
+
+async def test_pin_detects_once_after_enough_audio():
+    backend = _Detector()
+    pin = LanguagePin(backend, detect_seconds=10)
+    assert await pin.resolve(_seconds(0.5)) == "auto"
+    assert backend.calls == 0
+    assert await pin.resolve(_seconds(3)) == "zh"
+    assert await pin.resolve(_seconds(3)) == "zh"
+    assert backend.calls == 1
+
+
+async def test_pin_gives_up_on_unsure_stream():
+    backend = _Detector(probability=0.2)
+    pin = LanguagePin(backend, detect_seconds=10)
+    for _ in range(MAX_DETECT_ATTEMPTS + 2):
+        assert await pin.resolve(_seconds(3)) == "auto"
+    assert backend.calls == MAX_DETECT_ATTEMPTS
+    assert not pin.pinned
+
+
+async def test_pin_explicit_language_never_detects():
+    backend = _Detector()
+    pin = LanguagePin(backend, language="ja", detect_seconds=10)
+    assert await pin.resolve(_seconds(3)) == "ja"
+    assert backend.calls == 0
+
+
+async def test_pin_observes_first_decode_without_native_detector():
+    pin = LanguagePin(_NoDetector(), detect_seconds=10)
+    assert await pin.resolve(_seconds(3)) == "auto"
+    pin.observe(_result("und"), _seconds(3))
+    assert not pin.pinned
+    pin.observe(_result("en"), _seconds(3))
+    assert pin.language == "en"
+
+
+def test_cache_ttl_lru_and_sticky_resolution():
+    now = [0.0]
+    cache = LanguageCache(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+    cache.put("a", "zh")
+    cache.put("b", "en")
+    cache.put("b", "und")  # undetermined labels never overwrite
+    assert cache.get("a") == "zh"
+    cache.put("c", "ja")  # evicts "b", the least recently used
+    assert cache.get("b") is None
+
+    sticky = StickyLanguage(cache=cache, client_id="a")
+    assert sticky.resolve("auto") == "zh"
+    assert sticky.resolve("en") == "en"
+
+    now[0] = 61.0
+    assert sticky.resolve("auto") == "auto"
+    assert cache.snapshot()["hits"] == 2
+
+
+def test_sticky_hit_does_not_renew_a_wrong_cached_language():
+    """A decode forced to the cached language SHALL NOT re-store it: once
+    the TTL from the last real detection passes, the client is detected
+    again and a language switch is picked up."""
+    now = [0.0]
+    cache = LanguageCache(ttl_seconds=60, clock=lambda: now[0])
+    StickyLanguage(cache=cache, client_id="a").remember("auto", "zh")
+
+    # The client now speaks English; every request inside the TTL is
+    # forced to the stale "zh", which the decode then reports back.
+    for t in (30.0, 59.0):
+        now[0] = t
+        sticky = StickyLanguage(cache=cache, client_id="a")
+        assert sticky.resolve("auto") == "zh"
+        sticky.remember("auto", "zh")
+
+    now[0] = 61.0
+    sticky = StickyLanguage(cache=cache, client_id="a")
+    assert sticky.resolve("auto") == "auto", "detection must run again"
+    sticky.remember("auto", "en")
+    assert cache.get("a") == "en"
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "app.main._build_backend",
+        lambda **kw: (
+            MagicMock(name="WhisperBackend"),
+            {
+                "backend": "ctranslate2",
+                "format": "ct2",
+                "compute_type": "default",
+                "local_dir": "/fake",
+            },
+        ),
+    )
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+    module = "app.api.transcribe"
+    monkeypatch.setattr(f"{module}.file_manager.validate_file_size", lambda *a: True)
+    monkeypatch.setattr(f"{module}.file_manager.is_audio_file", lambda *a: True)
+    monkeypatch.setattr(f"{module}.file_manager.detect_mime_type", lambda *a: "audio/wav")
+    monkeypatch.setattr(f"{module}.file_manager.cleanup_file", lambda *a: None)
+    monkeypatch.setattr(f"{module}.audio_converter.convert_to_wav", lambda *a: wav_path)
+
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def test_transcribe_reuses_language_per_client_id(client):
+    app = client.app
+    seen: list[str] = []
+
+    async def fake_transcribe(path, *, language, initial_prompt, **kw):
+        seen.append(language)
+        return _result("zh")
+
+    app.state.whisper.transcribe = fake_transcribe
+
+    def post(headers):
+        return client.post(
+            "/transcribe",
+            headers={"Content-Type": "audio/wav", **headers},
+            content=b"raw",
+            params={"log": "false"},
+        )
+
+    assert post({"X-Client-Id": "phone-1"}).status_code == 200
+    post({"X-Client-Id": "phone-1"})
+    post({"X-Client-Id": "laptop"})
+    post({})
+    assert seen == ["auto", "zh", "auto", "auto"]
@@ -397,6 +397,57 @@ def test_valid_silence_frame_accepted(ws_client):
         ws.close()
 
 
+def test_draft_model_decodes_partials_and_session_model_finals(monkeypatch):
+    """With STREAM_DRAFT_MODEL_NAME resident, partials (beam_size=1) run on
+    the draft model and the final on the session's model."""
+    from app.services._whisper_backend import TranscriptionResult
+
+    calls: list[tuple[str, dict]] = []
+
+    def fake_build(**kw):
+        name = kw.get("model_name") or "main"
+        backend = MagicMock(name=f"backend-{name}")
+
+        async def transcribe_pcm(samples, **kwargs):
+            calls.append((name, kwargs))
+            return TranscriptionResult(
+                text="hello there", segments=[], language="en", duration_seconds=1.0
+            )
+
+        backend.transcribe_pcm = transcribe_pcm
+        return backend, {
+            "backend": "ctranslate2",
+            "format": "ct2",
+            "compute_type": "default",
+            "local_dir": "/fake",
+        }
+
+    monkeypatch.setattr("app.main._build_backend", fake_build)
+    monkeypatch.setattr("app.main._registry_model_names", lambda: ["main", "tiny"])
+    monkeypatch.setattr("app.main.config.MODEL_NAME", "main")
+    monkeypatch.setattr("app.main.config.STREAM_DRAFT_MODEL_NAME", "tiny")
+    monkeypatch.setattr("app.main.config.VAD_BACKEND", "rms")
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        pool = app.state.model_pool
+        client.portal.call(pool.load, "tiny")
+        calls.clear()  # drop warm-up decodes
+        with client.websocket_connect("/listen?language=en") as ws:
+            for _ in range(8):
+                ws.send_bytes(voice_frame(250))
+            for _ in range(4):
+                ws.send_bytes(silence_frame(250))
+            while json.loads(ws.receive_text())["type"] != "final":
+                pass
+
+    partials = [name for name, kw in calls if kw.get("beam_size") == 1]
+    finals = [name for name, kw in calls if kw.get("beam_size") is None]
+    assert partials and set(partials) == {"tiny"}
+    assert finals == ["main"]
+
+
 # ---------- partial decoding optimisations: greedy + adaptive cadence ----------
 
 
@@ -0,0 +1,217 @@
+"""Tests for long-form chunked transcription (app/services/longform.py)."""
+
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services._whisper_backend import Segment, TranscriptionResult
+from app.services.longform import (
+    SAMPLE_RATE,
+    Chunk,
+    load_wav_float32,
+    plan_chunks,
+    stitch_segments,
+    transcribe_longform,
+    wav_duration_seconds,
+)
+
+
+def _tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def _speech_with_pauses(n_bursts: int, burst_s: float, pause_s: float) -> np.ndarray:
+    parts = []
+    for _ in range(n_bursts):
+        parts.append(_tone(burst_s))
+        parts.append(_silence(pause_s))
+    return np.concatenate(parts)
+
+
+def _write_wav(path: Path, samples: np.ndarray) -> Path:
+    pcm = (samples * 32767).astype("<i2").tobytes()
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(pcm)
+    return path
+
+
+def test_plan_chunks_short_audio_is_single_chunk():
+    samples = _tone(5.0)
+    chunks = plan_chunks(samples, target_seconds=10.0)
+    assert len(chunks) == 1
+    assert chunks[0].start == 0
+    assert chunks[0].end == len(samples)
+
+
+def test_plan_chunks_cuts_inside_silences():
+    """Every internal boundary SHALL land inside a pause, not mid-burst."""
+    samples = _speech_with_pauses(n_bursts=12, burst_s=4.0, pause_s=1.0)
+    chunks = plan_chunks(samples, target_seconds=10.0, overlap_seconds=0.0)
+    assert len(chunks) > 1
+    for chunk in chunks[1:]:
+        boundary = int(chunk.owned_start * SAMPLE_RATE)
+        window = samples[boundary - 160 : boundary + 160]
+        assert np.max(np.abs(window)) == 0.0
+
+
+def test_plan_chunks_ownership_covers_timeline_without_gaps():
+    samples = _speech_with_pauses(n_bursts=12, burst_s=4.0, pause_s=1.0)
+    chunks = plan_chunks(samples, target_seconds=10.0, overlap_seconds=1.0)
+    assert chunks[0].owned_start == 0.0
+    for prev, curr in zip(chunks, chunks[1:], strict=False):
+        assert prev.owned_end == curr.owned_start
+        # Overlap padding extends the decoded range past the owned range.
+        assert curr.start < int(curr.owned_start * SAMPLE_RATE)
+    assert chunks[-1].owned_end == float("inf")
+
+
+def test_plan_chunks_hard_cuts_continuous_speech():
+    samples = _tone(40.0)
+    chunks = plan_chunks(samples, target_seconds=10.0, max_seconds=15.0)
+    assert len(chunks) >= 3
+    for chunk in chunks[:-1]:
+        assert chunk.owned_end - chunk.owned_start <= 15.0
+
+
+def test_stitch_segments_offsets_and_drops_overlap_duplicates():
+    first = Chunk(index=0, start=0, end=11 * SAMPLE_RATE, owned_start=0.0, owned_end=10.0)
+    second = Chunk(
+        index=1,
+        start=9 * SAMPLE_RATE,
+        end=20 * SAMPLE_RATE,
+        owned_start=10.0,
+        owned_end=float("inf"),
+    )
+    first_result = TranscriptionResult(
+        text="",
+        segments=[
+            Segment(text="alpha", start=0.0, end=4.0),
+            Segment(text="bravo", start=9.5, end=11.0),
+        ],
+        language="en",
+        duration_seconds=11.0,
+    )
+    second_result = TranscriptionResult(
+        text="",
+        segments=[
+            # Same phrase seen from the other side of the boundary.
+            Segment(text="bravo", start=0.5, end=2.0),
+            Segment(text="charlie", start=3.0, end=6.0),
+        ],
+        language="en",
+        duration_seconds=11.0,
+    )
+    stitched = stitch_segments([(second, second_result), (first, first_result)])
+    assert [s.text for s in stitched] == ["alpha", "bravo", "charlie"]
+    assert stitched[1].start == pytest.approx(9.5)
+    assert stitched[2].start == pytest.approx(12.0)
+
+
+def test_wav_duration_seconds_tolerates_non_wav(tmp_path):
+    bogus = tmp_path / "bogus.wav"
+    bogus.write_bytes(b"WAV")
+    assert wav_duration_seconds(bogus) is None
+    good = _write_wav(tmp_path / "good.wav", _tone(2.0))
+    assert wav_duration_seconds(good) == pytest.approx(2.0)
+    assert load_wav_float32(good).shape == (2 * SAMPLE_RATE,)
+
+
+class _ChunkEchoBackend:
+    """Fake backend: one segment per chunk spanning the chunk's duration."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    async def transcribe(self, wav_path, *, language, initial_prompt, task="transcribe"):
+        duration = wav_duration_seconds(wav_path)
+        self.calls.append(
+            {"language": language, "initial_prompt": initial_prompt, "task": task}
+        )
+        idx = len(self.calls)
+        return TranscriptionResult(
+            text=f"part{idx}",
+            segments=[Segment(text=f" part{idx}", start=0.0, end=duration)],
+            language="en",
+            duration_seconds=duration,
+        )
+
+    async def transcribe_pcm(self, samples, *, language, beam_size=None):
+        raise AssertionError("long-form path SHALL NOT use transcribe_pcm")
+
+
+async def test_transcribe_longform_stitches_absolute_timeline(tmp_path):
+    samples = _speech_with_pauses(n_bursts=12, burst_s=4.0, pause_s=1.0)
+    wav = _write_wav(tmp_path / "long.wav", samples)
+    backend = _ChunkEchoBackend()
+
+    result = await transcribe_longform(
+        backend,
+        wav,
+        language="auto",
+        initial_prompt="seed",
+        target_seconds=10.0,
+        overlap_seconds=0.0,
+        concurrency=3,
+    )
+
+    assert len(backend.calls) == len(result.segments) > 1
+    assert all(c["initial_prompt"] == "seed" for c in backend.calls)
+    starts = [s.start for s in result.segments]
+    assert starts == sorted(starts)
+    assert result.segments[-1].end == pytest.approx(len(samples) / SAMPLE_RATE, abs=0.01)
+    assert result.language == "en"
+    assert result.duration_seconds == pytest.approx(60.0)
+
+
+async def test_transcribe_longform_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        await transcribe_longform(_ChunkEchoBackend(), tmp_path / "missing.wav")
+
+
+class _DetectingBackend(_ChunkEchoBackend):
+    def __init__(self, language: str, probability: float) -> None:
+        super().__init__()
+        self.guess = (language, probability)
+        self.detect_calls = 0
+
+    async def detect_language(self, samples):
+        self.detect_calls += 1
+        return self.guess
+
+
+@pytest.mark.parametrize(
+    ("probability", "chunk_language", "result_language"),
+    [(0.9, "zh", "zh"), (0.2, "auto", "en")],
+)
+async def test_transcribe_longform_language_prepass(
+    tmp_path, probability, chunk_language, result_language
+):
+    samples = _speech_with_pauses(n_bursts=6, burst_s=4.0, pause_s=1.0)
+    wav = _write_wav(tmp_path / "long.wav", samples)
+    backend = _DetectingBackend("zh", probability)
+
+    result = await transcribe_longform(
+        backend,
+        wav,
+        language="auto",
+        target_seconds=10.0,
+        overlap_seconds=0.0,
+        detect_seconds=10.0,
+    )
+
+    assert backend.detect_calls == 1
+    assert len(backend.calls) > 1
+    assert {c["language"] for c in backend.calls} == {chunk_language}
+    assert result.language == result_language
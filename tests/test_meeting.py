@@ -10,9 +10,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from app.services.meeting import MeetingAnalyzer, MeetingResult, Segment, Word
+from app.services.meeting import (
+    SAMPLE_RATE,
+    MeetingAnalyzer,
+    MeetingResult,
+    Segment,
+    Word,
+)
+from app.services.speaker_assign import SpeakerTurns
 
 FIXTURE_WAV = Path(__file__).parent / "fixtures" / "meeting" / "two_speaker_30s.wav"
 
@@ -21,7 +29,7 @@ def _fake_pipeline(
     speakers: list[str] = ("SPEAKER_00", "SPEAKER_01"),
     language: str = "en",
 ) -> tuple:
-    """Build aligned + diarize outputs that mimic WhisperX shapes."""
+    """Build aligned + diarize outputs that mimic WhisperX / pyannote shapes."""
     aligned = {
         "language": language,
         "segments": [
@@ -45,17 +53,11 @@ def _fake_pipeline(
             },
         ],
     }
-    diarize_out = (
-        object()
-    )  # opaque to the test; merge consumes it via assign_word_speakers
-
-    def fake_assign(_diar, segs):
-        out = {"segments": []}
-        for seg, sp in zip(segs["segments"], speakers, strict=False):
-            out["segments"].append({**seg, "speaker": sp})
-        return out
-
-    return aligned, diarize_out, fake_assign
+    diarize_out = SpeakerTurns.from_tracks(
+        (seg["start"], seg["end"], speaker)
+        for seg, speaker in zip(aligned["segments"], speakers, strict=False)
+    )
+    return aligned, diarize_out
 
 
 def _make_analyzer() -> MeetingAnalyzer:
@@ -75,7 +77,7 @@ def test_fixture_exists():
 async def test_analyzer_runs_pipeline_on_fixture(monkeypatch):
     """End-to-end pipeline returns at least two SPEAKER_* labels for a
     two-speaker fixture (WhisperX + pyannote stages mocked)."""
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     async def _noop_load(self):
@@ -92,13 +94,6 @@ async def test_analyzer_runs_pipeline_on_fixture(monkeypatch):
     ):
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
-
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
@@ -113,20 +108,127 @@ async def test_analyzer_runs_pipeline_on_fixture(monkeypatch):
     assert result.segments[0].speaker != result.segments[1].speaker
 
 
-def test_pyannote_output_converted_to_dataframe():
-    """`_pyannote_output_to_df` SHALL produce the DataFrame shape that
-    WhisperX's `assign_word_speakers` consumes. Without it, the merge
-    stage crashes with `TypeError: object of type 'DiarizeOutput' has
-    no len()` — the regression that surfaced once Fast mode reached
-    the merge stage (no path had previously gotten that far on a real
-    long file)."""
-    import pandas as pd
+@pytest.mark.asyncio
+async def test_analyze_decodes_once_and_shares_waveform(monkeypatch):
+    """ASR, align and diarize SHALL consume one decoded float32 array —
+    the WAV is decoded once per job, not once per stage."""
+    import sys
+    import types
+
+    import numpy as np
+
+    from app.services import meeting as meeting_module
+
+    aligned, diar_out = _fake_pipeline()
+    analyzer = _make_analyzer()
+    received: dict = {}
+    decodes = []
+    real_load = meeting_module.load_meeting_audio
+
+    def counting_load(path):
+        decodes.append(path)
+        return real_load(path)
+
+    class _FakeASR:
+        def transcribe(self, audio, language=None, batch_size=None):
+            received["asr"] = audio
+            return {"language": "en", "segments": aligned["segments"]}
+
+    def fake_align(segments, model_a, metadata, audio, device, **_kwargs):
+        received["align"] = audio
+        return aligned
+
+    async def _noop_load(self):
+        self._asr = _FakeASR()
+        self._loaded = True
+
+    async def _fake_diarize(self, audio, **_kwargs):
+        received["diarize"] = await meeting_module._as_waveform(audio)
+        return diar_out
+
+    fake_wx = types.ModuleType("whisperx")
+    fake_wx.load_align_model = lambda **_kw: (object(), {})
+    fake_wx.align = fake_align
+    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
+    monkeypatch.setattr(meeting_module, "load_meeting_audio", counting_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _fake_diarize)
+
+    await analyzer.analyze(str(FIXTURE_WAV))
+
+    assert decodes == [str(FIXTURE_WAV)]
+    audio = received["asr"]
+    assert isinstance(audio, np.ndarray) and audio.dtype == np.float32
+    assert received["align"] is audio
+    assert received["diarize"] is audio
+
+
+@pytest.mark.asyncio
+async def test_shared_waveform_concurrent_first_use_decodes_once(monkeypatch):
+    """ASR and a parallel diarize task asking for the audio at once SHALL
+    share one decode, not race into two."""
+    import asyncio
+    import time
+
+    from app.services import meeting as meeting_module
+
+    decodes = []
+    real_load = meeting_module.load_meeting_audio
+
+    def slow_load(path):
+        decodes.append(path)
+        time.sleep(0.05)
+        return real_load(path)
+
+    monkeypatch.setattr(meeting_module, "load_meeting_audio", slow_load)
+    shared = meeting_module.SharedWaveform(str(FIXTURE_WAV))
+
+    first, second = await asyncio.gather(shared.get(), shared.get())
+
+    assert decodes == [str(FIXTURE_WAV)]
+    assert first is second
+
+
+def test_load_meeting_audio_matches_wave_decode(tmp_path):
+    """`load_meeting_audio` SHALL return the same samples as a plain `wave`
+    decode, down-mix stereo, and tolerate a header claiming too many
+    frames (truncated upload)."""
+    import wave
+
+    import numpy as np
+
+    from app.services.longform import load_wav_float32
+    from app.services.meeting import load_meeting_audio
+
+    audio = load_meeting_audio(FIXTURE_WAV)
+    assert np.array_equal(audio, load_wav_float32(FIXTURE_WAV))
 
-    from app.services.meeting import _pyannote_output_to_df
+    stereo = tmp_path / "stereo.wav"
+    frames = np.array([[1000, 3000], [-2000, 0]], dtype="<i2")
+    with wave.open(str(stereo), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(frames.tobytes())
+    assert load_meeting_audio(stereo).tolist() == [2000 / 32768, -1000 / 32768]
 
-    # Stand-in for a pyannote Annotation: only needs `itertracks`. The
-    # tuple shape `(segment, label, speaker)` matches what pyannote
-    # actually yields when `yield_label=True`.
+    truncated = tmp_path / "truncated.wav"
+    truncated.write_bytes(FIXTURE_WAV.read_bytes()[:10_000])
+    assert 0 < len(load_meeting_audio(truncated)) < len(audio)
+
+
+def test_pyannote_output_converted_to_turns():
+    """`_pyannote_output_to_turns` SHALL flatten both pyannote output
+    shapes into `SpeakerTurns`. Handing the raw `DiarizeOutput` to the
+    merge crashes it with `TypeError: object of type 'DiarizeOutput' has
+    no len()` — the regression that surfaced once Fast mode reached the
+    merge stage (no path had previously gotten that far on a real long
+    file)."""
+    from app.services.meeting import _pyannote_output_to_turns
+
+    # Stand-in for a pyannote Annotation: only needs `itertracks` and
+    # `labels`. The tuple shape `(segment, label, speaker)` matches what
+    # pyannote actually yields when `yield_label=True`.
     class _Segment:
         def __init__(self, start: float, end: float) -> None:
             self.start = start
@@ -138,22 +240,27 @@ def test_pyannote_output_converted_to_dataframe():
             yield (_Segment(0.0, 1.5), "track_0", "SPEAKER_00")
             yield (_Segment(1.5, 3.2), "track_1", "SPEAKER_01")
 
+        def labels(self):
+            return ["SPEAKER_00", "SPEAKER_01"]
+
     # Path 1: DiarizeOutput-style wrapper with `.speaker_diarization`.
     class _DiarizeOutput:
         speaker_diarization = _FakeAnnotation()
-
-    df = _pyannote_output_to_df(_DiarizeOutput())
-    assert isinstance(df, pd.DataFrame)
-    assert list(df.columns) == ["segment", "label", "speaker", "start", "end"]
-    assert len(df) == 2
-    assert df["speaker"].tolist() == ["SPEAKER_00", "SPEAKER_01"]
-    assert df["start"].tolist() == [0.0, 1.5]
-    assert df["end"].tolist() == [1.5, 3.2]
+        speaker_embeddings = [[0.1, 0.2], [0.3, 0.4]]
+
+    turns = _pyannote_output_to_turns(_DiarizeOutput())
+    assert isinstance(turns, SpeakerTurns)
+    assert len(turns) == 2
+    assert turns.records() == [
+        {"start": 0.0, "end": 1.5, "speaker": "SPEAKER_00"},
+        {"start": 1.5, "end": 3.2, "speaker": "SPEAKER_01"},
+    ]
+    assert turns.embeddings == {"SPEAKER_00": [0.1, 0.2], "SPEAKER_01": [0.3, 0.4]}
 
     # Path 2: bare Annotation (community-1 / older pipelines).
-    df2 = _pyannote_output_to_df(_FakeAnnotation())
-    assert isinstance(df2, pd.DataFrame)
-    assert len(df2) == 2
+    turns2 = _pyannote_output_to_turns(_FakeAnnotation())
+    assert len(turns2) == 2
+    assert turns2.embeddings == {}
 
 
 def test_load_wav_for_pyannote_accepts_path_objects():
@@ -210,10 +317,10 @@ async def test_diarize_passes_pre_decoded_dict_to_pyannote(monkeypatch):
     def fake_pipeline_call(audio_input, **kwargs):
         received_args["audio_input"] = audio_input
         received_args["kwargs"] = kwargs
-        # Return a stand-in DiarizeOutput so _pyannote_output_to_df can
+        # Return a stand-in DiarizeOutput so _pyannote_output_to_turns can
         # extract `.speaker_diarization` without exploding. The conversion
         # is exercised separately by
-        # `test_pyannote_output_converted_to_dataframe`; here we only
+        # `test_pyannote_output_converted_to_turns`; here we only
         # care about what was passed IN to the pipeline.
         class _EmptyDiarization:
             def itertracks(self, yield_label=False):
@@ -250,7 +357,7 @@ async def test_analyze_with_external_asr_skips_asr(monkeypatch):
     using caller-supplied segments WITHOUT touching the internal ASR
     stage. This is the contract that lets the meeting endpoint reuse the
     fast /transcribe backend (ggml+ANE) instead of WhisperX's CT2 ASR."""
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     asr_called = False
@@ -276,12 +383,6 @@ async def test_analyze_with_external_asr_skips_asr(monkeypatch):
         diarize_called = True
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
@@ -314,7 +415,7 @@ async def test_analyze_with_external_asr_skips_align_when_word_ts_off(
     """`enable_word_timestamps=False` SHALL skip align entirely on the fast
     path — the merge then runs with caller-supplied segments directly,
     same as on the slow path."""
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     align_called = False
@@ -332,12 +433,6 @@ async def test_analyze_with_external_asr_skips_align_when_word_ts_off(
     ):
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
     monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _fake_diarize)
@@ -362,7 +457,7 @@ async def test_analyze_with_external_asr_progress_cancellation(monkeypatch):
     """Progress callback raising CancelledError SHALL abort the fast
     pipeline cleanly — diarize MUST NOT run after a cancel raised in the
     asr_external progress checkpoint."""
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     diarize_called = False
@@ -380,12 +475,6 @@ async def test_analyze_with_external_asr_progress_cancellation(monkeypatch):
         diarize_called = True
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
     monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _fake_diarize)
@@ -412,7 +501,7 @@ async def test_analyze_with_external_asr_progress_cancellation(monkeypatch):
 async def test_analyzer_omits_words_when_word_timestamps_disabled(monkeypatch):
     """`enable_word_timestamps=False` skips the alignment stage and emits no
     `words` field per segment."""
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     align_called = False
@@ -433,13 +522,6 @@ async def test_analyzer_omits_words_when_word_timestamps_disabled(monkeypatch):
     ):
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
-
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
@@ -451,6 +533,210 @@ async def test_analyzer_omits_words_when_word_timestamps_disabled(monkeypatch):
     assert all(seg.words is None for seg in result.segments)
 
 
+@pytest.mark.asyncio
+async def test_parallel_diarize_overlaps_asr(monkeypatch):
+    """With `parallel_diarize=True`, diarize SHALL run while ASR is still in
+    flight (ASR below only finishes once diarize has started) and both
+    tracks SHALL be visible through the stage callback."""
+    import asyncio
+
+    aligned, diar_out = _fake_pipeline()
+    analyzer = _make_analyzer()
+    analyzer.parallel_diarize = True
+    diarize_started = asyncio.Event()
+
+    async def _noop_load(self):
+        self._loaded = True
+
+    async def _fake_asr(self, path, *, language=None):
+        await asyncio.wait_for(diarize_started.wait(), timeout=2)
+        return {"language": "en", "segments": aligned["segments"]}
+
+    async def _fake_align(self, asr_out, path):
+        return aligned
+
+    async def _fake_diarize(
+        self, path, *, num_speakers=None, min_speakers=None, max_speakers=None
+    ):
+        diarize_started.set()
+        return diar_out
+
+    monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _fake_diarize)
+
+    events: list[tuple[str, str]] = []
+    progress: list[str] = []
+    result = await analyzer.analyze(
+        "/tmp/a.wav",
+        progress_callback=lambda stage, p: progress.append(stage),
+        stage_callback=lambda stage, state: events.append((stage, state)),
+    )
+
+    assert result.speakers == ["SPEAKER_00", "SPEAKER_01"]
+    assert events.index(("diarize", "running")) < events.index(("asr", "done"))
+    assert ("diarize", "done") in events and ("align", "done") in events
+    assert progress[0] == "asr" and progress[-1] == "complete"
+
+
+@pytest.mark.asyncio
+async def test_parallel_diarize_failure_cancels_foreground(monkeypatch):
+    """A concurrent diarize failure SHALL surface immediately (not after ASR
+    finishes) and be reported as the failed stage."""
+    import asyncio
+    import sys
+    import types
+
+    analyzer = _make_analyzer()
+    analyzer.parallel_diarize = True
+    asr_cancelled = False
+
+    async def _noop_load(self):
+        self._loaded = True
+
+    async def _hanging_asr(self, path, *, language=None):
+        nonlocal asr_cancelled
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            asr_cancelled = True
+            raise
+
+    async def _failing_diarize(
+        self, path, *, num_speakers=None, min_speakers=None, max_speakers=None
+    ):
+        raise RuntimeError("pyannote model crashed")
+
+    monkeypatch.setitem(sys.modules, "whisperx", types.ModuleType("whisperx"))
+    monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _hanging_asr)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _failing_diarize)
+
+    stages: dict[str, str] = {}
+    with pytest.raises(RuntimeError, match="pyannote"):
+        await asyncio.wait_for(
+            analyzer.analyze(
+                "/tmp/a.wav",
+                stage_callback=lambda stage, state: stages.__setitem__(stage, state),
+            ),
+            timeout=2,
+        )
+    assert stages == {"asr": "running", "diarize": "failed"}
+    assert asr_cancelled
+
+
+@pytest.mark.asyncio
+async def test_align_model_cached_across_jobs(monkeypatch):
+    """`_run_align` SHALL load each language's align model once; the cache
+    evicts the least-recently-used language beyond `max_models`."""
+    import sys
+    import types
+
+    import numpy as np
+
+    from app.services.meeting import AlignModelCache
+
+    loads: list[str] = []
+
+    def fake_load_align_model(*, language_code, device, model_name):
+        loads.append(language_code)
+        return object(), {"language": language_code}
+
+    fake_wx = types.ModuleType("whisperx")
+    fake_wx.load_align_model = fake_load_align_model
+    fake_wx.align = lambda segments, *a, **kw: {"segments": segments}
+    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
+
+    analyzer = _make_analyzer()
+    analyzer._align_cache = AlignModelCache(max_models=2)
+    audio = np.zeros(16_000, dtype=np.float32)
+    for language in ("zh", "zh", "en", "zh", "ja", "zh"):
+        await analyzer._run_align({"language": language, "segments": []}, audio)
+
+    assert loads == ["zh", "en", "ja"]
+    cache = analyzer._align_cache
+    assert ("zh", None, "cpu") in cache and ("en", None, "cpu") not in cache
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_align_model_cache_budget_keeps_newest(monkeypatch):
+    """Over `budget_mb`, older models SHALL be evicted; the model just loaded
+    stays even when it alone exceeds the budget."""
+    import sys
+    import types
+
+    from app.services.meeting import AlignModelCache
+
+    class _Tensor:
+        def __init__(self, mib: int) -> None:
+            self.mib = mib
+
+        def numel(self) -> int:
+            return self.mib * 1024 * 1024
+
+        def element_size(self) -> int:
+            return 1
+
+    class _Model:
+        def __init__(self, mib: int) -> None:
+            self._tensors = [_Tensor(mib)]
+
+        def parameters(self):
+            return iter(self._tensors)
+
+    sizes = {"en": 300, "zh": 400, "ja": 900}
+    fake_wx = types.ModuleType("whisperx")
+    fake_wx.load_align_model = lambda *, language_code, device, model_name: (
+        _Model(sizes[language_code]),
+        {},
+    )
+    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
+
+    cache = AlignModelCache(max_models=5, budget_mb=800)
+    await cache.get("en", model_name=None, device="cpu")
+    await cache.get("zh", model_name=None, device="cpu")
+    assert len(cache) == 2 and cache.used_mb() == pytest.approx(700)
+    await cache.get("ja", model_name=None, device="cpu")
+    assert len(cache) == 1 and ("ja", None, "cpu") in cache
+
+
+@pytest.mark.asyncio
+async def test_align_model_cache_concurrent_miss_loads_once(monkeypatch):
+    """A preload and a job's align asking for the same language at once
+    SHALL share one load."""
+    import asyncio
+    import sys
+    import threading
+    import types
+
+    from app.services.meeting import AlignModelCache
+
+    loads: list[str] = []
+    release = threading.Event()
+
+    def slow_load_align_model(*, language_code, device, model_name):
+        loads.append(language_code)
+        release.wait(timeout=2)
+        return object(), {}
+
+    fake_wx = types.ModuleType("whisperx")
+    fake_wx.load_align_model = slow_load_align_model
+    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
+
+    cache = AlignModelCache(max_models=2)
+    first = asyncio.create_task(cache.get("zh", model_name=None, device="cpu"))
+    second = asyncio.create_task(cache.get("zh", model_name=None, device="cpu"))
+    await asyncio.sleep(0.05)
+    release.set()
+    (model_a, _), (model_b, _) = await asyncio.gather(first, second)
+
+    assert loads == ["zh"]
+    assert model_a is model_b
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
 def test_analyzer_uses_registry_ct2_path(monkeypatch):
     """`MeetingAnalyzer.from_config()` SHALL resolve the ASR model directory
     through `app.services.registry.resolve_ct2_variant` so the meeting endpoint
@@ -752,11 +1038,11 @@ def test_torch_device_forced_mps_falls_back_when_unavailable(monkeypatch, caplog
 
 @pytest.mark.asyncio
 async def test_concurrent_jobs_serialise(monkeypatch):
-    """Two analyze() calls submitted back-to-back SHALL execute one at a time:
-    the second only enters the pipeline after the first finishes (asyncio.Lock)."""
+    """Two analyze() calls submitted back-to-back SHALL take turns per stage:
+    the second only enters ASR after the first leaves it (stage gate)."""
     import asyncio
 
-    aligned, diar_out, fake_assign = _fake_pipeline()
+    aligned, diar_out = _fake_pipeline()
     analyzer = _make_analyzer()
 
     gate = asyncio.Event()
@@ -780,13 +1066,6 @@ async def test_concurrent_jobs_serialise(monkeypatch):
     async def fake_diarize(self, path, **kwargs):
         return diar_out
 
-    import sys
-    import types
-
-    fake_wx = types.ModuleType("whisperx")
-    fake_wx.assign_word_speakers = fake_assign
-    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
-
     monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", slow_load)
     monkeypatch.setattr(MeetingAnalyzer, "_run_asr", gated_asr)
     monkeypatch.setattr(MeetingAnalyzer, "_run_align", fake_align)
@@ -814,6 +1093,57 @@ async def test_concurrent_jobs_serialise(monkeypatch):
     assert inside == ["enter", "exit"]
 
 
+@pytest.mark.asyncio
+async def test_jobs_interleave_across_stages(monkeypatch):
+    """While one job diarizes, a second job SHALL be able to run its ASR:
+    the analyzer gates stages, not whole jobs."""
+    import asyncio
+
+    aligned, diar_out = _fake_pipeline()
+    analyzer = _make_analyzer()
+    release_diarize = asyncio.Event()
+    events: list[str] = []
+
+    async def _noop_load(self):
+        self._loaded = True
+
+    async def _fake_asr(self, audio, *, language=None):
+        events.append(f"asr {audio.path}")
+        return {"language": "en", "segments": aligned["segments"]}
+
+    async def _fake_align(self, asr_out, path):
+        return aligned
+
+    async def _blocking_diarize(self, audio, **kwargs):
+        events.append(f"diarize {audio.path}")
+        await release_diarize.wait()
+        return diar_out
+
+    monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_align", _fake_align)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _blocking_diarize)
+
+    async def _until(event: str) -> None:
+        while event not in events:
+            await asyncio.sleep(0.01)
+
+    job_a = asyncio.create_task(analyzer.analyze("/tmp/a.wav"))
+    await asyncio.wait_for(_until("diarize /tmp/a.wav"), timeout=2)
+    job_b = asyncio.create_task(analyzer.analyze("/tmp/b.wav"))
+    await asyncio.wait_for(_until("asr /tmp/b.wav"), timeout=2)
+
+    assert not job_a.done(), "job A is still diarizing"
+    release_diarize.set()
+    await asyncio.wait_for(asyncio.gather(job_a, job_b), timeout=2)
+    assert events == [
+        "asr /tmp/a.wav",
+        "diarize /tmp/a.wav",
+        "asr /tmp/b.wav",
+        "diarize /tmp/b.wav",
+    ]
+
+
 def test_generate_job_id_is_sortable_by_time():
     """Two job IDs generated 1 ms apart SHALL be lexicographically ordered
     (ULID-style time prefix)."""
@@ -867,16 +1197,19 @@ def test_job_store_unknown_id_returns_none():
 
 
 def test_job_store_evicts_expired_jobs_by_ttl():
-    """Jobs older than `ttl_seconds` SHALL be evicted on the next prune (i.e.
-    on the next create or get) and the get SHALL return None for the evicted id."""
+    """Jobs finished more than `ttl_seconds` ago SHALL be evicted on the next
+    prune (i.e. on the next create or get) and the get SHALL return None for
+    the evicted id."""
     from app.services.meeting_jobs import JobStore
 
     now = [1000.0]
     store = JobStore(ttl_seconds=1, max_jobs=100, clock=lambda: now[0])
     job = store.create()
+    now[0] = 1005.0  # the TTL counts from finishing, not from creation
+    store.mark_done(job.job_id, result=None)
     assert store.get(job.job_id) is not None
 
-    now[0] = 1002.5  # advance 2.5 s past the 1 s TTL
+    now[0] = 1007.5  # advance 2.5 s past the 1 s TTL
     assert store.get(job.job_id) is None
 
 
@@ -891,6 +1224,7 @@ def test_job_store_capacity_overflow_evicts_oldest_first():
     ids: list[str] = []
     for _ in range(4):
         job = store.create()
+        store.mark_done(job.job_id, result=None)
         ids.append(job.job_id)
         now[0] += 0.01  # spread creation times for stable sort
 
@@ -899,6 +1233,39 @@ def test_job_store_capacity_overflow_evicts_oldest_first():
         assert store.get(ids[i]) is not None, f"newer job ids[{i}] must remain"
 
 
+def test_job_store_never_evicts_pending_or_running_jobs():
+    """A job still queued or running SHALL survive both the TTL and the
+    capacity limit; only finished jobs make room."""
+    from app.services.meeting_jobs import JobStore
+
+    now = [1000.0]
+    store = JobStore(ttl_seconds=60, max_jobs=2, clock=lambda: now[0])
+    running = store.create()
+    store.mark_running(running.job_id)
+    now[0] += 0.01
+    finished = store.create()
+    store.mark_error(finished.job_id, "boom", "failed")
+    now[0] += 0.01
+    pending = [store.create() for _ in range(2)]
+
+    assert store.get(finished.job_id) is None, "the finished job makes room"
+    now[0] += 3700
+    for job in (running, *pending):
+        assert store.get(job.job_id) is job
+
+
+def test_job_store_transitions_on_unknown_id_are_noops():
+    """A worker reporting to an evicted job SHALL NOT raise."""
+    from app.services.meeting_jobs import JobStore
+
+    store = JobStore()
+    store.mark_running("gone")
+    store.mark_done("gone", result=None)
+    store.mark_error("gone", "boom", "failed")
+    store.mark_cancelled("gone")
+    assert store.get("gone") is None
+
+
 def test_job_store_count_by_status():
     from app.services.meeting_jobs import JobStore
 
@@ -921,3 +1288,130 @@ def test_word_segment_dataclass_shapes():
     )
     assert r.segments[0].words[0].word == "hi"
     assert r.speakers == ["SPEAKER_00"]
+
+
+def test_stages_to_rerun_only_invalidates_diarize_on_speaker_change():
+    from app.services.meeting import stages_to_rerun
+
+    def rerun(stages, num_speakers=2, enable_word_timestamps=True):
+        return stages_to_rerun(
+            stages,
+            num_speakers=num_speakers,
+            min_speakers=None,
+            max_speakers=None,
+            enable_word_timestamps=enable_word_timestamps,
+        )
+
+    diarize = {"num_speakers": 2, "min_speakers": None, "max_speakers": None}
+    saved = {"asr": {}, "align": {}, "diarize": diarize}
+
+    assert rerun(saved) == []
+    assert rerun(saved, num_speakers=3) == ["diarize"]
+    assert rerun({"asr": {}, "diarize": diarize}, enable_word_timestamps=False) == []
+    assert rerun({"asr": {}}, enable_word_timestamps=False) == ["diarize"]
+    assert rerun({}) == ["asr", "align", "diarize"]
+
+
+@pytest.mark.asyncio
+async def test_reanalyze_reruns_only_diarize_for_new_speaker_count(monkeypatch):
+    """Saved ASR + align outputs SHALL be reused as is; only diarize runs,
+    with the new constraint, and its checkpoint records that constraint."""
+    aligned, _ = _fake_pipeline()
+    analyzer = _make_analyzer()
+    diarize_kwargs: dict = {}
+
+    async def _noop_load(self):
+        self._loaded = True
+
+    async def _unexpected(self, *args, **kwargs):
+        raise AssertionError("saved stages SHALL NOT be recomputed")
+
+    async def _fake_diarize(self, path, **kwargs):
+        diarize_kwargs.update(kwargs)
+        return SpeakerTurns.from_tracks(
+            [(0.0, 5.5, "SPEAKER_00"), (6.0, 11.2, "SPEAKER_01")],
+            embeddings={"SPEAKER_00": [0.1, 0.2], "SPEAKER_01": [0.3, 0.4]},
+        )
+
+    monkeypatch.setattr(MeetingAnalyzer, "_load_pipeline", _noop_load)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _unexpected)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_align", _unexpected)
+    monkeypatch.setattr(MeetingAnalyzer, "_run_diarize", _fake_diarize)
+
+    stage_states: dict = {}
+    checkpoints: dict = {}
+    result = await analyzer.reanalyze(
+        str(FIXTURE_WAV),
+        stages={
+            "asr": {"language": "en", "segments": aligned["segments"]},
+            "align": aligned,
+            "diarize": {"num_speakers": 2, "turns": [], "embeddings": {}},
+        },
+        num_speakers=3,
+        stage_callback=lambda stage, state: stage_states.__setitem__(stage, state),
+        checkpoint_callback=checkpoints.__setitem__,
+    )
+
+    assert diarize_kwargs["num_speakers"] == 3
+    assert stage_states == {"asr": "reused", "align": "reused", "diarize": "done"}
+    assert set(checkpoints) == {"diarize"}
+    assert checkpoints["diarize"]["num_speakers"] == 3
+    assert checkpoints["diarize"]["turns"][1] == {
+        "start": 6.0,
+        "end": 11.2,
+        "speaker": "SPEAKER_01",
+    }
+    assert checkpoints["diarize"]["embeddings"]["SPEAKER_01"] == [0.3, 0.4]
+    assert [s.speaker for s in result.segments] == ["SPEAKER_00", "SPEAKER_01"]
+
+
+@pytest.mark.asyncio
+async def test_reanalyze_without_audio_refuses_stale_stages():
+    analyzer = _make_analyzer()
+    with pytest.raises(ValueError, match="diarize"):
+        await analyzer.reanalyze(
+            None,
+            stages={"asr": {"language": "en", "segments": []}},
+            enable_word_timestamps=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_chunked_asr_publishes_segments_per_chunk(monkeypatch):
+    """With `asr_chunk_seconds` set, ASR SHALL run chunk by chunk: segments
+    land on the absolute timeline, overlap-padding duplicates are dropped,
+    the first chunk's language is pinned and progress follows the audio."""
+    analyzer = _make_analyzer()
+    analyzer.asr_chunk_seconds = 10
+    calls: list[tuple[int, str | None]] = []
+
+    async def _fake_asr(self, audio, *, language=None):
+        calls.append((len(audio), language))
+        half = len(audio) / SAMPLE_RATE / 2
+        return {
+            "language": language or "en",
+            "segments": [
+                {"start": 0.0, "end": 0.5, "text": "head"},
+                {"start": half - 0.5, "end": half + 0.5, "text": "middle"},
+            ],
+        }
+
+    monkeypatch.setattr(MeetingAnalyzer, "_run_asr", _fake_asr)
+    # 30 s of constant tone: no silence, so plan_chunks hard-cuts at 15 s.
+    samples = np.full(30 * SAMPLE_RATE, 0.5, dtype=np.float32)
+    published: list[tuple[list[dict], str | None]] = []
+    progress: list[float] = []
+
+    out = await analyzer._run_asr_chunked(
+        samples,
+        language=None,
+        partial_callback=lambda segs, lang: published.append((segs, lang)),
+        progress_callback=lambda stage, p: progress.append(p),
+    )
+
+    assert [language for _, language in calls] == [None, "en"]
+    assert [len(segs) for segs, _ in published] == [2, 1]
+    assert [s["text"] for s in out["segments"]] == ["head", "middle", "middle"]
+    assert out["segments"][2]["start"] == pytest.approx(21.5)
+    assert out["language"] == "en"
+    assert progress == pytest.approx([0.1 + 0.3 * 16 / 30, 0.4])
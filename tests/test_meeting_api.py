@@ -362,6 +362,18 @@ def test_post_meeting_invalid_audio_returns_400(stubbed_app, meeting_available):
     assert detail["error"] == "invalid_audio"
 
 
+def test_post_meeting_invalid_priority_returns_400(stubbed_app, meeting_available):
+    with TestClient(stubbed_app) as client:
+        resp = client.post(
+            "/transcribe/meeting",
+            content=b"RIFF",
+            headers={"Content-Type": "audio/wav"},
+            params={"priority": "urgent"},
+        )
+    assert resp.status_code == 400
+    assert resp.json()["detail"]["error"] == "invalid_priority"
+
+
 def test_post_meeting_invalid_speaker_range_returns_400(stubbed_app, meeting_available):
     """min_speakers > max_speakers SHALL produce HTTP 400 with invalid_speaker_range."""
     with TestClient(stubbed_app) as client:
@@ -420,6 +432,100 @@ def test_get_meeting_status_reports_error_for_failed_pipeline(
     assert body["result"] is None
 
 
+def test_concurrent_diarize_failure_maps_to_diarize_failed(tmp_path):
+    """A diarize failure reported through the stage callback SHALL map to
+    `diarize_failed` even though progress was still on the ASR stage, and
+    the per-stage states SHALL appear in the job JSON."""
+    from app.api.meeting import _job_to_json, _run_meeting_job
+    from app.services.meeting_jobs import JobStore
+
+    async def failing_analyze(audio_path, **kwargs):
+        kwargs["progress_callback"]("asr", 0.1)
+        kwargs["stage_callback"]("asr", "running")
+        kwargs["stage_callback"]("diarize", "failed")
+        raise RuntimeError("pyannote model crashed")
+
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir="/fake/ct2",
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+    )
+    analyzer.analyze = failing_analyze
+    store = JobStore()
+    job = store.create()
+    asyncio.run(
+        _run_meeting_job(
+            analyzer=analyzer,
+            store=store,
+            job_id=job.job_id,
+            audio_path=tmp_path / "missing.wav",
+            language=None,
+            num_speakers=None,
+            min_speakers=None,
+            max_speakers=None,
+            enable_word_timestamps=True,
+        )
+    )
+
+    body = _job_to_json(store.get(job.job_id))
+    assert body["status"] == "error"
+    assert body["stage"] == "asr"
+    assert body["error"]["code"] == "diarize_failed"
+    assert body["stages"] == {"asr": "running", "diarize": "failed"}
+
+
+def test_partial_transcript_grows_while_job_runs(tmp_path):
+    """Segments published by chunked ASR SHALL appear under `partial` while
+    the job runs, `partial_offset` SHALL return only the newer ones, and the
+    finished job SHALL carry the result instead."""
+    from app.api.meeting import _job_to_json, _run_meeting_job
+    from app.services.meeting_jobs import JobStore
+
+    store = JobStore()
+    job = store.create()
+    snapshots: list[dict] = []
+
+    async def chunked_analyze(audio_path, **kwargs):
+        publish = kwargs["partial_callback"]
+        publish([{"start": 0.0, "end": 1.0, "text": "hello"}], "en")
+        publish([{"start": 1.0, "end": 2.0, "text": "world"}], "en")
+        snapshots.append(_job_to_json(store.get(job.job_id)))
+        snapshots.append(_job_to_json(store.get(job.job_id), partial_offset=1))
+        return MeetingResult(
+            language="en", duration_seconds=2.0, speakers=[], segments=[]
+        )
+
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir="/fake/ct2",
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+    )
+    analyzer.analyze = chunked_analyze
+    asyncio.run(
+        _run_meeting_job(
+            analyzer=analyzer,
+            store=store,
+            job_id=job.job_id,
+            audio_path=tmp_path / "missing.wav",
+            language=None,
+            num_speakers=None,
+            min_speakers=None,
+            max_speakers=None,
+            enable_word_timestamps=True,
+        )
+    )
+
+    full, tail = (s["partial"] for s in snapshots)
+    assert full["language"] == "en"
+    assert full["total"] == 2
+    assert [s["text"] for s in full["segments"]] == ["hello", "world"]
+    assert (tail["offset"], tail["total"]) == (1, 2)
+    assert [s["text"] for s in tail["segments"]] == ["world"]
+    done = _job_to_json(store.get(job.job_id))
+    assert done["status"] == "done"
+    assert "partial" not in done
+
+
 def test_post_meeting_returns_within_one_second(
     stubbed_app, meeting_available, monkeypatch
 ):
@@ -684,3 +790,320 @@ def test_pre_cancelled_job_skips_analyzer(
     assert job is not None
     assert job.status == "cancelled"
     assert job.stage == "cancelled"
+
+
+@pytest.fixture
+def meeting_journal(tmp_path):
+    """A MeetingJobJournal over a fresh in-memory SQLite."""
+    from app.services.meeting_journal import MeetingJobJournal
+    from app.services.persistence import SessionLocal, build_engine
+    from app.services.persistence.models import Base
+
+    engine = build_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal.configure(bind=engine)
+    try:
+        yield MeetingJobJournal(tmp_path / "spool")
+    finally:
+        engine.dispose()
+
+
+def test_shutdown_keeps_checkpointed_job_for_resume(tmp_path, meeting_journal):
+    """A job cancelled by server shutdown (not by DELETE) SHALL keep its
+    journal row, ASR checkpoint and spooled audio."""
+    from app.api.meeting import _run_meeting_job
+    from app.services.meeting_jobs import JobStore
+
+    wav = tmp_path / "job.wav"
+    wav.write_bytes(b"RIFF")
+
+    async def slow_analyze(audio_path, **kwargs):
+        kwargs["checkpoint_callback"](
+            "asr", {"language": "en", "segments": [{"start": 0, "end": 1, "text": "hi"}]}
+        )
+        await asyncio.sleep(60)
+
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir="/fake/ct2",
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+    )
+    analyzer.analyze = slow_analyze
+    store = JobStore(on_change=meeting_journal.sync)
+    job = store.create()
+    meeting_journal.record(job.job_id, audio_path=str(wav), params={}, priority=1)
+
+    async def run_then_shut_down():
+        task = asyncio.ensure_future(
+            _run_meeting_job(
+                analyzer=analyzer,
+                store=store,
+                job_id=job.job_id,
+                audio_path=str(wav),
+                language=None,
+                num_speakers=None,
+                min_speakers=None,
+                max_speakers=None,
+                enable_word_timestamps=True,
+                journal=meeting_journal,
+            )
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run_then_shut_down())
+
+    assert wav.exists()
+    (entry,) = meeting_journal.entries()
+    assert entry.job_id == job.job_id
+    assert entry.checkpoint["asr"] == {
+        "language": "en",
+        "segments": [{"start": 0.0, "end": 1.0, "text": "hi"}],
+    }
+
+
+def test_resumed_job_skips_checkpointed_asr(tmp_path, meeting_journal):
+    """A resumed job with an ASR checkpoint SHALL finish through
+    `analyzer.reanalyze`, then drop its journal row and audio."""
+    from app.api.meeting import _run_meeting_job
+    from app.services.meeting_jobs import JobStore
+
+    wav = tmp_path / "job.wav"
+    wav.write_bytes(b"RIFF")
+    calls: dict = {}
+
+    async def unexpected_analyze(audio_path, **kwargs):
+        raise AssertionError("ASR SHALL NOT rerun")
+
+    async def reanalyze(audio_path, **kwargs):
+        calls.update(kwargs)
+        return _fake_meeting_result()
+
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir="/fake/ct2",
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+    )
+    analyzer.analyze = unexpected_analyze
+    analyzer.reanalyze = reanalyze
+    store = JobStore(on_change=meeting_journal.sync)
+    job = store.restore("01J00000000000000000RESUME")
+    meeting_journal.record(job.job_id, audio_path=str(wav), params={}, priority=1)
+    segments = [{"start": 0.0, "end": 1.0, "text": "hi"}]
+
+    asyncio.run(
+        _run_meeting_job(
+            analyzer=analyzer,
+            store=store,
+            job_id=job.job_id,
+            audio_path=str(wav),
+            language=None,
+            num_speakers=2,
+            min_speakers=None,
+            max_speakers=None,
+            enable_word_timestamps=True,
+            journal=meeting_journal,
+            stages={"asr": {"language": "zh", "segments": segments}},
+        )
+    )
+
+    assert store.get(job.job_id).status == "done"
+    assert calls["stages"] == {"asr": {"language": "zh", "segments": segments}}
+    assert calls["num_speakers"] == 2
+    assert meeting_journal.entries() == []
+    assert not wav.exists()
+
+
+def _save_stage_outputs(meeting_id: str, stages: dict) -> None:
+    import json
+
+    from app.services.persistence import meeting_analyses_repo
+    from app.services.persistence.engine import SessionLocal
+
+    with SessionLocal() as db:
+        for stage, output in stages.items():
+            meeting_analyses_repo.save_stage_output(
+                db, meeting_id, stage, json.dumps(output)
+            )
+        db.commit()
+
+
+_SAVED_STAGES = {
+    "asr": {"language": "en", "segments": [{"start": 0.0, "end": 1.0, "text": "hi"}]},
+    "align": {"language": "en", "segments": []},
+    "diarize": {
+        "num_speakers": None,
+        "min_speakers": None,
+        "max_speakers": None,
+        "turns": [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}],
+        "embeddings": {},
+    },
+}
+
+
+def _create_meeting(client, meeting_id: str = "m1") -> None:
+    resp = client.post(
+        "/v1/meetings",
+        json={
+            "id": meeting_id,
+            "filename": "standup.m4a",
+            "result": {"language": "en", "speakers": ["SPEAKER_00"], "segments": []},
+            "speakers_count": 1,
+        },
+    )
+    assert resp.status_code == 201, resp.text
+
+
+def test_reanalyze_unknown_meeting_returns_404(stubbed_app, meeting_available):
+    with TestClient(stubbed_app) as client:
+        resp = client.post("/v1/meetings/nope/reanalyze", params={"num_speakers": 3})
+    assert resp.status_code == 404
+    assert resp.json()["detail"]["error"] == "meeting_not_found"
+
+
+def test_reanalyze_without_saved_stages_returns_409(stubbed_app, meeting_available):
+    """Meetings analysed before stage outputs were kept (or imported by the
+    PWA) SHALL be refused rather than silently rerun from scratch."""
+    with TestClient(stubbed_app) as client:
+        _create_meeting(client)
+        resp = client.post("/v1/meetings/m1/reanalyze", params={"num_speakers": 3})
+    assert resp.status_code == 409
+    assert resp.json()["detail"]["error"] == "stages_unavailable"
+
+
+def test_reanalyze_speaker_change_without_audio_returns_409(
+    stubbed_app, meeting_available
+):
+    """A speaker-count change reruns diarize, which needs the audio."""
+    with TestClient(stubbed_app) as client:
+        _create_meeting(client)
+        _save_stage_outputs("m1", _SAVED_STAGES)
+        resp = client.post("/v1/meetings/m1/reanalyze", params={"num_speakers": 3})
+    assert resp.status_code == 409
+    assert resp.json()["detail"]["error"] == "audio_unavailable"
+    assert "diarize" in resp.json()["detail"]["reason"]
+
+
+def test_reanalyze_reuses_saved_stages_and_replaces_result(
+    stubbed_app, meeting_available
+):
+    """With every saved stage still valid, the job SHALL go through
+    `analyzer.reanalyze` with the saved stages and no audio, then replace
+    the stored result in place (same meeting id, no new row)."""
+    calls: dict = {}
+
+    async def fake_reanalyze(audio_path, **kwargs):
+        calls["audio_path"] = audio_path
+        calls.update(kwargs)
+        return _fake_meeting_result()
+
+    with TestClient(stubbed_app) as client:
+        _install_fake_analyzer(stubbed_app, None)
+        stubbed_app.state.meeting_analyzer.reanalyze = fake_reanalyze
+        _create_meeting(client)
+        _save_stage_outputs("m1", _SAVED_STAGES)
+
+        resp = client.post(
+            "/v1/meetings/m1/reanalyze", params={"enable_word_timestamps": "false"}
+        )
+        assert resp.status_code == 202, resp.text
+        assert resp.json()["rerun"] == []
+        poll = client.get(resp.json()["status_url"])
+        assert poll.json()["status"] == "done"
+
+        meetings = client.get("/v1/meetings").json()["meetings"]
+
+    assert calls["audio_path"] is None
+    assert calls["stages"] == _SAVED_STAGES
+    assert calls["enable_word_timestamps"] is False
+    assert [m["id"] for m in meetings] == ["m1"]
+    assert meetings[0]["filename"] == "standup.m4a"
+    assert meetings[0]["result"]["speakers"] == ["SPEAKER_00", "SPEAKER_01"]
+
+
+def _stub_meeting_audio(monkeypatch, tmp_path, stages: dict) -> None:
+    """Give meeting m1 an attached audio file and the given saved stages."""
+    from types import SimpleNamespace
+
+    audio = tmp_path / "m1.m4a"
+    audio.write_bytes(b"audio")
+    row = SimpleNamespace(audio_path=str(audio), filename="standup.m4a")
+    monkeypatch.setattr(
+        "app.api.meeting_history._load_stage_outputs",
+        lambda meeting_id: (row, stages),
+    )
+
+
+def test_reanalyze_conversion_failure_returns_typed_500(
+    stubbed_app, meeting_available, monkeypatch, tmp_path
+):
+    """An ffmpeg failure on the attached audio SHALL surface as a typed
+    error, not a bare 500."""
+    _stub_meeting_audio(monkeypatch, tmp_path, _SAVED_STAGES)
+
+    def failing_convert(path):
+        raise RuntimeError("ffmpeg conversion failed: corrupt input")
+
+    monkeypatch.setattr(
+        "app.api.meeting.audio_converter.convert_to_wav", failing_convert
+    )
+    with TestClient(stubbed_app) as client:
+        resp = client.post("/v1/meetings/m1/reanalyze", params={"num_speakers": 3})
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == {
+        "error": "audio_conversion_failed",
+        "reason": "ffmpeg conversion failed: corrupt input",
+    }
+
+
+def test_reanalyze_job_is_journaled_and_resumes_onto_its_meeting(
+    stubbed_app, meeting_available, monkeypatch, tmp_path
+):
+    """A re-analysis that recomputes a stage SHALL be journaled with its
+    saved stages, and resume SHALL re-run it against the same meeting."""
+    from fastapi import BackgroundTasks
+
+    from app.api.meeting import resume_meeting_jobs
+
+    _stub_meeting_audio(monkeypatch, tmp_path, _SAVED_STAGES)
+    wav = tmp_path / "converted.wav"
+    wav.write_bytes(b"RIFF")
+    monkeypatch.setattr(
+        "app.api.meeting.audio_converter.convert_to_wav", lambda path: wav
+    )
+    monkeypatch.setattr(BackgroundTasks, "add_task", lambda self, *a, **kw: None)
+    resumed: dict = {}
+
+    async def fake_run(pool, *, priority, **kwargs):
+        resumed.update(kwargs)
+
+    monkeypatch.setattr("app.api.meeting._run_queued_meeting_job", fake_run)
+    monkeypatch.setattr(
+        "app.api.meeting._analyzer_for_state",
+        lambda state: state.meeting_analyzer,
+    )
+
+    with TestClient(stubbed_app) as client:
+        _install_fake_analyzer(stubbed_app, None)
+        resp = client.post("/v1/meetings/m1/reanalyze", params={"num_speakers": 3})
+        assert resp.status_code == 202, resp.text
+        job_id = resp.json()["job_id"]
+
+        (entry,) = stubbed_app.state.meeting_journal.entries()
+        assert entry.job_id == job_id
+        assert entry.params["meeting_id"] == "m1"
+        assert entry.checkpoint == _SAVED_STAGES
+        assert Path(entry.audio_path).exists()
+        assert not wav.exists()
+
+        async def resume():
+            await asyncio.gather(*resume_meeting_jobs(stubbed_app))
+
+        client.portal.call(resume)
+
+    assert resumed["job_id"] == job_id
+    assert resumed["meeting_id"] == "m1"
+    assert resumed["num_speakers"] == 3
+    assert resumed["stages"] == _SAVED_STAGES
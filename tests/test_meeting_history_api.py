@@ -396,3 +396,46 @@ def test_audio_download_coerces_legacy_bad_mime(client, tmp_path, monkeypatch):
     r = client.get("/v1/meetings/m-legacy/audio")
     assert r.status_code == 200
     assert r.headers["content-type"].startswith("application/octet-stream")
+
+
+def _save_diarize_output(mid: str, embeddings: dict[str, list[float]]) -> None:
+    import json
+
+    from app.services.persistence import SessionLocal
+    from app.services.persistence import meeting_analyses_repo as repo
+
+    with SessionLocal() as db:
+        repo.save_stage_output(
+            db,
+            mid,
+            "diarize",
+            json.dumps({"turns": [], "embeddings": embeddings}),
+        )
+        db.commit()
+
+
+def test_renamed_speakers_are_suggested_in_later_meetings(client):
+    """A rename SHALL teach a speaker profile, a later meeting with a similar
+    voice SHALL get that name suggested, and deleting the source meeting
+    SHALL forget it again."""
+    for mid in ("m1", "m2"):
+        r = client.post("/v1/meetings", json=_sample_meeting(mid))
+        assert r.status_code == 201, r.text
+    _save_diarize_output("m1", {"SPEAKER_00": [1.0, 0.0], "SPEAKER_01": [0.0, 1.0]})
+    _save_diarize_output("m2", {"SPEAKER_00": [0.1, 1.0], "SPEAKER_01": [1.0, 0.1]})
+
+    r = client.patch(
+        "/v1/meetings/m1", json={"speaker_names": {"SPEAKER_01": "Alice"}}
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["speaker_suggestions"] == {}
+
+    suggestions = client.get("/v1/meetings/m2").json()["speaker_suggestions"]
+    assert list(suggestions) == ["SPEAKER_00"]
+    assert suggestions["SPEAKER_00"]["name"] == "Alice"
+    assert suggestions["SPEAKER_00"]["similarity"] > 0.9
+    # Already-renamed speakers are not suggested for.
+    assert client.get("/v1/meetings/m1").json()["speaker_suggestions"] == {}
+
+    assert client.delete("/v1/meetings/m1").status_code == 204
+    assert client.get("/v1/meetings/m2").json()["speaker_suggestions"] == {}
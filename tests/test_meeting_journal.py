@@ -0,0 +1,123 @@
+"""Tests for the durable meeting job journal (meeting_jobs table + spool)."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.meeting import MeetingResult
+from app.services.meeting_jobs import JobStore
+from app.services.meeting_journal import MeetingJobJournal
+from app.services.persistence import SessionLocal, build_engine
+from app.services.persistence import meeting_jobs_repo as repo
+from app.services.persistence.models import Base
+
+
+@pytest.fixture()
+def journal(tmp_path):
+    """Journal over a fresh in-memory SQLite, spooling under tmp_path."""
+    engine = build_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal.configure(bind=engine)
+    try:
+        yield MeetingJobJournal(tmp_path / "spool")
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _row(job_id: str):
+    with SessionLocal() as db:
+        return repo.get_meeting_job(db, job_id)
+
+
+def test_spool_moves_audio_into_data_dir(journal, tmp_path):
+    wav = tmp_path / "converted.wav"
+    wav.write_bytes(b"RIFF")
+
+    spooled = journal.spool("JOB1", wav)
+
+    assert spooled == tmp_path / "spool" / "JOB1.wav"
+    assert not wav.exists()
+    assert (tmp_path / "spool" / "JOB1.wav").read_bytes() == b"RIFF"
+
+
+def test_record_checkpoint_and_entries_round_trip(journal):
+    journal.record(
+        "JOB1",
+        audio_path="/spool/JOB1.wav",
+        params={"language": "en", "fast": False},
+        priority=0,
+    )
+    segments = [{"start": 0.0, "end": 1.0, "text": "hi"}]
+    journal.checkpoint("JOB1", "asr", {"language": "en", "segments": segments})
+
+    (entry,) = journal.entries()
+    assert entry.job_id == "JOB1"
+    assert entry.priority == 0
+    assert entry.audio_path == "/spool/JOB1.wav"
+    assert entry.params == {"language": "en", "fast": False}
+    assert entry.checkpoint["asr"]["segments"][0]["text"] == "hi"
+
+
+def test_store_transitions_mirror_into_rows_until_terminal(journal):
+    """Wired as `JobStore.on_change`, the row SHALL follow status / stage /
+    progress and disappear once the job is done."""
+    store = JobStore(on_change=journal.sync)
+    job = store.create()
+    journal.record(job.job_id, audio_path="/spool/a.wav", params={}, priority=1)
+
+    store.mark_running(job.job_id, stage="asr")
+    store.update_progress(job.job_id, stage="align", progress=0.4)
+    row = _row(job.job_id)
+    assert (row.status, row.stage, row.progress) == ("running", "align", 0.4)
+
+    store.mark_done(
+        job.job_id,
+        MeetingResult(language="en", duration_seconds=1.0, speakers=[], segments=[]),
+    )
+    assert _row(job.job_id) is None
+    assert journal.entries() == []
+
+
+def test_progress_ticks_do_not_write_through(journal):
+    """`sync` runs on the event loop for every progress update; only a
+    status or stage change SHALL open a session and commit."""
+    sessions = []
+
+    def counting_session():
+        sessions.append(None)
+        return SessionLocal()
+
+    journal._session_factory = counting_session
+    store = JobStore(on_change=journal.sync)
+    job = store.create()
+    journal.record(job.job_id, audio_path="/spool/a.wav", params={}, priority=1)
+    sessions.clear()
+
+    store.mark_running(job.job_id, stage="asr")
+    for i in range(1, 50):
+        store.update_progress(job.job_id, stage="asr", progress=i / 100)
+    assert len(sessions) == 1
+
+    store.update_progress(job.job_id, stage="align", progress=0.5)
+    assert len(sessions) == 2
+    row = _row(job.job_id)
+    assert (row.status, row.stage, row.progress) == ("running", "align", 0.5)
+
+
+def test_discard_removes_row_and_spooled_audio(journal, tmp_path):
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"RIFF")
+    journal.record("JOB1", audio_path=str(wav), params={}, priority=1)
+
+    journal.discard("JOB1")
+
+    assert _row("JOB1") is None
+    assert not wav.exists()
+
+
+def test_restore_keeps_original_job_id():
+    store = JobStore(ttl_seconds=60, clock=lambda: 1_000_000.0)
+    job = store.restore("01J0000000000000000000ABCD")
+    assert store.get("01J0000000000000000000ABCD") is job
+    assert job.status == "pending"
@@ -7,6 +7,7 @@ for the WhisperX + pyannote model load. These tests pin that contract.
 
 from __future__ import annotations
 
+import contextlib
 import sys
 import types
 from pathlib import Path
@@ -84,23 +85,15 @@ async def test_first_analyze_loads_models_second_call_reuses_them(monkeypatch):
     def fake_load_audio(_path):
         return b"audio"
 
-    def fake_assign_word_speakers(_diar, segs):
-        return {
-            "segments": [
-                {**s, "speaker": "SPEAKER_00"} for s in segs.get("segments", [])
-            ]
-        }
-
     fake_wx = types.ModuleType("whisperx")
     fake_wx.load_model = fake_load_model
     fake_wx.load_audio = fake_load_audio
-    fake_wx.assign_word_speakers = fake_assign_word_speakers
     monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
 
     class _FakeDiarization:
-        # _pyannote_output_to_df calls .itertracks(yield_label=True) on
+        # _pyannote_output_to_turns calls .itertracks(yield_label=True) on
         # `output.speaker_diarization`; return an empty iterator so the
-        # downstream DataFrame is well-formed but carries no segments.
+        # downstream SpeakerTurns are well-formed but carry no turns.
         def itertracks(self, yield_label=False):
             return iter([])
 
@@ -140,3 +133,256 @@ async def test_first_analyze_loads_models_second_call_reuses_them(monkeypatch):
     assert pipeline_load_calls == 1, (
         "second analyze() must reuse the diarization pipeline"
     )
+
+
+def _install_fake_extras(monkeypatch) -> dict:
+    """Fake whisperx (with `asr.WhisperModel`) and pyannote.audio modules;
+    returns the load log: `asr` / `diarize` call counts and the kwargs of
+    every `whisperx.load_model` call."""
+    calls: dict = {"asr": 0, "diarize": 0, "asr_kwargs": []}
+
+    class _FakeASR:
+        def transcribe(self, audio, language=None, batch_size=None):
+            return {"language": "en", "segments": []}
+
+    def fake_load_model(model_dir, **kwargs):
+        calls["asr"] += 1
+        calls["asr_kwargs"].append(kwargs)
+        return _FakeASR()
+
+    class _WhisperXModel:
+        pass
+
+    fake_wx = types.ModuleType("whisperx")
+    fake_wx.load_model = fake_load_model
+    fake_wx.load_align_model = lambda **_kw: (object(), {})
+    fake_wx.align = lambda segments, *_a, **_kw: {"segments": segments}
+    fake_wx_asr = types.ModuleType("whisperx.asr")
+    fake_wx_asr.WhisperModel = _WhisperXModel
+    fake_wx.asr = fake_wx_asr
+    monkeypatch.setitem(sys.modules, "whisperx", fake_wx)
+    monkeypatch.setitem(sys.modules, "whisperx.asr", fake_wx_asr)
+
+    class _FakeDiarizeOutput:
+        class speaker_diarization:  # noqa: N801 — mirrors pyannote's attribute
+            @staticmethod
+            def itertracks(yield_label=False):
+                return iter([])
+
+    class _FakePipeline:
+        @classmethod
+        def from_pretrained(cls, _name, token=None):
+            calls["diarize"] += 1
+            return cls()
+
+        def __call__(self, _audio, **_kwargs):
+            return _FakeDiarizeOutput()
+
+    fake_pa_audio = types.ModuleType("pyannote.audio")
+    fake_pa_audio.Pipeline = _FakePipeline
+    fake_pa = types.ModuleType("pyannote")
+    fake_pa.audio = fake_pa_audio
+    monkeypatch.setitem(sys.modules, "pyannote", fake_pa)
+    monkeypatch.setitem(sys.modules, "pyannote.audio", fake_pa_audio)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_fast_path_never_loads_whisperx_asr(monkeypatch):
+    """analyze_with_external_asr() SHALL load only the stages it runs."""
+    calls = _install_fake_extras(monkeypatch)
+    analyzer = _fresh_analyzer()
+
+    await analyzer.analyze_with_external_asr(
+        str(FIXTURE_WAV),
+        asr_segments=[{"start": 0.0, "end": 1.0, "text": "hi"}],
+        language="en",
+        enable_word_timestamps=False,
+    )
+
+    assert calls == {"asr": 0, "diarize": 1, "asr_kwargs": []}
+    assert analyzer.resident_models() == {
+        "asr": "unloaded",
+        "align": "unloaded",
+        "diarize": "resident",
+    }
+
+
+@pytest.mark.asyncio
+async def test_asr_wraps_matching_server_model(monkeypatch, tmp_path):
+    """When a resident server backend holds the meeting's CT2 weights on the
+    same device and weight type, WhisperX SHALL get that model to wrap."""
+    calls = _install_fake_extras(monkeypatch)
+    ct2 = types.SimpleNamespace(device="cpu", compute_type="int8_float32")
+    server_model = types.SimpleNamespace(model=ct2, hf_tokenizer="tok")
+    backends = [
+        types.SimpleNamespace(model_dir=str(tmp_path / "other"), model=server_model),
+        types.SimpleNamespace(model_dir=str(tmp_path / "ct2"), model=server_model),
+    ]
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir=str(tmp_path / "ct2"),
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+        compute_type="int8",
+        shared_backends=lambda: backends,
+    )
+
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+
+    view = calls["asr_kwargs"][0]["model"]
+    assert isinstance(view, sys.modules["whisperx.asr"].WhisperModel)
+    assert view.model is ct2 and view.hf_tokenizer == "tok"
+    assert analyzer.resident_models()["asr"] == "shared"
+
+    # A different weight type is not shareable: WhisperX loads its own copy.
+    ct2.compute_type = "float32"
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir=str(tmp_path / "ct2"),
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+        compute_type="int8",
+        shared_backends=lambda: backends,
+    )
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert "model" not in calls["asr_kwargs"][1]
+    assert analyzer.resident_models()["asr"] == "resident"
+
+
+@pytest.mark.asyncio
+async def test_idle_models_unload_and_reload_on_next_job(monkeypatch):
+    """Sub-models unused for idle_unload_seconds SHALL be dropped, and the
+    next job SHALL load them again."""
+    calls = _install_fake_extras(monkeypatch)
+    now = [1000.0]
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir="/nonexistent/ct2",
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+        idle_unload_seconds=60,
+        clock=lambda: now[0],
+    )
+
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert analyzer.loaded is True
+    assert analyzer.unload_idle() == []
+
+    now[0] += 59
+    assert analyzer.unload_idle() == []
+    now[0] += 1
+    assert analyzer.unload_idle() == ["asr", "diarize"]
+    assert analyzer.loaded is False
+
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert (calls["asr"], calls["diarize"]) == (2, 2)
+
+
+def _server_backend(model_dir: Path) -> types.SimpleNamespace:
+    """A resident server backend holding int8 CT2 weights from `model_dir`."""
+    ct2 = types.SimpleNamespace(device="cpu", compute_type="int8_float32")
+    return types.SimpleNamespace(
+        model_dir=str(model_dir), model=types.SimpleNamespace(model=ct2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_asr_decodes_one_scheduler_slot_per_chunk(
+    monkeypatch, tmp_path
+):
+    """Every decode on a borrowed server model SHALL hold a scheduler slot,
+    one per chunk, so live decodes are granted a slot between chunks."""
+    _install_fake_extras(monkeypatch)
+    slots: list[bool] = []  # per decode: was a slot held while it ran
+    holding = False
+
+    @contextlib.asynccontextmanager
+    async def decode_slot():
+        nonlocal holding
+        holding = True
+        try:
+            yield
+        finally:
+            holding = False
+
+    class _ASR:
+        def transcribe(self, audio, language=None, batch_size=None):
+            slots.append(holding)
+            return {"language": "en", "segments": []}
+
+    monkeypatch.setattr(
+        sys.modules["whisperx"], "load_model", lambda _dir, **_kw: _ASR()
+    )
+    backends = [_server_backend(tmp_path / "ct2")]
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir=str(tmp_path / "ct2"),
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+        compute_type="int8",
+        asr_chunk_seconds=10,
+        shared_backends=lambda: backends,
+        shared_decode_slot=decode_slot,
+    )
+
+    await analyzer.analyze(
+        str(FIXTURE_WAV),
+        enable_word_timestamps=False,
+        partial_callback=lambda segments, language: None,
+    )
+
+    assert len(slots) > 1
+    assert all(slots)
+
+
+@pytest.mark.asyncio
+async def test_shared_asr_dropped_once_its_server_model_is_unloaded(
+    monkeypatch, tmp_path
+):
+    """After the lending backend is hot-swapped or evicted, the analyzer
+    SHALL stop reporting (and holding) the old model and rewrap or reload
+    on the next job."""
+    calls = _install_fake_extras(monkeypatch)
+    backends = [_server_backend(tmp_path / "ct2")]
+    analyzer = MeetingAnalyzer(
+        ct2_model_dir=str(tmp_path / "ct2"),
+        hf_token="fake-token",
+        diarization_pipeline="pyannote/speaker-diarization-3.1",
+        compute_type="int8",
+        shared_backends=lambda: backends,
+    )
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert analyzer.resident_models()["asr"] == "shared"
+
+    # Hot swap: a new backend on the same weights replaces the lender.
+    replacement = _server_backend(tmp_path / "ct2")
+    backends[:] = [replacement]
+    assert analyzer.resident_models()["asr"] == "unloaded"
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert calls["asr"] == 2
+    assert calls["asr_kwargs"][1]["model"].model is replacement.model.model
+
+    # Evicted with nothing resident in its place: WhisperX loads its own.
+    backends.clear()
+    await analyzer.analyze(str(FIXTURE_WAV), enable_word_timestamps=False)
+    assert calls["asr"] == 3
+    assert "model" not in calls["asr_kwargs"][2]
+    assert analyzer.resident_models()["asr"] == "resident"
+
+
+@pytest.mark.asyncio
+async def test_asr_sharing_needs_a_scheduler_slot_left_for_live():
+    """The server model SHALL only be lent when the scheduler keeps a slot
+    out of batch reach, and shared decodes SHALL take a batch slot."""
+    from app.api.meeting import _asr_sharing
+    from app.services.scheduler import Scheduler
+
+    assert _asr_sharing(types.SimpleNamespace(scheduler=None)) == {}
+    single = types.SimpleNamespace(scheduler=Scheduler(max_inflight=1))
+    assert _asr_sharing(single) == {}
+
+    scheduler = Scheduler(max_inflight=2)
+    state = types.SimpleNamespace(scheduler=scheduler, whisper="server")
+    hooks = _asr_sharing(state)
+    assert hooks["shared_backends"]() == ["server"]
+    async with hooks["shared_decode_slot"]():
+        classes = scheduler.snapshot()["classes"]
+    assert classes["batch"]["running"] == 1
+    assert classes["live"]["running"] == 0
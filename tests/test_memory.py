@@ -0,0 +1,60 @@
+"""Tests for weight prefault and process memory reporting (app/services/memory.py)."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.memory import MIN_PREFAULT_BYTES, prefault_weights, process_memory
+
+
+def test_prefault_maps_only_weight_files(tmp_path):
+    (tmp_path / "model.bin").write_bytes(b"\0" * (2 * MIN_PREFAULT_BYTES))
+    (tmp_path / "config.json").write_text("{}")
+    report = prefault_weights(tmp_path)
+    assert report["files"] == 1
+    assert report["size_mb"] == 2.0
+
+
+def test_prefault_missing_path_is_a_no_op(tmp_path):
+    assert prefault_weights(tmp_path / "nope")["files"] == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_memory_reports_rss_split():
+    mem = process_memory()
+    assert mem["rss_mb"] > 0
+    assert mem["private_mb"] == pytest.approx(mem["rss_mb"] - mem["shared_mb"], abs=0.2)
+
+
+def test_build_backend_prefaults_before_load(monkeypatch, tmp_path):
+    import app.main as main
+
+    calls = []
+    monkeypatch.setattr(main, "prefault_weights", calls.append)
+    monkeypatch.setattr(
+        main, "CTranslate2Backend", lambda **kw: calls.append("load") or object()
+    )
+    (tmp_path / "model.bin").write_bytes(b"\0")
+    main._build_backend(
+        model_dir_override=str(tmp_path),
+        model_name=None,
+        backend_format_override=None,
+        compute_type="default",
+        device="cpu",
+        prefault=True,
+    )
+    assert calls == [tmp_path, "load"]
+
+
+def test_status_includes_memory_block(monkeypatch):
+    metadata = {"backend": "ctranslate2", "format": "ct2", "local_dir": "/fake"}
+    monkeypatch.setattr("app.main._build_backend", lambda **kw: (object(), metadata))
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        memory = client.get("/status").json()["memory"]
+    assert set(memory) >= {"rss_mb", "shared_mb", "private_mb", "pss_mb"}
@@ -0,0 +1,130 @@
+"""Tests for latency metrics and GET /metrics (app/services/metrics.py, app/api/metrics.py)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import metrics
+from app.services.metrics import MetricsRegistry, observe_inference, timed_stage
+
+
+def test_histogram_renders_cumulative_buckets():
+    reg = MetricsRegistry()
+    hist = reg.histogram("t_seconds", "Test.", ("stage",), buckets=(0.1, 1.0))
+    hist.observe(0.05, stage="a")
+    hist.observe(0.5, stage="a")
+    hist.observe(5.0, stage="a")
+
+    text = reg.render()
+    assert "# TYPE t_seconds histogram" in text
+    assert 't_seconds_bucket{stage="a",le="0.1"} 1' in text
+    assert 't_seconds_bucket{stage="a",le="1"} 2' in text
+    assert 't_seconds_bucket{stage="a",le="+Inf"} 3' in text
+    assert 't_seconds_sum{stage="a"} 5.55' in text
+    assert 't_seconds_count{stage="a"} 3' in text
+
+
+def test_counter_and_gauge_render_and_escape_labels():
+    reg = MetricsRegistry()
+    reg.counter("c_total", "Test.", ("type",)).inc(2, type='say "hi"')
+    gauge = reg.gauge("g", "Test.")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    text = reg.render()
+    assert 'c_total{type="say \\"hi\\""} 2' in text
+    assert "\ng 1\n" in text
+
+
+def test_duplicate_metric_name_rejected():
+    reg = MetricsRegistry()
+    reg.counter("x_total", "Test.")
+    with pytest.raises(ValueError):
+        reg.gauge("x_total", "Test.")
+
+
+def test_timed_stage_records_even_when_body_raises():
+    before = metrics.STAGE_SECONDS.count(endpoint="/test", stage="boom")
+    with pytest.raises(RuntimeError), timed_stage("/test", "boom"):
+        raise RuntimeError("x")
+    assert metrics.STAGE_SECONDS.count(endpoint="/test", stage="boom") == before + 1
+
+
+def test_observe_inference_records_rtf_only_with_duration():
+    before = metrics.INFERENCE_RTF.count(endpoint="/test")
+    observe_inference("/test", 0.5, None)
+    observe_inference("/test", 0.5, 2.0)
+    assert metrics.INFERENCE_RTF.count(endpoint="/test") == before + 1
+    assert metrics.AUDIO_SECONDS.value(endpoint="/test") >= 2.0
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    from app.services._whisper_backend import TranscriptionResult
+
+    backend = MagicMock(name="WhisperBackend")
+
+    async def fake_transcribe(*a, **kw):
+        return TranscriptionResult(
+            text="hello", language="en", duration_seconds=2.0, segments=[]
+        )
+
+    backend.transcribe = fake_transcribe
+    metadata = {"backend": "ctranslate2", "format": "ct2", "local_dir": "/fake"}
+    monkeypatch.setattr("app.main._build_backend", lambda **kw: (backend, metadata))
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+    monkeypatch.setattr(
+        "app.api.transcribe.file_manager.validate_file_size", lambda *a: True
+    )
+    monkeypatch.setattr("app.api.transcribe.file_manager.is_audio_file", lambda *a: True)
+    monkeypatch.setattr(
+        "app.api.transcribe.file_manager.detect_mime_type", lambda *a: "audio/wav"
+    )
+    monkeypatch.setattr(
+        "app.api.transcribe.audio_converter.convert_to_wav", lambda *a: wav_path
+    )
+
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def test_metrics_endpoint_exposes_request_and_stage_series(client):
+    resp = client.post(
+        "/transcribe", content=b"fake", headers={"Content-Type": "audio/wav"}
+    )
+    assert resp.status_code == 200
+
+    scrape = client.get("/metrics")
+    assert scrape.status_code == 200
+    assert scrape.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = scrape.text
+    assert (
+        'whisper_wrap_request_duration_seconds_count{route="/transcribe",'
+        'method="POST",status="200"}'
+    ) in body
+    for stage in ("upload_read", "mime_sniff", "convert", "inference", "postprocess"):
+        assert (
+            f'whisper_wrap_stage_duration_seconds_count{{endpoint="/transcribe",'
+            f'stage="{stage}"}}'
+        ) in body
+    assert 'whisper_wrap_inference_rtf_count{endpoint="/transcribe"}' in body
+    assert 'whisper_wrap_scheduler_queued{priority="interactive"} 0' in body
+
+
+def test_unmatched_routes_share_one_label(client):
+    client.get("/no/such/path/123")
+    body = client.get("/metrics").text
+    assert 'route="unmatched",method="GET",status="404"' in body
+    assert "/no/such/path/123" not in body
+
+
+def test_metrics_disabled_returns_404(client, monkeypatch):
+    monkeypatch.setattr("app.api.metrics.config.METRICS_ENABLED", False)
+    assert client.get("/metrics").status_code == 404
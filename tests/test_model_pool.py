@@ -0,0 +1,234 @@
+"""Tests for multi-model residency and hot swap (app/services/model_pool.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import Segment, TranscriptionResult
+from app.services.model_pool import (
+    ModelPool,
+    ModelPoolFullError,
+    UnknownModelError,
+    dir_size_mb,
+)
+
+
+class _Builder:
+    def __init__(self, sizes: dict[str, int] | None = None, tmp_path=None) -> None:
+        self.calls: list[str] = []
+        self._sizes = sizes or {}
+        self._tmp = tmp_path
+
+    def __call__(self, name: str):
+        self.calls.append(name)
+        metadata: dict = {"backend": "ctranslate2"}
+        if name in self._sizes:
+            d = self._tmp / name
+            d.mkdir(exist_ok=True)
+            (d / "model.bin").write_bytes(b"\0" * self._sizes[name] * 1024 * 1024)
+            metadata["local_dir"] = str(d)
+        return MagicMock(name=f"backend-{name}"), metadata
+
+
+def _pool(build, *, max_models=2, budget_mb=0, now=None, **kw) -> ModelPool:
+    clock = (lambda: now[0]) if now is not None else None
+    pool = ModelPool(
+        build=build,
+        known=("a", "b", "c"),
+        max_models=max_models,
+        budget_mb=budget_mb,
+        **({"clock": clock} if clock else {}),
+        **kw,
+    )
+    pool.adopt("a", MagicMock(name="backend-a"), {})
+    return pool
+
+
+async def test_loads_on_demand_and_evicts_lru():
+    now = [0.0]
+    build = _Builder()
+    pool = _pool(build, max_models=2, now=now)
+
+    b = await pool.get("b")
+    assert await pool.get("b") is b
+    now[0] = 5.0
+    await pool.get("c")  # evicts "b"; the default is pinned
+    assert pool.resident("b") is None
+    assert pool.resident("a") is not None
+    assert build.calls == ["b", "c"]
+    assert pool.snapshot()["evictions"] == 1
+
+
+async def test_single_model_pool_refuses_second_model():
+    pool = _pool(_Builder(), max_models=1)
+    with pytest.raises(ModelPoolFullError):
+        await pool.get("b")
+    with pytest.raises(UnknownModelError):
+        await pool.get("nope")
+
+
+async def test_budget_counts_on_disk_weight_size(tmp_path):
+    build = _Builder(sizes={"b": 2, "c": 2}, tmp_path=tmp_path)
+    pool = _pool(build, max_models=3, budget_mb=3, estimate_mb=lambda n: 2.0)
+    await pool.get("b")
+    assert dir_size_mb(tmp_path / "b") == pytest.approx(2.0)
+    await pool.get("c")  # 2 + 2 > 3 MiB, so "b" goes
+    assert pool.resident("b") is None
+    assert pool.used_mb() == pytest.approx(2.0)
+
+
+async def test_concurrent_requests_share_one_load():
+    build = _Builder()
+    pool = _pool(build)
+    first, second = await asyncio.gather(pool.get("b"), pool.get("b"))
+    assert first is second
+    assert build.calls == ["b"]
+
+
+async def test_activate_swaps_default_and_publishes():
+    published = []
+    pool = _pool(_Builder(), max_models=1, on_activate=published.append)
+    entry = await pool.activate("b")
+    assert pool.default_name == "b"
+    assert published == [entry]
+    assert pool.resident("a") is None  # old default evicted under max_models=1
+    with pytest.raises(ModelPoolFullError):
+        pool.unload("b")
+
+
+async def test_pinned_model_is_never_evicted_nor_counted():
+    pool = _pool(_Builder(), max_models=1, pinned=["b"])
+    draft = await pool.get("b")  # fits although max_models=1 holds the default
+    with pytest.raises(ModelPoolFullError):
+        await pool.get("c")  # "b" is not evictable to make room
+    assert pool.resident("b").backend is draft
+    assert [m["pinned"] for m in pool.snapshot()["models"]] == [False, True, False]
+
+
+async def test_peek_loads_in_background_once():
+    build = _Builder()
+    pool = _pool(build, pinned=["b"])
+    assert pool.peek("b") is None
+    assert pool.peek("b") is None
+    await asyncio.sleep(0.05)
+    assert pool.peek("b") is pool.resident("b").backend
+    assert build.calls == ["b"]
+    assert pool.peek("nope") is None
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    built: list[str | None] = []
+
+    def fake_build(**kw):
+        name = kw.get("model_name")
+        built.append(name)
+        backend = MagicMock(name="WhisperBackend")
+
+        async def transcribe(path, **_kw):
+            return _result(name)
+
+        backend.transcribe = transcribe
+        return backend, {
+            "backend": "ctranslate2",
+            "format": "ct2",
+            "compute_type": "default",
+            "local_dir": "/fake",
+        }
+
+    monkeypatch.setattr("app.main._build_backend", fake_build)
+    monkeypatch.setattr("app.config.config.MODEL_POOL_MAX_MODELS", 2)
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+    module = "app.api.transcribe"
+    monkeypatch.setattr(f"{module}.file_manager.validate_file_size", lambda *a: True)
+    monkeypatch.setattr(f"{module}.file_manager.is_audio_file", lambda *a: True)
+    monkeypatch.setattr(f"{module}.file_manager.detect_mime_type", lambda *a: "audio/wav")
+    monkeypatch.setattr(f"{module}.file_manager.cleanup_file", lambda *a: None)
+    monkeypatch.setattr(f"{module}.audio_converter.convert_to_wav", lambda *a: wav_path)
+
+    from app.main import app
+
+    with TestClient(app) as c:
+        c.built = built
+        yield c
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        segments=[Segment(text=text, start=0.0, end=1.0)],
+        language="en",
+        duration_seconds=1.0,
+    )
+
+
+def test_transcribe_routes_model_param_to_pool(client):
+    pool = client.app.state.model_pool
+    default = pool.default_name
+    other = next(m["name"] for m in pool.snapshot()["models"] if m["name"] != default)
+
+    def post(**params):
+        return client.post(
+            "/transcribe",
+            headers={"Content-Type": "audio/wav"},
+            content=b"raw",
+            params={"log": "false", **params},
+        )
+
+    assert post().json()["text"] == default
+    assert post(model="nope").status_code == 400
+    assert post(model=other).json()["text"] == other  # loaded on demand
+    assert client.built[-1] == other
+    assert pool.resident(other) is not None
+
+    listing = client.get("/v1/models").json()["data"]
+    assert [m["id"] for m in listing] == [default, other]
+
+
+def test_rejected_upload_does_not_load_a_pool_model(client, monkeypatch):
+    """An upload refused by the size / MIME checks SHALL NOT load the model
+    it named (a load can evict another resident model)."""
+    pool = client.app.state.model_pool
+    other = next(
+        m["name"] for m in pool.snapshot()["models"] if m["name"] != pool.default_name
+    )
+    monkeypatch.setattr(
+        "app.api.transcribe.file_manager.is_audio_file", lambda *a: False
+    )
+
+    resp = client.post(
+        "/transcribe",
+        headers={"Content-Type": "audio/wav"},
+        content=b"not audio",
+        params={"log": "false", "model": other},
+    )
+
+    assert resp.status_code == 415
+    assert other not in client.built
+    assert pool.resident(other) is None
+
+
+def test_models_endpoints(client):
+    pool = client.app.state.model_pool
+    default = pool.default_name
+    other = next(m["name"] for m in pool.snapshot()["models"] if m["name"] != default)
+
+    body = client.get("/models").json()
+    assert body["default"] == default
+    assert client.post("/models/nope/load").status_code == 404
+    assert client.delete(f"/models/{default}").status_code == 409
+    assert client.delete(f"/models/{other}").status_code == 404
+
+    assert client.post(f"/models/{other}/activate").status_code == 202
+    for _ in range(50):
+        if pool.default_name == other:
+            break
+        client.get("/models")
+    assert pool.default_name == other
+    assert client.get("/status").json()["model"]["name"] == other
+    assert client.delete(f"/models/{default}").status_code == 204
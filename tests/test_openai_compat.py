@@ -311,6 +311,24 @@ def test_invalid_response_format_400(client, tmp_path):
         )
 
 
+def test_batched_field_forwarded(client, tmp_path):
+    """whisper-wrap extension: `batched` form field overrides CT2_DECODE_MODE."""
+    CAPTURED_CALLS.clear()
+    resp = _post_transcribe(client, tmp_path, model="whisper-1", batched="true")
+    assert resp.status_code == 200
+    assert CAPTURED_CALLS[-1]["kwargs"]["batched"] is True
+
+    CAPTURED_CALLS.clear()
+    _post_transcribe(client, tmp_path, model="whisper-1")
+    assert "batched" not in CAPTURED_CALLS[-1]["kwargs"]
+
+
+def test_invalid_batched_field_400(client, tmp_path):
+    resp = _post_transcribe(client, tmp_path, model="whisper-1", batched="maybe")
+    assert resp.status_code == 400
+    assert resp.json()["error"]["param"] == "batched"
+
+
 # ---------- Task 3.1: /v1/audio/translations ----------
 
 
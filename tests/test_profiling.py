@@ -0,0 +1,95 @@
+"""Tests for the sampling profiler (app/services/profiling.py, app/api/profiling.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.profiling import SamplingProfiler
+
+
+def _spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_capture_writes_collapsed_stacks(tmp_path):
+    profiler = SamplingProfiler(tmp_path, interval=0.001)
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin_until, args=(stop,), name="spinner")
+    worker.start()
+    capture = profiler.start("unit test")
+    time.sleep(0.1)
+    path = profiler.stop(capture)
+    stop.set()
+    worker.join()
+
+    assert path == tmp_path / capture.name
+    lines = path.read_text().splitlines()
+    spinner = [line for line in lines if line.startswith("thread:spinner;")]
+    assert spinner and "_spin_until (test_profiling.py:" in spinner[0]
+    _stack, count = spinner[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert profiler.stop(capture) == path  # second stop is a no-op
+
+
+def test_timed_capture_is_written_by_the_sampler(tmp_path):
+    clock = [0.0]
+    profiler = SamplingProfiler(tmp_path, interval=0.001, clock=lambda: clock[0])
+    capture = profiler.start("global", seconds=5)
+    clock[0] = 10.0
+    deadline = time.monotonic() + 2
+    while capture.path is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert capture.path is not None and capture.path.is_file()
+    assert profiler.active() == []
+
+
+def test_path_for_rejects_names_outside_the_directory(tmp_path):
+    profiler = SamplingProfiler(tmp_path)
+    (tmp_path / "ok.collapsed").write_text("")
+    assert profiler.path_for("ok.collapsed") == tmp_path / "ok.collapsed"
+    assert profiler.path_for("../ok.collapsed") is None
+    assert profiler.path_for("history.db") is None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    metadata = {"backend": "ctranslate2", "format": "ct2", "local_dir": "/fake"}
+    monkeypatch.setattr("app.main._build_backend", lambda **kw: (object(), metadata))
+    monkeypatch.setattr("app.api.profiling.config.PROFILING_ENABLED", True)
+
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def test_profile_header_returns_downloadable_profile(client):
+    resp = client.get("/status", headers={"X-Profile": "true"})
+    name = resp.headers["X-Profile-Id"]
+
+    listing = client.get("/profiling").json()
+    assert name in [p["name"] for p in listing["profiles"]]
+    download = client.get(f"/profiling/{name}")
+    assert download.status_code == 200
+    assert download.headers["content-type"].startswith("text/plain")
+
+
+def test_requests_without_header_are_not_profiled(client):
+    assert "X-Profile-Id" not in client.get("/status").headers
+
+
+def test_global_capture_starts_with_202(client):
+    resp = client.post("/profiling/start", params={"seconds": 1})
+    assert resp.status_code == 202
+    assert resp.json()["profile"].endswith(".collapsed")
+
+
+def test_profiling_routes_404_when_disabled(client, monkeypatch):
+    monkeypatch.setattr("app.api.profiling.config.PROFILING_ENABLED", False)
+    assert client.get("/profiling").status_code == 404
+    assert "X-Profile-Id" not in client.get("/status", headers={"X-Profile": "1"}).headers
@@ -0,0 +1,140 @@
+"""Tests for staged / lazy startup (app/services/readiness.py, app/api/readiness.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.readiness import (
+    STATE_FAILED,
+    STATE_READY,
+    ComponentNotReadyError,
+    Readiness,
+)
+
+
+async def test_components_run_concurrently():
+    readiness = Readiness()
+    barrier = threading.Barrier(2, timeout=5)
+    readiness.add("a", barrier.wait)
+    readiness.add("b", barrier.wait)  # deadlocks unless both run at once
+    await readiness.start()
+    assert readiness.ready
+    assert readiness.snapshot()["components"]["a"]["state"] == STATE_READY
+
+
+async def test_failure_is_recorded_and_reraised():
+    readiness = Readiness()
+
+    def boom():
+        raise OSError("disk gone")
+
+    readiness.add("db", boom)
+    readiness.add("ok", lambda: None)
+    await readiness.start()
+    db = readiness.snapshot()["components"]["db"]
+    assert (db["state"], db["error"]) == (STATE_FAILED, "disk gone")
+    assert readiness.is_ready("ok")
+    with pytest.raises(OSError, match="disk gone"):
+        readiness.raise_for_failure()
+    with pytest.raises(ComponentNotReadyError) as info:
+        await readiness.wait("db", timeout=1)
+    assert info.value.failed
+
+
+async def test_wait_blocks_until_ready_or_times_out():
+    readiness = Readiness(mode="lazy")
+    release = threading.Event()
+    readiness.add("model", lambda: release.wait(5))
+    startup = asyncio.ensure_future(readiness.start())
+    with pytest.raises(ComponentNotReadyError) as info:
+        await readiness.wait("model", timeout=0.05)
+    assert not info.value.failed
+    await readiness.wait("unregistered", timeout=0)
+    release.set()
+    await readiness.wait("model", timeout=5)
+    await startup
+
+
+@pytest.fixture
+def lazy_client(monkeypatch):
+    release = threading.Event()
+
+    def slow_build(**kw):
+        release.wait(10)
+        return MagicMock(name="WhisperBackend"), {
+            "backend": "ctranslate2",
+            "format": "ct2",
+            "compute_type": "default",
+            "local_dir": "/fake",
+        }
+
+    monkeypatch.setattr("app.main._build_backend", slow_build)
+    monkeypatch.setattr("app.config.config.STARTUP_MODE", "lazy")
+    monkeypatch.setattr("app.config.config.STARTUP_WAIT_SECONDS", 0)
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        client.release = release
+        yield client
+        release.set()
+
+
+def test_lazy_startup_serves_status_before_model(lazy_client):
+    body = lazy_client.get("/status").json()
+    assert body["status"] == "starting"
+    assert body["model"]["loaded"] is False
+    assert body["startup"]["mode"] == "lazy"
+    assert body["startup"]["components"]["model"]["state"] == "loading"
+
+    resp = lazy_client.post(
+        "/transcribe", headers={"Content-Type": "audio/wav"}, content=b"raw"
+    )
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "5"
+    assert resp.json()["detail"] == {"error": "not_ready", "component": "model"}
+
+    lazy_client.release.set()
+    for _ in range(100):
+        body = lazy_client.get("/status").json()
+        if body["status"] == "ok":
+            break
+        time.sleep(0.05)
+    assert body["status"] == "ok"
+    assert body["model"]["loaded"] is True
+    assert lazy_client.get("/models").status_code == 200
+
+
+def test_unknown_startup_mode_fails_lifespan(monkeypatch):
+    monkeypatch.setattr("app.config.config.STARTUP_MODE", "sometimes")
+
+    from app.main import app
+
+    with pytest.raises(ValueError, match="STARTUP_MODE"):
+        with TestClient(app):
+            pass
+
+
+async def test_dependent_component_waits_and_skips_on_failure():
+    readiness = Readiness()
+    order: list[str] = []
+
+    def boom():
+        raise RuntimeError("no model")
+
+    async def after_model():
+        order.append("warmup")
+
+    readiness.add("model", boom)
+    readiness.add("warmup", after_model, after=("model",))
+    await readiness.start()
+    assert order == []
+    assert readiness.snapshot()["components"]["warmup"]["state"] == STATE_FAILED
+    with pytest.raises(RuntimeError, match="no model"):
+        readiness.raise_for_failure()
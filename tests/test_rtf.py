@@ -0,0 +1,155 @@
+"""Tests for real-time-factor accounting (app/services/rtf.py) and its scheduler hook."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import TranscriptionResult
+from app.services.model_pool import ModelPool
+from app.services.rtf import RtfTracker, backend_labels
+from app.services.scheduler import PRIORITY_INTERACTIVE, PRIORITY_LIVE, Scheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(tracker: RtfTracker, **overrides) -> None:
+    fields = {
+        "backend": "ctranslate2",
+        "model": "breeze-asr-25",
+        "variant": "int8",
+        "mode": "beam",
+        "priority": "interactive",
+        "audio_seconds": 10.0,
+        "inference_seconds": 2.0,
+        "wait_seconds": 0.0,
+    }
+    fields.update(overrides)
+    tracker.record(**fields)
+
+
+def test_snapshot_groups_by_backend_variant_and_mode():
+    tracker = RtfTracker(capacity=10)
+    _record(tracker, inference_seconds=2.0)
+    _record(tracker, inference_seconds=4.0)
+    _record(tracker, mode="greedy", audio_seconds=2.0, inference_seconds=0.2)
+
+    snap = tracker.snapshot()
+    beam, greedy = (
+        next(g for g in snap["groups"] if g["mode"] == mode) for mode in ("beam", "greedy")
+    )
+    assert beam["count"] == 2
+    assert beam["rtf"]["mean"] == 0.3
+    assert beam["x_realtime"] == 3.3
+    assert greedy["rtf"]["max"] == 0.1
+    assert greedy["variant"] == "int8"
+    assert snap["total_decodes"] == 3
+
+
+def test_ring_buffer_keeps_only_recent_decodes():
+    tracker = RtfTracker(capacity=2)
+    for seconds in (1.0, 2.0, 3.0):
+        _record(tracker, inference_seconds=seconds)
+    snap = tracker.snapshot()
+    assert snap["samples"] == 2
+    assert snap["total_decodes"] == 3
+    assert [r["inference_ms"] for r in snap["recent"]] == [3000.0, 2000.0]
+
+
+def test_unknown_duration_counts_toward_wait_but_not_rtf():
+    tracker = RtfTracker()
+    _record(tracker, audio_seconds=None, wait_seconds=0.5)
+    group = tracker.snapshot()["groups"][0]
+    assert group["count"] == 1
+    assert group["rtf"]["count"] == 0
+    assert group["wait_ms"]["max"] == 500.0
+
+
+def test_backend_labels_use_pool_metadata():
+    pool = ModelPool(build=lambda name: None, known=())
+    backend = object()
+    pool.adopt("breeze-asr-25", backend, {"backend": "ctranslate2", "compute_type": "int8"})
+    assert backend_labels(pool, backend) == ("ctranslate2", "breeze-asr-25", "int8")
+    assert backend_labels(pool, object()) == ("object", "unknown", None)
+
+
+async def test_scheduler_records_wait_and_decode_mode():
+    clock = _Clock()
+    scheduler = Scheduler(max_inflight=1, rtf=RtfTracker(clock=clock), clock=clock)
+    backend = MagicMock()
+    release = asyncio.Event()
+
+    async def fake_pcm(samples, **kwargs):
+        if kwargs.get("beam_size") != 1:
+            await release.wait()
+        clock.now += 0.5
+        return TranscriptionResult(
+            text="x", segments=[], language="en", duration_seconds=0.0
+        )
+
+    backend.transcribe_pcm = fake_pcm
+    audio = np.zeros(32_000, dtype=np.float32)
+    final = asyncio.create_task(
+        scheduler.view(backend, PRIORITY_INTERACTIVE).transcribe_pcm(audio)
+    )
+    await asyncio.sleep(0)
+    partial = asyncio.create_task(
+        scheduler.view(backend, PRIORITY_LIVE).transcribe_pcm(audio, beam_size=1)
+    )
+    await asyncio.sleep(0)
+    clock.now += 1.0
+    release.set()
+    await asyncio.gather(final, partial)
+
+    snap = scheduler.rtf.snapshot()
+    modes = {g["mode"]: g for g in snap["groups"]}
+    assert modes["beam"]["rtf"]["mean"] == 0.75  # 1.5 s in the slot, 2 s of PCM
+    assert modes["greedy"]["wait_ms"]["max"] == 1500.0
+    assert snap["queue_wait_ms"]["live"]["count"] == 1
+
+
+def test_status_reports_throughput_block(monkeypatch, tmp_path):
+    metadata = {
+        "backend": "ctranslate2",
+        "format": "ct2",
+        "compute_type": "int8",
+        "local_dir": "/fake",
+    }
+    monkeypatch.setattr(
+        "app.main._build_backend", lambda **kw: (MagicMock(name="WhisperBackend"), metadata)
+    )
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+    monkeypatch.setattr("app.api.transcribe.file_manager.validate_file_size", lambda *a: True)
+    monkeypatch.setattr("app.api.transcribe.file_manager.is_audio_file", lambda *a: True)
+    monkeypatch.setattr("app.api.transcribe.file_manager.detect_mime_type", lambda *a: "audio/wav")
+    monkeypatch.setattr("app.api.transcribe.audio_converter.convert_to_wav", lambda *a: wav_path)
+
+    from app.main import app
+
+    async def fake_transcribe(*a, **kw):
+        return TranscriptionResult(text="hello.", segments=[], language="en", duration_seconds=4.0)
+
+    with TestClient(app) as client:
+        app.state.whisper.transcribe = fake_transcribe
+        client.post(
+            "/transcribe",
+            headers={"Content-Type": "audio/wav"},
+            content=b"raw",
+            params={"log": "false"},
+        )
+        block = client.get("/status").json()["throughput"]
+
+    (group,) = block["groups"]
+    assert (group["backend"], group["variant"], group["mode"]) == ("ctranslate2", "int8", "beam")
+    assert group["audio_seconds"] == 4.0
+    assert block["recent"][0]["priority"] == "interactive"
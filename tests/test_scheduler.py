@@ -0,0 +1,214 @@
+"""Tests for the decode-call scheduler (app/services/scheduler.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import Segment, TranscriptionResult
+from app.services.scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_LIVE,
+    Scheduler,
+)
+
+
+def _write_wav(path: Path, seconds: float) -> Path:
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(int(16_000 * seconds)) * 50).astype("<i2")
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16_000)
+        wf.writeframes(samples.tobytes())
+    return path
+
+
+def _result(text: str = "x") -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        segments=[Segment(text=text, start=0.0, end=1.0)],
+        language="en",
+        duration_seconds=1.0,
+    )
+
+
+async def _hold(scheduler: Scheduler, priority: int, tag: str, order: list, gate: asyncio.Event):
+    async with scheduler.slot(priority=priority, job_id=tag):
+        order.append(tag)
+        await gate.wait()
+
+
+async def test_live_then_interactive_then_batch():
+    scheduler = Scheduler(max_inflight=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, PRIORITY_BATCH, "meeting", order, gate))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(_hold(scheduler, PRIORITY_BATCH, "meeting-2", order, gate)),
+        asyncio.create_task(_hold(scheduler, PRIORITY_INTERACTIVE, "upload", order, gate)),
+        asyncio.create_task(_hold(scheduler, PRIORITY_LIVE, "partial", order, gate)),
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["meeting", "partial", "upload", "meeting-2"]
+
+
+async def test_batch_leaves_a_slot_free_by_default():
+    scheduler = Scheduler(max_inflight=2)
+    assert scheduler.batch_slots == 1
+    order: list[str] = []
+    gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_hold(scheduler, PRIORITY_BATCH, f"b{i}", order, gate))
+        for i in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert order == ["b0"]
+    tasks.append(
+        asyncio.create_task(_hold(scheduler, PRIORITY_LIVE, "partial", order, gate))
+    )
+    await asyncio.sleep(0)
+    assert order == ["b0", "partial"]
+    gate.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_view_forwards_calls_and_attributes():
+    scheduler = Scheduler(max_inflight=1)
+    backend = MagicMock()
+    backend.decode_mode = "sequential"
+    seen: dict = {}
+
+    async def fake_pcm(samples, **kwargs):
+        seen["running"] = scheduler.running(PRIORITY_LIVE)
+        seen["kwargs"] = kwargs
+        return _result("live")
+
+    backend.transcribe_pcm = fake_pcm
+    view = scheduler.view(backend, PRIORITY_LIVE)
+    result = await view.transcribe_pcm(np.zeros(160, dtype=np.float32), beam_size=1)
+    assert result.text == "live"
+    assert seen == {"running": 1, "kwargs": {"beam_size": 1}}
+    assert view.decode_mode == "sequential"
+    assert scheduler.running() == 0
+    assert scheduler.snapshot()["classes"]["live"]["completed"] == 1
+
+
+async def test_interactive_cuts_in_between_batch_chunks(tmp_path):
+    wav = _write_wav(tmp_path / "meeting.wav", seconds=40)
+    scheduler = Scheduler(max_inflight=1, batch_chunk_seconds=10)
+    order: list[str] = []
+    first_chunk = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fake_transcribe(path, **kwargs):
+        tag = "memo" if Path(path).name == "memo.wav" else "chunk"
+        order.append(tag)
+        if tag == "chunk" and not first_chunk.is_set():
+            first_chunk.set()
+            await release.wait()
+        return _result()
+
+    backend = MagicMock()
+    backend.decode_mode = "sequential"
+    backend.transcribe = fake_transcribe
+
+    batch = asyncio.create_task(
+        scheduler.view(backend, PRIORITY_BATCH).transcribe(
+            wav, language=None, initial_prompt=None
+        )
+    )
+    await first_chunk.wait()
+    memo = asyncio.create_task(
+        scheduler.view(backend, PRIORITY_INTERACTIVE).transcribe(
+            tmp_path / "memo.wav", language="en", initial_prompt=None
+        )
+    )
+    await asyncio.sleep(0)
+    release.set()
+    result, _ = await asyncio.gather(batch, memo)
+
+    assert order[:2] == ["chunk", "memo"]
+    assert order.count("chunk") >= 3
+    assert result.language == "en"
+
+
+@pytest.mark.parametrize(
+    ("chunk_seconds", "decode_mode", "priority"),
+    [
+        (0, "sequential", PRIORITY_BATCH),
+        (10, "batched", PRIORITY_BATCH),
+        (10, "sequential", PRIORITY_INTERACTIVE),
+    ],
+)
+async def test_single_call_when_chunking_does_not_apply(
+    tmp_path, chunk_seconds, decode_mode, priority
+):
+    wav = _write_wav(tmp_path / "long.wav", seconds=40)
+    scheduler = Scheduler(max_inflight=1, batch_chunk_seconds=chunk_seconds)
+    calls: list[dict] = []
+
+    async def fake_transcribe(path, **kwargs):
+        calls.append({"path": path, **kwargs})
+        return _result()
+
+    backend = MagicMock()
+    backend.decode_mode = decode_mode
+    backend.transcribe = fake_transcribe
+    await scheduler.view(backend, priority).transcribe(
+        wav, language="en", initial_prompt="hi"
+    )
+    assert calls == [{"path": wav, "language": "en", "initial_prompt": "hi"}]
+
+
+def test_status_reports_scheduler_block(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "app.main._build_backend",
+        lambda **kw: (
+            MagicMock(name="WhisperBackend"),
+            {
+                "backend": "ctranslate2",
+                "format": "ct2",
+                "compute_type": "default",
+                "local_dir": "/fake",
+            },
+        ),
+    )
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+    monkeypatch.setattr("app.api.transcribe.file_manager.validate_file_size", lambda *a: True)
+    monkeypatch.setattr("app.api.transcribe.file_manager.is_audio_file", lambda *a: True)
+    monkeypatch.setattr("app.api.transcribe.file_manager.detect_mime_type", lambda *a: "audio/wav")
+    monkeypatch.setattr("app.api.transcribe.file_manager.cleanup_file", lambda *a: None)
+    monkeypatch.setattr("app.api.transcribe.audio_converter.convert_to_wav", lambda *a: wav_path)
+
+    from app.main import app
+
+    async def fake_transcribe(*a, **kw):
+        return _result("hello.")
+
+    with TestClient(app) as client:
+        app.state.whisper.transcribe = fake_transcribe
+        resp = client.post(
+            "/transcribe",
+            headers={"Content-Type": "audio/wav"},
+            content=b"raw",
+            params={"log": "false"},
+        )
+        assert resp.status_code == 200
+        block = client.get("/status").json()["scheduler"]
+
+    assert set(block["classes"]) == {"live", "interactive", "batch"}
+    assert block["classes"]["interactive"]["completed"] == 1
+    assert block["running"] == 0
+    assert block["max_inflight"] >= 1
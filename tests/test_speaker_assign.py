@@ -0,0 +1,96 @@
+"""Tests for `app/services/speaker_assign.py`."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.services.speaker_assign import (
+    SpeakerTurns,
+    assign_speakers,
+    dominant_speakers,
+)
+
+
+def _reference(turns: list[tuple[float, float, str]], start: float, end: float):
+    """WhisperX's per-interval rule: sum positive intersections per speaker,
+    most wins (ties to the label that sorts first), none → None."""
+    totals: dict[str, float] = {}
+    for t_start, t_end, speaker in turns:
+        overlap = min(t_end, end) - max(t_start, start)
+        if overlap > 0:
+            totals[speaker] = totals.get(speaker, 0.0) + overlap
+    if not totals:
+        return None
+    return min(totals, key=lambda sp: (-totals[sp], sp))
+
+
+def test_assign_speakers_labels_segments_and_words():
+    turns = SpeakerTurns.from_tracks(
+        [(0.0, 4.0, "SPEAKER_01"), (3.0, 9.0, "SPEAKER_00"), (20.0, 21.0, "X")]
+    )
+    aligned = {
+        "language": "en",
+        "segments": [
+            {
+                "start": 0.0,
+                "end": 5.0,
+                "text": " hi",
+                "words": [
+                    {"word": "hi", "start": 0.5, "end": 1.0},
+                    {"word": "there", "start": 4.0, "end": 5.0},
+                    {"word": "um"},
+                ],
+            },
+            {"start": 12.0, "end": 13.0, "text": " nobody"},
+        ],
+    }
+
+    merged = assign_speakers(turns, aligned)
+
+    first, second = merged["segments"]
+    assert first["speaker"] == "SPEAKER_01"
+    assert [w.get("speaker") for w in first["words"]] == [
+        "SPEAKER_01",
+        "SPEAKER_00",
+        None,
+    ]
+    assert "speaker" not in second
+    assert merged["language"] == "en"
+    assert "speaker" not in aligned["segments"][0], "input SHALL NOT be mutated"
+
+
+def test_dominant_speakers_matches_pairwise_overlap():
+    """Prefix-sum coverage SHALL pick the same speaker as summing every
+    turn's intersection, including overlapping turns of one speaker."""
+    rng = np.random.default_rng(7)
+    starts = np.sort(rng.uniform(0, 600, 300))
+    tracks = [
+        (
+            float(s),
+            float(s + rng.uniform(0.2, 8.0)),
+            f"SPEAKER_{rng.integers(4):02d}",
+        )
+        for s in starts
+    ]
+    turns = SpeakerTurns.from_tracks(tracks)
+    q_start = rng.uniform(0, 620, 2000)
+    q_end = q_start + rng.uniform(0.05, 3.0, 2000)
+
+    codes = dominant_speakers(turns, q_start, q_end)
+
+    got = [turns.labels[c] if c >= 0 else None for c in codes.tolist()]
+    want = [_reference(tracks, a, b) for a, b in zip(q_start, q_end, strict=True)]
+    assert got == want
+
+
+def test_ties_go_to_first_label_and_empty_turns_assign_nothing():
+    turns = SpeakerTurns.from_tracks(
+        [(0.0, 1.0, "SPEAKER_01"), (1.0, 2.0, "SPEAKER_00")]
+    )
+    assert dominant_speakers(turns, np.array([0.5]), np.array([1.5])).tolist() == [0]
+
+    empty = SpeakerTurns.from_tracks([])
+    assert len(empty) == 0
+    assert dominant_speakers(empty, np.array([0.0]), np.array([1.0])).tolist() == [-1]
+    merged = assign_speakers(empty, {"segments": [{"start": 0.0, "end": 1.0}]})
+    assert "speaker" not in merged["segments"][0]
@@ -0,0 +1,111 @@
+"""Tests for cross-meeting speaker profiles (`app/services/speaker_profiles.py`)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.services import speaker_profiles
+from app.services.persistence import SessionLocal, build_engine
+from app.services.persistence import meeting_analyses_repo as meetings
+from app.services.persistence import speaker_profiles_repo as repo
+from app.services.persistence.models import Base
+from app.services.speaker_profiles import SpeakerIndex
+
+
+@pytest.fixture()
+def db():
+    """Session over a fresh in-memory SQLite with two meetings."""
+    engine = build_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal.configure(bind=engine)
+    try:
+        with SessionLocal() as session:
+            for mid in ("m1", "m2"):
+                meetings.create_meeting_analysis(
+                    session, id=mid, filename=f"{mid}.wav", result_json="{}"
+                )
+            session.commit()
+            yield session
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _profiles(db) -> dict[str, tuple[int, list[float]]]:
+    return {
+        p.name: (p.sample_count, json.loads(p.centroid_json))
+        for p in repo.list_profiles(db)
+    }
+
+
+def test_index_matches_best_pairs_above_threshold():
+    index = SpeakerIndex(
+        [
+            (1, "Alice", [1.0, 0.0]),
+            (2, "Bob", [0.0, 1.0]),
+            (3, "Wide", [1.0, 0.0, 0.0]),
+        ]
+    )
+    assert len(index) == 3
+
+    matches = index.match(
+        {
+            "SPEAKER_00": [0.9, 0.1],
+            # Also close to Alice but less so, and Bob is below threshold.
+            "SPEAKER_01": [0.8, 0.2],
+            "SPEAKER_02": [0.1, 0.9],
+        },
+        min_similarity=0.5,
+    )
+
+    assert {label: m.name for label, m in matches.items()} == {
+        "SPEAKER_00": "Alice",
+        "SPEAKER_02": "Bob",
+    }
+    assert matches["SPEAKER_00"].similarity == pytest.approx(0.9939, abs=1e-4)
+    assert index.match({"SPEAKER_00": [1.0, 0.0, 0.0, 0.0]}, min_similarity=0.0) == {}
+
+
+def test_renames_build_centroids_and_feed_suggestions(db):
+    speaker_profiles.learn_speaker_names(
+        db,
+        "m1",
+        {"SPEAKER_00": "Alice", "SPEAKER_01": "", "SPEAKER_02": "SPEAKER_02"},
+        {
+            "SPEAKER_00": [2.0, 0.0],
+            "SPEAKER_01": [0.0, 1.0],
+            "SPEAKER_02": [1.0, 1.0],
+        },
+    )
+    speaker_profiles.learn_speaker_names(
+        db, "m2", {"SPEAKER_01": "Alice"}, {"SPEAKER_01": [0.0, 3.0]}
+    )
+    db.commit()
+    speaker_profiles.invalidate_index()
+
+    # Unit-normalised samples averaged: ([1, 0] + [0, 1]) / 2.
+    assert _profiles(db) == {"Alice": (2, [0.5, 0.5])}
+    suggestions = speaker_profiles.suggest_names(
+        db,
+        {"SPEAKER_00": [1.0, 1.2], "SPEAKER_01": [1.0, 1.0]},
+        min_similarity=0.6,
+        exclude={"SPEAKER_01"},
+    )
+    assert list(suggestions) == ["SPEAKER_00"]
+    assert suggestions["SPEAKER_00"].name == "Alice"
+
+
+def test_renaming_again_moves_the_sample_and_forget_drops_it(db):
+    embeddings = {"SPEAKER_00": [1.0, 0.0]}
+    speaker_profiles.learn_speaker_names(db, "m1", {"SPEAKER_00": "Alice"}, embeddings)
+    speaker_profiles.learn_speaker_names(db, "m1", {"SPEAKER_00": "Alice"}, embeddings)
+    assert _profiles(db) == {"Alice": (1, [1.0, 0.0])}
+
+    speaker_profiles.learn_speaker_names(db, "m1", {"SPEAKER_00": "Alicia"}, embeddings)
+    assert _profiles(db) == {"Alicia": (1, [1.0, 0.0])}
+
+    speaker_profiles.forget_meeting(db, "m1")
+    assert _profiles(db) == {}
+    assert repo.list_samples(db, meeting_id="m1") == []
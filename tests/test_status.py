@@ -273,7 +273,7 @@ def test_status_includes_vad_block_rms(monkeypatch, stubbed_app):
 
 
 def test_status_meeting_block_shape(stubbed_app, monkeypatch):
-    """`/status.meeting` SHALL expose all 7 documented fields with sensible defaults."""
+    """`/status.meeting` SHALL expose all documented fields with sensible defaults."""
     # Force unavailable so we don't need the registry/extras to be real
     monkeypatch.setattr(
         "app.api.meeting.check_meeting_availability",
@@ -291,14 +291,17 @@ def test_status_meeting_block_shape(stubbed_app, monkeypatch):
     assert set(m.keys()) == {
         "available",
         "loaded",
+        "models",
         "hf_token_configured",
         "extras_installed",
         "asr_model_dir",
         "active_jobs",
         "queued_jobs",
+        "pool",
     }
     assert m["available"] is False
     assert m["loaded"] is False
+    assert m["models"] is None
     assert m["extras_installed"] is False
     assert m["asr_model_dir"] is None
     assert m["active_jobs"] == 0
@@ -0,0 +1,220 @@
+"""Integration tests for async transcription jobs (`?async=true`).
+
+TestClient runs BackgroundTasks before returning the response, so by the time
+`client.post(...)` returns the job has already been through the queue; the
+poll / SSE / result endpoints then observe the settled record.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import Segment, TranscriptionResult
+
+
+@pytest.fixture
+def stubbed_app(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "app.main._build_backend",
+        lambda **kw: (
+            MagicMock(name="WhisperBackend"),
+            {
+                "backend": "ctranslate2",
+                "format": "ct2",
+                "compute_type": "default",
+                "local_dir": "/fake",
+            },
+        ),
+    )
+
+    wav_path = tmp_path / "out.wav"
+    wav_path.write_bytes(b"WAV")
+
+    for module in ("app.api.transcribe", "app.api.openai_compat"):
+        monkeypatch.setattr(f"{module}.file_manager.validate_file_size", lambda *a: True)
+        monkeypatch.setattr(f"{module}.file_manager.is_audio_file", lambda *a: True)
+        monkeypatch.setattr(
+            f"{module}.file_manager.detect_mime_type", lambda *a: "audio/wav"
+        )
+        monkeypatch.setattr(
+            f"{module}.audio_converter.convert_to_wav", lambda *a: wav_path
+        )
+    monkeypatch.setattr("app.api.transcribe.file_manager.cleanup_file", lambda *a: None)
+
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture
+def client(stubbed_app):
+    async def fake_transcribe(*a, **kw):
+        return TranscriptionResult(
+            text="hello world.",
+            segments=[Segment(text="hello world.", start=0.0, end=2.5)],
+            language="en",
+            duration_seconds=2.5,
+        )
+
+    with TestClient(stubbed_app) as c:
+        stubbed_app.state.whisper.transcribe = fake_transcribe
+        yield c
+
+
+def _submit(client, **params):
+    return client.post(
+        "/transcribe",
+        headers={"Content-Type": "audio/wav"},
+        content=b"raw",
+        params={"async": "true", "log": "false", **params},
+    )
+
+
+def test_async_submit_returns_202_job_handle(client):
+    resp = _submit(client)
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["job_id"]
+    assert body["status_url"] == f"/transcribe/jobs/{body['job_id']}"
+    assert body["events_url"] == f"/transcribe/jobs/{body['job_id']}/events"
+
+
+def test_async_job_result_matches_sync_body(client):
+    sync = client.post(
+        "/transcribe",
+        headers={"Content-Type": "audio/wav"},
+        content=b"raw",
+        params={"log": "false"},
+    ).json()
+
+    job_id = _submit(client).json()["job_id"]
+    poll = client.get(f"/transcribe/jobs/{job_id}")
+    assert poll.status_code == 200
+    body = poll.json()
+    assert body["status"] == "done"
+    assert body["progress"] == 1.0
+    assert body["result"] == sync
+
+
+def test_async_job_failure_surfaces_error(client, stubbed_app):
+    async def boom(*a, **kw):
+        raise RuntimeError("decoder exploded")
+
+    stubbed_app.state.whisper.transcribe = boom
+    job_id = _submit(client).json()["job_id"]
+    body = client.get(f"/transcribe/jobs/{job_id}").json()
+    assert body["status"] == "error"
+    assert body["error"]["code"] == "transcription_failed"
+    assert "decoder exploded" in body["error"]["message"]
+
+
+def test_events_stream_ends_with_terminal_event(client):
+    job_id = _submit(client).json()["job_id"]
+    resp = client.get(f"/transcribe/jobs/{job_id}/events")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    frames = [f for f in resp.text.split("\n\n") if f.strip()]
+    event, data = frames[-1].split("\n", 1)
+    assert event == "event: done"
+    assert json.loads(data.removeprefix("data: "))["result"]["text"] == "hello world."
+
+
+def test_unknown_job_returns_404(client):
+    assert client.get("/transcribe/jobs/NOPE").status_code == 404
+    assert client.get("/transcribe/jobs/NOPE/events").status_code == 404
+    assert client.delete("/transcribe/jobs/NOPE").status_code == 404
+
+
+def test_delete_finished_job_returns_409(client):
+    job_id = _submit(client).json()["job_id"]
+    assert client.delete(f"/transcribe/jobs/{job_id}").status_code == 409
+
+
+def test_openai_async_srt_result_keeps_media_type(client):
+    resp = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("clip.wav", b"fake", "audio/wav")},
+        data={"model": "whisper-1", "response_format": "srt", "async": "true"},
+    )
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+
+    result = client.get(f"/transcribe/jobs/{job_id}/result")
+    assert result.status_code == 200
+    assert result.headers["content-type"].startswith("text/plain")
+    assert "00:00:00,000 --> 00:00:02,500" in result.text
+
+
+def test_openai_invalid_async_field_400(client):
+    resp = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("clip.wav", b"fake", "audio/wav")},
+        data={"model": "whisper-1", "async": "later"},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"]["param"] == "async"
+
+
+def test_result_before_done_returns_409(client, stubbed_app, monkeypatch):
+    from fastapi import BackgroundTasks
+
+    # Never run the worker so the job stays pending.
+    monkeypatch.setattr(BackgroundTasks, "add_task", lambda self, *a, **kw: None)
+    job_id = _submit(client).json()["job_id"]
+    assert client.get(f"/transcribe/jobs/{job_id}").json()["status"] == "pending"
+    assert client.get(f"/transcribe/jobs/{job_id}/result").status_code == 409
+
+
+def test_status_reports_queue_metrics(client):
+    _submit(client)
+    body = client.get("/status").json()
+    queue = body["queue"]
+    assert queue["concurrency"] >= 1
+    assert queue["queued"] == 0
+    assert set(queue["classes"]) == {"interactive", "batch", "meeting"}
+    assert queue["classes"]["interactive"]["completed"] >= 1
+    assert queue["classes"]["interactive"]["wait_ms"]["count"] >= 1
+    assert queue["transcribe_jobs"]["done"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_job_queued_past_ttl_and_capacity_still_completes(tmp_path):
+    """A job that waits in the queue longer than the TTL, while newer jobs
+    push the store over capacity, SHALL keep its record and settle normally."""
+    import asyncio
+
+    from app.api.transcribe_jobs import JobOutput, run_transcription_job
+    from app.services.job_queue import PRIORITY_INTERACTIVE, JobQueue
+    from app.services.meeting_jobs import JobStore
+
+    now = [1000.0]
+    store = JobStore(ttl_seconds=60, max_jobs=1, clock=lambda: now[0])
+    queue = JobQueue(concurrency=1)
+    job = store.create()
+
+    async def work() -> JobOutput:
+        return JobOutput(content={"text": "late"}, media_type="application/json")
+
+    async with queue.slot(priority=PRIORITY_INTERACTIVE):
+        task = asyncio.create_task(
+            run_transcription_job(
+                store=store,
+                queue=queue,
+                job_id=job.job_id,
+                priority=PRIORITY_INTERACTIVE,
+                work=work,
+                wav_path=tmp_path / "queued.wav",
+            )
+        )
+        await asyncio.sleep(0)
+        now[0] += 3700
+        store.create()  # over capacity while the first job is still queued
+        assert store.get(job.job_id) is job
+    await task
+
+    assert job.status == "done"
+    assert job.result.content == {"text": "late"}
@@ -0,0 +1,70 @@
+"""Tests for startup warm-up (app/services/warmup.py)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from app.services._whisper_backend import TranscriptionResult
+from app.services.stream import PARTIAL_WINDOW_MS, SAMPLE_RATE
+from app.services.warmup import FINAL_WINDOW_SECONDS, warm_up
+
+
+class _Backend:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int | None]] = []
+
+    async def transcribe_pcm(self, samples, *, language, beam_size=None):
+        self.calls.append((len(samples), beam_size))
+        return TranscriptionResult(
+            text="", segments=[], language="en", duration_seconds=0.0
+        )
+
+
+class _Vad:
+    def __init__(self) -> None:
+        self.frames: list[int] = []
+
+    def is_speech(self, pcm: bytes) -> bool:
+        self.frames.append(len(pcm))
+        return False
+
+
+async def test_warm_up_runs_partial_and_final_windows():
+    backend, vad = _Backend(), _Vad()
+    report = await warm_up(backend, vad, rounds=2, concurrency=2)
+    partial = PARTIAL_WINDOW_MS * SAMPLE_RATE // 1000
+    final = int(FINAL_WINDOW_SECONDS * SAMPLE_RATE)
+    assert backend.calls == [(partial, 1), (partial, 1), (final, None)] * 2
+    assert len(vad.frames) == 2
+    assert len(report["partial_ms"]) == len(report["final_ms"]) == 2
+    assert report["error"] is None
+
+
+async def test_warm_up_failure_is_reported_not_raised():
+    class _Broken(_Backend):
+        async def transcribe_pcm(self, samples, **kwargs):
+            raise RuntimeError("out of memory")
+
+    report = await warm_up(_Broken(), None, rounds=1)
+    assert report["error"] == "out of memory"
+
+
+async def test_warm_up_skips_test_doubles():
+    report = await warm_up(MagicMock(), _Vad(), rounds=3)
+    assert report["rounds"] == 0
+
+
+def test_status_reports_warmup(monkeypatch):
+    backend = _Backend()
+    metadata = {"backend": "ctranslate2", "format": "ct2", "local_dir": "/fake"}
+    monkeypatch.setattr("app.main._build_backend", lambda **kw: (backend, metadata))
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        body = client.get("/status").json()
+    assert body["startup"]["components"]["warmup"]["state"] == "ready"
+    assert len(body["warmup"]["final_ms"]) == 1
+    assert backend.calls
@@ -155,3 +155,94 @@ def test_construct_from_directory_wraps_faster_whisper_error(tmp_path, monkeypat
 
     with pytest.raises(WhisperLoadError, match="shared lib missing"):
         whisper_ct2.CTranslate2Backend(model_dir=str(model_dir))
+
+
+# ---------- Batched decode mode ----------
+
+
+@pytest.fixture
+def mock_pipeline(monkeypatch):
+    """Replace BatchedInferencePipeline so batched calls are observable."""
+    from app.services import whisper_ct2
+
+    pipeline = MagicMock()
+    pipeline.transcribe.return_value = (
+        iter(_fake_segments("batched text")),
+        _fake_info("en", duration=42.0),
+    )
+    factory = MagicMock(return_value=pipeline)
+    monkeypatch.setattr(whisper_ct2, "BatchedInferencePipeline", factory)
+    return factory, pipeline
+
+
+async def test_sequential_mode_never_builds_pipeline(tmp_wav, mock_model, mock_pipeline):
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    factory, _ = mock_pipeline
+    backend = CTranslate2Backend(model=mock_model)
+    result = await backend.transcribe(tmp_wav, language="auto", initial_prompt=None)
+    assert result.text == "hello world"
+    factory.assert_not_called()
+
+
+async def test_batched_mode_routes_through_pipeline(tmp_wav, mock_model, mock_pipeline):
+    """decode_mode="batched" SHALL wrap the same WhisperModel and pass batch_size."""
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    factory, pipeline = mock_pipeline
+    backend = CTranslate2Backend(model=mock_model, decode_mode="batched", batch_size=4)
+    result = await backend.transcribe(tmp_wav, language="zh", initial_prompt="seed")
+
+    factory.assert_called_once_with(model=mock_model)
+    kwargs = pipeline.transcribe.call_args.kwargs
+    assert kwargs["batch_size"] == 4
+    assert kwargs["language"] == "zh"
+    assert kwargs["initial_prompt"] == "seed"
+    assert result.text == "batched text"
+    assert result.duration_seconds == 42.0
+    mock_model.transcribe.assert_not_called()
+
+
+async def test_per_request_batched_overrides_mode(tmp_wav, mock_model, mock_pipeline):
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    _, pipeline = mock_pipeline
+    backend = CTranslate2Backend(model=mock_model, decode_mode="batched")
+    await backend.transcribe(tmp_wav, language="auto", initial_prompt=None, batched=False)
+    pipeline.transcribe.assert_not_called()
+    mock_model.transcribe.assert_called_once()
+
+    sequential = CTranslate2Backend(model=mock_model)
+    await sequential.transcribe(tmp_wav, language="auto", initial_prompt=None, batched=True)
+    pipeline.transcribe.assert_called_once()
+
+
+async def test_transcribe_pcm_stays_sequential_in_batched_mode(mock_model, mock_pipeline):
+    import numpy as np
+
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    factory, _ = mock_pipeline
+    backend = CTranslate2Backend(model=mock_model, decode_mode="batched")
+    await backend.transcribe_pcm(np.zeros(16000, dtype=np.float32), language="auto")
+    factory.assert_not_called()
+
+
+def test_unknown_decode_mode_raises_load_error(mock_model):
+    from app.services._whisper_backend import WhisperLoadError
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    with pytest.raises(WhisperLoadError, match="sequential, batched"):
+        CTranslate2Backend(model=mock_model, decode_mode="turbo")
+
+
+async def test_detect_language_returns_language_and_probability(mock_model):
+    import numpy as np
+
+    from app.services.whisper_ct2 import CTranslate2Backend
+
+    mock_model.detect_language.return_value = ("zh", 0.93, [("zh", 0.93)])
+    backend = CTranslate2Backend(model=mock_model)
+    samples = np.zeros(16_000, dtype=np.float32)
+    assert await backend.detect_language(samples) == ("zh", 0.93)
+    assert mock_model.detect_language.call_args.args[0] is samples